@@ -25,6 +25,9 @@ from .metadata_summary import (
 from .utils import (
     normalize_string,
     normalize_label,
+    canonicalize_label,
+    group_similar_labels,
+    get_closest_matches,
     make_names, 
     add_col_to_adata_obs,
     add_col_to_adata_var,
@@ -47,25 +50,61 @@ from .ai import (
     get_llm_config, 
     get_llm, 
     call_llm, 
+    LLMResponseCache,
+    configure_llm_cache,
+    get_llm_cache,
+    get_llm_request_key,
+    SingleFlight,
+    LLMGovernor,
+    get_llm_governor,
+    configure_llm_governor,
+    classify_llm_error,
+    LLMBackend,
+    register_llm_backend,
+    get_llm_backend,
+    list_llm_backends,
+    unregister_llm_backend,
+    use_llm_backend,
+    LLMUsage,
+    track_llm_usage,
+    configure_llm_response_log,
+    LocalChatModel,
+    LabelMappingStore,
+    configure_label_mapping_store,
+    get_label_mapping_store,
     retry_llm_call, 
+    acall_llm,
+    aretry_llm_call,
+    configure_llm_concurrency,
+    configure_llm_structured_output,
+    run_async,
     ai_cell_types_by_comparison, 
     enforce_semantic_list, 
     extract_dictionary_from_ai_string, 
+    parse_ai_literal,
     attempt_ai_integration, 
     generate_file_key, 
     map_cell_type_labels_to_simplified_set, 
+    amap_cell_type_labels_to_simplified_set,
     map_gene_labels_to_simplified_set, 
     ai_biological_process, 
     ai_cell_type,
+    aai_cell_type,
     ai_gene_list,
     ai_compare_cell_types_binary,
+    ai_compare_cell_type_pairs,
     ai_compare_cell_types_categorical,
     encode_plot_for_openai, 
+    encode_image_for_openai,
+    UmapRaster,
     ai_resolution_interpretation,
     determine_sign_of_resolution_change,
     process_llm_category_mapping,
     filter_gene_list,
     cell_type_marker_gene_score,
+    score_genes_multi,
+    get_marker_gene_list,
+    clear_marker_gene_list_cache,
     module_score_barplot,
     module_score_umap
 )
@@ -83,6 +122,7 @@ from .stablelabel import (
     plot_confusion_matrix_from_adata, 
     plot_confusion_matrix,
     plot_sankey, 
+    get_sankey_flows,
     save_sankey,
     plot_grouped_average,
     plot_model_agreement,
@@ -96,6 +136,7 @@ from .dict import (
     AdataDict,
     adata_dict_fapply, 
     adata_dict_fapply_return,
+    adata_dict_fapply_export,
     check_and_create_strata,
     read,
     read_adata_dict,
@@ -118,7 +159,10 @@ from .dict import (
     neighbors_adata_dict,
     leiden_adata_dict,
     leiden_sub_cluster,
+    leiden_sub_cluster_graph_only,
     leiden_sub_cluster_adata_dict,
+    leiden_resolution_sweep,
+    leiden_resolution_sweep_adata_dict,
     calculate_umap_adata_dict, 
     plot_umap_adata_dict, 
     write_adata_dict, 
@@ -139,10 +183,16 @@ from .dict import (
     simplify_var_index_adata_dict, 
     ai_determine_leiden_resolution, 
     ai_determine_leiden_resolution_adata_dict, 
+    ai_determine_leiden_resolution_from_sweep,
+    ai_interpret_umap_resolution,
     ai_annotate, 
+    aai_annotate,
+    ai_annotate_adata_dict,
     ai_annotate_by_comparison, 
     ai_annotate_cell_type, 
     ai_annotate_cell_type_adata_dict, 
+    aai_annotate_cell_type,
+    aai_annotate_cell_type_adata_dict,
     ai_annotate_cell_type_by_comparison,
     ai_annotate_cell_type_by_comparison_adata_dict,
     ai_annotate_cell_sub_type,
@@ -150,9 +200,11 @@ from .dict import (
     ai_annotate_biological_process, 
     ai_annotate_biological_process_adata_dict, 
     ai_unify_labels, 
+    aai_unify_labels,
     create_label_df,
     ai_compare_cell_type_labels_pairwise,
     ai_compare_cell_type_labels_pairwise_adata_dict,
+    run_llm_benchmark,
     create_label_hierarchy, 
     create_label_hierarchy_adata_dict, 
     plot_sankey_adata_dict, 
@@ -209,6 +261,7 @@ __all__ = [
     'AdataDict', 
     'adata_dict_fapply',
     'adata_dict_fapply_return', 
+    'adata_dict_fapply_export',
     'resample_adata',
     'resample_adata_dict',
     'normalize_adata_dict', 
@@ -260,9 +313,11 @@ __all__ = [
     'attempt_ai_integration', 
     'generate_file_key', 
     'map_cell_type_labels_to_simplified_set', 
+    'amap_cell_type_labels_to_simplified_set',
     'map_gene_labels_to_simplified_set', 
     'ai_biological_process', 
     'ai_cell_type',
+    'aai_cell_type',
     'ai_gene_list',
     'simplify_obs_column', 
     'simplify_obs_column_adata_dict', 
@@ -270,19 +325,29 @@ __all__ = [
     'simplify_var_index_adata_dict', 
     'ai_determine_leiden_resolution', 
     'ai_determine_leiden_resolution_adata_dict', 
+    'ai_determine_leiden_resolution_from_sweep',
+    'ai_interpret_umap_resolution',
     'ai_annotate', 
+    'aai_annotate',
+    'ai_annotate_adata_dict',
     'ai_annotate_by_comparison',
     'ai_annotate_cell_type', 
     'ai_annotate_cell_type_adata_dict', 
+    'aai_annotate_cell_type',
+    'aai_annotate_cell_type_adata_dict',
     'ai_annotate_biological_process', 
     'ai_annotate_biological_process_adata_dict', 
     'ai_unify_labels',
+    'aai_unify_labels',
     'set_var_index',
     'set_obs_index', 
     'encode_plot_for_openai', 
+    'encode_image_for_openai',
+    'UmapRaster',
     'ai_resolution_interpretation', 
     'determine_sign_of_resolution_change', 
     'plot_sankey', 
+    'get_sankey_flows',
     'plot_sankey_adata_dict',
     'create_label_hierarchy',
     'create_label_hierarchy_adata_dict',
@@ -290,16 +355,22 @@ __all__ = [
     'save_sankey',
     'save_sankey_adata_dict',
     'ai_compare_cell_types_binary',
+    'ai_compare_cell_type_pairs',
     'ai_compare_cell_types_categorical'
     'create_label_df', 
     'ai_compare_cell_type_labels_pairwise', 
     'ai_compare_cell_type_labels_pairwise_adata_dict', 
+    'run_llm_benchmark',
     'plot_grouped_average', 
     'plot_grouped_average_adata_dict',
     'enforce_semantic_list', 
     'extract_dictionary_from_ai_string',
+    'parse_ai_literal',
     'leiden_sub_cluster',
+    'leiden_sub_cluster_graph_only',
     'leiden_sub_cluster_adata_dict',
+    'leiden_resolution_sweep',
+    'leiden_resolution_sweep_adata_dict',
     'convert_messages_to_anthropic_prompt', 
     'ai_cell_types_by_comparison', 
     'ai_annotate_cell_type_by_comparison',
@@ -312,6 +383,28 @@ __all__ = [
     'get_llm_config', 
     'get_llm', 
     'call_llm',
+    'LLMResponseCache',
+    'configure_llm_cache',
+    'get_llm_cache',
+    'get_llm_request_key',
+    'SingleFlight',
+    'LLMGovernor',
+    'get_llm_governor',
+    'configure_llm_governor',
+    'classify_llm_error',
+    'LLMBackend',
+    'register_llm_backend',
+    'get_llm_backend',
+    'list_llm_backends',
+    'unregister_llm_backend',
+    'use_llm_backend',
+    'LLMUsage',
+    'track_llm_usage',
+    'configure_llm_response_log',
+    'LocalChatModel',
+    'LabelMappingStore',
+    'configure_label_mapping_store',
+    'get_label_mapping_store',
     'add_col_to_adata_var',
     'convert_obs_col_to_category',
     'convert_obs_col_to_string',
@@ -324,11 +417,19 @@ __all__ = [
     'default_init',
     'PROVIDER_MODELS',
     'retry_llm_call',
+    'acall_llm',
+    'aretry_llm_call',
+    'configure_llm_concurrency',
+    'configure_llm_structured_output',
+    'run_async',
     'get_adata_columns',
     'kappa_adata',
     'krippendorff_alpha_adata',
     'normalize_string',
     'normalize_label',
+    'canonicalize_label',
+    'group_similar_labels',
+    'get_closest_matches',
     'ensure_label_consistency_adata_dict',
     'ensure_label_consistency_adata',
     'ensure_label_consistency_main',
@@ -337,6 +438,9 @@ __all__ = [
     'annotate_gene_groups_with_ai_biological_process',
     'filter_gene_list',
     'cell_type_marker_gene_score',
+    'score_genes_multi',
+    'get_marker_gene_list',
+    'clear_marker_gene_list_cache',
     'module_score_barplot',
     'module_score_umap'
 ]
@@ -15,6 +15,7 @@ from IPython.display import HTML, display
 
 from sklearn.decomposition import PCA
 from scipy.stats import gaussian_kde
+from scipy.sparse import csc_matrix, issparse
 
 import seaborn as sns
 import matplotlib
@@ -31,28 +32,51 @@ import importlib
 from typing import List, Dict, Any
 from langchain.llms.base import BaseLLM
 from langchain.schema import HumanMessage, AIMessage, SystemMessage, BaseMessage
-from langchain_core.rate_limiters import InMemoryRateLimiter
 import boto3
 import json
+import sqlite3
+import asyncio
+import weakref
+import contextvars
+from contextlib import contextmanager, asynccontextmanager
+from email.utils import parsedate_to_datetime
+import threading
+import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from types import MappingProxyType
+import hashlib
+import time
+from collections import OrderedDict
+
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-
-from difflib import get_close_matches
 import ast
 
-from .utils import normalize_string, normalize_label
+from .utils import normalize_string, normalize_label, get_closest_matches, group_similar_labels, canonicalize_label
 # import time
 # import csv
 # import threading
 
 #LLM configuration
+# Rate limiting is done by the LLMGovernor of each provider and model (see get_llm_governor), so the init funcs
+# remove these settings before the provider's constructor sees them
+RATE_LIMIT_ARGS = ['requests_per_minute', 'tokens_per_minute', 'max_concurrency', 'max_bucket_size', 'check_every_n_seconds']
+
+def pop_rate_limit_args(constructor_args):
+    """Removes the rate limit settings from constructor_args and returns them as a dict."""
+    return {key: constructor_args.pop(key) for key in RATE_LIMIT_ARGS if key in constructor_args}
+
+
 def bedrock_init(constructor_args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     """Initialization function for Bedrock"""
     # Retrieve values from environment variables
-    region_name = os.environ.get('LLM_REGION_NAME')
-    aws_access_key_id = os.environ.get('LLM_AWS_ACCESS_KEY_ID')
-    aws_secret_access_key = os.environ.get('LLM_AWS_SECRET_ACCESS_KEY')
-    model_id = os.environ.get('LLM_MODEL')  # This comes from the 'model' parameter in configure_llm_backend
+    # (or from the settings of an LLMBackend, which are passed in constructor_args)
+    region_name = constructor_args.get('region_name', os.environ.get('LLM_REGION_NAME'))
+    aws_access_key_id = constructor_args.get('aws_access_key_id', os.environ.get('LLM_AWS_ACCESS_KEY_ID'))
+    aws_secret_access_key = constructor_args.get('aws_secret_access_key', os.environ.get('LLM_AWS_SECRET_ACCESS_KEY'))
+    model_id = constructor_args.get('model', os.environ.get('LLM_MODEL'))  # This comes from the 'model' parameter in configure_llm_backend
     
     if not region_name:
         raise ValueError("Bedrock requires LLM_REGION_NAME to be set in environment variables.")
@@ -89,21 +113,7 @@ def bedrock_init(constructor_args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     # filtered_args['model_id'] = model_id
     filtered_args['client'] = bedrock_client
 
-    # Extract rate limiter parameters from kwargs, or use defaults
-    requests_per_minute = float(constructor_args.pop('requests_per_minute', 40))
-    requests_per_second = requests_per_minute / 60  # Convert to requests per second
-    check_every_n_seconds = float(constructor_args.pop('check_every_n_seconds', 0.1))
-    max_bucket_size = float(constructor_args.pop('max_bucket_size', requests_per_minute))
-
-    # Add rate limiter specific to Bedrock
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=requests_per_second,
-        check_every_n_seconds=check_every_n_seconds,
-        max_bucket_size=max_bucket_size
-    )
-    
-    # Add rate limiter to the constructor arguments
-    filtered_args['rate_limiter'] = rate_limiter
+    pop_rate_limit_args(constructor_args)
 
     #Add a debug print to see what's being passed to BedrockChat
     # print(f"BedrockChat constructor args: {json.dumps(filtered_args, default=str, indent=2)}")
@@ -129,6 +139,8 @@ def azureml_init(constructor_args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     constructor_args['endpoint_api_type'] = AzureMLEndpointApiType.serverless
     constructor_args['endpoint_api_key'] = api_key
     constructor_args['content_formatter'] = LlamaChatContentFormatter()
+
+    pop_rate_limit_args(constructor_args)
     
     return constructor_args, kwargs
 
@@ -145,43 +157,22 @@ def google_genai_init(constructor_args, **kwargs):
     #Google API will send ignorable warnings if you are on mac, so supress them by setting this env var
     os.environ['GRPC_VERBOSITY'] = 'ERROR'
 
-    # Extract rate limiter parameters from kwargs, or use defaults
-    requests_per_minute = float(constructor_args.pop('requests_per_minute', 40))
-    requests_per_second = requests_per_minute / 60  # Convert to requests per second
-    check_every_n_seconds = float(constructor_args.pop('check_every_n_seconds', 0.1))
-    max_bucket_size = float(constructor_args.pop('max_bucket_size', requests_per_minute))
-
-    # Add a custom rate limiter for Google Gemini API
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=requests_per_second, 
-        check_every_n_seconds=check_every_n_seconds,
-        max_bucket_size=max_bucket_size
-    )
-    
-    # Add rate limiter to constructor arguments
-    constructor_args['rate_limiter'] = rate_limiter
+    pop_rate_limit_args(constructor_args)
 
     # For Google, we've handled these in the constructor, so we return empty kwargs
     return constructor_args, {}
 
 def default_init(constructor_args, **kwargs):
-    """Default initialization function that sets a rate limiter"""
-
-    # Extract rate limiter parameters from kwargs, or use defaults
-    requests_per_minute = float(constructor_args.pop('requests_per_minute', 40))
-    requests_per_second = requests_per_minute / 60  # Convert to requests per second
-    check_every_n_seconds = float(constructor_args.pop('check_every_n_seconds', 0.1))
-    max_bucket_size = float(constructor_args.pop('max_bucket_size', requests_per_minute))
-
-    # Add a default rate limiter
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=requests_per_second,
-        check_every_n_seconds=check_every_n_seconds,
-        max_bucket_size=max_bucket_size
-    )
+    """Default initialization function. Removes the rate limit settings, which are handled by the LLMGovernor."""
 
-    # Add rate limiter to constructor arguments
-    constructor_args['rate_limiter'] = rate_limiter
+    pop_rate_limit_args(constructor_args)
+
+    return constructor_args, kwargs
+
+def local_init(constructor_args, **kwargs):
+    """Initialization function for the local provider (see LocalChatModel). Removes the rate limit settings, which are handled by the LLMGovernor."""
+
+    pop_rate_limit_args(constructor_args)
 
     return constructor_args, kwargs
 
@@ -240,6 +231,11 @@ PROVIDER_MAPPING = {
         'class': 'ChatOllama',
         'module': 'langchain_community.chat_models.ollama',
         'init_func': default_init
+    },
+    'local': {
+        'class': 'LocalChatModel',
+        'module': 'anndict.ai',
+        'init_func': local_init
     }
 }
 
@@ -359,6 +355,9 @@ PROVIDER_MODELS = {
         'watson-natural-language-understanding',
         'watson-speech-to-text',
         'watson-text-to-speech'
+    ],
+    'local': [
+        'synthetic'
     ]
 }
 
@@ -400,8 +399,16 @@ def configure_llm_backend(provider, model, **kwargs):
         # For Bedrock
 
         configure_llm_backend('bedrock', 'anthropic.claude-v2', region_name='us-west-2', aws_access_key_id='your-access-key-id', aws_secret_access_key='your-secret-access-key')
+
+        # For offline runs, replaying recorded responses or simulating a provider (see LocalChatModel)
+
+        configure_llm_backend('local', 'synthetic', latency=0.5, error_rate=0.01)
+
+        # Rate limits, enforced for all calls to this provider and model (see LLMGovernor)
+
+        configure_llm_backend('openai', 'gpt-4o', api_key='your-openai-api-key', requests_per_minute=500, tokens_per_minute=200000, max_concurrency=32)
     """
-    global _llm_instance
+    global _llm_instance, _llm_config_version
     provider_info = PROVIDER_MAPPING.get(provider.lower())
     if not provider_info:
         raise ValueError(f"Unsupported provider: {provider}")
@@ -417,10 +424,40 @@ def configure_llm_backend(provider, model, **kwargs):
     for key, value in kwargs.items():
         os.environ[f'LLM_{key.upper()}'] = str(value)
 
+    # Invalidate the configuration snapshot (see get_llm_config) and everything derived from it
+    with _llm_config_lock:
+        _llm_config_version += 1
     _llm_instance = None
+    _llm_call_kwargs.clear()
+
+    # Rebuild the governor of this provider and model with the new rate limit settings
+    with _llm_governors_lock:
+        _llm_governors.pop((provider.lower(), model), None)
 
 
+_llm_config_version = 0
+_llm_config_snapshot = None
+_llm_config_lock = threading.Lock()
+
 def get_llm_config():
+    """
+    Returns the LLM configuration set by configure_llm_backend, as an immutable snapshot that is read from the
+    environment variables once per call of configure_llm_backend rather than on every LLM call. LLM_ environment
+    variables changed by other means are picked up at the next call of configure_llm_backend.
+    """
+    global _llm_config_snapshot
+    snapshot = _llm_config_snapshot
+    if snapshot is not None and snapshot[0] == _llm_config_version:
+        return snapshot[1]
+
+    with _llm_config_lock:
+        version = _llm_config_version
+        config = MappingProxyType(read_llm_config())
+        _llm_config_snapshot = (version, config)
+    return config
+
+
+def read_llm_config():
     """Retrieves the LLM configuration from environment variables."""
     provider = os.getenv('LLM_PROVIDER')
     model = os.getenv('LLM_MODEL')
@@ -440,6 +477,7 @@ def get_llm_config():
 
 _llm_instance = None
 _llm_config = None
+_llm_instance_lock = threading.Lock()
 
 def get_llm(**kwargs):
     """Dynamically retrieves the appropriate LLM based on the configuration."""
@@ -448,10 +486,24 @@ def get_llm(**kwargs):
     #Retrieve the current configuration
     config = get_llm_config()
 
-    # Check if the instance already exists and the configuration hasn't changed
-    if _llm_instance is not None and _llm_config == config:
+    # Check if the instance already exists and the configuration hasn't changed (a new configuration is a new snapshot)
+    if _llm_instance is not None and _llm_config is config:
         return _llm_instance
-    
+
+    with _llm_instance_lock:
+        if _llm_instance is not None and _llm_config is config:
+            return _llm_instance
+
+        _llm_instance = build_llm(config, **kwargs)
+
+        # Cache the config to detect changes
+        _llm_config = config
+
+        return _llm_instance
+
+
+def build_llm(config, **kwargs):
+    """Constructs the LangChain chat model described by config (see get_llm_config)."""
     try:
         module = importlib.import_module(config['module'])
         llm_class = getattr(module, config['class'])
@@ -464,25 +516,1073 @@ def get_llm(**kwargs):
         constructor_args, _ = init_func(constructor_args, **kwargs)
         # print(constructor_args)
 
-        _llm_instance = llm_class(**constructor_args)
-
-        # Cache the config to detect changes
-        _llm_config = config  
-        
-        return _llm_instance
+        return llm_class(**constructor_args)
     except (ImportError, AttributeError) as e:
         raise ValueError(f"Error initializing provider {config['provider']}: {str(e)}")
 
+
+_llm_call_kwargs = {}
+
+# Providers whose chat API has a JSON mode (see configure_llm_structured_output)
+JSON_MODE_PROVIDERS = ('openai', 'azure_openai')
+
+def get_llm_call_kwargs(config, **kwargs):
+    """
+    Converts the generation parameters of a call (e.g. max_tokens, temperature) with the init_func of the provider
+    in config. The result is memoized per provider, model and parameters, so init_func is not rerun on every call.
+    response_format='json' becomes the JSON mode of providers in JSON_MODE_PROVIDERS and is ignored by the others.
+    """
+    try:
+        key = (config['provider'], config['model'], tuple(sorted(kwargs.items())))
+        call_kwargs = _llm_call_kwargs.get(key)
+    except TypeError:
+        key, call_kwargs = None, None
+    if call_kwargs is None:
+        # response_format='json' asks for a JSON object where the provider supports it, and is dropped otherwise
+        response_format = kwargs.pop('response_format', None)
+        constructor_args = {k: v for k, v in config.items() if k not in ['class', 'module', 'provider']}
+        _, call_kwargs = PROVIDER_MAPPING[config['provider']]['init_func'](constructor_args, **kwargs)
+        if response_format == 'json' and config['provider'] in JSON_MODE_PROVIDERS:
+            call_kwargs['response_format'] = {'type': 'json_object'}
+        if key is not None:
+            if len(_llm_call_kwargs) >= 1024:
+                _llm_call_kwargs.clear()
+            _llm_call_kwargs[key] = call_kwargs
+    return dict(call_kwargs)
+
+#Local LLM provider
+class LocalLLMError(Exception):
+    """A simulated provider error raised by LocalChatModel. Classified like the HTTP error of its status_code (see classify_llm_error)."""
+    def __init__(self, message, status_code=503):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def synthetic_llm_response(messages, request_hash):
+    """
+    Default responder of LocalChatModel. Answers a label mapping prompt (see map_cell_type_labels_to_simplified_set)
+    with a dictionary that maps each label to itself, and any other prompt with a short label derived from request_hash.
+    """
+    prompt = messages[-1]['content'] if messages else ''
+    if isinstance(prompt, str) and 'Generate only a dictionary:' in prompt:
+        labels = prompt.split('Generate only a dictionary:', 1)[1].rsplit('->', 1)[0].split('    ')
+        return str({label.strip(): label.strip() for label in labels if label.strip()})
+    return f"synthetic response {request_hash[:8]}"
+
+
+def load_llm_cassette(path):
+    """
+    Loads recorded LLM responses as {request hash: response}, from a response log (JSON lines with request_hash and
+    response, see configure_llm_response_log) or a JSON file containing such a dictionary.
+    """
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    try:
+        recorded = json.loads(text)
+        # A response log with a single entry is also valid JSON
+        if isinstance(recorded, dict) and 'request_hash' not in recorded:
+            return recorded
+    except json.JSONDecodeError:
+        pass
+    cassette = {}
+    for line in text.splitlines():
+        if line.strip():
+            entry = json.loads(line)
+            if entry.get('request_hash') is not None:
+                cassette[entry['request_hash']] = entry['response']
+    return cassette
+
+
+class LocalChatModel:
+    """
+    Chat model of the 'local' provider, which answers without a live provider so that pipelines can be run and
+    load-tested offline and reproducibly. It replays recorded responses keyed by request hash (see get_llm_request_hash),
+    synthesizes responses, or both.
+
+    Record a cassette by running against a live provider with the response log enabled (see configure_llm_response_log),
+    then replay it with the provider and model it was recorded with:
+
+        configure_llm_backend('local', 'gpt-4o', cassette='response.jsonl', cassette_provider='openai')
+
+    Or simulate a provider:
+
+        configure_llm_backend('local', 'synthetic', latency=0.8, latency_distribution='lognormal', error_rate=0.02, max_requests_per_second=20)
+
+    Calls to the local provider are not throttled by its LLMGovernor unless requests_per_minute is passed to configure_llm_backend.
+
+    Args:
+        model (str): Model name. Also the model the cassette was recorded with, unless cassette_model is given.
+        cassette (str, optional): Path of the recorded responses (see load_llm_cassette).
+        cassette_provider (str): Provider the cassette was recorded with. Default: 'local'.
+        cassette_model (str, optional): Model the cassette was recorded with. Default: model.
+        on_miss (str): 'error' to raise a KeyError for requests missing from the cassette, or 'synthetic' to synthesize
+            a response. Default: 'error' with a cassette, 'synthetic' without.
+        responder (callable, optional): Function (messages, request_hash) -> response text used to synthesize responses.
+            Default: synthetic_llm_response.
+        latency (float): Mean simulated latency in seconds. Default: 0.
+        latency_distribution (str): 'constant', 'exponential' or 'lognormal'. Default: 'constant'.
+        latency_sigma (float): Shape of the lognormal latency distribution. Default: 0.5.
+        error_rate (float): Fraction of calls that fail with a retryable LocalLLMError (status 503). Default: 0.
+        max_requests_per_second (float, optional): Calls beyond this rate fail with a LocalLLMError with status 429.
+        seed (int): Seed of the simulated latencies and errors, which depend only on the seed, the request, and how
+            many times it has been made, not on the order of calls across threads. Default: 0.
+    """
+    def __init__(self, model, cassette=None, cassette_provider='local', cassette_model=None, on_miss=None, responder=None,
+                 latency=0, latency_distribution='constant', latency_sigma=0.5, error_rate=0, max_requests_per_second=None, seed=0, **kwargs):
+        # Settings from configure_llm_backend arrive as strings
+        self.model = model
+        self.cassette = load_llm_cassette(cassette) if cassette else {}
+        self.cassette_provider = cassette_provider
+        self.cassette_model = cassette_model or model
+        self.on_miss = on_miss or ('error' if cassette else 'synthetic')
+        if self.on_miss not in ('error', 'synthetic'):
+            raise ValueError("on_miss must be either 'error' or 'synthetic'.")
+        self.responder = responder or synthetic_llm_response
+        self.latency = float(latency)
+        self.latency_distribution = latency_distribution
+        if self.latency_distribution not in ('constant', 'exponential', 'lognormal'):
+            raise ValueError("latency_distribution must be 'constant', 'exponential' or 'lognormal'.")
+        self.latency_sigma = float(latency_sigma)
+        self.error_rate = float(error_rate)
+        self.max_requests_per_second = float(max_requests_per_second) if max_requests_per_second not in (None, '', 'None') else None
+        self.seed = seed
+        self._request_counts = {}
+        self._request_times = []
+        self._lock = threading.Lock()
+
+    def _respond(self, messages, request_hash=None, **kwargs):
+        """
+        Returns (response message, simulated latency) for messages, or raises a simulated error. request_hash is
+        passed in by call_llm (see get_llm_request_hash), so it matches the hash of the request in the response log.
+        """
+        if request_hash is None:
+            raise ValueError("LocalChatModel must be called through call_llm or acall_llm, which pass the request_hash.")
+        messages = [
+            {'role': {'system': 'system', 'ai': 'assistant'}.get(message.type, 'user'), 'content': message.content}
+            for message in messages
+        ]
+
+        with self._lock:
+            # Throughput limit over a sliding window of one second
+            if self.max_requests_per_second is not None:
+                now = time.monotonic()
+                self._request_times = [t for t in self._request_times if now - t < 1]
+                if len(self._request_times) >= self.max_requests_per_second:
+                    raise LocalLLMError("Too many requests (simulated rate limit)", status_code=429)
+                self._request_times.append(now)
+            attempt = self._request_counts.get(request_hash, 0)
+            self._request_counts[request_hash] = attempt + 1
+
+        rng = random.Random(f"{self.seed}:{request_hash}:{attempt}")
+        if self.latency_distribution == 'exponential':
+            latency = rng.expovariate(1 / self.latency) if self.latency > 0 else 0
+        elif self.latency_distribution == 'lognormal':
+            latency = self.latency * rng.lognormvariate(-self.latency_sigma ** 2 / 2, self.latency_sigma) if self.latency > 0 else 0
+        else:
+            latency = self.latency
+        if rng.random() < self.error_rate:
+            return LocalLLMError("Service unavailable (simulated error)", status_code=503), latency
+
+        if request_hash in self.cassette:
+            content = self.cassette[request_hash]
+        elif self.on_miss == 'synthetic':
+            content = self.responder(messages, request_hash)
+        else:
+            raise KeyError(f"Request {request_hash} is not in the cassette of the local provider.")
+
+        token_usage = {'prompt_tokens': estimate_llm_tokens(messages), 'completion_tokens': len(content) // 4}
+        return AIMessage(content=content, response_metadata={'token_usage': token_usage, 'request_hash': request_hash}), latency
+
+    def invoke(self, messages, **kwargs):
+        response, latency = self._respond(messages, **kwargs)
+        time.sleep(latency)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    __call__ = invoke
+
+    async def ainvoke(self, messages, **kwargs):
+        response, latency = self._respond(messages, **kwargs)
+        await asyncio.sleep(latency)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+
+#LLM backend registry
+class LLMBackend:
+    """
+    A named LLM configuration that can be used alongside others in the same process, unlike the
+    process-wide configuration set by configure_llm_backend. The LangChain model is constructed
+    lazily and thread-safely on first use.
+
+    Create and register backends with register_llm_backend, and pass them (or their names) to call_llm
+    or the AI functions as backend=.
+
+    Args:
+        name (str): Name of the backend in the registry.
+        provider (str): One of the keys of PROVIDER_MAPPING.
+        model (str): The provider's model name.
+        kwargs: Provider settings, as for configure_llm_backend (e.g. api_key, requests_per_minute).
+    """
+    def __init__(self, name, provider, model, **kwargs):
+        provider = provider.lower()
+        if provider not in PROVIDER_MAPPING:
+            raise ValueError(f"Unsupported provider: {provider}")
+        self.name = name
+        self.provider = provider
+        self.model = model
+        self.settings = {key.lower(): value for key, value in kwargs.items()}
+        self._llm = None
+        self._config = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"LLMBackend(name={self.name!r}, provider={self.provider!r}, model={self.model!r})"
+
+    def get_config(self):
+        """Returns the configuration of this backend, as an immutable snapshot in the format of get_llm_config."""
+        if self._config is None:
+            provider_info = PROVIDER_MAPPING[self.provider]
+            config = {'provider': self.provider, 'model': self.model, 'class': provider_info['class'], 'module': provider_info['module']}
+            config.update(self.settings)
+            self._config = MappingProxyType(config)
+        return self._config
+
+    def get_llm(self, **kwargs):
+        """Returns the LangChain model of this backend, constructing it on first use."""
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    self._llm = build_llm(self.get_config(), **kwargs)
+        return self._llm
+
+
+_llm_backends = {}
+_llm_backends_lock = threading.Lock()
+_active_llm_backend = contextvars.ContextVar('active_llm_backend', default=None)
+
+def register_llm_backend(name, provider, model, **kwargs):
+    """
+    Registers a named LLM backend, replacing any backend registered under the same name.
+
+    Examples:
+        register_llm_backend('gpt-4o', 'openai', 'gpt-4o', api_key='your-openai-api-key')
+        register_llm_backend('claude', 'anthropic', 'claude-3-5-sonnet-20240620', api_key='your-anthropic-api-key')
+
+        # Annotate the same data with both models at the same time
+        with ThreadPoolExecutor() as executor:
+            futures = {name: executor.submit(ai_annotate_cell_type_adata_dict, adata_dicts[name], groupby='leiden', backend=name)
+                       for name in ['gpt-4o', 'claude']}
+
+    Returns:
+        LLMBackend: The registered backend.
+    """
+    backend = LLMBackend(name, provider, model, **kwargs)
+    with _llm_backends_lock:
+        _llm_backends[name] = backend
+    return backend
+
+
+def get_llm_backend(name):
+    """Returns the registered LLMBackend with the given name."""
+    with _llm_backends_lock:
+        if name not in _llm_backends:
+            raise KeyError(f"No LLM backend registered under the name '{name}'. Registered backends: {list(_llm_backends)}")
+        return _llm_backends[name]
+
+
+def list_llm_backends():
+    """Returns the names of the registered LLM backends."""
+    with _llm_backends_lock:
+        return list(_llm_backends)
+
+
+def unregister_llm_backend(name):
+    """Removes a backend from the registry."""
+    with _llm_backends_lock:
+        _llm_backends.pop(name, None)
+
+
+def resolve_llm_backend(backend=None):
+    """
+    Returns the LLMBackend to use: backend (an LLMBackend or a registered name) if given, otherwise the backend
+    activated with use_llm_backend, otherwise None (the configuration from configure_llm_backend).
+    """
+    if backend is None:
+        return _active_llm_backend.get()
+    if isinstance(backend, LLMBackend):
+        return backend
+    return get_llm_backend(backend)
+
+
+@contextmanager
+def use_llm_backend(backend):
+    """
+    Context manager that makes backend (an LLMBackend or a registered name) the default for LLM calls made in this
+    context, including threads started by adata_dict_fapply. If backend is None, the current default is kept.
+    """
+    if backend is None:
+        yield
+        return
+    token = _active_llm_backend.set(resolve_llm_backend(backend))
+    try:
+        yield
+    finally:
+        _active_llm_backend.reset(token)
+
+
+def get_active_llm_config(backend=None):
+    """Returns the configuration of resolve_llm_backend(backend), or of configure_llm_backend if there is none."""
+    backend = resolve_llm_backend(backend)
+    return backend.get_config() if backend is not None else get_llm_config()
+
+
+#LLM response cache
+class LLMResponseCache:
+    """
+    Cache of LLM responses keyed by request (see get_llm_request_key). An in-memory LRU sits in front
+    of an optional SQLite database, so responses persist across sessions, notebooks and processes.
+
+    Args:
+        path (str, optional): Path of the SQLite database. If None, responses are only cached in memory.
+        max_memory_entries (int): Maximum number of responses held in the in-memory LRU.
+        max_disk_entries (int, optional): Maximum number of responses kept in the database. The least recently used are evicted.
+        ttl (float, optional): Time to live of an entry in seconds. Expired entries are treated as misses and removed.
+    """
+    def __init__(self, path=None, max_memory_entries=10000, max_disk_entries=None, ttl=None):
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT, created REAL, accessed REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed)")
+            self._connection.commit()
+
+    def _is_expired(self, created, now):
+        return self.ttl is not None and now - created > self.ttl
+
+    def _remember(self, key, response, created):
+        self._memory[key] = (response, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Returns the cached response for key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._is_expired(entry[1], now):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._memory[key]
+
+            if self._connection is not None:
+                row = self._connection.execute("SELECT response, created FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    response, created = row
+                    if not self._is_expired(created, now):
+                        self._connection.execute("UPDATE llm_cache SET accessed = ? WHERE key = ?", (now, key))
+                        self._connection.commit()
+                        self._remember(key, response, created)
+                        self.hits += 1
+                        return response
+                    self._connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._connection.commit()
+
+            self.misses += 1
+            return None
+
+    def set(self, key, response):
+        """Stores response under key."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, response, now)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, response, now, now)
+                )
+                self._writes_since_eviction += 1
+                # Counting rows is O(n), so only check the size limit periodically
+                if self.max_disk_entries is not None and self._writes_since_eviction >= 100:
+                    self._evict_disk_entries()
+                self._connection.commit()
+
+    def _evict_disk_entries(self):
+        self._writes_since_eviction = 0
+        if self.ttl is not None:
+            self._connection.execute("DELETE FROM llm_cache WHERE created < ?", (time.time() - self.ttl,))
+        excess = self._connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_disk_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY accessed ASC LIMIT ?)", (excess,)
+            )
+
+    def invalidate(self, key):
+        """Removes key from the cache, e.g. when its response could not be processed."""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._connection.commit()
+
+    def clear(self):
+        """Removes all entries and resets the hit and miss counters."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM llm_cache")
+                self._connection.commit()
+
+    def stats(self):
+        """Returns a dictionary of hit/miss counts, hit rate and number of entries in memory and on disk."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            disk_entries = None
+            if self._connection is not None:
+                disk_entries = self._connection.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'disk_entries': disk_entries
+            }
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_llm_cache = None
+
+def configure_llm_cache(path=None, max_memory_entries=10000, max_disk_entries=None, ttl=None, enabled=True):
+    """
+    Configures the cache used by call_llm. Responses are cached per provider, model, messages and generation parameters,
+    so reruns with identical prompts don't call the provider again. Caching is off until this is called.
+
+    Args:
+        path (str, optional): Path of a SQLite database to persist the cache to. If None, the cache is in memory only.
+        max_memory_entries (int): Maximum number of responses held in memory.
+        max_disk_entries (int, optional): Maximum number of responses kept in the database.
+        ttl (float, optional): Time to live of an entry in seconds.
+        enabled (bool): If False, remove the cache so that every call goes to the provider.
+
+    Returns:
+        LLMResponseCache or None: The configured cache.
+
+    Examples:
+        configure_llm_cache('llm_cache.sqlite', ttl=30*24*3600)
+
+        # Bypass the cache for a single call
+        call_llm(messages, max_tokens=100, temperature=0, use_cache=False)
+    """
+    global _llm_cache
+    if _llm_cache is not None:
+        _llm_cache.close()
+    _llm_cache = LLMResponseCache(path, max_memory_entries, max_disk_entries, ttl) if enabled else None
+    return _llm_cache
+
+
+def get_llm_cache():
+    """Returns the LLMResponseCache used by call_llm, or None if caching is disabled."""
+    return _llm_cache
+
+
+# Keyword arguments of call_llm that control how the call is made rather than what is generated
+LLM_CALL_CONTROL_ARGS = ('use_cache', 'coalesce', 'max_transport_attempts', 'max_transport_wait', 'backend')
+
+def get_llm_request_key(messages, provider=None, model=None, **kwargs):
+    """
+    Computes the cache key of an LLM request from the provider, model, normalized messages and generation parameters.
+
+    Args:
+        messages (list): Messages as passed to call_llm.
+        provider (str, optional): Defaults to the provider of the active backend (see get_active_llm_config).
+        model (str, optional): Defaults to the model of the active backend.
+        kwargs: Generation parameters as passed to call_llm (e.g. max_tokens, temperature).
+
+    Returns:
+        str: A hex digest identifying the request.
+    """
+    if provider is None or model is None:
+        config = get_active_llm_config(kwargs.get('backend'))
+        provider = provider or config['provider']
+        model = model or config['model']
+
+    normalized_messages = [
+        {'role': msg['role'], 'content': msg['content'].strip() if isinstance(msg['content'], str) else msg['content']}
+        for msg in messages
+    ]
+    request = {
+        'provider': provider,
+        'model': model,
+        'messages': normalized_messages,
+        'params': {k: v for k, v in kwargs.items() if k not in LLM_CALL_CONTROL_ARGS}
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_llm_request_hash(messages, config, **kwargs):
+    """
+    Returns the hash of a request that is recorded in the response log and looked up in the cassettes of the local
+    provider: get_llm_request_key of the messages and generation parameters as passed to call_llm (before any
+    provider-specific conversion), under the provider and model of config. For the local provider, these are the
+    cassette_provider and cassette_model it replays (see LocalChatModel).
+    """
+    provider, model = config['provider'], config['model']
+    if provider == 'local':
+        provider = config.get('cassette_provider') or 'local'
+        model = config.get('cassette_model') or model
+    return get_llm_request_key(messages, provider=provider, model=model, **kwargs)
+
+
+def invalidate_llm_cache_entry(messages, **kwargs):
+    """Removes the cached response of a call_llm request, if caching is enabled."""
+    if _llm_cache is not None:
+        _llm_cache.invalidate(get_llm_request_key(messages, **kwargs))
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls: while a call for a key is in flight, other callers with the same key
+    wait for its result (or exception) instead of making the call themselves.
+    """
+    def __init__(self):
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """Returns func(*args, **kwargs), sharing the result with concurrent callers of the same key."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+_llm_single_flight = SingleFlight()
+
+
+def is_deterministic_llm_call(kwargs):
+    """
+    Returns True if the call_llm kwargs ask for greedy decoding (temperature 0). Only such requests are coalesced
+    by default, since callers that sample at a higher temperature (e.g. retries, or several votes) expect different responses.
+    """
+    return kwargs.get('temperature') == 0
+
+
+#LLM rate governor
+class LLMGovernor:
+    """
+    Enforces the request rate, token rate and concurrency limits of one provider and model, shared by all
+    threads and event loops of the process. Rates are token buckets that refill continuously. When the provider
+    reports rate limiting or overload, the governor pauses and slows down, then recovers gradually on success.
+
+    Args:
+        requests_per_minute (float, optional): Maximum request rate. None for no request rate limit, in which case
+            overload errors are counted but do not pause or slow down requests.
+        tokens_per_minute (float, optional): Maximum token rate, counting prompt and max_tokens (see estimate_llm_tokens).
+        max_concurrency (int, optional): Maximum number of requests in flight.
+        max_bucket_size (float, optional): Maximum burst of requests, at least 1 (default: requests_per_minute, or 1 if that is less).
+        check_every_n_seconds (float): Longest time between checks while waiting.
+        max_slowdown (float): Largest factor by which rates are divided after overload errors.
+    """
+    def __init__(self, requests_per_minute=40, tokens_per_minute=None, max_concurrency=None, max_bucket_size=None, check_every_n_seconds=0.1, max_slowdown=16):
+        self.requests_per_minute = float(requests_per_minute) if requests_per_minute is not None else None
+        if self.requests_per_minute is not None and self.requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {requests_per_minute}.")
+        self.tokens_per_minute = float(tokens_per_minute) if tokens_per_minute else None
+        if self.tokens_per_minute is not None and self.tokens_per_minute < 0:
+            raise ValueError(f"tokens_per_minute must be positive, got {tokens_per_minute}.")
+        self.max_concurrency = int(max_concurrency) if max_concurrency else None
+        # A request takes a whole unit of the bucket, so a smaller bucket would never grant one
+        if max_bucket_size and float(max_bucket_size) < 1:
+            raise ValueError(f"max_bucket_size must be at least 1, got {max_bucket_size}.")
+        self.max_bucket_size = float(max_bucket_size) if max_bucket_size else max(self.requests_per_minute or 1.0, 1.0)
+        self.check_every_n_seconds = float(check_every_n_seconds)
+        self.max_slowdown = max_slowdown
+
+        self.slowdown = 1.0
+        self.in_flight = 0
+        self.overload_errors = 0
+        self._request_bucket = self.max_bucket_size
+        self._token_bucket = self.tokens_per_minute
+        self._paused_until = 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute is not None:
+            self._request_bucket = min(self.max_bucket_size, self._request_bucket + elapsed * self.requests_per_minute / 60 / self.slowdown)
+        if self.tokens_per_minute is not None:
+            self._token_bucket = min(self.tokens_per_minute, self._token_bucket + elapsed * self.tokens_per_minute / 60 / self.slowdown)
+
+    def _try_acquire(self, tokens):
+        """Takes a slot if all limits allow it and returns 0, otherwise returns how long to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.max_concurrency is not None and self.in_flight >= self.max_concurrency:
+                return self.check_every_n_seconds
+
+            waits = []
+            if self.requests_per_minute is not None and self._request_bucket < 1:
+                waits.append((1 - self._request_bucket) * 60 * self.slowdown / self.requests_per_minute)
+            if self.tokens_per_minute is not None:
+                # A request larger than the whole bucket goes through once the bucket is full
+                tokens = min(tokens, self.tokens_per_minute)
+                if self._token_bucket < tokens:
+                    waits.append((tokens - self._token_bucket) * 60 * self.slowdown / self.tokens_per_minute)
+            if waits:
+                return max(waits)
+
+            if self.requests_per_minute is not None:
+                self._request_bucket -= 1
+            if self.tokens_per_minute is not None:
+                self._token_bucket -= tokens
+            self.in_flight += 1
+            return 0
+
+    def acquire(self, tokens=0):
+        """Blocks until a request of the given number of tokens may be sent."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                return
+            time.sleep(min(wait, self.check_every_n_seconds))
+
+    async def aacquire(self, tokens=0):
+        """Async version of acquire."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                return
+            await asyncio.sleep(min(wait, self.check_every_n_seconds))
+
+    def release(self, overloaded=False, retry_after=None):
+        """
+        Frees the slot of a finished request. If the provider reported rate limiting or overload, pauses all requests
+        (for retry_after seconds if given) and slows down; otherwise speeds back up towards the configured rates.
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if overloaded:
+                self.overload_errors += 1
+                if self.requests_per_minute is None:
+                    return
+                self.slowdown = min(self.slowdown * 2, self.max_slowdown)
+                pause = retry_after if retry_after is not None else self.slowdown * 60 / self.requests_per_minute
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                self._request_bucket = min(self._request_bucket, 0)
+            else:
+                self.slowdown = max(1.0, self.slowdown * 0.95)
+
+    @contextmanager
+    def request(self, tokens=0):
+        """Context manager that holds a slot for the duration of one request."""
+        self.acquire(tokens)
+        overloaded, retry_after = False, None
+        try:
+            yield
+        except Exception as e:
+            overloaded, retry_after = is_overload_error(e), get_retry_after(e)
+            raise
+        finally:
+            # Also frees the slot on cancellation and KeyboardInterrupt, which are not provider errors
+            self.release(overloaded=overloaded, retry_after=retry_after)
+
+    @asynccontextmanager
+    async def arequest(self, tokens=0):
+        """Async version of request."""
+        await self.aacquire(tokens)
+        overloaded, retry_after = False, None
+        try:
+            yield
+        except Exception as e:
+            overloaded, retry_after = is_overload_error(e), get_retry_after(e)
+            raise
+        finally:
+            self.release(overloaded=overloaded, retry_after=retry_after)
+
+    def stats(self):
+        """Returns the current state of the governor."""
+        with self._lock:
+            return {
+                'in_flight': self.in_flight,
+                'slowdown': self.slowdown,
+                'overload_errors': self.overload_errors,
+                'paused_for': max(0.0, self._paused_until - time.monotonic())
+            }
+
+
+def get_error_status_code(error):
+    """Returns the HTTP status code of a provider error, if it has one."""
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        # botocore errors
+        return response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+    for obj in (error, response):
+        for attr in ('status_code', 'status', 'http_status', 'code'):
+            value = getattr(obj, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_overload_error(error):
+    """Returns True if the error indicates that the provider is rate limiting or overloaded."""
+    status_code = get_error_status_code(error)
+    if status_code is not None:
+        return status_code in (429, 503, 529)
+    message = str(error).lower()
+    return any(marker in message for marker in ('rate limit', 'ratelimit', 'too many requests', 'throttl', 'overloaded', '429', '529'))
+
+
+def get_retry_after(error):
+    """Returns the number of seconds from the Retry-After header of a provider error response, if any."""
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        headers = response.get('ResponseMetadata', {}).get('HTTPHeaders')
+    else:
+        headers = getattr(response, 'headers', None) or getattr(error, 'headers', None)
+    if not headers:
+        return None
+    value = headers.get('retry-after') or headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+RETRYABLE_ERROR_NAMES = ('timeout', 'connection', 'ratelimit', 'throttl', 'overloaded', 'serviceunavailable', 'internalserver')
+
+def classify_llm_error(error):
+    """
+    Classifies an exception raised by a provider call.
+
+    Returns:
+        str: 'retryable' for transient errors (rate limiting, overload, 5xx, timeouts, connection errors),
+        'fatal' for everything else (e.g. authentication errors, invalid requests).
+    """
+    status_code = get_error_status_code(error)
+    if status_code is not None:
+        return 'retryable' if status_code in RETRYABLE_STATUS_CODES else 'fatal'
+    if isinstance(error, (TimeoutError, ConnectionError, asyncio.TimeoutError)):
+        return 'retryable'
+    error_name = type(error).__name__.lower()
+    if any(marker in error_name for marker in RETRYABLE_ERROR_NAMES) or is_overload_error(error):
+        return 'retryable'
+    return 'fatal'
+
+
+def get_transport_retry_delay(error, attempt, base_delay=1.0, max_delay=60.0):
+    """
+    Returns how long to wait before retrying after a transient error: the Retry-After of the response if given,
+    otherwise exponential backoff with full jitter.
+    """
+    retry_after = get_retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+
+def call_with_transport_retries(func, max_attempts=5, max_wait=120):
+    """
+    Calls func(), retrying transient provider errors (see classify_llm_error) with backoff.
+
+    Args:
+        func (callable): The provider call.
+        max_attempts (int): Attempt budget of the call, including the first attempt.
+        max_wait (float): Maximum total seconds to spend waiting between attempts.
+
+    Returns:
+        The return value of func. Fatal errors, and the last error once the budget is spent, are raised.
+    """
+    waited = 0
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func()
+        except Exception as e:
+            delay = get_transport_retry_delay(e, attempt)
+            if classify_llm_error(e) == 'fatal' or attempt == max_attempts or waited + delay > max_wait:
+                raise
+            print(f"Transient LLM error on attempt {attempt}: {type(e).__name__}: {e}. Retrying in {delay:.1f}s...")
+            time.sleep(delay)
+            waited += delay
+
+
+async def acall_with_transport_retries(func, max_attempts=5, max_wait=120):
+    """Async version of call_with_transport_retries; func is a coroutine function."""
+    waited = 0
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await func()
+        except Exception as e:
+            delay = get_transport_retry_delay(e, attempt)
+            if classify_llm_error(e) == 'fatal' or attempt == max_attempts or waited + delay > max_wait:
+                raise
+            print(f"Transient LLM error on attempt {attempt}: {type(e).__name__}: {e}. Retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+def estimate_llm_tokens(messages, max_tokens=None):
+    """Estimates the tokens of a request as about four characters per prompt token plus max_tokens."""
+    prompt_characters = sum(len(msg['content']) if isinstance(msg['content'], str) else len(str(msg['content'])) for msg in messages)
+    return prompt_characters // 4 + int(max_tokens or 0)
+
+
+_llm_governors = {}
+_llm_governors_lock = threading.Lock()
+
+def get_llm_governor(config=None):
+    """
+    Returns the LLMGovernor of the provider and model in config (default: the configured LLM), creating it on first use
+    from the requests_per_minute, tokens_per_minute, max_concurrency, max_bucket_size and check_every_n_seconds settings
+    passed to configure_llm_backend. The local provider has no request rate limit unless one is set, so that its
+    simulated latencies and errors are not compounded by the governor's throttling.
+    """
+    config = config or get_active_llm_config()
+    key = (config['provider'], config['model'])
+    governor = _llm_governors.get(key)
+    if governor is not None:
+        return governor
+    with _llm_governors_lock:
+        governor = _llm_governors.get(key)
+        if governor is None:
+            settings = {arg: config[arg] for arg in RATE_LIMIT_ARGS if config.get(arg) is not None}
+            if config['provider'] == 'local':
+                settings.setdefault('requests_per_minute', None)
+            governor = LLMGovernor(**settings)
+            _llm_governors[key] = governor
+        return governor
+
+
+def configure_llm_governor(provider, model, **kwargs):
+    """
+    Replaces the LLMGovernor of a provider and model, to set its limits without reconfiguring the backend.
+    kwargs are passed to LLMGovernor.
+
+    Example:
+        configure_llm_governor('openai', 'gpt-4o', requests_per_minute=500, tokens_per_minute=200000, max_concurrency=32)
+    """
+    governor = LLMGovernor(**kwargs)
+    with _llm_governors_lock:
+        _llm_governors[(provider.lower(), model)] = governor
+    return governor
+
+
 # Define a global thread-safe lock
 # csv_lock = threading.Lock()
 
+#LLM usage tracking
+class LLMUsage:
+    """
+    Totals of the LLM calls made in a track_llm_usage context: number of provider calls, cache hits,
+    input and output tokens, and the time spent waiting for the provider. Thread-safe.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.cached_calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latency = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, input_tokens=0, output_tokens=0, latency=0.0, cached=False):
+        """Adds one call (or cache hit, if cached) to the totals."""
+        with self._lock:
+            if cached:
+                self.cached_calls += 1
+                return
+            self.calls += 1
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+            self.latency += latency
+
+    def cost(self, input_cost=0.0, output_cost=0.0):
+        """Returns the cost of the recorded tokens, given the input and output prices per million tokens."""
+        return (self.input_tokens * input_cost + self.output_tokens * output_cost) / 1e6
+
+    def stats(self):
+        """Returns the totals as a dict."""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'cached_calls': self.cached_calls,
+                'input_tokens': self.input_tokens,
+                'output_tokens': self.output_tokens,
+                'latency': self.latency,
+                'mean_latency': self.latency / self.calls if self.calls else 0.0,
+            }
+
+
+_llm_usage = contextvars.ContextVar('llm_usage', default=None)
+
+@contextmanager
+def track_llm_usage():
+    """
+    Context manager that records the LLM calls made in this context, including threads started by
+    adata_dict_fapply, in a new LLMUsage.
+
+    Examples:
+        with track_llm_usage() as usage:
+            ai_annotate_cell_type_adata_dict(adata_dict, groupby='leiden')
+        print(usage.stats())
+    """
+    usage = LLMUsage()
+    token = _llm_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _llm_usage.reset(token)
+
+
+def get_llm_token_usage(response, messages):
+    """
+    Returns the (input_tokens, output_tokens) of a LangChain response, from its usage metadata if the provider
+    reports it, otherwise estimated from the lengths of the messages and the response.
+    """
+    usage = getattr(response, 'usage_metadata', None)
+    if not usage:
+        metadata = getattr(response, 'response_metadata', None) or {}
+        usage = metadata.get('token_usage') or metadata.get('usage') or {}
+    input_tokens = usage.get('input_tokens', usage.get('prompt_tokens'))
+    output_tokens = usage.get('output_tokens', usage.get('completion_tokens'))
+    if input_tokens is None:
+        input_tokens = estimate_llm_tokens(messages)
+    if output_tokens is None:
+        output_tokens = len(str(getattr(response, 'content', ''))) // 4
+    return int(input_tokens), int(output_tokens)
+
+
+def record_llm_usage(response=None, messages=None, latency=0.0, cached=False):
+    """Records a provider call (or a cache hit, if cached) in the LLMUsage of the current track_llm_usage context, if any."""
+    usage = _llm_usage.get()
+    if usage is None:
+        return
+    if cached:
+        usage.record(cached=True)
+        return
+    input_tokens, output_tokens = get_llm_token_usage(response, messages)
+    usage.record(input_tokens, output_tokens, latency)
+
+
 def call_llm(messages, **kwargs):
-    """Calls the configured LLM provider with the given parameters."""
-    config = get_llm_config()
-    llm = get_llm(**kwargs)
+    """
+    Calls the configured LLM provider with the given parameters.
+
+    If a cache is configured (see configure_llm_cache), identical requests are answered from the cache.
+    Pass use_cache=False to bypass it for this call.
+
+    Concurrent identical requests at temperature 0 (e.g. from threads in adata_dict_fapply) are coalesced into a
+    single provider call whose response is shared. Pass coalesce=False to always make a separate call, or coalesce=True
+    to also coalesce requests at other temperatures.
 
-    # Get the provider-specific parameter handler
-    _, kwargs = PROVIDER_MAPPING[config['provider']]['init_func']({}, **kwargs)
+    Transient provider errors (rate limiting, overload, 5xx, timeouts, connection errors) are retried with
+    backoff, up to max_transport_attempts attempts (default 5) and max_transport_wait seconds of waiting
+    (default 120). Other errors are raised immediately.
+
+    Pass backend= (an LLMBackend or the name of a registered one, see register_llm_backend) to use a backend
+    other than the one activated with use_llm_backend or configured with configure_llm_backend.
+
+    Calls made within track_llm_usage are recorded, with their tokens and latency, in its LLMUsage.
+    """
+    backend = resolve_llm_backend(kwargs.pop('backend', None))
+    config = backend.get_config() if backend is not None else get_llm_config()
+    use_cache = kwargs.pop('use_cache', True)
+    coalesce = kwargs.pop('coalesce', None)
+    if coalesce is None:
+        coalesce = is_deterministic_llm_call(kwargs)
+    max_transport_attempts = kwargs.pop('max_transport_attempts', 5)
+    max_transport_wait = kwargs.pop('max_transport_wait', 120)
+
+    request_key = None
+    if coalesce or (use_cache and _llm_cache is not None):
+        request_key = get_llm_request_key(messages, provider=config['provider'], model=config['model'], **kwargs)
+
+    cache_key = None
+    if use_cache and _llm_cache is not None:
+        cache_key = request_key
+        cached_response = _llm_cache.get(cache_key)
+        if cached_response is not None:
+            record_llm_usage(cached=True)
+            return cached_response
+
+    def call_provider():
+        content = call_with_transport_retries(lambda: invoke_llm(messages, config, backend=backend, **kwargs), max_transport_attempts, max_transport_wait)
+        if cache_key is not None:
+            _llm_cache.set(cache_key, content)
+        return content
+
+    if coalesce:
+        return _llm_single_flight.do(request_key, call_provider)
+    return call_provider()
+
+def prepare_llm_call(messages, config, backend=None, **kwargs):
+    """
+    Gets the LLM (of backend, if given) and converts messages and generation parameters for the provider described by config.
+
+    Returns:
+    tuple: (llm, langchain_messages, kwargs) ready for llm.invoke or llm.ainvoke.
+    """
+    llm = backend.get_llm(**kwargs) if backend is not None else get_llm(**kwargs)
+
+    # Convert the parameters with the provider-specific handler
+    kwargs = get_llm_call_kwargs(config, **kwargs)
 
     # Check if this model doesn't support system messages
     supports_system_messages = kwargs.pop('supports_system_messages', True)
@@ -493,16 +1593,33 @@ def call_llm(messages, **kwargs):
         'assistant': AIMessage
     }
 
+    # JSON mode requires the messages to ask for JSON
+    if kwargs.get('response_format') and messages and not any('json' in str(msg['content']).lower() for msg in messages):
+        messages = messages[:-1] + [{**messages[-1], 'content': f"{messages[-1]['content']} Respond with a JSON object."}]
+
     langchain_messages = [
         message_types.get(msg['role'], HumanMessage)(content=msg['content'])
         for msg in messages
     ]
 
+    return llm, langchain_messages, kwargs
+
+def invoke_llm(messages, config, backend=None, **kwargs):
+    """Sends messages to the LLM provider described by config (using backend, if given) and returns the response content."""
+    request_hash = get_llm_request_hash(messages, config, **kwargs)
+    llm, langchain_messages, kwargs = prepare_llm_call(messages, config, backend=backend, **kwargs)
+    if config['provider'] == 'local':
+        kwargs['request_hash'] = request_hash
+
     # Log timestamp for when the request is sent
     # request_timestamp = time.time()
 
-    # Call the LLM with the processed parameters
-    response = llm(langchain_messages, **kwargs)
+    # Call the LLM with the processed parameters, within the rate limits of this provider and model
+    with get_llm_governor(config).request(estimate_llm_tokens(messages, kwargs.get('max_tokens'))):
+        start = time.monotonic()
+        response = llm(langchain_messages, **kwargs)
+        latency = time.monotonic() - start
+        record_llm_usage(response, messages, latency)
 
     # Log timestamp for when the response is received
     # response_timestamp = time.time()
@@ -527,12 +1644,110 @@ def call_llm(messages, **kwargs):
     #             response.content.strip()
     #         ])
 
-    # Write the response to a file instead of printing it
-    with open(os.getenv("RESPONSE_PATH", "response.txt"), "a") as f:
-        f.write(f"{response}\n")
+    log_llm_response(response, messages, config, latency, request_hash)
 
     return response.content.strip()
 
+
+#LLM response log
+_llm_response_log_settings = {'enabled': True, 'path': None, 'max_bytes': 10_000_000, 'backup_count': 5}
+_llm_response_logger = logging.getLogger('anndict.llm_responses')
+_llm_response_logger.propagate = False
+_llm_response_listener = None
+_llm_response_log_lock = threading.Lock()
+
+class LLMResponseLogFormatter(logging.Formatter):
+    """Formats a logged LLM response as a JSON line with its timestamp, provider, model, request hash, latency, tokens and content."""
+    def format(self, record):
+        entry = record.llm_response
+        response, messages = entry['response'], entry['messages']
+        input_tokens, output_tokens = get_llm_token_usage(response, messages) if messages is not None else (None, None)
+        return json.dumps({
+            'timestamp': entry['timestamp'],
+            'provider': entry['provider'],
+            'model': entry['model'],
+            'request_hash': entry['request_hash'],
+            'latency': entry['latency'],
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'response': getattr(response, 'content', response),
+        }, default=str)
+
+
+def get_llm_response_logger():
+    """
+    Returns the logger of LLM responses, starting its background writer on first use, or None if the
+    response log is disabled (see configure_llm_response_log).
+    """
+    global _llm_response_listener
+    if not _llm_response_log_settings['enabled']:
+        return None
+    if _llm_response_listener is None:
+        with _llm_response_log_lock:
+            if _llm_response_listener is None:
+                path = _llm_response_log_settings['path'] or os.getenv("RESPONSE_PATH", "response.jsonl")
+                file_handler = RotatingFileHandler(path, maxBytes=_llm_response_log_settings['max_bytes'],
+                                                   backupCount=_llm_response_log_settings['backup_count'], encoding='utf-8', delay=True)
+                file_handler.setFormatter(LLMResponseLogFormatter())
+                log_queue = queue.SimpleQueue()
+                _llm_response_logger.handlers = [QueueHandler(log_queue)]
+                _llm_response_logger.setLevel(logging.INFO)
+                listener = QueueListener(log_queue, file_handler)
+                listener.start()
+                _llm_response_listener = listener
+    return _llm_response_logger
+
+
+def stop_llm_response_log():
+    """Writes the pending entries of the LLM response log and stops its background writer."""
+    global _llm_response_listener
+    with _llm_response_log_lock:
+        if _llm_response_listener is not None:
+            _llm_response_listener.stop()
+            for handler in _llm_response_listener.handlers:
+                handler.close()
+            _llm_response_logger.handlers = []
+            _llm_response_listener = None
+
+atexit.register(stop_llm_response_log)
+
+
+def configure_llm_response_log(enabled=True, path=None, max_bytes=10_000_000, backup_count=5):
+    """
+    Configures the log of LLM responses. Responses are queued by the calling thread and written as JSON lines
+    (timestamp, provider, model, request hash, latency, tokens and content) by a background thread.
+
+    Args:
+        enabled (bool): Set to False to disable the log entirely, e.g. for throughput runs.
+        path (str, optional): Path of the log file. Defaults to the RESPONSE_PATH environment variable, or response.jsonl.
+        max_bytes (int): Size at which the log file is rotated.
+        backup_count (int): Number of rotated log files to keep.
+    """
+    stop_llm_response_log()
+    _llm_response_log_settings.update(enabled=enabled, path=path, max_bytes=max_bytes, backup_count=backup_count)
+
+
+def log_llm_response(response, messages=None, config=None, latency=None, request_hash=None):
+    """Queues an LLM response for the response log (see configure_llm_response_log). request_hash is computed by get_llm_request_hash."""
+    logger = get_llm_response_logger()
+    if logger is None:
+        return
+    logger.handle(logging.makeLogRecord({
+        'name': logger.name,
+        'levelno': logging.INFO,
+        'levelname': 'INFO',
+        'msg': '',
+        'llm_response': {
+            'timestamp': time.time(),
+            'provider': config['provider'] if config is not None else None,
+            'model': config['model'] if config is not None else None,
+            'latency': latency,
+            'request_hash': request_hash,
+            'response': response,
+            'messages': messages,
+        },
+    }))
+
 def retry_llm_call(messages, process_response, failure_handler, max_attempts=5, call_llm_kwargs=None, process_response_kwargs=None, failure_handler_kwargs=None):
     """
     A generic wrapper for LLM calls that implements retry logic with custom processing and failure handling.
@@ -568,11 +1783,174 @@ def retry_llm_call(messages, process_response, failure_handler, max_attempts=5,
         except Exception as e:
             print(f"Attempt {attempt} failed: {str(e)}. Retrying...")
             print(f"Response from failed attempt:\n{response}")
+            # Don't serve the unusable response again on the next attempt or a later run
+            invalidate_llm_cache_entry(messages, **call_llm_kwargs)
     
     # If we've exhausted all attempts, call the failure handler
     print(f"All {max_attempts} attempts failed. Calling failure handler.")
     return failure_handler(**failure_handler_kwargs)
 
+
+#Async LLM calls
+class AsyncSingleFlight:
+    """
+    Event-loop counterpart of SingleFlight: while a coroutine for a key is in flight, other tasks with the
+    same key await its result instead of starting their own.
+    """
+    def __init__(self):
+        self.coalesced = 0
+        self._in_flight = {}
+
+    async def do(self, key, func, *args, **kwargs):
+        """Returns await func(*args, **kwargs), sharing the result with concurrent tasks of the same key."""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved in case no other task is waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+
+_llm_max_concurrency = 64
+_async_llm_state = weakref.WeakKeyDictionary()
+
+def configure_llm_concurrency(max_concurrency):
+    """
+    Sets the maximum number of concurrent requests made by acall_llm within an event loop.
+    Applies to event loops that have not made a request yet.
+
+    Args:
+    max_concurrency (int): Maximum number of requests in flight at once (default: 64).
+    """
+    global _llm_max_concurrency
+    _llm_max_concurrency = max_concurrency
+
+
+def get_async_llm_state():
+    """Returns the semaphore and single-flight of the running event loop, creating them on first use."""
+    loop = asyncio.get_running_loop()
+    state = _async_llm_state.get(loop)
+    if state is None:
+        state = {'semaphore': asyncio.Semaphore(_llm_max_concurrency), 'single_flight': AsyncSingleFlight()}
+        _async_llm_state[loop] = state
+    return state
+
+
+async def acall_llm(messages, **kwargs):
+    """
+    Async version of call_llm. Calls the configured LLM provider with LangChain's ainvoke, so many requests
+    can run concurrently on one event loop instead of one OS thread each. The number of requests in flight
+    is bounded by a per-loop semaphore (see configure_llm_concurrency).
+
+    Accepts the same keyword arguments as call_llm, including use_cache, coalesce, max_transport_attempts, max_transport_wait and backend.
+    """
+    backend = resolve_llm_backend(kwargs.pop('backend', None))
+    config = backend.get_config() if backend is not None else get_llm_config()
+    use_cache = kwargs.pop('use_cache', True)
+    coalesce = kwargs.pop('coalesce', None)
+    if coalesce is None:
+        coalesce = is_deterministic_llm_call(kwargs)
+    max_transport_attempts = kwargs.pop('max_transport_attempts', 5)
+    max_transport_wait = kwargs.pop('max_transport_wait', 120)
+    state = get_async_llm_state()
+
+    request_key = None
+    if coalesce or (use_cache and _llm_cache is not None):
+        request_key = get_llm_request_key(messages, provider=config['provider'], model=config['model'], **kwargs)
+
+    cache_key = None
+    if use_cache and _llm_cache is not None:
+        cache_key = request_key
+        cached_response = _llm_cache.get(cache_key)
+        if cached_response is not None:
+            record_llm_usage(cached=True)
+            return cached_response
+
+    async def ainvoke_llm():
+        request_hash = get_llm_request_hash(messages, config, **kwargs)
+        llm, langchain_messages, provider_kwargs = prepare_llm_call(messages, config, backend=backend, **kwargs)
+        if config['provider'] == 'local':
+            provider_kwargs['request_hash'] = request_hash
+        async with state['semaphore']:
+            async with get_llm_governor(config).arequest(estimate_llm_tokens(messages, provider_kwargs.get('max_tokens'))):
+                start = time.monotonic()
+                response = await llm.ainvoke(langchain_messages, **provider_kwargs)
+                latency = time.monotonic() - start
+                record_llm_usage(response, messages, latency)
+        log_llm_response(response, messages, config, latency, request_hash)
+        return response.content.strip()
+
+    async def call_provider():
+        content = await acall_with_transport_retries(ainvoke_llm, max_transport_attempts, max_transport_wait)
+        if cache_key is not None:
+            _llm_cache.set(cache_key, content)
+        return content
+
+    if coalesce:
+        return await state['single_flight'].do(request_key, call_provider)
+    return await call_provider()
+
+
+async def aretry_llm_call(messages, process_response, failure_handler, max_attempts=5, call_llm_kwargs=None, process_response_kwargs=None, failure_handler_kwargs=None):
+    """
+    Async version of retry_llm_call, using acall_llm. process_response and failure_handler are regular functions.
+    """
+    call_llm_kwargs = dict(call_llm_kwargs or {})
+    process_response_kwargs = process_response_kwargs or {}
+    failure_handler_kwargs = failure_handler_kwargs or {}
+
+    for attempt in range(1, max_attempts + 1):
+        # Adjust temperature if it's in call_llm_kwargs
+        if 'temperature' in call_llm_kwargs:
+            call_llm_kwargs['temperature'] = 0 if attempt <= 2 else (attempt - 2) * 0.025
+
+        # Call the LLM
+        response = await acall_llm(messages=messages, **call_llm_kwargs)
+
+        # Attempt to process the response
+        try:
+            processed_result = process_response(response, **process_response_kwargs)
+            return processed_result
+        except Exception as e:
+            print(f"Attempt {attempt} failed: {str(e)}. Retrying...")
+            print(f"Response from failed attempt:\n{response}")
+            # Don't serve the unusable response again on the next attempt or a later run
+            invalidate_llm_cache_entry(messages, **call_llm_kwargs)
+
+    # If we've exhausted all attempts, call the failure handler
+    print(f"All {max_attempts} attempts failed. Calling failure handler.")
+    return failure_handler(**failure_handler_kwargs)
+
+
+def run_async(coroutine):
+    """
+    Runs a coroutine to completion from synchronous code and returns its result.
+    Works inside Jupyter (where an event loop is already running) by running the coroutine on a separate thread,
+    in a copy of the current context so that use_llm_backend, track_llm_usage, etc. still apply.
+
+    Example:
+        results = run_async(aai_annotate_cell_type_adata_dict(adata_dict, groupby='leiden'))
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(contextvars.copy_context().run, asyncio.run, coroutine).result()
+
 def enforce_semantic_list(lst):
     error_message = "input list appears to contain any of: NaN, numeric, or numeric cast as string. Please ensure you are passing semantic labels (i.e. gene symbols or cell types) and not integer labels for AI interpretation. Make sure adata.var.index and adata.obs.index are not integers or integers cast as strings."
     
@@ -587,54 +1965,138 @@ def enforce_semantic_list(lst):
             before, after = get_context(lst, index)
             raise ValueError(f"{error_message} Item at index {index} is not a string: {item}. Context: Before: {before}, After: {after}")
 
-    # Check if any item can be converted to float
-    for index, item in enumerate(lst):
-        try:
-            float(item)
-        except ValueError:
-            pass
-        else:
-            before, after = get_context(lst, index)
-            raise ValueError(f"{error_message} Item at index {index} can be cast to a number: {item}. Context: Before: {before}, After: {after}")
+    # Check if any item can be converted to float
+    for index, item in enumerate(lst):
+        try:
+            float(item)
+        except ValueError:
+            pass
+        else:
+            before, after = get_context(lst, index)
+            raise ValueError(f"{error_message} Item at index {index} can be cast to a number: {item}. Context: Before: {before}, After: {after}")
+
+    return True
+    
+
+#Structured output
+_llm_structured_output = False
+
+def configure_llm_structured_output(enabled=True):
+    """
+    Turns structured output on or off for the label mapping functions (e.g. map_cell_type_labels_to_simplified_set).
+    When on, their batches ask for a JSON object, using the JSON mode of providers that have one (see JSON_MODE_PROVIDERS).
+    Responses are parsed with parse_ai_literal either way.
+
+    Args:
+    enabled (bool): Whether to ask for JSON output.
+    """
+    global _llm_structured_output
+    _llm_structured_output = enabled
+
+
+def find_ai_literal(ai_string, opening='{', close_truncated=False):
+    """
+    Returns the first literal that starts with opening ('{' or '[') in a generated string, up to its matching closing
+    bracket. Brackets inside quoted strings are ignored, so labels containing brackets don't end the literal early.
+
+    Args:
+    ai_string (str): The string generated by the LLM.
+    opening (str): '{' for a dictionary or '[' for a list.
+    close_truncated (bool): If True, a literal that is cut off (e.g. by max_tokens) is closed after its last complete
+        item. By default, it is treated as missing, so that callers retry rather than silently lose items.
+
+    Returns:
+    str: The literal, or an empty string if ai_string contains none (or only a cut off one).
+    """
+    closing = {'{': '}', '[': ']'}
+    start = ai_string.find(opening)
+    if start < 0:
+        return ''
+
+    stack, quote, escaped, last_item_end = [], None, False, None
+    for i in range(start, len(ai_string)):
+        char = ai_string[i]
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in closing:
+            stack.append(closing[char])
+        elif char in '}]':
+            stack.pop()
+            if not stack:
+                return ai_string[start:i+1]
+        elif char == ',' and len(stack) == 1:
+            last_item_end = i
+
+    # Cut off: keep the complete items and close the literal if asked to
+    if not close_truncated:
+        return ''
+    if last_item_end is None:
+        return ai_string[start] + closing[opening]
+    return ai_string[start:last_item_end] + closing[opening]
+
+
+def parse_ai_literal(ai_string, expected_type=dict, close_truncated=False):
+    """
+    Parses the first dictionary or list in a generated string without evaluating code. The literal is found with
+    find_ai_literal and read as JSON, or else as a Python literal (ast.literal_eval), also after removing trailing commas.
+
+    Args:
+    ai_string (str): The string generated by the LLM.
+    expected_type (type): dict or list.
+    close_truncated (bool): Whether to parse the complete items of a cut off literal (see find_ai_literal). Leave
+        False for label mappings, where a missing label would silently be mapped to itself.
+
+    Returns:
+    dict or list: The parsed literal.
+
+    Raises:
+    ValueError: If no literal of expected_type can be parsed.
+    """
+    literal = find_ai_literal(ai_string, '{' if expected_type is dict else '[', close_truncated)
+    candidates = [literal, re.sub(r',\s*([}\]])', r'\1', literal)]
+    for candidate in candidates:
+        for parse in (json.loads, ast.literal_eval):
+            try:
+                parsed = parse(candidate)
+            except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+                continue
+            if isinstance(parsed, expected_type):
+                return parsed
+    raise ValueError(f"Could not parse a {expected_type.__name__} from: {ai_string[:200]!r}")
 
-    return True
-    
 
 def extract_dictionary_from_ai_string(ai_string):
     """
     Cleans a generated string by removing everything before the first '{'
-    and everything after the first '}'.
+    and everything after its matching '}' (see find_ai_literal).
 
     Args:
     generated_string (str): The string generated by retry_call_llm which includes unwanted characters or code.
 
     Returns:
-    str: A cleaned string that can be evaluated as a dictionary.
+    str: A cleaned string that can be parsed as a dictionary (see parse_ai_literal).
     """
-    # Find the positions of the first '{' and the first '}'
-    start = ai_string.find('{')
-    end = ai_string.find('}')
-    # Extract the first substring that starts with '{' and ends with '}'
-    cleaned_string = ai_string[start:end+1]
-    return cleaned_string
+    return find_ai_literal(ai_string, '{')
 
 def extract_list_from_ai_string(ai_string):
     """
-    Cleans a generated string by removing everything before the first '{'
-    and everything after the first '}'.
+    Cleans a generated string by removing everything before the first '['
+    and everything after its matching ']' (see find_ai_literal).
 
     Args:
     generated_string (str): The string generated by retry_call_llm which includes unwanted characters or code.
 
     Returns:
-    str: A cleaned string that can be evaluated as a dictionary.
+    str: A cleaned string that can be parsed as a list (see parse_ai_literal).
     """
-    # Find the positions of the first '{' and the first '}'
-    start = ai_string.find('[')
-    end = ai_string.find(']')
-    # Extract the first substring that starts with '{' and ends with '}'
-    cleaned_string = ai_string[start:end+1]
-    return cleaned_string
+    return find_ai_literal(ai_string, '[')
 
 
 def attempt_ai_integration(ai_func, fallback_func, *args, **kwargs):
@@ -700,37 +2162,398 @@ def process_llm_category_mapping(original_categories, llm_dict):
     dict: Mapping of original categories to simplified categories.
     """
     
-    # Normalize original categories and LLM keys
-    normalized_llm_keys = [normalize_string(key) for key in llm_dict.keys()]
-    
+    # Index the LLM keys by normalized form (the first key of each normalized form is used)
+    llm_key_index = {}
+    for key in llm_dict.keys():
+        llm_key_index.setdefault(normalize_string(key), key)
+
+    # Find closest matches for all categories without a direct match at once
+    normalized_categories = [normalize_string(original) for original in original_categories]
+    unmatched = [normalized for normalized in dict.fromkeys(normalized_categories) if normalized not in llm_key_index]
+    close_matches = dict(zip(unmatched, get_closest_matches(unmatched, list(llm_key_index), cutoff=0.6)))
+
     # Create mapping
     final_mapping = {}
-    for original in original_categories:
-        normalized = normalize_string(original)
-        if normalized in normalized_llm_keys:
-            # Direct match found
-            index = normalized_llm_keys.index(normalized)
-            final_mapping[original] = llm_dict[list(llm_dict.keys())[index]]
+    for original, normalized in zip(original_categories, normalized_categories):
+        match = normalized if normalized in llm_key_index else close_matches[normalized]
+        if match is not None:
+            final_mapping[original] = llm_dict[llm_key_index[match]]
         else:
-            # Find closest match
-            matches = get_close_matches(normalized, normalized_llm_keys, n=1, cutoff=0.6)
-            if matches:
-                index = normalized_llm_keys.index(matches[0])
-                final_mapping[original] = llm_dict[list(llm_dict.keys())[index]]
-            else:
-                # No match found, use original category
-                final_mapping[original] = original
+            # No match found, use original category
+            final_mapping[original] = original
+            record_failed_mapping_labels([original])
     
     return final_mapping
 
 #Label simplification functions
-def map_cell_type_labels_to_simplified_set(labels, simplification_level='', batch_size=50):
+class LabelMappingStore:
+    """
+    Persistent store of label mappings learned from the LLM, keyed by kind ('cell_type' or 'gene'), simplification_level
+    and source label, in a SQLite database. When a store is configured (see configure_label_mapping_store), the label
+    simplification functions look labels up in it first and only send unseen labels to the LLM.
+
+    Every write gets a new version number, and the full history is kept, so the mappings as of an earlier version can be
+    read back (e.g. to reproduce a previous atlas release). Manual overrides take precedence over learned mappings at any version.
+    Removing an override writes a tombstone (an override row with no target) in a new version rather than deleting history.
+
+    Args:
+        path (str): Path of the SQLite database. ':memory:' keeps the store in memory.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS label_mappings (kind TEXT, simplification_level TEXT, source TEXT, target TEXT, "
+            "version INTEGER, override INTEGER, PRIMARY KEY (kind, simplification_level, source, version))"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS label_mapping_versions (version INTEGER PRIMARY KEY AUTOINCREMENT, created REAL, origin TEXT, n_mappings INTEGER)"
+        )
+        self._connection.commit()
+
+    def _new_version(self, origin, n_mappings):
+        cursor = self._connection.execute(
+            "INSERT INTO label_mapping_versions (created, origin, n_mappings) VALUES (?, ?, ?)", (time.time(), origin, n_mappings)
+        )
+        return cursor.lastrowid
+
+    def _get_latest(self, labels, simplification_level, kind, version=None):
+        """
+        Returns ({label: learned target}, {label: override target}) of the latest rows of labels as of version. The
+        override target is None for labels whose override was removed.
+        """
+        labels = [str(label) for label in labels]
+        version = version if version is not None else 2**62
+        learned, overrides = {}, {}
+        with self._lock:
+            for start in range(0, len(labels), 500):
+                chunk = labels[start:start + 500]
+                rows = self._connection.execute(
+                    f"SELECT source, target, override FROM label_mappings WHERE kind = ? AND simplification_level = ? AND version <= ? "
+                    f"AND source IN ({','.join('?' * len(chunk))}) ORDER BY version ASC",
+                    (kind, simplification_level, version, *chunk)
+                ).fetchall()
+                for source, target, override in rows:
+                    (overrides if override else learned)[source] = target
+        return learned, overrides
+
+    def get_many(self, labels, simplification_level='', kind='cell_type', version=None):
+        """
+        Returns {label: target} for the labels that have a mapping, as of version (default: the latest).
+        An override, if any, is returned instead of the learned mapping.
+        """
+        learned, overrides = self._get_latest(labels, simplification_level, kind, version)
+        learned.update({source: target for source, target in overrides.items() if target is not None})
+        return learned
+
+    def put_many(self, mapping, simplification_level='', kind='cell_type', override=False, origin=None):
+        """
+        Stores {label: target} as a new version and returns its version number. Labels whose latest learned target (or,
+        with override=True, whose current override) is unchanged are skipped. With override=True, the mappings are manual overrides.
+        """
+        learned, overrides = self._get_latest(list(mapping), simplification_level, kind)
+        current = overrides if override else learned
+        mapping = {str(source): str(target) for source, target in mapping.items() if current.get(str(source)) != str(target)}
+        if not mapping:
+            return None
+        with self._lock:
+            version = self._new_version(origin or ('override' if override else 'llm'), len(mapping))
+            self._connection.executemany(
+                "INSERT INTO label_mappings (kind, simplification_level, source, target, version, override) VALUES (?, ?, ?, ?, ?, ?)",
+                [(kind, simplification_level, source, target, version, int(override)) for source, target in mapping.items()]
+            )
+            self._connection.commit()
+        return version
+
+    def set_overrides(self, mapping, simplification_level='', kind='cell_type'):
+        """Stores manual overrides {label: target}, which take precedence over mappings learned from the LLM."""
+        return self.put_many(mapping, simplification_level, kind, override=True)
+
+    def remove_overrides(self, labels, simplification_level='', kind='cell_type'):
+        """
+        Removes the manual overrides of labels, so that their learned mappings apply again, and returns the version number
+        of the removal. The removal is recorded as a tombstone (an override with no target), so earlier versions still read back the overrides.
+        """
+        _, overrides = self._get_latest(labels, simplification_level, kind)
+        sources = [source for source, target in overrides.items() if target is not None]
+        if not sources:
+            return None
+        with self._lock:
+            version = self._new_version('remove_override', len(sources))
+            self._connection.executemany(
+                "INSERT INTO label_mappings (kind, simplification_level, source, target, version, override) VALUES (?, ?, ?, NULL, ?, 1)",
+                [(kind, simplification_level, source, version) for source in sources]
+            )
+            self._connection.commit()
+        return version
+
+    def get_targets(self, simplification_level='', kind='cell_type'):
+        """Returns the set of target labels currently stored for a simplification level."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT target FROM label_mappings WHERE kind = ? AND simplification_level = ? AND target IS NOT NULL", (kind, simplification_level)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def versions(self):
+        """Returns a DataFrame of the versions of the store, with the time, origin and number of mappings of each."""
+        with self._lock:
+            return pd.read_sql_query("SELECT * FROM label_mapping_versions ORDER BY version", self._connection)
+
+    def to_dataframe(self, simplification_level=None, kind=None):
+        """Returns all stored mappings, including past versions, overrides and removed overrides (with no target), as a DataFrame."""
+        query, params = "SELECT * FROM label_mappings WHERE 1 = 1", []
+        if simplification_level is not None:
+            query, params = query + " AND simplification_level = ?", params + [simplification_level]
+        if kind is not None:
+            query, params = query + " AND kind = ?", params + [kind]
+        with self._lock:
+            return pd.read_sql_query(query + " ORDER BY kind, simplification_level, source, version", self._connection, params=params)
+
+    def clear(self):
+        """Removes all mappings and versions."""
+        with self._lock:
+            self._connection.execute("DELETE FROM label_mappings")
+            self._connection.execute("DELETE FROM label_mapping_versions")
+            self._connection.commit()
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_label_mapping_store = None
+
+def configure_label_mapping_store(path=None, enabled=True):
+    """
+    Configures the LabelMappingStore consulted by map_cell_type_labels_to_simplified_set and map_gene_labels_to_simplified_set
+    (and so by ai_unify_labels, simplify_obs_column, create_label_hierarchy, etc.). The store is off until this is called.
+
+    Args:
+        path (str): Path of the SQLite database.
+        enabled (bool): If False, remove the store so that all labels are sent to the LLM.
+
+    Returns:
+        LabelMappingStore or None: The configured store.
+
+    Examples:
+        store = configure_label_mapping_store('label_mappings.sqlite')
+
+        # Fix a mapping by hand
+        store.set_overrides({'Tregs': 'Regulatory T cell'}, simplification_level='unified, typo-fixed')
+    """
+    global _label_mapping_store
+    if _label_mapping_store is not None:
+        _label_mapping_store.close()
+    _label_mapping_store = LabelMappingStore(path) if enabled and path is not None else None
+    return _label_mapping_store
+
+
+def get_label_mapping_store():
+    """Returns the configured LabelMappingStore, or None if there is none."""
+    return _label_mapping_store
+
+
+def split_stored_labels(labels, simplification_level, kind):
+    """Returns (stored mapping, unseen labels) for labels, using the configured LabelMappingStore."""
+    stored_mapping = _label_mapping_store.get_many(labels, simplification_level, kind)
+    unseen_labels = [label for label in dict.fromkeys(labels) if str(label) not in stored_mapping]
+    return stored_mapping, unseen_labels
+
+
+_failed_mapping_labels = contextvars.ContextVar('failed_mapping_labels', default=None)
+
+@contextmanager
+def track_failed_mapping_labels():
+    """
+    Context manager that collects, in a new set, the labels that the label simplification functions called in this
+    context could not map: labels of batches that fell back to the failure handler, and labels with no match in the LLM output.
+    """
+    failed_labels = set()
+    token = _failed_mapping_labels.set(failed_labels)
+    try:
+        yield failed_labels
+    finally:
+        _failed_mapping_labels.reset(token)
+
+
+def record_failed_mapping_labels(labels):
+    """Adds labels to the set of the enclosing track_failed_mapping_labels, if any."""
+    failed_labels = _failed_mapping_labels.get()
+    if failed_labels is not None:
+        failed_labels.update(str(label) for label in labels)
+
+
+def store_learned_labels(labels, stored_mapping, new_mapping, simplification_level, kind, failed_labels=()):
+    """
+    Stores the mappings of newly mapped labels in the configured LabelMappingStore and returns the mapping of all labels.
+    New targets that are trivial variants (see canonicalize_label) of an already stored target are replaced by it,
+    so that labels mapped in different runs stay consistent. Labels in failed_labels (see track_failed_mapping_labels)
+    are returned but not stored, so that they are sent to the LLM again next time.
+    """
+    existing_targets = {canonicalize_label(target): target for target in sorted(_label_mapping_store.get_targets(simplification_level, kind))}
+    new_mapping = {label: existing_targets.get(canonicalize_label(target), target) for label, target in new_mapping.items()}
+    _label_mapping_store.put_many({label: target for label, target in new_mapping.items() if str(label) not in failed_labels},
+                                  simplification_level, kind)
+    return {label: stored_mapping[str(label)] if str(label) in stored_mapping else new_mapping[label] for label in labels}
+
+
+def get_cell_type_simplification_messages(labels, simplification_level=''):
+    """Returns the opening messages of a cell type label simplification conversation."""
+    # Prepare the initial prompt
+    initial_labels_str = "    ".join(labels)
+
+    return [
+        {"role": "system", "content": f"You are a python dictionary mapping generator that takes a list of categories and provides a mapping to a {simplification_level} simplified set as a dictionary. Generate only a dictionary. Example: Fibroblast.    Fibroblasts.    CD8-positive T Cells.    CD4-positive T Cells. -> {{'Fibroblast.':'Fibroblast','Fibroblasts.':'Fibroblast','CD8-positive T Cells.':'T Cell','CD4-positive T Cells.':'T Cell'}}"},
+        {"role": "user", "content": f"Here is the full list of labels to be simplified: {initial_labels_str}. Acknowledge that you've seen all labels. Do not provide the mapping yet."}
+    ]
+
+
+def process_simplification_response(response):
+    """Parses the dictionary out of a label simplification response."""
+    return parse_ai_literal(response, dict)
+
+
+def get_mapping_call_kwargs(batch_labels, backend=None):
+    """Returns the call_llm kwargs of one batch of a label mapping, asking for JSON if structured output is enabled (see configure_llm_structured_output)."""
+    call_llm_kwargs = {
+        'max_tokens': min(300 + 25*len(batch_labels), 4000),
+        'temperature': 0,
+        'backend': backend
+    }
+    if _llm_structured_output:
+        call_llm_kwargs['response_format'] = 'json'
+    return call_llm_kwargs
+
+
+def simplification_failure_handler(labels):
+    """Maps each label to itself when simplification fails."""
+    print(f"Simplification failed for labels: {labels}")
+    record_failed_mapping_labels(labels)
+    return {label: label for label in labels}
+
+
+def gene_simplification_failure_handler(labels):
+    """Maps each gene label to itself when simplification fails."""
+    print(f"Simplification failed for gene labels: {labels}")
+    record_failed_mapping_labels(labels)
+    return {label: label for label in labels}
+
+
+def get_stateless_batch_context(labels, vocabulary=None, label_kind='labels'):
+    """
+    Returns the context sent with every batch of a stateless batched mapping: the short target vocabulary if given,
+    otherwise the full list of labels.
+    """
+    if vocabulary is not None:
+        return f"Map each of the {label_kind} to one of these target labels where possible: {'    '.join(vocabulary)}."
+    return f"Here is the full list of {label_kind} to be simplified: {'    '.join(labels)}. Map each batch consistently with this full list."
+
+
+def get_stateless_batch_messages(system_message, context, batch_labels, label_kind='labels'):
+    """Returns the messages of one batch of a stateless batched mapping, which do not depend on the other batches."""
+    batch_str = "    ".join(batch_labels)
+    return [
+        system_message,
+        {"role": "user", "content": f"{context}\nProvide a mapping for this batch of {label_kind}. Generate only a dictionary: {batch_str} -> "}
+    ]
+
+
+def map_labels_in_stateless_batches(labels, system_message, context, label_kind, process_response, failure_handler, batch_size=50, num_workers=None, backend=None):
+    """
+    Maps labels in batches that each send only system_message and context (see get_stateless_batch_context), not the
+    previous batches, so they are sent in parallel. Returns the union of the batch mappings.
+    """
+    def map_batch(batch_labels):
+        return retry_llm_call(
+            messages=get_stateless_batch_messages(system_message, context, batch_labels, label_kind),
+            process_response=process_response,
+            failure_handler=failure_handler,
+            call_llm_kwargs=get_mapping_call_kwargs(batch_labels, backend),
+            failure_handler_kwargs={'labels': batch_labels}
+        )
+
+    batches = [labels[i:i+batch_size] for i in range(0, len(labels), batch_size)]
+    full_mapping = {}
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, map_batch, batch) for batch in batches]
+        for future in futures:
+            full_mapping.update(future.result())
+    return full_mapping
+
+
+async def amap_labels_in_stateless_batches(labels, system_message, context, label_kind, process_response, failure_handler, batch_size=50, backend=None):
+    """Async version of map_labels_in_stateless_batches. The batches are sent concurrently on the running event loop."""
+    async def map_batch(batch_labels):
+        return await aretry_llm_call(
+            messages=get_stateless_batch_messages(system_message, context, batch_labels, label_kind),
+            process_response=process_response,
+            failure_handler=failure_handler,
+            call_llm_kwargs=get_mapping_call_kwargs(batch_labels, backend),
+            failure_handler_kwargs={'labels': batch_labels}
+        )
+
+    batch_mappings = await asyncio.gather(*[map_batch(labels[i:i+batch_size]) for i in range(0, len(labels), batch_size)])
+    full_mapping = {}
+    for batch_mapping in batch_mappings:
+        full_mapping.update(batch_mapping)
+    return full_mapping
+
+
+def get_reconciliation_context(targets, label_kind='labels'):
+    """Returns the context of the reconciliation pass over the simplified labels produced by separate batches."""
+    return (f"These {label_kind} were simplified in separate batches, so some of them may be synonyms or variants (e.g. plural forms, "
+            f"abbreviations or typos) of each other. Map them to one consistent set: {'    '.join(targets)}.")
+
+
+def reconcile_label_mapping(mapping, system_message, label_kind, process_response, failure_handler, batch_size=50, num_workers=None, backend=None):
+    """
+    Reconciliation pass of a stateless batched mapping: maps the union of the batch outputs to one consistent set,
+    and returns mapping with its values replaced accordingly.
+    """
+    targets = sorted({str(value) for value in mapping.values()})
+    if len(targets) < 2:
+        return mapping
+    target_mapping = map_labels_in_stateless_batches(targets, system_message, get_reconciliation_context(targets, label_kind), label_kind,
+                                                     process_response, failure_handler, batch_size, num_workers, backend)
+    target_mapping = process_llm_category_mapping(targets, target_mapping)
+    return {label: target_mapping[str(value)] for label, value in mapping.items()}
+
+
+async def areconcile_label_mapping(mapping, system_message, label_kind, process_response, failure_handler, batch_size=50, backend=None):
+    """Async version of reconcile_label_mapping."""
+    targets = sorted({str(value) for value in mapping.values()})
+    if len(targets) < 2:
+        return mapping
+    target_mapping = await amap_labels_in_stateless_batches(targets, system_message, get_reconciliation_context(targets, label_kind), label_kind,
+                                                            process_response, failure_handler, batch_size, backend)
+    target_mapping = process_llm_category_mapping(targets, target_mapping)
+    return {label: target_mapping[str(value)] for label, value in mapping.items()}
+
+
+def map_cell_type_labels_to_simplified_set(labels, simplification_level='', batch_size=50, backend=None, parallel=False, num_workers=None, vocabulary=None, group_threshold=None, use_mapping_store=True):
     """
     Maps a list of labels to a smaller set of labels using the AI, processing in batches.
     Args:
     labels (list of str): The list of labels to be mapped.
     simplification_level (str): A qualitative description of how much you want the labels to be simplified. Or a direction about how to simplify the labels. Could be anything, like 'extremely', 'barely', 'compartment-level', 'remove-typos'
     batch_size (int): The number of labels to process in each batch.
+    backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
+    parallel (bool): If True, each batch is sent as an independent request with a compact fixed context (the full label list,
+        or vocabulary) instead of the growing conversation of all previous batches. The batches are sent in parallel, and their
+        outputs reconciled by a final pass.
+    num_workers (int, optional): Maximum number of batches sent at once when parallel is True.
+    vocabulary (list of str, optional): Target labels to send as the context of each batch instead of the full label list, when parallel is True.
+    group_threshold (float, optional): If given, labels that are trivial variants of each other (casing, punctuation, plurals,
+        marker notation, or a character n-gram similarity of at least group_threshold) are grouped offline first, see group_similar_labels.
+        Only one label per group is sent to the LLM, and its mapping is applied to the whole group.
+    use_mapping_store (bool): If True and a LabelMappingStore is configured (see configure_label_mapping_store), labels already
+        mapped at this simplification_level are taken from the store, and only unseen labels are sent to the LLM and then stored.
     Returns:
     dict: A dictionary mapping the original labels to the smaller set of labels.
     """
@@ -738,21 +2561,40 @@ def map_cell_type_labels_to_simplified_set(labels, simplification_level='', batc
     #enforce that labels are semantic
     enforce_semantic_list(labels)
 
-    # Prepare the initial prompt
-    initial_labels_str = "    ".join(labels)
-    
+    if use_mapping_store and _label_mapping_store is not None:
+        stored_mapping, unseen_labels = split_stored_labels(labels, simplification_level, 'cell_type')
+        with track_failed_mapping_labels() as failed_labels:
+            new_mapping = map_cell_type_labels_to_simplified_set(unseen_labels, simplification_level, batch_size, backend, parallel, num_workers, vocabulary,
+                                                                 group_threshold, use_mapping_store=False) if unseen_labels else {}
+        return store_learned_labels(labels, stored_mapping, new_mapping, simplification_level, 'cell_type', failed_labels)
+
+    if group_threshold is not None:
+        label_groups = group_similar_labels(labels, threshold=group_threshold)
+        representative_mapping = map_cell_type_labels_to_simplified_set(list(dict.fromkeys(label_groups.values())), simplification_level, batch_size,
+                                                                        backend, parallel, num_workers, vocabulary, use_mapping_store=False)
+        # Labels whose representative could not be mapped could not be mapped either
+        failed_labels = _failed_mapping_labels.get()
+        if failed_labels:
+            record_failed_mapping_labels([label for label in labels if str(label_groups[label]) in failed_labels])
+        return {label: representative_mapping[label_groups[label]] for label in labels}
+
     # Prepare the messages for the Chat Completions API
-    messages = [
-        {"role": "system", "content": f"You are a python dictionary mapping generator that takes a list of categories and provides a mapping to a {simplification_level} simplified set as a dictionary. Generate only a dictionary. Example: Fibroblast.    Fibroblasts.    CD8-positive T Cells.    CD4-positive T Cells. -> {{'Fibroblast.':'Fibroblast','Fibroblasts.':'Fibroblast','CD8-positive T Cells.':'T Cell','CD4-positive T Cells.':'T Cell'}}"},
-        {"role": "user", "content": f"Here is the full list of labels to be simplified: {initial_labels_str}. Acknowledge that you've seen all labels. Do not provide the mapping yet."}
-    ]
+    messages = get_cell_type_simplification_messages(labels, simplification_level)
+
+    if parallel and len(labels) > batch_size:
+        context = get_stateless_batch_context(labels, vocabulary)
+        full_mapping = map_labels_in_stateless_batches(labels, messages[0], context, 'labels', process_simplification_response,
+                                                       simplification_failure_handler, batch_size, num_workers, backend)
+        full_mapping = reconcile_label_mapping(full_mapping, messages[0], 'labels', process_simplification_response,
+                                               simplification_failure_handler, batch_size, num_workers, backend)
+        return process_llm_category_mapping(labels, full_mapping)
 
     # Get initial acknowledgment
     initial_response = retry_llm_call(
         messages=messages,
         process_response=lambda x: x,
         failure_handler=lambda: "Failed to process initial prompt",
-        call_llm_kwargs={'max_tokens': 30, 'temperature': 0},
+        call_llm_kwargs={'max_tokens': 30, 'temperature': 0, 'backend': backend},
         max_attempts=1
     )
     messages.append({"role": "assistant", "content": initial_response})
@@ -760,25 +2602,14 @@ def map_cell_type_labels_to_simplified_set(labels, simplification_level='', batc
     def process_batch(batch_labels):
         batch_str = "    ".join(batch_labels)
         messages.append({"role": "user", "content": f"Provide a mapping for this batch of labels. Generate only a dictionary: {batch_str} -> "})
-        
-        def process_response(response):
-            cleaned_mapping = extract_dictionary_from_ai_string(response)
-            return eval(cleaned_mapping)
-
-        def failure_handler(labels):
-            print(f"Simplification failed for labels: {labels}")
-            return {label: label for label in labels}
-
-        call_llm_kwargs = {
-            'max_tokens': min(300 + 25*len(batch_labels), 4000),
-            'temperature': 0
-        }
+
+        call_llm_kwargs = get_mapping_call_kwargs(batch_labels, backend)
         failure_handler_kwargs = {'labels': batch_labels}
 
         batch_mapping = retry_llm_call(
             messages=messages,
-            process_response=process_response,
-            failure_handler=failure_handler,
+            process_response=process_simplification_response,
+            failure_handler=simplification_failure_handler,
             call_llm_kwargs=call_llm_kwargs,
             failure_handler_kwargs=failure_handler_kwargs
         )
@@ -798,19 +2629,99 @@ def map_cell_type_labels_to_simplified_set(labels, simplification_level='', batc
     return final_mapping
 
 
-def map_gene_labels_to_simplified_set(labels, simplification_level='', batch_size=50):
+async def amap_cell_type_labels_to_simplified_set(labels, simplification_level='', batch_size=50, backend=None, parallel=False, vocabulary=None, group_threshold=None, use_mapping_store=True):
+    """
+    Async version of map_cell_type_labels_to_simplified_set. The batches of one call are sent in sequence
+    because each builds on the previous answers, unless parallel is True, in which case they are sent
+    concurrently. Many calls can run concurrently on one event loop.
+    """
+    #enforce that labels are semantic
+    enforce_semantic_list(labels)
+
+    if use_mapping_store and _label_mapping_store is not None:
+        stored_mapping, unseen_labels = split_stored_labels(labels, simplification_level, 'cell_type')
+        with track_failed_mapping_labels() as failed_labels:
+            new_mapping = await amap_cell_type_labels_to_simplified_set(unseen_labels, simplification_level, batch_size, backend, parallel, vocabulary,
+                                                                        group_threshold, use_mapping_store=False) if unseen_labels else {}
+        return store_learned_labels(labels, stored_mapping, new_mapping, simplification_level, 'cell_type', failed_labels)
+
+    if group_threshold is not None:
+        label_groups = group_similar_labels(labels, threshold=group_threshold)
+        representative_mapping = await amap_cell_type_labels_to_simplified_set(list(dict.fromkeys(label_groups.values())), simplification_level,
+                                                                               batch_size, backend, parallel, vocabulary, use_mapping_store=False)
+        # Labels whose representative could not be mapped could not be mapped either
+        failed_labels = _failed_mapping_labels.get()
+        if failed_labels:
+            record_failed_mapping_labels([label for label in labels if str(label_groups[label]) in failed_labels])
+        return {label: representative_mapping[label_groups[label]] for label in labels}
+
+    messages = get_cell_type_simplification_messages(labels, simplification_level)
+
+    if parallel and len(labels) > batch_size:
+        context = get_stateless_batch_context(labels, vocabulary)
+        full_mapping = await amap_labels_in_stateless_batches(labels, messages[0], context, 'labels', process_simplification_response,
+                                                              simplification_failure_handler, batch_size, backend)
+        full_mapping = await areconcile_label_mapping(full_mapping, messages[0], 'labels', process_simplification_response,
+                                                      simplification_failure_handler, batch_size, backend)
+        return process_llm_category_mapping(labels, full_mapping)
+
+    # Get initial acknowledgment
+    initial_response = await aretry_llm_call(
+        messages=messages,
+        process_response=lambda x: x,
+        failure_handler=lambda: "Failed to process initial prompt",
+        call_llm_kwargs={'max_tokens': 30, 'temperature': 0, 'backend': backend},
+        max_attempts=1
+    )
+    messages.append({"role": "assistant", "content": initial_response})
+
+    # Process all labels in batches
+    full_mapping = {}
+    for i in range(0, len(labels), batch_size):
+        batch_labels = labels[i:i+batch_size]
+        batch_str = "    ".join(batch_labels)
+        messages.append({"role": "user", "content": f"Provide a mapping for this batch of labels. Generate only a dictionary: {batch_str} -> "})
+
+        batch_mapping = await aretry_llm_call(
+            messages=list(messages),
+            process_response=process_simplification_response,
+            failure_handler=simplification_failure_handler,
+            call_llm_kwargs=get_mapping_call_kwargs(batch_labels, backend),
+            failure_handler_kwargs={'labels': batch_labels}
+        )
+        messages.append({"role": "assistant", "content": str(batch_mapping)})
+        full_mapping.update(batch_mapping)
+
+    # Final pass to ensure consistency
+    return process_llm_category_mapping(labels, full_mapping)
+
+
+def map_gene_labels_to_simplified_set(labels, simplification_level='', batch_size=50, backend=None, parallel=False, num_workers=None, vocabulary=None, use_mapping_store=True):
     """
     Maps a list of genes to a smaller set of labels using AI, processing in batches.
     Args:
     labels (list of str): The list of labels to be mapped.
     simplification_level (str): A qualitative description of how much you want the labels to be simplified.
     batch_size (int): The number of labels to process in each batch.
+    backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
+    parallel (bool): If True, the batches are sent in parallel as independent requests, as in map_cell_type_labels_to_simplified_set.
+    num_workers (int, optional): Maximum number of batches sent at once when parallel is True.
+    vocabulary (list of str, optional): Target labels to send as the context of each batch instead of the full label list, when parallel is True.
+    use_mapping_store (bool): If True and a LabelMappingStore is configured (see configure_label_mapping_store), labels already
+        mapped at this simplification_level are taken from the store, and only unseen labels are sent to the LLM and then stored.
     Returns:
     dict: A dictionary mapping the original labels to the smaller set of labels.
     """
     # Enforce that labels are semantic
     enforce_semantic_list(labels)
 
+    if use_mapping_store and _label_mapping_store is not None:
+        stored_mapping, unseen_labels = split_stored_labels(labels, simplification_level, 'gene')
+        with track_failed_mapping_labels() as failed_labels:
+            new_mapping = map_gene_labels_to_simplified_set(unseen_labels, simplification_level, batch_size, backend, parallel, num_workers, vocabulary,
+                                                            use_mapping_store=False) if unseen_labels else {}
+        return store_learned_labels(labels, stored_mapping, new_mapping, simplification_level, 'gene', failed_labels)
+
     # Prepare the initial prompt
     initial_labels_str = "    ".join(labels)
     
@@ -820,12 +2731,20 @@ def map_gene_labels_to_simplified_set(labels, simplification_level='', batch_siz
         {"role": "user", "content": f"Here is the full list of gene labels to be simplified: {initial_labels_str}. Acknowledge that you've seen all labels. Do not provide the mapping yet."}
     ]
 
+    if parallel and len(labels) > batch_size:
+        context = get_stateless_batch_context(labels, vocabulary, 'gene labels')
+        full_mapping = map_labels_in_stateless_batches(labels, messages[0], context, 'gene labels', process_simplification_response,
+                                                       gene_simplification_failure_handler, batch_size, num_workers, backend)
+        full_mapping = reconcile_label_mapping(full_mapping, messages[0], 'gene labels', process_simplification_response,
+                                               gene_simplification_failure_handler, batch_size, num_workers, backend)
+        return process_llm_category_mapping(labels, full_mapping)
+
     # Get initial acknowledgment
     initial_response = retry_llm_call(
         messages=messages,
         process_response=lambda x: x,
         failure_handler=lambda: "Failed to process initial prompt",
-        call_llm_kwargs={'max_tokens': 30, 'temperature': 0},
+        call_llm_kwargs={'max_tokens': 30, 'temperature': 0, 'backend': backend},
         max_attempts=1
     )
     messages.append({"role": "assistant", "content": initial_response})
@@ -833,25 +2752,14 @@ def map_gene_labels_to_simplified_set(labels, simplification_level='', batch_siz
     def process_batch(batch_labels):
         batch_str = "    ".join(batch_labels)
         messages.append({"role": "user", "content": f"Provide a mapping for this batch of gene labels. Generate only a dictionary: {batch_str} -> "})
-        
-        def process_response(response):
-            cleaned_mapping = extract_dictionary_from_ai_string(response)
-            return eval(cleaned_mapping)
-
-        def failure_handler(labels):
-            print(f"Simplification failed for gene labels: {labels}")
-            return {label: label for label in labels}
-
-        call_llm_kwargs = {
-            'max_tokens': min(300 + 25*len(batch_labels), 4000),
-            'temperature': 0
-        }
+
+        call_llm_kwargs = get_mapping_call_kwargs(batch_labels, backend)
         failure_handler_kwargs = {'labels': batch_labels}
 
         batch_mapping = retry_llm_call(
             messages=messages,
-            process_response=process_response,
-            failure_handler=failure_handler,
+            process_response=process_simplification_response,
+            failure_handler=gene_simplification_failure_handler,
             call_llm_kwargs=call_llm_kwargs,
             failure_handler_kwargs=failure_handler_kwargs
         )
@@ -872,12 +2780,13 @@ def map_gene_labels_to_simplified_set(labels, simplification_level='', batch_siz
 
 
 #Biological inference functions
-def ai_biological_process(gene_list):
+def ai_biological_process(gene_list, backend=None):
     """
     Describes the most prominent biological process represented by a list of genes using the AI.
 
     Args:
         gene_list (list of str): The list of genes to be described.
+        backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
 
     Returns:
         dict: A dictionary containing the description of the biological process.
@@ -902,12 +2811,13 @@ def ai_biological_process(gene_list):
     annotation = call_llm(
         messages=messages,
         max_tokens=200,
-        temperature=0
+        temperature=0,
+        backend=backend
     )
 
     return annotation
 
-def ai_gene_list(cell_type, species, list_length=None):
+def ai_gene_list(cell_type, species, list_length=None, backend=None):
     """
     Returns a list of specific marker genes for the input cell_type.
 
@@ -915,6 +2825,7 @@ def ai_gene_list(cell_type, species, list_length=None):
         cell_type (str): The cell type to get marker genes for.
         species (str): The species to consider.
         list_length (str, optional): if not None, provides a {list_length} list of genes (i.e. very long, short, much shorter, etc.)
+        backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
 
     Returns:
         list: A list of marker genes.
@@ -938,7 +2849,8 @@ def ai_gene_list(cell_type, species, list_length=None):
     response1 = call_llm(
         messages=messages,
         max_tokens=500,
-        temperature=0
+        temperature=0,
+        backend=backend
     )
     messages.append({"role": "assistant", "content": response1})
     
@@ -951,7 +2863,8 @@ def ai_gene_list(cell_type, species, list_length=None):
         response2 = call_llm(
             messages=messages,
             max_tokens=750,
-            temperature=0
+            temperature=0,
+            backend=backend
         )
         messages.append({"role": "assistant", "content": response2})
     
@@ -960,8 +2873,7 @@ def ai_gene_list(cell_type, species, list_length=None):
     messages.append({"role": "user", "content": step3_prompt})
 
     def process_response(response):
-        gene_list = extract_list_from_ai_string(response)
-        return eval(gene_list)
+        return parse_ai_literal(response, list)
 
     def failure_handler(cell_type):
         print(f"Failed to generate list for: {cell_type}")
@@ -969,7 +2881,8 @@ def ai_gene_list(cell_type, species, list_length=None):
 
     call_llm_kwargs = {
         'max_tokens': 1000,
-        'temperature': 0
+        'temperature': 0,
+        'backend': backend
     }
 
     failure_handler_kwargs = {'cell_type': cell_type}
@@ -985,15 +2898,81 @@ def ai_gene_list(cell_type, species, list_length=None):
     return gene_list
 
 
-def ai_cell_type(gene_list, tissue=None):
+#Marker gene list cache
+_marker_gene_lists = {}
+_marker_gene_lists_lock = threading.Lock()
+_marker_gene_single_flight = SingleFlight()
+
+
+def get_marker_gene_list(cell_type, species, list_length=None, backend=None):
+    """
+    Cached version of ai_gene_list. The gene list of each (cell_type, species, list_length) is requested from each
+    model once per session, and concurrent requests for the same list (e.g. from strata that share a cell type) share one call.
+    Failed (empty) lists are not cached.
+
+    Args:
+        See ai_gene_list.
+
+    Returns:
+        list: A list of marker genes.
+    """
+    config = get_active_llm_config(backend)
+    key = (str(cell_type), species, list_length, config.get('provider'), config.get('model'))
+    with _marker_gene_lists_lock:
+        if key in _marker_gene_lists:
+            return list(_marker_gene_lists[key])
+
+    def get_gene_list():
+        gene_list = ai_gene_list(cell_type, species, list_length=list_length, backend=backend)
+        if gene_list:
+            with _marker_gene_lists_lock:
+                _marker_gene_lists[key] = list(gene_list)
+        return gene_list
+
+    return list(_marker_gene_single_flight.do(key, get_gene_list))
+
+
+def clear_marker_gene_list_cache():
+    """Empties the cache of get_marker_gene_list."""
+    with _marker_gene_lists_lock:
+        _marker_gene_lists.clear()
+
+
+def ai_cell_type(gene_list, tissue=None, backend=None):
     """
     Returns the cell type based on a list of marker genes as determined by AI.
     Args:
     gene_list (list of str): The list of genes to be described.
     tissue (str, optional): The tissue of origin to provide context for the AI.
+    backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
     Returns:
     str: The cell type label generated by AI
     """
+    # Call the LLM using the call_llm function
+    annotation = call_llm(
+        messages=get_ai_cell_type_messages(gene_list, tissue),
+        max_tokens=100,
+        temperature=0,
+        backend=backend
+    )
+
+    return annotation
+
+
+async def aai_cell_type(gene_list, tissue=None, backend=None):
+    """
+    Async version of ai_cell_type.
+    """
+    return await acall_llm(
+        messages=get_ai_cell_type_messages(gene_list, tissue),
+        max_tokens=100,
+        temperature=0,
+        backend=backend
+    )
+
+
+def get_ai_cell_type_messages(gene_list, tissue=None):
+    """Builds the messages used by ai_cell_type and aai_cell_type."""
     #enforce that labels are semantic
     enforce_semantic_list(gene_list)
 
@@ -1009,28 +2988,24 @@ def ai_cell_type(gene_list, tissue=None):
         base_prompt += f" Consider that these cells are from {tissue} tissue."
 
     # Prepare the messages for the Chat Completions API
-    messages = [
+    return [
         {"role": "system", "content": "You are a terse molecular biologist."},
         {"role": "user", "content": base_prompt}
     ]
 
-    # Call the LLM using the call_llm function
-    annotation = call_llm(
-        messages=messages,
-        max_tokens=100,
-        temperature=0
-    )
-
-    return annotation
-
 
-def ai_cell_types_by_comparison(gene_lists, cell_types=None, tissues=None, subtype=False):
+def ai_cell_types_by_comparison(gene_lists, cell_types=None, tissues=None, subtype=False, backend=None, parallel=False, num_workers=None):
     """
     Returns cell type labels for multiple lists of marker genes as determined by AI.
     Args:
     gene_lists (list of lists): A list containing multiple lists of genes to be described.
     cell_type (str, optional): The cell type to provide context for the AI.
     tissue (str, optional): The tissue of origin to provide context for the AI.
+    backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
+    parallel (bool, optional): If True, each gene list is labeled by an independent request that carries only the
+        shared contrast of all gene sets plus its own question, and these requests are sent concurrently. Otherwise,
+        the gene lists are labeled one after another in a single growing conversation.
+    num_workers (int, optional): Maximum number of concurrent requests when parallel is True.
     Returns:
     list of str: The cell type labels generated by AI for each gene list.
     """
@@ -1065,7 +3040,7 @@ def ai_cell_types_by_comparison(gene_lists, cell_types=None, tissues=None, subty
         messages=messages,
         process_response=lambda x: x,
         failure_handler=lambda: "Failed to contrast gene sets",
-        call_llm_kwargs={'max_tokens': 300, 'temperature': 0},
+        call_llm_kwargs={'max_tokens': 300, 'temperature': 0, 'backend': backend},
         max_attempts=1
     )
 
@@ -1074,9 +3049,7 @@ def ai_cell_types_by_comparison(gene_lists, cell_types=None, tissues=None, subty
 
     messages.append({"role": "user", "content": "Provide only the new label. "})
 
-    # Process each gene list
-    cell_subtype_labels = []
-    for i, gene_list in enumerate(gene_lists, 1):
+    def get_label(messages, i, gene_list):
         tissue_str = " " + ', '.join(tissues[i]) if tissues and tissues[i] else ""
         cell_type_str = " " + ', '.join(cell_types[i]) if cell_types and cell_types[i] else ""
 
@@ -1084,14 +3057,27 @@ def ai_cell_types_by_comparison(gene_lists, cell_types=None, tissues=None, subty
         messages.append({"role": "user", "content": gene_set_prompt})
 
         # Get the subtype label
-        subtype_label = retry_llm_call(
+        return retry_llm_call(
             messages=messages,
             process_response=lambda x: x.strip(),
             failure_handler=lambda: cell_type_str if cell_types and cell_types[i] else "Unknown",
-            call_llm_kwargs={'max_tokens': 50, 'temperature': 0},
+            call_llm_kwargs={'max_tokens': 50, 'temperature': 0, 'backend': backend},
             max_attempts=1
         )
 
+    if parallel:
+        # Branch from the shared prefix (system prompt, contrast and instruction), one independent request per gene list
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, get_label, list(messages), i, gene_list)
+                for i, gene_list in enumerate(gene_lists, 1)
+            ]
+            return [future.result() for future in futures]
+
+    # Process each gene list
+    cell_subtype_labels = []
+    for i, gene_list in enumerate(gene_lists, 1):
+        subtype_label = get_label(messages, i, gene_list)
         cell_subtype_labels.append(subtype_label)
         messages.append({"role": "assistant", "content": subtype_label})
 
@@ -1099,13 +3085,14 @@ def ai_cell_types_by_comparison(gene_lists, cell_types=None, tissues=None, subty
     return cell_subtype_labels
 
 
-def ai_compare_cell_types_binary(label1, label2):
+def ai_compare_cell_types_binary(label1, label2, backend=None):
     """
     Compares two cell type labels using AI.
 
     Args:
         item1 (str): The first item to compare.
         item2 (str): The second item to compare.
+        backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
 
     Returns:
         str: The comparison result generated by AI.
@@ -1128,19 +3115,21 @@ def ai_compare_cell_types_binary(label1, label2):
     comparison_result = call_llm(
         messages=messages,
         max_tokens=20,
-        temperature=0
+        temperature=0,
+        backend=backend
     )
 
     return comparison_result
 
 
-def ai_compare_cell_types_categorical(label1, label2):
+def ai_compare_cell_types_categorical(label1, label2, backend=None):
     """
     Compares two cell type labels using AI.
 
     Args:
         item1 (str): The first item to compare.
         item2 (str): The second item to compare.
+        backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
 
     Returns:
         str: The comparison result generated by AI.
@@ -1162,12 +3151,101 @@ def ai_compare_cell_types_categorical(label1, label2):
     comparison_result = call_llm(
         messages=messages,
         max_tokens=30,
-        temperature=0
+        temperature=0,
+        backend=backend
     )
 
     return comparison_result
 
 
+COMPARISON_ANSWERS = {
+    'binary': ('yes', 'no'),
+    'categorical': ('perfect match', 'partial match', 'no match'),
+}
+
+def get_pair_comparison_messages(pairs, comparison_level='binary'):
+    """Returns the messages of a batched comparison of label pairs, with one numbered line per pair."""
+    answers = COMPARISON_ANSWERS[comparison_level]
+    if comparison_level == 'binary':
+        task = "determines if two labels refer to the same cell type"
+        examples = "1: 1) CD8-positive T cell 2) T cell\n2: 1) Macrophage 2) Endothelial Cell\n3: 1) B cell 2) Plasma Cell -> 1: yes\n2: no\n3: yes"
+    else:
+        task = "assesses the degree to which two labels refer to the same cell type"
+        examples = "1: 1) CD8-positive T cell 2) T cell\n2: 1) Macrophage 2) Endothelial Cell\n3: 1) macrophage 2) Macrophage. -> 1: partial match\n2: no match\n3: perfect match"
+    pairs_str = "\n".join(f"{i}: 1) {label1} 2) {label2}" for i, (label1, label2) in enumerate(pairs, start=1))
+    return [
+        {"role": "system", "content": f"You are a terse molecular biologist who {task}. You are given numbered pairs of labels. For each pair, respond with one line containing its number and only {', '.join(repr(answer) for answer in answers[:-1])} or {answers[-1]!r}. Example: {examples}"},
+        {"role": "user", "content": f"{pairs_str} -> "}
+    ]
+
+
+def process_pair_comparison_response(response, n_pairs, comparison_level='binary'):
+    """Parses the answers of a batched pair comparison, one per numbered line. Raises a ValueError if any pair is missing an answer."""
+    # Longest answers first, so that 'no match' is not read as 'no'
+    answers = sorted(COMPARISON_ANSWERS[comparison_level], key=len, reverse=True)
+    results = {}
+    for match in re.finditer(r'^\W*(\d+)\s*[:.)\-]\s*(.+)$', response, flags=re.MULTILINE):
+        index, answer = int(match.group(1)), match.group(2).strip().lower()
+        for candidate in answers:
+            if answer.startswith(candidate):
+                results[index] = candidate
+                break
+    missing = [i for i in range(1, n_pairs + 1) if i not in results]
+    if missing:
+        raise ValueError(f"No answer for pairs {missing}")
+    return [results[i] for i in range(1, n_pairs + 1)]
+
+
+def ai_compare_cell_type_pairs(pairs, comparison_level='binary', batch_size=40, num_workers=None, backend=None):
+    """
+    Compares many pairs of cell type labels with few LLM calls. Pairs whose normalized labels are equal are answered
+    locally, symmetric and repeated pairs are compared once, and the remaining pairs are packed batch_size at a time
+    into numbered prompts whose answers are parsed line by line. Batches are sent in parallel. If a batch can't be
+    parsed after retries, its pairs are compared one at a time with ai_compare_cell_types_binary or ai_compare_cell_types_categorical.
+
+    Args:
+        pairs (list of tuple): Pairs (label1, label2) to compare.
+        comparison_level (str): 'binary' or 'categorical'.
+        batch_size (int): Number of pairs per LLM call.
+        num_workers (int, optional): Maximum number of batches sent at once.
+        backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
+
+    Returns:
+        list of str: The answer for each pair, as returned by ai_compare_cell_types_binary ('yes' or 'no') or
+        ai_compare_cell_types_categorical ('perfect match', 'partial match' or 'no match').
+    """
+    if comparison_level not in COMPARISON_ANSWERS:
+        raise ValueError("comparison_level must be either 'binary' or 'categorical'.")
+    compare_pair = ai_compare_cell_types_binary if comparison_level == 'binary' else ai_compare_cell_types_categorical
+    identical_answer = COMPARISON_ANSWERS[comparison_level][0]
+
+    # Canonical (order-independent) key of each pair, or None if it is answered locally
+    pair_keys = [
+        None if normalize_string(str(label1)) == normalize_string(str(label2)) else tuple(sorted((str(label1), str(label2))))
+        for label1, label2 in pairs
+    ]
+    unique_pairs = list(dict.fromkeys(key for key in pair_keys if key is not None))
+
+    def compare_batch(batch):
+        return retry_llm_call(
+            messages=get_pair_comparison_messages(batch, comparison_level),
+            process_response=process_pair_comparison_response,
+            failure_handler=lambda: [compare_pair(label1, label2, backend=backend).strip().lower() for label1, label2 in batch],
+            call_llm_kwargs={'max_tokens': 20 + 12*len(batch), 'temperature': 0, 'backend': backend},
+            process_response_kwargs={'n_pairs': len(batch), 'comparison_level': comparison_level},
+            max_attempts=3
+        )
+
+    batches = [unique_pairs[i:i+batch_size] for i in range(0, len(unique_pairs), batch_size)]
+    answers = {}
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, compare_batch, batch) for batch in batches]
+        for batch, future in zip(batches, futures):
+            answers.update(zip(batch, future.result()))
+
+    return [identical_answer if key is None else answers[key] for key in pair_keys]
+
+
 #image understanding functions
 def encode_plot_for_openai(plot):
     buffer = BytesIO()
@@ -1179,53 +3257,164 @@ def encode_plot_for_openai(plot):
     return encoded_image
 
 
-def ai_resolution_interpretation(plot):
+def get_category_palette(n_categories):
+    """
+    Returns an (n_categories, 3) uint8 array of RGB colors for categorical plots.
+    Uses tab20 for up to 20 categories (close to scanpy's default) and husl beyond that.
+    """
+    if n_categories <= 20:
+        colors = matplotlib.colormaps['tab20'].colors[:n_categories]
+    else:
+        colors = sns.color_palette("husl", n_colors=n_categories)
+    return (np.asarray(colors, dtype=float).reshape(-1, 3) * 255).round().astype(np.uint8)
+
+
+class UmapRaster:
+    """
+    UMAP coordinates pre-rasterized once onto a small pixel grid.
+
+    Each partition (i.e. each Leiden resolution) can then be drawn by recoloring the precomputed pixels
+    with a single vectorized numpy assignment, instead of re-plotting the full figure with matplotlib.
+
+    Parameters:
+        coords (array-like): (n_cells, 2) embedding coordinates, i.e. adata.obsm['X_umap'].
+        size (int): Width and height of the image in pixels (default 256).
+        point_size (int): Radius of each drawn point in pixels (default 1, a 3x3 square).
+        padding (float): Fraction of the coordinate range left blank around the points.
+        random_state (int): Seed for the fixed drawing order, so no category is systematically drawn on top.
+    """
+    def __init__(self, coords, size=256, point_size=1, padding=0.03, random_state=0):
+        coords = np.asarray(coords, dtype=float)[:, :2]
+        self.size = size
+
+        # Scale coordinates to [0, 1] with some padding
+        low = coords.min(axis=0)
+        span = coords.max(axis=0) - low
+        span[span == 0] = 1
+        low = low - padding * span
+        span = span * (1 + 2 * padding)
+        scaled = (coords - low) / span
+
+        # Pixel of each cell (image rows run top to bottom, so flip y)
+        cols = np.rint(scaled[:, 0] * (size - 1)).astype(int)
+        rows = np.rint((1 - scaled[:, 1]) * (size - 1)).astype(int)
+
+        # Expand each cell to a square of pixels
+        offsets = np.arange(-point_size, point_size + 1)
+        row_offsets, col_offsets = np.meshgrid(offsets, offsets, indexing='ij')
+        rows = np.clip(rows[:, None] + row_offsets.ravel()[None, :], 0, size - 1)
+        cols = np.clip(cols[:, None] + col_offsets.ravel()[None, :], 0, size - 1)
+
+        # Fix the drawing order once
+        self.order = check_random_state(random_state).permutation(coords.shape[0])
+        self.pixel_index = (rows * size + cols)[self.order]
+
+    def render(self, labels, missing_color=(200, 200, 200)):
+        """
+        Draws the cells colored by a categorical labelling.
+
+        Args:
+            labels (array-like): One label per cell, i.e. adata.obs['leiden']. Missing labels are drawn in missing_color.
+            missing_color (tuple): RGB color for cells with a missing label.
+
+        Returns:
+            np.ndarray: (size, size, 3) uint8 RGB image.
+        """
+        labels = pd.Series(labels)
+        if isinstance(labels.dtype, pd.CategoricalDtype):
+            codes = labels.cat.codes.to_numpy()
+            n_categories = len(labels.cat.categories)
+        else:
+            codes, uniques = pd.factorize(labels)
+            n_categories = len(uniques)
+
+        # Last palette entry is for missing labels (code -1)
+        palette = np.vstack([get_category_palette(n_categories), np.array(missing_color, dtype=np.uint8)])
+        cell_colors = palette[codes[self.order]]
+
+        image = np.full((self.size * self.size, 3), 255, dtype=np.uint8)
+        points_per_cell = self.pixel_index.shape[1]
+        image[self.pixel_index.ravel()] = np.repeat(cell_colors, points_per_cell, axis=0)
+        return image.reshape(self.size, self.size, 3)
+
+
+def encode_image_for_openai(image, image_format='png', quality=80):
+    """
+    Encodes an RGB image array as a base64 string without going through matplotlib.
+
+    Args:
+        image (np.ndarray): (height, width, 3) uint8 RGB image, i.e. from UmapRaster.render.
+        image_format (str): 'png' (lossless) or 'webp' (smaller).
+        quality (int): Quality of lossy webp encoding (ignored for png).
+
+    Returns:
+        str: The base64-encoded image.
+    """
+    from PIL import Image
+
+    buffer = BytesIO()
+    if image_format.lower() == 'webp':
+        Image.fromarray(image).save(buffer, format='WEBP', quality=quality)
+    else:
+        Image.fromarray(image).save(buffer, format='PNG')
+    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+# Example images for ai_resolution_interpretation, encoded as base64
+OVERSPLIT_EXAMPLE = "iVBORw0KGgoAAAANSUhEUgAAAHwAAACRCAYAAAABxNziAAABWmlDQ1BJQ0MgUHJvZmlsZQAAKJF1kL1LQmEUxn+WYphUQ0NUhFBDhYWYQzUI5iBBg/jR13a9mgZql6sRQRQNzTU11Rb9CRpNDdFSW1AQ0dweuJTcztVKLTrwcH48PO95DwfaOhRNy1qBXL6oR0JzruWVVZf9FTv9dGHBqagFLRAOL0iE795alQfJSd1PmLOiDuftgX93/fqkr3Rjuzz9m28pRzJVUKV/iDyqphfB4hYObxU1k3eEe3VZSvjI5HSdz0xO1PmilolFgsJ3wj1qRkkKPwu7E01+uolz2U31awdze2cqH4+ac0SDBIgSF7lYJISXaWb+yftq+SAbaGyjs06aDEV5GRBHI0tKeJ48KpO4hb14RD7zzr/v1/D2hmA2IF+NN7zYIZT8MPDS8IZHoXtf/BFN0ZWfq1oq1sLalLfOnWWwHRvG2xLYx6D6aBjvZcOonkP7E1xVPgHNoWEQDEZXhgAAAFZlWElmTU0AKgAAAAgAAYdpAAQAAAABAAAAGgAAAAAAA5KGAAcAAAASAAAARKACAAQAAAABAAAAfKADAAQAAAABAAAAkQAAAABBU0NJSQAAAFNjcmVlbnNob3SeXeUJAAAB1mlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNi4wLjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyI+CiAgICAgICAgIDxleGlmOlBpeGVsWURpbWVuc2lvbj4xNDU8L2V4aWY6UGl4ZWxZRGltZW5zaW9uPgogICAgICAgICA8ZXhpZjpQaXhlbFhEaW1lbnNpb24+MTI0PC9leGlmOlBpeGVsWERpbWVuc2lvbj4KICAgICAgICAgPGV4aWY6VXNlckNvbW1lbnQ+U2NyZWVuc2hvdDwvZXhpZjpVc2VyQ29tbWVudD4KICAgICAgPC9yZGY6RGVzY3JpcHRpb24+CiAgIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CrxF5gkAADQUSURBVHgB7V0HfFTF1v9vyW56771BQgmELtKrdAGxgIIgReQTxI69i+XZeD7Fgl0eiiICIkU6SO81EEogpPe6fb9z7u7d7C67CWD0kXLyy97p986cmXPOnDkzIzES4B+GytJSPDFwEM6nn0KH7r3x4vJlcFEoLF+Rn3kJZQVFSEhtbwlrdtRPC0j+aYRXlZfjo9lzsPHXny01CA4Og09AEHQ6Lbx8vHFk324hrkuv/nhpxXJLumbHX2+Bfxzhz4+8Ffu2b7rKL5dgdXHpVaZtTnY1LSC9mkT1mSbr/LlrKM6IeYMGX0P65qR1tcDfOsK/eOppbFu2DF2HDEVs2zYw6PXQ63T48pWXoNaoLN8mlcpgMOgtfnvHB+s3okXnzvbBzf7raIG/DeFZZ89iWucOV/VJwcHhyMvLcprWVemGN1etJqR3cpqmOeLqWuBvI+kH1q23fIFEIrG4r3RIakG2KZ9KXY1Xxt+F+1q3wbafaoS9K8tqDqmrBf6WEX7mwAG8d/9MXKBpF0N8i1bIy8pERWW5zffURcplMhn0xAaswdfHH4svXLAOanZfQwvU2wg/sH49TbcewuePP4GHBvSzIFsqkWLM7Nn4MfMyhtx1j82n1ca3OaE9sjmspLQILOlXFBeDVQjvTZuOe1u0xPcvv8LRzVBHC/ylEa7TaiF3ccEPb7yBb96aLyDA+n0yEsY+3bsfYfHxWDj3Yaz4epF1tOCWy12E+bdtBJPy2vVBSSkdcN/LL+PJMSMtWRenpcM3ONjib3Zc2QLyK4OuLmTJ6/Px7b/eQGBgKPLzsx1mCo+MwdNDh0FGWrSK0mKHaVjZIoJUKsWUp59Hx0GD8NqECci6nCFGXfE8d/IYAiIj4EIdRktleHv5ws3L64p0zQG2LXDdCF++8GNhRDOymWwbjAahZH+/IBQV58PPLxD+ISE4vHenEO7j7Wf7Zjtf1z4D8X8ffoCgyChUV1ZCJpfZpbD1hkfFIjwxEa//8isO/rEBve+4A0o3N9tEzb4rWuC6Ed6yfQdBY8bInvjEU9j688/IunheQDa/pbKiDBHEW0WEs6QeEhqJ3JxM4SN4qqVQKFFdXYmklI647ZG5eHPiZFSVlyEwLByXMqwVNLYkvlu/QZj2xutCOa1uvhltevYU3M0/dbfAdfPw1Z98ig/nPSa8Yey0B7B80SeWUS6+9oMNm/HdSy9j79aNQpDCRSEgmaV1Jt8Gg4kqiGRZzFfXkzsZS/ARsQmCcMidZ+HefQiOiqora5OPv2aEs0Ll908+x+kD+3F0/y6hAVu164TSokJkZV6wNKiEkBIcFIpcK4UKj/K/a3EuNiEZ72/fCoWrq+Ubmh1XtsA1I/yFduMw1fczXKw+hF1lP+DusHchcZPCZX45tm5eDP+wULw5czpcpW5QGaotbxweMhPlukJsLVxqCatvx6h7p2Lm++/Vd7GNqrxrnod3ko+Ep9wPrb36YUrkx1BK3aFQu0L+VRDGzH2IEB4GucTFBtnuMk8MDHgAM6IXIc69NRRSpdCIwUFhlsZM8uyEGTEL0MlnoCXMkWPaC68gqW2qoyiUFhQ6DG8OrGmBa0a4R3tvqPVVphKMJtUneyS+gKEESIrvCR/ShokwOGgK3kjegyBlnBD0csud+KxdNjr7DIaE+DiDQqrAY/Gr0Nt/Mh6OX4ZgZbgQLv6E+EQiJiAZo++bgZEPzETasUNilPBk4a995+6Y8lqz8sWmYRx4rklKP7XiAP69cjo0eg0YkZMiPxCKlHjTg/QkJWOB81UHUVVZIYQPC56J8ZFvQWKlQ2E+LoMcA0Jn4GTVZqzAh5SWwojnizAwdBoOeK9EzqlLSHBPxZzEpZAZKBfNulyIOPj5BqC4pGY06/U6zF74ET5/8in4keJl6ltvNPNysTHtnlfNwzXHgI9vexhr80zaMubRC9tfJmlbhnWe76J17mBEu6VgSdY8rMr9SHjN7NjP0c3vDsGtNWiRXvknkjx707ydKAMhzqAyYEvh5/ji0uPoGTkGU0IXQqE3CV3GwWoY17tAaqzpCFzQyqhXsXTVOwJVUOtU1M+MSCatG3/HicP7hHexLiC1V2/M/fxTQRMoBDb/CC1g25q1NIr2CNDasx+k9MeQ4t0bVfGFmH0kHt9teQkvnR6IMm0e2nkNgQvxcAYX6hQirMp7A6+lj8KjJ5Px+Mm2yC5LExQ2ce6d0SfwdnRUjCLFSY2ELd2tvALZXJZmjw4RxB5eSNyAt1rtx6yWC/HKt6ttpH9W/Gxc8TM2fP2N+Prmp7kFrpqkK24COvmOwqvJW1Gmy0Nbr4HIPpGGEGUMIl1b4Hj5LhQZM0mY64u3W++nNAUkoHVGZvUJrMh9HTuLVxLhBvLV2fSUULeRQ2/U4WTFZlysOg6tXo0Ur1tIuvcQPs1YSg9WtlktlrHIcFvYixgT+oKJSlB0GBJRtOciHvnsE6yf+yOOn9iG46Vm7V6zXl1oS+ufqyLpmWmn4KEJhvGhGmHMuhB27yxdgr4P3QX11+Sx4tkc93vee/BxCSVkemJ70bckiY9CD/97hGTcCUS7Wab0FmAiwXoZK4Rb4qwcLEA+dq4tFjx4EpK1Julfb9SjSJaBxCXxkAVaJW52kjxVhyZk0byn8PMn/wGvag0NuB8DgmcQrQYCjbG2zUfUWEoLVRKaaelNRqe28dfgkwRRJyigDHYdx74I7ijrCz5EG68BCHdtJVAQ6zQ8c5D3B7wetA5t2u46ET4luRVycy/btNLjPX9A+8qhNmFCa9eBINsMzn0ST8K1SdB3mEjiTtSerJ1WnXwXffJmwI0ohz3wp4gEw+NtkhGbraOEJqpTaLt5xAhTQvO0ifXh8V1r2SDAJSqELM5/REyIKewWxgRkExVhxIMpRxQ9xTws11H5um3AUO0jVyBblkKjug8lF7+B8kl9xBc1P52O8LSfd2Hz85/DIzAAEYPaIrJna+QVXURMm1bw25cM9SInjceIcTDSrUctz9tlHQlpm52UYQ6WUb8yXKLiimpPZxPLYih1OgnJfhLS3yiHAW5WxOiPpSuwY+1GdO7TA8Mn3m6TtSl4nCL88w6zUFaYbWkDuVyJ8SvfQlCbaJBwjcrPAO0mQkaBJUntDuoIjGiWvplHS3genuk8i3UHcZ7KQYxdh8s0nsW/8SjadElF+pFjKC4sppdzIuDtH75AeFy0g0Iab5BTku4bVaPn5urrdGrk7D0rtISERpGRtKvOkM2jSxpD7Rpq1XA06oWpFgUZ8+m/Fh7NueqKtyqZXkQ+JuHUiSQ1U3khSaQkAYZKA/Zu3o7iItL9mpEtkUpIG2eS6m3KauQepwgftfgx9Hr4PsR36yY0gX9INBJGdkL1b6RCnUmjm57OQEKDxpBBSMtxkoKQ4vawk7g6gh1wC8gHkLr1V2ITreid4gKdWS7YrvkNKlDvtANvHx94+bJOuGmBU5IuNsPp5XtQcjYHqTMHk6LcFRVzxBirJzeuOF+2I6lWqSzOCmMetlwmdaz3MMSRxo5B4kfIImp7PeByC1EgUv0arSYTOg8dniq4DSp9pdMivf188eKiBQiJtF2scZqhEUTUivAT/92GNU++K1QzvlN39HF5wikZt7QFIVxqHuGWMAeOCm0Bll+ajUFhLyDEPZmwRUhnHl/mILFdEM+/rZU0EtIH2Qt261Q/YKWOBA0CXrBp3TGVTKeCsXP9ZmjUakuJCqUSfUcOQWrPm/DhM68K6t3H3n0NscmJljSNyeEU4efWHsK2l75BYeZ5ob5R/p0xwP8Z27pbj2wxhnip73+BUjJBF8mrIIDxQLOjxxnlfyI0ri2UBVdPWtVGFb6vfgsKiRvucXtcfKvNs8RAtutVd9LrTC8cO20ibptxr5CmpLAI/5r7DM6nnbHJExETjcsZF4Ww3sMG4/4Xn7CJbywehzy8uqgcK2fOtyCbK5tbepIYpR3GRDJu3Ro0wsuorURkc5RBRU1vMCWq0pHgZIZI364IevNKZIsWsGI68cnS/YagJTho2Ipj+l1YXP0O9ms2i9E4g8N4VnonjnfbQlavPD8jvk7Wr71H3CIsrhTnF9HBA0pcPHvOkocdckorIpv9CW2I4jRSMLWKXeUMGj0ZGNLcywr00MDt3ypI811hyJJA/QshMr0mgdagwuHCJcjSHEHvsofhq4wSIos0F/DHhZfJCsYNCZ59cb5iKzoHTEZwcDL8nmVxnpLZUQo2UnQEmkotXCspD0ElSrFT/zt26dciRpaEQFkYijQ5KNUU4tc9X0Bv3o3KJJtJ+MSbBgtIV5LNG9vbiUJHRHQ0olvGY+cfm7lYBBM/H3j7KMHdGH8ctqxHqC/6Pz8LHl4Bljrr9Vp82f8BfDRqHHZt+hpu04g3kopThKzKAzhW+iuKqs/jSPFPKNNkY0fuh/gtcx6qdMXwU0SRVasWbX3HYl/R19jn/xk00cUomE9M2xGlMBecXXUE5docWlnTI6csA30l4zBCPpkWAVg6ZC5hQCkx8Api/lu1y4UwVRWtk5stYlVV1XjizqmW5VO1SoX4VklCOv7RUcceevftcPfwEKjCmCl3W+Iao8PhCOeKtp86AMe+XY/K8hrLElUVaU0IDi1ZgfYniCfybMcsleerTgtx/OPjEoHNOW/SiMsgSxYXJNLI7hn6kBB/unQ9SjSXEFPZGV/0mEkLHyPQMXCiJS+v5ZRqsuCtCBM6yvrsV6ij6KgcBQJCb0GkPAG3uN4Dd6kv9mjXIpHUcR9U8xyP2IbZtEZcD2IkMh+vrrSdlp0mBYwI5XTCxI//WURWOpWCsURMy0QxqlE+nSKcaxs7oBNyz6VdUXGlgsiquJ+f2LqC8NXiz75QZRYhqHcM2ZfdhrNzNpO1AmeVwdulZtojurPOHKfNghocLfkF1foStPAejI05rwkIYh6e7DsSZfTHyGbQGNXo6jqU+pdpZPdSjAD/F0VcwkXFUZw+elxIZ/2jotGcSKpgawRbx7vQusCQu8Zgxbc/CsG8Vy792EnEJCVYJ2tU7loR3vLWrtjz+RIihwYyIZJb+LpKU46CLicQnNsasnbAqfLfsHXt50LDpB/fhqzOaRjy+Rz8+ep/BdJ66szvCHZrBVeZD/YXfkM8VIb8EhNF4BF4pnwTslRHaM5cs514j3ojTnidQwv3cChV1UjzLUGc7k9sVv2McEk8IqWJ1B0KMOLJsah6zTSCWVDjDQritItPnGBk83y7qrzyik2LWq0GyxZ9Z0FoaFQEuvTrYfE3RofsRQJnFfMI8UUwkTh3L3/0eHw80lbuIASaGK5PB38kfdAO+bqTOPbNBpTmZluKKc3KgodvIIZ+Nhtt7u4LdXE1MtR7CLEbUVBCkp5o8UA5lDIv9AyZhRzJCUJUjb5V6Z2ALNklVBkr4amWoMRDjxPG/ahGBfLJsuas/ggyjekIiqC59bqNwruZb7t7emLSI7NwcOcey3uYb4u7XCwfaefo2q83nv/s/Ua/P63WEc5tkjC8k/BflllI57MINFpoKv+kCKSv3IcVD74uNKyEjAjFzsAJ9n65FDkH0lGQfh6Jg7pD4eFG0zzb6RCn05BSviQlHarNJvmAw1xl3pCX5iJV70t2bXqBiEcWKXA+kPiIiaLD1d2NLFgV2Ll2E2exQDmdAbfs8+9g1JvngZYY5w62pevUp7vzBI0oxqnixb6OGx//Cod++NUUTJqrSWsW4NQP27Hnix+EMDdPP1RXONeNyl3coNOKiu6a0v1ColCce8kSwFMmZiGO4EBQOYw8hasFpDLas1YHsu23PPEed+bfd82ahpGT76ql9IYf5XBa5qhaalLGiOBCyAtsFYmUKf3pQL1wms4oEd+nqxjt8KnTXYlsudwVNz9tOw1yhGwD8flMJU21ruJr7ZHNyA2i7U/WcPfcB8ACmwiMbIad622phRjfmJ5X0YSm6galxFrqLSXBiMEnhoz+D/4HD51bgtYTelvIrUzG5ipm2ivmImneHjxoQ8Fvc9+wD7bx6709cSygErl+hBSrItnGrk6g9DxFy8/OsSQNCAnCr198DxbY5FZI5wRd+1MdGjlcNcJT7huIyLbt4eEdiL7PTbVpFl21GpvmLaLWNQWzkoZJtUxeM4qsM0SltEf/Zx6AlqRvMY8QT50klA4AimzTDl4BoVApXXBUkQOti6lgLz8fSzHWJ0dYAslhPXLHzZhi2c4kpinMzQfzeQbescLAa+PTnnoYo6faUhshspH9XDUPF+t9eddprJr6lsBnO98/Bp5hAVg7bwEJdDUrUGJav+BIFOdlil7L89ZPnkPC0I74NGUGHQVC1hBmaNmvD2L6tYeqpAJ/fLEEl7WFkOolKPShIz1oalVWUqOHF/NYP5Pap6C8uIQOJjDJBB50BAjvQ+deVV565TJct/590LlfTyjJECIgJBjvPfGicHDgnPnPoWX7NtZFNxr3NSP8l3Fv4Pye3ZYGYH6udSCMcYJoOiUilw7aUatq+D+Hu3n44rYlL2DbC98j48A+DrIBnpsfCqoAbScTwJeOC1HTRgVVdTXNBGx5Q2RcLDLPXxDSDR43GjvWbUBlme37eM+4hqZmIrBUPvvV5+Dp44X5Dz5B36cCa9gu0aIKywDtb+qCJxbMF5M3qudVk3Sx1kFtYkSn8HSGbI5sO3EgJm54B50n326Tp7qyBD+OexZ51BmcgdXGVMjcFIJ61B7ZnDcvKxu+AQGk9/dCQU7OFcjmNHzcZ+fePcASfLuunbFgxWJ06NUN+7f8KSA7tnUS/EKDkNyxvaBPj0qI42yNEq55hHMrLEgYT9MY04hhSXvs9y/g0MI1yD6choqSPEG7xunCW7VFRW4ByopqhCYOrwsKZVpkBBGLMAtddaW3xLNQZyYA7l6epF0zKXI69uyOR999RRDgWGo/vvcg/vPc64JhREVFBdp262QpIimlDUZOulOIswQ2Isc1j3Cue2Qq6VPNkDysH3QVGpzetAXlhFhx4YKjs+horSuQTUhRurLBuXPI9tYQ3ujPSiPHqf2rXeGqcv7J1suqIrJ5bfvB154WXsbIZlj51X/piJJisDFEJBk+lOSbFoh0Gi0Gjh3ZaJHNdXfeehzrBEZ++wi6TZ+AHrPvxYD3pqIs08pW2Q5JYhEuCvNaKo3AEFqedHX3FqOueIaXKhBH6+5u1VLrmRh8aMAmlLpZ0vNqmDj9C6KTJxypT728va9Ql0YlxlvKYGHwwsnTOEmjnm9hcPeiMhsxXBfCXdyV6PHc7ej2+GjIXGSkL+9FUxuzhOWksdjMWYSLhw5AVVVG1idWC+piJD39DS7w17sgudQdHcpD4VvhghZ5bkKYaYyaEvOSJpEB9B89Au//+i0i4mJNEfTL0rkLGT8MvG2kJUx09BoxWHTi2L6DiEyMgy9tuLhr9nRLeGN1XBfC7RtDpnBBdGoHIZg3LHSaOA7eAWE2yaz17IwkBq3Gdp1aJrOdt0tdyLpmeBz82kejXK5HsUyH8341HUd8QWBYiODsNXSgGCSMdqYAcUTST+w/jMxzGUJc1oWL+OS1d2rS0Yoa8/sw2pCwh2zXGzvUuXhytQ0weuk8ZGw8Cv8WYfCND4Grvyd2fPDV1WaHQumBxIE9cOaP7YLQxxRBd1O4QNJ9aEXMo1yOXE0RKktq5u1ceKsO7THy3juF98QmtxD4r8j7S4uKaCGFDDHzTSyHBbLsS5nw8PSwpJORxs7Nw0Rp2PypscN1SelX0yjrZn2CY6vW1CRlgcmOvwsLLpW04EIDnpdgq8qLatKTS5cUBkn7AFM+yq/VaHB8134hjY+/PyY99n+kDu2FQzt2o5QsV7r07YG0Q0ex6psfofR0J7IuoekaSet2Fi9cgFatoWmaTBABRFWxjNjA0LvGohVNzxor1BvCi05nIXtvOhKGdYKrnwfyj1/E4hGPkfrStDBBrU9Wj45XwZw1Lq+ctXxqHE6kn7AkKcrNg4ZUuZMfn40Umk4d2b0Pa5eaVvH4RiR7jRpr0Ri5BrvOZinQzhEdH4c7Z91nF9p4vPXCw4tpZ8r3Qx/D2qfew5LBpikQbzocufBpGkHmV9SBbEGAM6eV0uJLh7tG466lb8I1tEZ/rqBTmeOIbI+ZNgmxSYn4c90mZJw+a8GGPbI5Qq1SIywq0pKmLgeX25ihXnh4/tGLFvVqUS65q9RgST6yZzKZHPF56FcKWtaN6qJww+1LX0FIapzAWzlOQ4g6SmetH2bLFTNoiKTz/84/NmHXhs2WeboLCY16HZtWO6YgTNI79eqOvMxsXDKrYcUyrZ+9hw5GtwG9rIManbteSDoj+MfhLyKPDB7b0LYdNv4/sWojIYFIqZV9O49iFqh0dNyWNT9vO3oYBi+wnRIt/eQrXDhTM3rro+X9g+ho73xboY/LTWydjJbtWqPNVV7KUx/f8r8qo15IOo/muzfNx9zzP8Ej2BeHl60SplzWyOYKarVVgtVLWFIbwWhCrPTR5atx8Is/RK/wLCBeXd/gCNnuJKEPvn10k0A2t2e9IFxEDB+lqbKyjOFwD58gYcolpDHrubNPHaMBznYsJmBlyokVOwQPW598Pv99VJhXvORODsp3IbMkHpkshf8VYHL/06df/ZUiGlTeekU417z7M+MQ26kLAsJj0WPOvZh+6GPiu7YKFk5nIOmdEc1IN1JHaTuxHwdjy2/r6JQGk26b/TrizY6AzZYGjBnuKMoS5krLoD1uGYCudLxHbVBddeX31Za+IcfVi9Bm3QDuQT4Y+4tJUhfDAyPiUGBnsSogmkyMQtu3wuD37kdwTBjU1bQ/bddeMVutzxZtW2H5l4tpZ0yNabMPWcQoXN0sJk0soe9Yu0Eox9GVWOIL+o4YIjob/bPeR7h9i51bcwgFl88LwQrzKpmRlCj6nnEwjmmJyiRXBEYGE7KrsfjfnwnStn0Zop/nyCJsWb0O+Tm5old49hgyEHfMnILQyAi4uZsERDEBX4nF4VFxMeCRL4IfKXCSO6SI3kb//NsRfnHLUYtE7sJHIRMYaT4tCfcQ3GXaShTTOee8A6Qgr3ZBLeuSyXRJyEg/9tOwjct/g46mbXyigzupT+0hJ/MyTcsyyHLGtJbP8aV0/xkvlTYV+NsR3uaePrQU6iPMrzvPHIOE7t0hIaTIK0xzZubFa35Yjkxa1KgLdFpdrUlY4Fu7dLnAFgrz8mtNK0ayBq4oz2p5V4xopM96mYfX1TZsJ6ZTaWj3iYmUaipVkMilYAvSHWQLfu5kWl1FXBEv8mReBo2IjUY2GS7y3jLm2yKwBG/N48VwfgaHhxFlKUBUQizGTL5b0KtbxzdWd70LbY4aim3JRGRzvOhmrdn1IJvL4HXuatogGBYThZ8XfStI89YSPZ/q4AzZPmT0MHzCbQgMNS2rcnlNBf4RhDtrTLYHt4ZIEqgSyBomI/0sLljpyK3TsCSe0q0LGSOa7NB4fVvcOWKdTkeGi/bAgtyIu+8gPXyCfVST8f8jJL221jywfTcukyDVrntnxJhNj1j9WkKC3LbV65F2tGalzD8wkKTwyXS+mmlB5cC2nTiyZz9Nw0zSOo9qFuTshTnx/TcP7IceQ/qL3ib5/J8jvLZW53n5Vpp+8cIIn6xkbW/GkvVn89+1qORb0Mb/jrRAsv6nFSgi3mwPPB0bOWk8aeaulN7t0zZm/w2N8NoanjcbfPr6u8S7dXQKkwzTn3qENhZ4C8YOC19+k9bha1bOWpNVzPC7x9VWXJOJ+5/y8NpaeSupWPdv3wnm63zQDm/ptQYPby+MnXIPTh87Lhzrwchm4MUQ3pRQVmLaP8Zhf8dCDJfbEOGGRDhbqOzetE1oTxbeLp45h3jaHWIPfBaL9XksOq0e235fT6tyZisbcwYV6cqZr5v2mdmX0rT8f7vi5XqaU04GDf5BgUJWXhXzpy2+VwMHd+zEvq07hG1JPE8XgUc7Gz80Ax1CeCM2Au8QGU+nMZwlhUx4dCTtHaPDVK8RQiLChCVWRjarWX0Dr72Ma3xlg0jeYIU2R61bTsj9bsGnZB5Vjb6jhiGB2EBm+gU6BD9K2G7sKE9TC7shSfr1IuEobReqKCuj9Xct9m/dCU8S7JI7pjQj26pBGxXC/WnbsAh+zSRcbAqb5w3Jw22+8Bo8PJqltChTRqdAtOvW+RpyNp2kjYqHNx20XX9NGxVJv/5maDo5mxHedHAt1LQZ4c0Ib2It0MSq2zzCmxHexFqgiVW3eYQ3I7yJtUATq27zCG9GeBNrgSZW3eYR3ozwJtYCTay6zSO8GeFNrAWaWHWbR3gzwptYCzSx6t7wFi+GylKoD2yk7cUKKDsNgERRc3pDE8NVvVT3hke4ev8f0GemC5WVKN2g7Ni/XireVAu58Xm49Tns1u6mirG/WO8b3qbNqKqC+ug2SOgIT4mrOwxV5VC06gqpR80ZrH+xDZpU9hse4SI2tOeOQb3rN8ErpcP3lV2HUCeQQ+rdvKNEbKOred7wPFyshNHqgF4jCXLVv39JURLIE+nCHdqapGjZEVI69dEe9MV0MhRdgS2zu6HBPl1T8TeYEU4bvqHatw6GcjpiS6eFwe5qLImHNzxufUDAmyZtHwx0nZaETo/SHt0uhCk69CVW0K2p4NVpPRvECNcTclU7Vgok3LXXaOgLsoi8rxbuNaN9wELljBrT6U2aE7ugObTligrrs+hwwGaE35i7R+2xpdqxAkYa2Xxcp3r/Orj1vRPyMDqVkUi55tif4A6haNNdGP2aw6Z95fZlyGOSbYI2mE/sHHAVZ/OKlylsojy/lhiRQDdpTfSVwJ12JCvN5xKV0ZGwrjTnUdieU2TzTtFjIGolXrshhv1Tzxt+hBvoEnpGtghG80G4EqUrXYajF5QxfNCLai+dBZOTQcc81hz1IebhjsHSvVFdjVM7fsdiZRzOh6cK0TvpJqxbvCXoQki0B0b0dopflG8ElyqWXFgO7Ck3QkEIfj5Mgm2VRqyle3BFf6z5cia+ZktK73al06P4QIKPnnsKpw8fIrceI+6ZjCET7rF/5d/uv/ERboVsbg3mzVVrv4GhlA7uoeugFR37QZt2EEbqGE6BMKclSkCHuCMq5wzU8S0tSU/RQcqnqoyIJwVeKzcJBtGIz6YTv8iJBYToItvDJIR8BjpXRkonRmmoB2wiZG8xny7C/p9LjXg0SIIDWzbjy7dM111OeeJpXDqXjpNWF+uu/+kHC8Ir6HprdXUVAkLDLN/1dzlueITLQ2IhcfOEsdpMg6klDIU1pzlojhIiNTVnpzprKIl3ACRKd5RLXdCu+Bxy/OJgsLoo7xwVcU5lxG+19BuxbE1pNlwDomAk4bGDqwIbS/iIb5MOS8N8h2DjL0uFkczuJR++jxZDb0VlUCQ88jM5iG4zTsLuP9Zi6cf/Md2aTJTp1slTERIVjcvnzuLmocPpIIRAIW19/jQIKV1fnEvTsK8c1ltC118Z7a6/sk4o8fSDPK4NJHRUd2VYIh7Lc4WaLsgVhD2+aek6QFWYgZMf3AYfhRwT7n0ZO8P6k67fNHaMlw/BTa9C7M6NyN6yUShdRocKF3+wimQQCXTLPsUt2suY8HACXp66gu4/rbkT3T8ohK7oMJ05FxEbj6c//uw6vq72LDf8COfPZ2Q5AqlfKJQ3DYVq688wVpY5SoKLve7Ce5lVRP0laHvkJNSR3U3prhPZnFnpG4WIoQ9DW1GIze50j6qIbDoqTBKRCqY3u1U6eG5eDk8j3Z/We4iAbM7re/sM3B3VBnLJSRrNHQnhvhwsgHBhnvlM4OKC2k+WFvNc67NBIJy1bI7AUJyD6jVfmwQ1vgKLG574tDV8dS4XVf6JQtBBOd1ISAKT8Tp08kwLRKFNQmfHBne/WyiT+bkIpcd/h2+74YJX5uaNXRX7BLfb9gyEutKx3gPmoHuoUkA2R0x//gDemD2WzpM3jfIyuu2Yga/+GjNtpuCu75/ro2n1/RV1lCcLjKAU5vkOqVNtQJTK+WmHbE4XUF4zUtxVJPFf58gWkW3zbvKw8GagY8I81UWYmxwFTWkuLq58DWkf3mVKSp9dXZCB80ueheSr8RimNOLr4ul0cR5wVJKKHk+/Qee/3otxMx5AeblJ+uP7YHjmYcQa6mTe9O9F7m/sX31d/gbBw7lm+kK6m5ymVqqdq0jTZjuKa6u5jjrK8oA2KHFxx4GwTjC4etWW/C/FdaOiv3j1VmgKMuHdqg+UAdGIGDgbBQeX4cyCu+Eakojo/hORtekHOlosF26+ERjm2RLp504hzj8SKrpwx6xHotOrYvB/8zfD2/+88E0cLpdyvW0PKLzWD24wCBcrVrn8Y0K8Y34tpnH0ZMR/EnYTwjRlOOwbj9zgVo6S/eWwA8+kIvXF3ZCSoKZXVUAmXvvBquGiiyg78yepCjTwOvkSgiQXsWELUQjo4C8LxJuzlfhlUc0BhAPGZmH09FPCN50+FIDkVJ6duNBo30P/95I7nOYGS+l59QtIshcJKEeDAZl/GHQZp4nkOb7tyFFFjrgF481W41Du4oXbs/dgeOFx/BHQCnoXB9oWRwU4CDu35DGkL5oJVeF5+LcbIqQwMp0m/u6dYNLZS2gKyGfOMfAVXy4efvCMagfP6A4oLtfi9IY/oFKbmIUG1XjpuTKkHQygM2qUdC+LnjhUHM4dN+DP38PgEzATUYm9Te9BMj2z6J9HfxZ15eHUAb4jdym5Y+npHBrcCOeq6C6nQ7XlZ6e1krgTzyPyz6CSyPBSizEoDogX/EmZe/Dwpc2Y5xmPqnbjIM6bhcir/KnKOoWDT7a2pG7/+mFCpOmiHAPp9IU72fQalJ7ZjoD2JiHOktjsODU/FYUnjliCJ97ujhcfqgIt/yPtQCAiEgoQQOf3r/rqAQSE6dB9yHHS2g0khL5EFMHUiSyZ0ZOc2wUvMTCKvbUmys5lJwHZxd6gXnl4AklLpMgmidsGyN7NY8R0wVDimeNZCM49hak5e+FO96aJ+hQddYB3o/qhmPi5hAakCCxta8tyofRnAbF2kHsGQupKwpSqDFIlHepLNzOIIFUokf7tbOSu+48QFD3hDUQNfUKMJsKkQ1XGeoQOfQha2WKUHd0A0ryiZRxhmoBsPNC+J2kRzXDz2C8R4MsTPSJqICUTCXFXggnZpvA99GhkCGfdOFu/iKNYbAAJdQJeN6dlDVT6huGQxBU5BcdJqxYjJsHZiE6Cm8eIrqSI0mtoGdUNx5/vgorcdPh1uRWt5/xiSc8OIx/WW14CiX+QEK7wDkSbp9ahYM+PCOxyO2RHjqBarYVr25ugunwGZadqFnAqMw4LOn/+Nu5Uqrx0uEUPggdJ9z5tJ2DP7GhUVeTjTeof40cw6RcEdK6iAH4+JmSbfIz0x0Sn1TOY3Hn0n0h1v98q/EpngyTpXA3WvmnT9sNQVgRDwWVLzWQRiXDrcxsySaD9nvTaCnUV9mtp2NiBtjAXksXvQT9yMgJOr8Dab+dZUnT7pBhyWku3Bj3RWhkPPzsw0OH9UjqvXX3hNPTqShz/eDQ0hZcsqQLbpGDSnWqsyCJ9+q/zoc5Og3e7QWj76BqBQu19KBLJUXn49l3A0dn9vIAjIj+vkC7nCbAUbeXwIOGtwsrv3NlgEW6pEpH16m3LoL98TghiQwiJiyvkLVIhD42BlFSvUzOMMMtGlmxG1oqRgMUwfPcneGvRPJRUlyI8vCXi3jwljEajjpFsIqFGvhKTBC8myRI6qdlAbKLi4iF4J/agUUkX72mqkf71A4ge/TwMtCpXmrYFmctfRYBrDjypn6SbPs/y/rjJ/0bxkd9xR+vVGDWQFm4SLVHX4YgmhGdcVb6Gj3CuJk151Mf/pJGeRUukF2wqrrxpGIxxKXifVr6OmFktS9PWF+wEFKTjgaOLcbIoD6t7z0VVQIJNvPAKUorw4ovuv+9DlnkaJy6thcbXC53eOC68T09I1hZmwZXlCwJWxuycqmQa7BToPh/QYdEICQTmTgHueYgWcAhvs6cCM8cL1cKqTUBmDjDjLpqQOZS4uEOmECl/gv4Hk9vV6fs4onEg3FxFXfY5qDbxvLQGZFEt4dZrjEDi512uaX2JVgUjUQILkGbDQKtu6lOHIAkKgyvdl8qgLSuAglbr1NtXUb+SIHTZx0L4pR6D4HnHI9CU5UB96QzOLbwXEZPfQvBNhCkCpiB75kRCR/GO4JUnYnHn8AsYfh/A16TfORqg+/oE8PAAjqwFHnqZpPR1prAZE4Ena2fPlJCsebHblMHJr8M+4yTtDR8sD4uH8uaR0F1Kg56QwMxPHmNSsETS+kuKJ6kzidWFKwx4unw/tudL8P2y1VCndIMsJgnKHz9E6IUT0CnccHbIELi36ASZtlpQk5aW5iM5YYylDdxHTifliouwTFq+by3dtXIZZz+9XyDT3km9ENsxCHEdwhGsysEOBzioVl8An+H/6uOE7Jk0si8KU3hQPwFf7sSatTPnLa9DUc2NHjWBINKAGomezDJoykZkg5ZvJPiS/vtbpTU5GxXCuUousa2Ff7ZnZ320xI2GixmeJMMEA7XRnwc3Yda384lvtsNL996LnWtWI6Z1BJZeOCmklBM/1pMhZKWrHNW5Z8HIZjiXtR2yHrOg1NHFe9QpGJg9uCZ1oM7FZLwCBdvoDlX6j6BFuSRStVYR4hxBRChQQSzm1QW0+kaUf+8B4GEawb5EoYNIMOtDJLwlERm6HAKuRIjmTgaKCel0pYsQRre70CvvI47xll3xpJQiMGIA/SfRiN9MPnqZGRodwrlePDXTnNorjHBFW2p5nlbxVI62KvHdeHOevwfFJbnYuXcj2rbshKhZT+OLArKK6T0K/lt/RRlN0y7t+y88D6yEZ1JPyiqnvqODnlSgxze8BBffcNJ6kfbLvy2tzvgiZ9On3MIW4Hfs3elJ44zIiR2wxD13BjCkV03EuJE06ysHHpw4jAJ1+G1TKbKydiPQD1hORTPwyDfLmKYAVJmRHUP+DHOY/SON0rxNHeMdS0SjRLj6wCbo0g8LleQlVH02NQi1dFH3MXjfJR4RM79C+UeTib+SYUVBGdY8+yhUvsGQT3gExWOm4eTC8YguCkcrV6KtmRVI8u6NCk0JWctocdJYDG1xFs4vmkWNSUujhGipgngFIZLdDKxhFZGtlLiToaMSZYZiIY47A12uKABPuX76yLSqywG5hasRQqObRzjDKeJKW6nfdmhNxJqUcgOo7zJYT9WcI9uU1n6xpcHp0sVq1PbUXjgOI9u8MfB6tVYttNJRlQHbfchgITiRLE518Cq7DN2JQlJHZ8LjMpFuN3d065iKyOiWUGzbDdrXIhQhJ8S4S12hIcqRrROFsBpabSQ1qjNIdW2D1tRx9EYJignpjKxNOwiJKUBshDDTs2Slo96FJf0IUql6k13EyIFkYEmUQEnyRy5V5wBNCLgzBQtrJUTbhe/TW/I7ckjxGwUTTzBDoxzhytS+UNM1GEy/ZUHhZKe+laorQTYhWoQLK99DdVk+ggjJgXJqXYJxIZ4YT3weQZ3wWlIKstJOCOHUxsIALtMT03UElEVJZatJU2cPlwwkzFVeQqmBOhZBcBCR9GlAd2L74kjlW7Lp5i5hvs5p+NPTzlI/pL4VH03CZktTehbkapbzSUapE3oR0XmNUkXS98+mJwmxdeZpgAl4o6Fbv3GWL5eT9o1172M9/KEm7Rvbkp8kEbmaUhxWncJ9vaYiNbU7BtHFOAeO70QFLbw89OIrWL90CTJOn8KZY0dpZJGpsswIqV5BErQGw0dOw7oda6AtyhRIeWjvMbglciP2bThOAh1JyfSOzu1ZCMvHK++aPiU4GJg1CbiDWDXHM2RkAWOn0zr6O6RDTzaFffkTsPRXk5tu3AYZ6QpQg2yTv+7f84TwbeZk5YTuZxonwu0bQtxzxnL1na7U0jRSkl7/CZ/+8C+kJHXC7InPgneuLFvzFR5/nSRfGtLdu/THnHufB99IzAhPU1/Aee15oejOHXrjwyc/Q5dJqShghBPMbfs2Rg0gx20QplD+Zj69ZY8QLQiL7z0P3JRq8ou/qzaQ3EckOj7KJJhxuIJIuAgspV8/mL6N8xvxLP0mNw2Eiw32537gxbdMpPTpR3rg01d7kH17Pqlmf6F5+2l0JbPjAHd/FFQWCRL87v1bsXjBBoyadB92fPqQWAzUpFVj+PcjH+D592ajtKwErRMvWeIZ2TxyK4jqvvMZcQiaCibGd0ZEyFFKQ/KEGXhPxdotwLxZtnr0SaOBwmKSF7NJ+TJFTP3Xn0YsRqMU2pw1zSffAxcu0ACnEV6hAgZ2LEbV71/BWGKaZ7sR2c9WV+BoNiUi4HXtDindMea2KYhNSMSOfZsho6NH2ianonNKTyTHp2B0xyFo6RmCL9dvRud2WvCVp3R7FkjrigefluPwCQPU9K7n5mRh29dtiLMY6PZjGUIiNODrVMePAuhaNRtg0n1zR5q69SGJnubl1wc0uaeJpC1caloIL6cRtWufqQlGDycC558F3fljNW1Ca5P9Jj0Lj6BQHD11ECmtO2Pe/fNJ0aFEImnsdEYNtuxcjfTzJ3Hi7CH0DUvB72P6onzTenT0IEVH+y/x/ZtknEFI37I8EuuP55JFi4mixMXSqN+ejANbQ3FsVwgG35lR896/xWWPbH6JpmGTdO3ZI9DSfFsWHgclbSbUElmWevo63Qt+6yAQ6TXxyuQEqr8hVsirz8uEPLIFFDRqpV5+eGD8k8K/PR4qrGzfK6sqkbN1E9m7m6ZkZYf3Yggpedzu/xeWfbYQ/sGlmDCqFKt/lNONx3oMuRlY+DPJDwTxySX2RVv53clNPfNvgga5eKLLvkDbjXKgOUIM0AzS4CgY8oiPkvjr2p92l4bEiFG1PtVHttFe82y4JHel5dTYWtOWVZRi3tvTib/m48U57yPSxQfraIRXV5Qg+c7p6PzK25b8axZ/h5XffmnxDxs/AR37uiPn0qNo0zWbrsc2RdlOtXjidA8JWN9Z8tk6osl70TbomnyBDW+Eq/asJS3aIdtqEpKNZAghAE+f+LCAq0A428YJmwwpI+8fl8e3hWu3YTVzJtu3wNvTBx+99KNN6OidabRiVgq3oGCb8B1rWOFRA3x5Xlj0VPofRHy9PbGLLFwgIXrZ1z3wyDOXKeEFc2JGqmOQgL6NLFWNIHH/moGNJPLNqqRrzvy/y6DLOGXzcnlCO7jSHNglpYegleC9ZvKY1jZpnHpISLMGHe1w4b3m1wIyWvmwRzbnT04lqYuBOmNMYksMnTDJ5KcVrvatM/HbT69i+6+vYfoDKwgJ62lkT6F/2m1KihIJZpjT2j94dhBvH0jpx1OYneRH5k5AzRxQApMyoMGRdBUd7MOIYZAntKcROURwCz+i6qompE6X5uRuYg3baIiTkEMSuMfIGTYrbHUW4CSBkb7l7LEjZF4chKDwcCepnAXTkSboRZG8rtqC/lni5hG6hJ60a5U6hxH7CNEz6Z/nbTQlQDaFvUpP1qrNoicrAnj3yip6hlBYV3pS/6MPMwquBvDDpzJqzx6lVS/anxVFS3/u1z1nsamtgXiwLuss8X0yFXJwMJBN4n/Mw1I2S/I8cs0Mvx7eLa+HMv6xInjjIJ/iwCALiKAVjfpBOEv2isQOqN65UhD8WIDjs+D+t8Ds5kry/Ve/iab4DQN4FIrI5i/WW1mq1kcNdDnnoSf5wFhdCQ0ZSAgkvj4KvsHKaDAI58N1wUbbAtCqT2TLem1KHuXiUhRbvoruen3JDVBYg+LhupwLgr0aK0nYfq2+QZ9/mXapXib5IJmO9qwfdlHf3/hXy2tQCP+rlW3OD/w/+GHMuF/3b+sAAAAASUVORK5CYII="
+WELL_SPLIT_EXAMPLE = "iVBORw0KGgoAAAANSUhEUgAAAIQAAACVCAYAAACZzlKZAAABWmlDQ1BJQ0MgUHJvZmlsZQAAKJF1kL1LQmEUxn+WYphUQ0NUhFBDhYWYQzUI5iBBg/jR13a9mgZql6sRQRQNzTU11Rb9CRpNDdFSW1AQ0dweuJTcztVKLTrwcH48PO95DwfaOhRNy1qBXL6oR0JzruWVVZf9FTv9dGHBqagFLRAOL0iE795alQfJSd1PmLOiDuftgX93/fqkr3Rjuzz9m28pRzJVUKV/iDyqphfB4hYObxU1k3eEe3VZSvjI5HSdz0xO1PmilolFgsJ3wj1qRkkKPwu7E01+uolz2U31awdze2cqH4+ac0SDBIgSF7lYJISXaWb+yftq+SAbaGyjs06aDEV5GRBHI0tKeJ48KpO4hb14RD7zzr/v1/D2hmA2IF+NN7zYIZT8MPDS8IZHoXtf/BFN0ZWfq1oq1sLalLfOnWWwHRvG2xLYx6D6aBjvZcOonkP7E1xVPgHNoWEQDEZXhgAAAFZlWElmTU0AKgAAAAgAAYdpAAQAAAABAAAAGgAAAAAAA5KGAAcAAAASAAAARKACAAQAAAABAAAAhKADAAQAAAABAAAAlQAAAABBU0NJSQAAAFNjcmVlbnNob3Rykxa0AAAB1mlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNi4wLjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyI+CiAgICAgICAgIDxleGlmOlBpeGVsWURpbWVuc2lvbj4xNDk8L2V4aWY6UGl4ZWxZRGltZW5zaW9uPgogICAgICAgICA8ZXhpZjpQaXhlbFhEaW1lbnNpb24+MTMyPC9leGlmOlBpeGVsWERpbWVuc2lvbj4KICAgICAgICAgPGV4aWY6VXNlckNvbW1lbnQ+U2NyZWVuc2hvdDwvZXhpZjpVc2VyQ29tbWVudD4KICAgICAgPC9yZGY6RGVzY3JpcHRpb24+CiAgIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CiGiL5YAACQ9SURBVHgB7V0HnBRF1n+TZ3c2AaJ4mDgx66EognomVAzIKRhQFDhM6KdnDmf6lDPnn4rpO1HPgDnded6Z44nZUxRUQDEgCLrsLrsTdtL3f9VdPTU93b0zu8uys9Pv95vp6qpX1dWvXr1671VoTxZAawiyKSKPfw093H2sJQW8lrGrOTLTStQ0jWjlGKLmM4mYMVRI/0yUXKDGuOGeooCnpyVENkq06nqi1Ou5V/QMgKRowH0av2qizDwtzTecqB64LvQcBXqcIZrPQrt/UvwL9n+1eFwXs+sU6PEhI7O0tEo3/ak0fBe7axRYrRKi9XboAq8T+UcR+TZGRTP4QV+Iz8K1HT8JzJacZgM1M4mCW9okutHdSoHVxhCpH4laphRXV89aUCx/ccANEtXeRBTYwgHHTeoWCqy2IaP9faV+HiVsEbRlBpkP0qT1YlglR0C6uDqFBQW7L2q1METyS4wI/8hV0rsBrAhYDwXQ0dOV9GwjpMhyotitBaW4Ed1IgW4bMhKQCO1voWYQ78mnlRqiUatgWVTtD3PzGqS9oKR1MujbDkPIpUTeGgxLV8Fq+RjDyQFENcd0skA3m0GBLjGE9DS23U+U+BvKNPs8wQx1iPcPBjNAB0gqUsOogQ8h9j+owEOFuSw1HWHvJmCy6URtZ+cSGp5AfP/cvRsqnQKddhy3oaETYAQPGiD7q/WDPeuCEc5AGj8F3klLUJkBDBQ6BkJmR6D/L8pdZplDRGa+heUyEEEum13gkBaWw5J9EW6KBQU6zRDtT6I09GLBDEqPZo9jtgmNU4/e2g+d/3PtqZ5ai6crUb4dIPIxtPjWQf4YElhyOIAXzOZfH3muw1D1AVF4Lzwz7JDBTSqKAp1mCBbZwuMIZghNxXDwGlwJP2nMwE/OtoEh0GCSIQh4HvTo7Aq9XiHcB3Af18X/kZAmM5AG1za7srNLdDy+KAzHt74RRJGTOQRpsg1+w7Sw+991CnRah4g+AxPwFq0CgfFgiGcRzuRXqBaOqegsMMVHejzYzwOlk+cz8hpZF/v5uR3uMLQQfl7oJpnvEAZz1d+nSReHXG5SERQomSHY4RSDFZH+Co0xT3uCdzM0cjN+6pjPEoF7uupwMvX0IupXNAqbtvV34ZlgDhc6T4GSGWIlpAE3vgBpIWDs5rE8CX3BCyaIXdn5CnUlZ2AczNEzulKCm5eFb0mQXaWgyyECekDsrxjXJ0JsgyGKBZYgpUJoOphuqHUug1Gtk93YIihQMkP4fqeUCitDAlsXGVgXXiiOnjoZ28GVh5AigM1JNisDB2O5BCRUZqEpE3QQ39ZgyBNN8e5tyRRgda5oiL8C3eHTQnTBAGCOpgl6mmoy2ukNwMmTNmqxsD68G6Hh9VVTbImwwsqua1ZK2aTNkwZ4duRcOKlmIg1+kRpYIK4uoRK0+HDROkQ79IPW01CwIhWEpcDaPkR4BkpmScDKXyKXgyWAaHh9OV1gP+gkLyBdfR5ufaPAlO/r8Xoam8Dst8h8iSuApZVvW+gTFyBcEstr+Sv5v+ghI/kZyGRqHNEQ6U4wA1NcYQZmLPZbqI6l1JzC53G29Lv4Y91F1oUV2ouUew5i6OIlerHnceNCSRQomiGC6JlCIijFZ75WbjjY2d7IjYtftjVXnhgS1KGHk6x0Dgwn7ZjcqvkzJNVvgaPkYU+pC6VRoCiGSH2HxgLhjV5p9QyUFDoaCVaNZoXfURz0iAKQUsGUkICFE3sUguMbJEBiMXiq3AU1GiVK++9Qh+BlcO1PoFDueUxsvrIkUEU+bgmi27s2GmJdoL3HEZ0H4eL+BfltGKDYklmX8I+GLnFKsTlcvA4lRPJ1nUh6z2OmsPQfgEEy33edGcTTeHLLgRnYDPXvCt7cWq+bzYV1ieRT4F3pOrfBc6NzFOiQIfy/15HlUADp4MeEki1wiTANHUGWJZGUcZ+jhC6BIYMtDyF51sdV5oEk4vJTb4EBf0DYBD7Uzb87ImUdkM8LM9WF4ihgqwby2sXYbWgHKGZB6AaBYWgoeCn9Q9Dj3rYoXPZovmINpBmEWakrjTwVzptw2BIQIKWPfisuSTTkllqj5zU8dBmhzwApzxeh503PRwBM6YngB3M0dADqPlRPxCX6BKr3MuIgYSJH5eLdkEYBWx2CF7SyI8gA9LhaMEhgY8Sn4ASCIsdT3nmTVwayRQA9lR1Y3IisI7DjKPOjBZ4epTKQPZZFCksSyZycrEssHxiaHV28NlNC3SyNweW9e9XIZUkH729M0ej1Ke59AHb28BS2HTNw7/RuCLxBGr74RyPJHs1rIlQTU8Eygh2lG4gcYCbgIQJMpvoyOEn4LCBVWNFVmYHzFOCKDJX9Z6tD1F0O+h4H0T5CI5AHDBKCPhH7J1zUJ0I64GoHng3QDt+hAZbZYEAPqDrDJq0T0f69iPo9i7pugWeyQsrg0y52/yytvLBCXMingO2QIdHir6N3LcGkEuYpkovgvj5VpihXJr7UA8wiW0Ezgiq+Hsm6SnalgVFSILAvpBdc6+oqKzHkQIqZF+2oBTMOD4O8FM8FjQKODBF7ARLhGg2R5wZ4zLcbJgyCgiF4sYpYyWREdhDQmUjoGC0d4Foki4W+im5QgMJ1goLqXUezTggKqwEYagKQMIGd8a5XIhb3NVfhfnMDo6ICtgyRmAMC3YWG/V6jh6WSZ9HTmaAND+PcB1gmUnyLvG0oR1X2dDKznmE7tHRTUwSPRCMfrxWW/gVrN8/Fey3OL5yHxOxPWpx/T2wfuDg/vVLuLHWIDHpp2yU5ZmBisBLJYj0P5DChRqI3toDgkhk4ydbtDeW09go1s3NYWCeqompGR3nstPKNRAIzKwOuYZiezIxpKLPCuvlBpOT+gCOZgSP90EUqFUDCQsiySM2Y4sE6dbeDqFAU0+hJiaeBstCEw7fIl1mkxDPLwUw1A/siqs9HLKdz41kxlzkTpAybvLaANE4XazZk/QPAhoXUuDeuLKEgwQwnFwfXxeOHoIrv4IbvB6Jeh2rhSvy3lBC8DC78JxBH1cJB6JYToFSeBeLBnq86DunojQWgjs+cKBvGhMg6iX9jlHcdEophBqCJ1dpo3A4hwcg6FsItxyr3yO/Fcw3As8NH4g6Wj5Amk42UigzY6hBMjSYwgKUUQBozg2ggDBEG8TlTkeDdCmV/BWSnHl9kWXZoPOMpjlSDH8IOGIcZROwfgbysvaVyFUqmkaWEkMTz7yhDpmsIhJZERk8MolfxHIJ3U/gqpkB6nG8jPZRisj/iphuYgR1gYqGOUrYMZiEd2OKxBTBA4CAww5c6BuqTnGeLXREJjgwR2gM0kBg+hR4gNGvi3o1A0D9ojZ+eix7/NXSL+zFkv4h5AiiLLAW8Ngqa9FoaparlG5EdBCCdqjGEkeqMYp1BAoYrrhNbOUJPkfHyCgZofwQ3OmN6YJaG95CJlXmVzW359jwpVH0pGv1gNPDVQFGIzbusG+6BRABjpN7Nz847tfjAkIZbtV/wCLTHDmAO9GZVoTNyoRZioa4RYRHgockMkE5JPMuYE4E+wFYE6z8GIyMo3OBIcwJeq9kP5nKl7x531CFUAqaXw7eAhpVQdTaIX4vZw0sRg4YpsBTQyLxkn3dp8xQ6z5Sm3pS5lSsamtc2pN5DHCRP0YCG572hYvk/Dz8KlOz1DGKYOw2//ZVCKjSIUbQ4iKL3GIBG5POe4i8hhpkBIJxPzVpY/ENcp/+r3Yt5DzSgFbDZl8coLAn0Mq3wjTgwD+sIBZNgYMQOXeDmZ6CuMVg7GTB9ZKrxhIoMgHzFQd6Yj8bldRFV48AIGHd5KPHZKaCyeKvezz3zOImgX4thBlOWvFs0bh6g8flQMxVCsJ7yFgTrOgRP51c6FM0Qvk1ypPLoCqAPvZvH3f4vYNxmccs9j4HljgyLCOs/noOI/sU6TcYKhVDeqNdiZBvXAQymzr/wM9sfQjwzgakM/27qAyozXDRDVMGa4DWMPD6H/yefWGyCRm9GnOzdIDbPDahKqJqDTdTwKYiR1oFMRAOy6crWiWdtREKCqENCHnPovVpmNa5KIwePQqyJMcXhZa06tlQ0gRM+FfMdxxilVGygaKVSUqgd5mXbpbiDaA5OROMNQLtej3uzhxJRdhNX1ZehAXbBMYOHosEbgagDK5eBESgaCmg7JI+ZGdR7mUe9mo8lEJ5UZnmWEjy5ZgK2LIKQCuyc4pNr+OhD9ppGLkH8MBNyhdyWzBDN54JmHyrUYWXRSj9AtFi2trCwMdg6qQETRe/IKZ5KiQVBobCyRODnSCmkY3kGI2qJdsMn0aXeKHyemL9o1zPwBZKn+kIwcz2YAO/Dcx0skeSSQXar19+o4FdQsOghQ9LEN1SG9KsNM3BqEA1UdzeukCQqsAnaegYkwTdqrEMYDUgYlszMwDnEBmA0LEuDzM8WzMBI6PVi5Rfelk3hhscgoSCNxDGKOqNIZmB07xD+r0woWUIwmRpZgZSMgMaquRbt9RToPh8N8ivSMJwwsJeSFTrjXCkturh/OfabJIJjZs6j4xtzLYjybY8eD7NSpAEnAQkXvVwrSQwlYBgJgQMxnwFmNeseMr2vX0uWEEwQdYNMYDToHNV8CaLhlQbMMIOsMJEQDSLGdlN0wS2Xo5Ql0ktwb4uJN2Tiiau6v+il60wWfwBFt2g/73p6Gl9AjcgfcdXxOKrSoFMMwQRmDT40DdLhTEgGtdHNjSgpGtYDSGdLIs9ikDhWV7VxlJ7MqKwMysYTvgaLZ7O+IvCUssWmYP2ez5qQwE6ySnddd4ohmMA1x6I3TQaxYeYJl29HvTcpyQ4G+hS9k00/ySS5pMKQQ7liVRaYwD8G/hDoBaxgGsCMBIdZaLwRYwTCwJcgpr35GfiFj5axlXvtFEOYycVMYRw1BJ0iCHNS+BFURLV3y57MiqIKKCcPuHZsXaigSgw93jdICwT3VhDxDGZcXizLWwcSH2tp7WDGVacpeKzvcN3wE9/xUJIqMWhugk7ToO4aaO0fgDE2QI9FT22DKE7MKr441it8O6Nd/gPpwY3E2r+unOaVIplJj2TFNTJFu/Fvhmcyw+g4rCesuhTFQJdhiO+I8AIEVCZT8HmDUaVDp6yMYojWcjXo/qKCqRBexoqzotBo3IAF50ZJJJsrM1D4dAxXo8F8j6Khl8K3MBl8BAnAB6qKIQnPFD4MmLlFAYYN3kBUdUBR2H0SqdsYgg8VSaInhnaBYgZFjjf1rDoJNJO9kcW/VY93IivyiKnxN3QkyVS4Vs8AQ/we5iPM3fhMLd2SqVhPsXBo2T3WiyGm4Xa71L4fz83UZRCfUzoRY/W1WDPBTADgTcERNJq0AjpkBm44WRsMZLwop+ZmZIckMABKIk9OBQ9D+lA4t+4C48GnICFvRlZGQk9RrQoZbXf172CXUhnx3aJDpBaCWLqjivc3sPbPCl0QLuA2NKLQB5zoCWaovRGNDB1AMlAGcw+xZ9Hg6rADvYLnPtofw+9x4Ep9AoqskEQ2EogZJTAW+gnq6XRaHq8NrZnmVNG+n9YtQwYzQDM0d96PEWCTDmyWfAXXJH5phYgsBbgRWWGUjYlgYH8wxDkIKNB0Csqbp0R0Q9Buso2/0BPcE7oDvJSVDt3CEAYR0UNb70F7zzZi8gMe3IIR2DIQy/uZYXQInwy94BB5h5nQ8UBFz17dwEpn3b2wcAas7ieVR/ly1O6e2qI0cyPyeVSGp1CXCsIMVCQEP5xXajPwsriVE5Vy7AY1DBPcsztcnKsVa/vP1oj46o8tRmUldC9DgHYRjMF8XBDPEfDnkvo9gsY1O6CYxql8QvPMKEPrzcBfoYXFvwlPpnD5kTPlnXJlKaQDK6S80Ze3CjiB7RHLTpn6aFr3Dhk2RGoCk9gdD8DzGpGz0GibAAe9VZyXbcMEavHiKz6vIs8PuVixGRlMINdHCAVVSiL4GAx9Rh+6ZM6qc6E/7CfvKvva7RLCTM7EO2i077XYPBNSR+TpcV6wy6ukmqcj0oEZxKYfXQLwhiD+pJMKYUikekgYcZxRBCmSGRgJyq13I/xgyahHCfGkmMsMTCANVjtDJD/Bg2TDhORjc1c2I9mp1QIpkV2ai7cKCUVUlsVX1YLBbRwOpSwsGLG1D84xM2QWg4m+Ag6sIgm8foP9KC5oFFjtDBGCKBZT3ejZwcOhX4zSSc/+CQDPULZdjYZaqN07/itWiRUeH2Ow6go08Mto9GVWGBZxYKzUYov4Co3qER2CezL3XGltyB7K7u0YzFS5oaekNpA6AVia9RDBUGyRKAqs0xFF/MVAXnLHB5XVXYe62VkzJVWq/JF7hgxoPMkMTDIZZsboFDOgDN4KkFkJZXQbSJiLEMG6B/8k4M14ttMK2P0duRh5h1qlVnZczzCEHY1NAxb39ACGlNTHYJTPrTNxY7Jnkz+1xMCzm1ZbAPKYQ2CCEaFo8qk1oZ31CPdSQIGeGTIKHpuL4KnrFBo1jMms0I56PI/rP6Dn3wbG+CCHy4tu6mBF8B4KhraHwRDPQxIs0e7FTiwLZVNPFZNiNSfJO/dqRYE1zhBWlZJxbIq23oo7DAU1mNtQ1zuKGdapSGMGALAzLAwPZ/QGRC3X4tR/lj58wJnrolapUhju1QxRWN1cDB8v2DwJ96w3YOCrfxCNDQnCekXT4YiDIiuBjyMwVl7LSPdqSYE1q0NYVkmLXHULVIPnNEdS/fUY/00+DB8cSrzeIvEazNndNGbgnPxZJWFdgDEk2HlJZbp7zVGgVzIEWx/JZ7RKZr5Ao7+H4QCNbobQTtA78JPApm3rTNzhqoJYTscSg01VFxwpYNLzHXF7LJFdy+LcCX4iHFjs2i4Goo9oUkXsxlJYnQ8QaZ9fTAkujkK2XkQMeDXrYWHE3wI/bA2GgBOpVODT55gR+MeeUv96pZZQmfhlq1RaNVf6Z8yJnAgmwJATPh7DCYaZ9g+hY2ApHx9u4kLHFOiVQ0bH1bbG4DWYYoEOdIjEk2CCgZjJ3N9lBmtqWcf2KYbwKUOLd5D1C7uxzhTonTqEc51tU8UeUyihGcx0Vo23RXMTHCjQp3QIh/d0k4qkQJ8aMop8ZxfNgQIuQzgQpxKTXIaoxFZ3eGeXIRyIU4lJLkNUYqs7vLPLEA7EqcQklyEqsdUd3tllCAfiVGKSyxCV2OoO7+wyhANxKjHJZYhKbHWHd3YZwoE4lZjkMkQltrrDO7sM4UCcSkxyGaISW93hnV2GcCBOJSb1+hVTqWVLqW0WNluEqqj2xNPIW1Nbie3UY+/c6xmi9a6b8TmF9wVB2mrrqXb6n3qMOJX4oF4/ZHj8WCQpIaCEZZx77VYK9Po1lemVjdT24Czs7azCifkNlPnlZxxwOon8g9yNFt3KCXphvZ4h5EtHX3yeYndi1y/Au9EmOB7gHBwDFCD/BhtKFPfaDRTo9TqEfMdstE0G8eW/5dRy9gngDC8Fdh+DvXpeqho7gQJDfmvgyEBy0ULKJtspuPmWMsq9OlCgbCREtj1Bq26/EXsuluL44zgOQl2Y91qe/gOp/92Piri2px+j9OJF5B04iBJPP4jtXFkKHXEM1Rx+dF4e96aQAmUhIdq//pJab7yCPEE/1Z43Ax9qmU9RHj6wKZjS+skgMU2CtD5yPyUeu097Uw8QwAwMqU8/InIZQqOLw39ZMETrDZfh/GtIBrxI6503U8NlN1BoxEgwhIdaH7qP0t8uoKpDj6LUku8p8cQDudfVmYEjgrvskYtHKPYWThoBVO26p7g6/unlxN95k2JPzib/pltRZNIUnIgLRTeonWSSaV0lwp5g0LEokchM7Oudh1X0eoZI/bREMIOkcra5SQTZQZVNpajupNOEFGiZeT1FP/8v9vHpEkNm4Ct0jcwvKyjT0kTNF51FmSWLDcnRPudNCo85kELbbq/m0MJghPj7cyh6y5XiWQRdhKF98QKc3v8MeWobqO6ymyj+7tuUePQefP2nluquuNlQdDNtOCTL4yNvdTXqlaGmGedReh7XMUOhw6ZSzRFTtOf0ov9er0PEP3iX2q66II9k3iGb4pzr73E6SDuFJ51AiX8/g09KY0OnE0CaBPc5SDSkFZp/+Cjyb7UthXffm9LLl8HMDeFk/qtwTvc3VuhGXOjQKdT+3OM48R9nEAACow+gulPOFhIoevOVYlirPu1CSkG5bX92tpGPpUv/2f8U98yomWisV5jSvV5ChIePoGh9P2zzx8kfOmS+/VoGKfHUA/jUdM4CMRJMAe86g3H2VF1+LCQH91aG1Mfvil/8wbs06aHoH/mZlDvkD/5uOCWeyTU0QflliD/7uCGtYnfdRP7t5ZnOWn7vkM0o9vILFLv3VqEkC6kBxde//oaU+mYRVe07lnxrDdSQe/C/10sIpkVy0QJqOWe6JVk8aw/GMYRLLNM40jNwXQrutjdOz41QcJtt8B3Pc3CgSNQWv5QET0N/Cu41FmdR5PQWtnY8dQ3ieen5GB4YWF9gBsMQR34/+bcdRcGRv6fYA3fhtN0co3v6r41vimlnKnrXG0L9bpml5e/B/14vIZgWniqMwRbg3XAo1Zx6Hg48v9AgZB4aGqH62FOo7ZqLRK+PswKo9+A8vE7esNRSmYGLyTauED9RpC6BvGDKzLIfRRQ3embJdxS97W2h24hI/c8DXYO/DsAgGUO767l/yMzeD/GX/2VZSfZFtJx7okY8r6+QcaAUtt10mTYEcAnMDJ3V7q3mURQrRlQwYLIw9OEow/qNnhbcdS98dPYH7X2Q7qnDOYo6ZJt0bgAjhSfjbKQ1AGXBEP7Nt8r1poDpwErph4B1YTkUwImVBxI/L7KIGxb3DuAdvCFFTr/QGoPzQgH2bbUddIMD83DCh04mVkzDk0/C14hbtDTBSFl8r/wDapz8B2o8ehzFXns5L9/quikLHYJfvv3r+TAdl1PbzGuhsWka/eoiSqfKZQVzn4Op/YWnHLOzqZpdpZnOjOgdvAGGkO9xMHuNphzrUofjmcGzjb9o5UECDnj0352XcI61yiWWDUPIKjceNxFEWiFv+/YVCqhQRPktFYZILoDn9tZriZXaunP+F5/WNllPXaBKWQwZ6vtFTj2/UFdQEfpQ2NMwwHib4L4HG9Jh1YxzKfPjYnxC4mNqnXU7Pk7TTrFXX6T2z+ca+J0NlJ2E4BeNz3mL2q67xPqdYVl4+g3IiVprLPIMwEnp0C+McdsGr8eiWTdKQ9dQPa1QgH1bbodpfr8YTvzDthfezV8njM5VC8qqb+gWlJ7/qTBtI+ddTuEdd8qllxgqC7PT/E7hkbtQG6+kSuV/hMsTqaX6W+4jX79+1Dj9qDyXt7kMnkLvVZDUHFqkmsZQgNMLvjB0pvRXc4V/g4cPg3GgrKYXztNeBfpHCsMJdYEhym7IEG8OBc5TYzFu+tCTdKeTp7sX4+qTWKudicx+EpMCHX/gjhwz6JXhjsCM5B20HlWNGdulKpblkMFvzN7LGNzD6Z9+pMw36BU6+IaNoIZLrqHUsp8o+uj9GF9TlJrzqkzuk1d23PV/CN+S6AYoW4aQ757FsNF8+YWU/uxDEcW6ARMoNGYcBYcNF3MDjdMOyZsLkXn7ytWz1iDq/3/KfEoXXqzsGYLfnVdTtT58P8bb+dr0siQIFMyqE86kqj33oVV33kTJ11+QKX3jCmWTFx971x9C4fETKYQOINdndPYFy1OHML0tE6F26vEUPuiw/BQoWcn3/wMiBan6sMn5aaXcYaqaNwp1J3iwvK/LAKUzizUX6S8/wxKBC6kJaz26Cn2CISQRwiN2oupTzide2yA0cZhtQaxvYPCv+xsK7LqPMM18m25NwbGHkX/kbjKr7VWsioKySonu9Y5mV3SwfsO2RrkE9nqqkIG1sfLkP1LjCZMo8Zk+06oiFBHuE0OG1Xvyfg5ec+frjw99qoB5gsTc/4qlcL6NhlJwh1EUf/E5CmBdg1zmr6Kv0bBqXpoqwnpSYAwW/Dz7sCkld8vzK3V/uQFmuIkGOZSCUJ9kiEw0Sm1YbMszmzUTJ1MmFsNKNi956+oFARr/OAHrELT5hOpTMSHl91H01qs1c66zk18FpC0xAqa0f7uRWKrHw0ArPl2t+xacisH7efoNdFwtFhw3kWqnTXcqJS+tLB1TeW9gcdN690wokP8WKc2LvtYUTTBE+Ojp1P7mK/BV5FZY8U6wxNPQ0PX1khbF5aJ4kYt5yjuX2rUQJFfqozmllQEJ0tHSQfZylgKlYZdS8hrE5R4mIfPjt1rPh0s48dRDhvnJ8wS8ICXxD6yHVFZQBUaPhZu4lVLvviGLyF1XFzPknlBciN3zUHSzXJ98Z21+fkid6glH5Md1cNcnh4z0z0tp1W03YsiAGN5sK22fBojjG7oVpb/WJ4BUF7FOpOCBh1PtMdrClJWnH48Ftos6IF/vTvZtsS35Nt0CXzMeSNVjD9KW8XVQ5T7JEOZ3Tn77DSaIMFG01trU9tQjYkV14rknjfWMvm22Fyuuaw6bJNZdZKFzBIZsTG2Pz6b0oq+I5xAEgKkEQLz7d9odHtB8KcJrKVm6GFPWGvYa+2cnnZyzCU86jiKHTuqwLhXBECoVWOFkPSD1w2KKPf0Y+TbeFFv8jqJMWxslsEcjegd2hCHdt/Vwqj4cS+znfkKJx/+mFkG+LYZRwxU3UePU8Vjs0pyX1mtvwMyRsy6h8E67OlaxT/khHN8UifEP5tDKaRPwG0+ZX3+h+vNnYAfYKGrGIt2Vk8dR9G58X5rHZQCvNVh16ZlYqb0dhSZO0/waIgUoCW1msuacGcJL6Om/lp5if+G9JN3t3LJ/mkUKm9tvdTynU1EMkeDFumxNYI1j/OXniXeFtfz55Jx2zzON6kJZ1vyX/CBM18jZl2KnVr2YJ/EOXIfSv/5Kwa1/R3UXYP3BhKPEbKNFMxhRYnNyNzu3jMKtAuxdZatIgfRnH1H0+WeVmMJgRTFEYLsRBpEC247AsPFdvrkJu7724mux4PUErHGsFUND1W6jBdXCo3ah0IGHCosk9d4btAq7uviogabTjqHY3di+t80OVHvVbfarucBcPQo8ba5LO/lc1m+4rm1/f0pGFVzL2uyM/usflHjleQoM24EicEDxZlwfXNTBzbYseFGOqN5vHAU22QJmaArXzcXSszh0hfSCedg8M5IiRx9L/sHriZ4fGV9orrGyKSEbjwv9Qu7z4PmE4GaXiXE6et8dYLQUmKfVcIDx+kdjmb0sxOIqzEnTGggLtC5FZbBkwA7KkiESH71PyQVfQdm7T/SCxDdfUWreZ5o1AOWp5qJrrDfvggqBjYcatOBJL//QzcV9eJ8DBDMYiRaB6kOOpPTPP8GX0UQRbADyRuDH+PujoqF5TydDCFsP+Zd3LAHig3vshwUsv6HYX2+CgpIWuFZ//pG7UvLNlwp6N+PyNHdHjiirMmUc7wFhfad6wuEyquBadgzRcut1lHwNugCDHCPBBJmlOtdDNCexZN9yN7eWy/jntZlyX2brF59QfOfRVH8mNhbLcg1MLeCNRKgeq5xV6HfnbDGMeHH+lQrtL/9TvaUMdnnVTDmOeOhpOvUYw+T1DFhHuNizy38S+N61cG8S9bKgACbtvAMGUPzhWTKq6KunOkL973uyQ/yyY4jUe2/mXgqEC+y+LwUxy5lp/JVif7sDi2fXoarRY3I4DiGPqkCirNR/XqH2A8fbDjlWRbGUsToTwr/NcEq+gfUXYC7echg5cqrIzvMp/e99glbdfQeslRjOmZiGoStO0SdmY7hbnyKHTMSxBS2UfKlQ+csm4+RdZ938auAdApi1Tc2fC5/Dz0YaL6cjTIDJjdHhqZrDzUCwCZSdH6L5hitEw/H7BPbYl+qwt9MA7lk2vdvAMQVaH3sI+zPvx5gPHzA084aZDxTOkJryFHWLuiTmfooP0g/E1PvgorIYSBhSmi44XSyw9a6LhvWD6VC32rMuFF5HPguDHWahMX+gqr32hSJbRenGRoo+/hB54Xyr2u9ADGcRIWniH75HvoYGoTMZ5TsEyooh2CUde+lfmIOIUBgnv/gGru3wasUnpZYuocR772DJ3faWB5cVX1I3YoIpUiuWk5/fEdZPT0FZMUTjlIO1fRSQArVX3IKT5bDns7sADdB87Qwopl9QCCfaRQ6Db6ECoWz8EKml0O7lZliI4+S8L7q1ufikmtQHbwtlL/7IPWKdZrc+oEwKKxuG8ITDOfcxJERoZ2effKn0Z/8F8VI5gKffWpSncJZaWBnjl9WQwdvjE++8IU5fCWMOoruB90Ymv5xLYXgnfWsP6u7iy6K8smKIsqBomVeybIaMMqdz2VS/VzLEm18uo1PufZuefH9x2RCyr1S01w0ZrfEk7XzGbEomsDUeMGncdnTx+OF9hd69/j3+H8jXIuayFVfoAAAAAElFTkSuQmCC"
+UNDERSPLIT_EXAMPLE = "iVBORw0KGgoAAAANSUhEUgAAAIEAAACYCAYAAADDeYoDAAABXGlDQ1BJQ0MgUHJvZmlsZQAAKJF1kLtKA1EQhv9oZL2ihZWKBLRQWSWsCaiFsKYIgsKSi7ducxI3gU1y2KyIKIhPoJW+gPgEYrQRH8BOULxgY2MvpNFwnJOoSRQP/MzHz39mhgGaWk3ObS+AbM51IuE538rqmk95hYI+dJHtMVmB64axQIzv2vhKt/DIejMue90vajx/dPrSdrGtXQYfg3/zDa89mSowqh8kP+OOSyNVYmPT5ZJ3iHsdWor4QLJV5WPJiSqfVzKxSIj4mriHpc0k8ROxmqjzrTrO2hvsawe5fWcqF4/KPqQB6IgiTvJhCWFomML0P/lAJR9CHhxbcJCBhTRc+qmTw2EjRTyPHBgmoBJr8JMC8s6/71fzdgeBGZ1GjdW82D5wNgv0P9e8oRGge4/8YW465s9VPSVvYX1Sq3JHEWg5FOJtGVBGgfKdEO9FIconQPMDcFX6BNg7YazuqqV9AAAAVmVYSWZNTQAqAAAACAABh2kABAAAAAEAAAAaAAAAAAADkoYABwAAABIAAABEoAIABAAAAAEAAACBoAMABAAAAAEAAACYAAAAAEFTQ0lJAAAAU2NyZWVuc2hvdK4BWr8AAAHWaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA2LjAuMCI+CiAgIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgICAgIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICAgICAgICAgIHhtbG5zOmV4aWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vZXhpZi8xLjAvIj4KICAgICAgICAgPGV4aWY6UGl4ZWxZRGltZW5zaW9uPjE1MjwvZXhpZjpQaXhlbFlEaW1lbnNpb24+CiAgICAgICAgIDxleGlmOlBpeGVsWERpbWVuc2lvbj4xMjk8L2V4aWY6UGl4ZWxYRGltZW5zaW9uPgogICAgICAgICA8ZXhpZjpVc2VyQ29tbWVudD5TY3JlZW5zaG90PC9leGlmOlVzZXJDb21tZW50PgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4Kaj0ZjAAAJ5JJREFUeAHtXQd8VFXWP0BCEpJAAkkILUAoIaEXqVKkIyD2ii729tmwrJVF0dVVUbCsuq6K4oqK6CIrgjTpnQhILym00EIICSShff//m7mTOy9vkkkhTJg5+WVeu/e+9+4979xzT610HiA+8OoeqOzVb+97eaMHfEjgQwTxIYEPCXxI4MMB8SGBDwl8SODDAfTAReEJzpw5J76VqefgX7kjwYw1e+TyJ36Snk9Ol1/W7nXqiXPnzsv65HQ5fjLP6bzv4ML2QKXyFBat250uz362QtKPnTTeqhJ+m8XWktOnz0q1QH9J2pchJ0+elipVKsnk5wZI87rVL+zb+1q3jUN5IcHOA5ky8u9z5czZc251/bCesTL2lg5ulfUVKl0PlNt0kHrkpNsIwFf6ZfFuSUxKL93b+Wq71QMXBAnSjp+S28cvlBHjfsO8v0c+n7dDquBObVvUFk4B7gAVGh/9stmdor4ypeyBC8ITvDp1vfx3wQ7j0Ti/nz3rWkcVGlJVTmS5ZgT7d20kb9zRqZSv6ateWA+UORJw6Tf85d8k7dCJwu5rMH+FIYeqXAmkI6pWiDRtECZvjuosAf4XhHip23nltkx7lEu875YmOyFAt3Z1hQNpBn8/925NRffBI1myNHGv/A/LSx+UfQ/4lbbJsxj4L+bvkIzs07J04z7Zsz/T0WRURIi8OrKTpA09JU9+uhzIkeW4VhIrhvem/SHhwVWlb5s6smTLIXnju0SpWSNQxt/dRSKrBzra9u0UrwdKPB1Q6peHuX7UhN9ld8qxAnft1KoOBqezAEdk+Eu/Sla287xfGdSB18xAomFx2lGMVGXq3wbJk/9eKSl7M4zztw6Ol9FXtXSU8e0UrweKTQlO5Z2Ve95bJNt2H5XGMeGSlFoQAfgI1QL8ZNhLs6R5w5oFEIDXzQjQpGG4/N/wVrLncLa88906FrEEUpDZifslulY1BxI0iAi2LOs76V4PFBsJVu88YiAAm9cRICCgClYB5+TMmfPSt3OMzF+VajzB2k0HCn0SP6wdX7mrq/RtHS1+4BMoSnZFJVRDHZrWktt6x8o3i5OkNqaDEbifD0reA8VGgmZ1qktQoJ+cyjljcO29wfjNAcN2IivHsRTMBH8QGhKAc7kGU9gA4t+DR7IlN/es8aS1I0MkPeOk+PtVkQdGtJaUo1ly3etzpSWoxtxVyU5Uwg9LzDP2JWZoiL88cm076QRRcyXMC/f0ayaViTE+KFUPlIgnuP2dhbJl52Hjy72xf5x8M2uL00Nw7f/pE33kzrfny6lTZ4xrLZrUkq27jhr7fn4YWFAMAud4d5lEUgryIpw6kvdkCFcjN/RvLs9c28Zoy/dTsh4oFhLM23BA1mDwf160S3LBGxBuxCBMnbfdaSA5NZDMZ0MZpKAoEq/KFXdLSvDvp/tKGyCGD0rWA24jwfrkY3L3m/OMu+gcfJu4KHlgaIJs25spC9bvlQ3bDrn1JDo1YAV3KIIr6WO1av4y5/XhPkGSWz1fsJB7EhvUO3Tcpv5lE/oSjoMeADJ9e59YycrJ//IL3sr5TG3IEIoDjSExHHd3N8squeBPTp+1USbLAr6ThfaA20jQr3VdCahaxbIxCnBSDmfJg8MSLK9bncw4keN02hVfUB38RUy9GvLW3V1lyeY0pzo84LXRt3SUENgj+KBkPeD26uCvX6528AH6rS7vUF/+8tZ8QwlUxU1OPQRIYxYeqTbbxNXGlHLQOOTKIBPKpdNYHVSqdF5aN6opM5fsVkWN7dXdG4NKnZLHPl0hdw2Ik7aNfLyBUwe5ceAWT/DOz5sKrADYdjDm4nrRobIdFkPuglpe6uWjsWRMAyUhRNSsJlX9/WT/wXzxM883wnSQnnEKlkd5jiUjkW7UsJby2c9/sgjqVTHKPXdDe2ndMMw45/spugfcmg4SdxxxaonTQi0MFrn/4iAAG+Gyzgyn7PIDnj+afrIAAvD8IcgSMk/kOhCA50b0bir1NWlhHszUtkOS+cbURF72gZs94BYSxJu+Ki4POVgKyLW7C2ppqZc/nnnKcUgUqVE9yHHMncp4ypMnbfIG/cLa7YdkWMf6cuXlscIpRkFYaIDa9W3d6IFCeYLc0+cMhq96tfwOtmoztgHmYeDBjjIyB4Mg0QEk+dRUWkHKvuPyDqaCWct2g8Lkl7g8vk7+gW+vyB5wyRMQAUaOX2DoB/xhyHEax4EQF+dgOWaGOlGhEgL+IBfkOBUDU1IgIxgJA5IDmkFKUGAViKhdL/+s5AvkDVo2jZSXb+sodWs6U5WSPtulXM/ldJBy+IRDQUQEIBABOFA60DiEg7YD/gJ7YVFcGjgPCUSOxh+wrUqV8h+RUsjYmDChyVlVu4WR1dKSvEHiljSZAIbWB0X3QH4Pm8rGgGNvWN/GYfNrI8TUryE1w6vZDuy/pyHLVxDmhmFHjer58zUpjA6U9xyDUIr3IPMZVSvY0E+oMg3qhkJ9fFzmr0yxiRjVBWxrgA+g9rI5lEsKakDh5IOie8ByOqCh6IK1qdKueZSh2evcPEIOgBHsBhHxPe8tlp346q2ADJw+N6sytcHBU4tIuK5vM/l1ebKcPOVauhjfJFJy8k4L53yr1YTRkMVPeFiQZEGb2ah+uLSALuGZa9pIkF3AtRVtvTVtg4RBuzn21vYS6hMuOXqwABLsTjshN74y21GAO1yj//Bcf+McJYPv/2+TLEncZ2j0nAq6OODXz+UdSffIIfHy9a/OWke9GuVNLvhAvViR+6Re/G8PJjH9xClJBQVRDOZtQxLkieHuSzeLvFkFL+BMj/EyNUFWqZDRgWpbWhQRomoEydotB10iQETNYEloFulExo9n2hCA9Reu38+NSyguAoTheahJNOsiiHCkSjRqSUrNcCAAbxwCBtcH+T1QAAnCsN7+7Mkr5C6YetWz+wIO7dnEqPHWTxtl6EszXfoJVAXpPZWTJ5t3HHaJJJ3iIrECKBtzMPIUv7wyRF69p6thkaxeCwSgUOjXNrrQ6952scB0oDogBxz2D8tSpEawvwzv1EBe+/4P+en3neqyY6sv4WqGB8HZNF/w4yik7SjDEHWKA1bFbiyizrniLdR1tSW5f+KmDvLOt842iY3A0CbbjVBVWX3Le46+taPccnlj/bTX7rtEgtGfr5RFdjv/m6CY+QGGI2pOddVbzRrXlN0wPHXHqUS1QWljFSz9KBSiyVpxgJSHzi5qCavqcimpHF+pgq6HlU5yWqbs1czheb9YMI9jgQzPfrEKuosT8jBM10bCdtHbwBIJPpu7Xb6avVWy7Wbi9WFXaJYBWBl4DOsVK02jq8sEUA0FXLodB1NoBn7F5B8OH7WtGszXy+K4Qd0a8vXTfSQ4wF9I2T6etQ1MqbN/YwKESpthLUWojmed/4/hZXHrCtVGAZ6ADqQf/bjBgQB8Gw6YWT9g9bWnY7Dfn7beqQOsEIAFemOKqe0mb0Dy3T4+2ngOp8a1g0CYtHEVw6lAQV+ouYkAx2jwir8tFubxO1Jsdo+s0wRLS2+EAmxyloWINiwkUCY+0B1LrTxZse2wTJkLKqHZD6qO+xPm6DpyUAdwxiTxJSffsWUdwzPpr5NWq6qFbqk5OAolk5V0UFWkpJGrGJ3pjIF84qqXZ0MrafOLjNUUYYHwi7iyRyP5cX4+n/PiLW1Vc161LUAJrusSI8N6NTF086onNu04JLe+Nlce/XCxtMW8P7BLI2MOV9fVlrIABeTczQjAaxT+PDK8pazYftjwL1Tli9q6q5NQUVDY3ptT1jkQgMeH4NhCxpSQm3dGhnSMcUhFe4EyNYwINa55208BSsBOegIuXf+DRbECrt1zcm1M28T/bpSdKTaJYQC+plz7eZalLwAZNYKZWTNO2n++mLNNFqxO1U+V2T6ZV05f9IM8aDdUUY1nadSLjzl9ZarDiymuXv40osp7y7YAJeCL14DqmHoCKziryYU5D9MPsDmoQxc4ib71YA8Z2LWxVTWnc4vXlRwBKnOEAVwBDO5hfS8OcDT4DXtRp3urg+7t6snOvfni70RMZd4KlkjAzujfvoGjT3QvH64SyNQ1hb3fmNs7yzJI5LbDjmAlfBKe/miJDOhQT+4Y2lJaw1aQCiAzcBCtpglzOVfH5+yUpmOraNgc5iuLqkEKqA/6+q0HJQzGKWYllWp3+fp9shVmcXw3LjVv6dNUXfK6reUSkb1AsvoVhEMn4EFUI8hP3v8hn+v/bswgIdM164998vrXqyUvL1+TSEHPz+OGSjQER7ugh/gYegJy50n7MkW3IFI93QyGoTvg0+AK+N3bJhjnEl3b1hUyorrBKqWcM1cgPoJpGnCu6XxEbeXCt0c4eAXnq95xVIAnUK9NYcqd0PgRxk/P18tzqdgExqW6MEnV4ZazxeP/WibZQB4O3oNgAv8xZa0Rmk4vx32u0U8UEbPQjAB8Ln8YjRxGGDwdAdjejGVJxZY7XHFZQ1b1anCJBHqvzMLXpYAklrAdShkFtBA+otkc7tTiFYxF3ELzQKp6x7NzZZ/dEMXVF6/Kqi0p1Fkwo7u0+6trmVAjm4FThH0GMV8yVkCzlu6WVCwhJz3ey2udW13yBHqPndYm8Ti7z99dg1sYnUgP4yhI/lwBEYAuZ2YY1K2xhENCp8AVoqjraqvP++qc2iqvZ3VMCaDuMNMJ8gmKkRXQAolAieHB4wURSJW71LduUYI6USEOI9LwUFtYmGu7NhT+Ex7451JHP4FpBz/hODR2lAeyfnbN1jQ5WoSyyeordvVV621znz4RutyCiEiBUxIESmY/SFojMc6Bt4JblOCp69oJv3hGJrl7gI1PUB1Gpk8PROGH+Toahqeu4A44r95/desCCEA9AkXDcRiQELieEdSAh9XIpxiu2iWXr5aP/NobmkLiEhGJAATuK4rSo319+fLx3l47FbA/XK4OeNEMH8zcKt/O2SoMOvEwPH9+WbNX5ixPMhczjqMjQw3NnH6R1srkxJdi+Tb6gyWOSyTZb97fXTbD+uf4yVz5dvY2xzXu1Mf9dA2g00X7AeUVepwETgWVsVTJgIuaGcJhiPI8LJEPwqNpCIJsPPHZKqEOYeSgeLl/UJy5+CV/7DYSkCHr9uiPbtv80SHE7DfI3uzbuZE8e31rGfTXGY4vneeVVtLMINaDBjMNjBvvrwPLB0I5lI3VBaOi9IaySJdyqrJ0aKU/owIiy+19msgDQEIGvtJtILjyWPH+taASBXkYVf9S3Lo1HfDF2UH0GdSBQhYroL/hK7d2kImP9ILAyNk6ef6qZLkZga7NoBRP+lAHQT7B1YMZAViX5TnAAQGVpX7tEPlNW8Hobfe9LMZgYGnB/N6jvYwoZ2QCVeQz3QimLtTg3oYA7Cu3KQELb0rJkL/8I38Au7evByVMA5kEXcDRjBwn0su5/z8QFPGjUjGH2IY7YKYG7tRRZSghVHoL7i+feK26JCcQP+F+UgBYHpOK6MIrGsR8+EAPw8bSUcFLdtymBOyP5vWqGyJW1TcPXZkg82A4ugtyAfPcOwVGKfyCdQTgl+0O6NTAnfJ6GYUA5D/ex5evw8y1+wyHVSq9aAupE/3BEIXTyNYboVhIQG+jzxEfiOZm4x/uKS0QICIt3doyiAGmzMAgVp3bIMyt+UIxj+l8SvE026HW0zxNsTl6SzWp7bxKiYOlkdKD1MBS198+nWGmkz4IvumtUCwkYCdx4J++prX0blnb6LMeLeta9p3+NSs+iwOwaoPN5JxawMLA3981qlBcTPE02100foSMguBKgRpkeiOFg2HUoVWDGmAibfIAmrVVRuALIgARs6GJ39HrXer7hY+EG28/tFM9CQqy+SkwTF1P8Ai0M9BBrfeVNxERRBmCshy/aoJCFu6fPq2jkY0x5XkdgoMDDKZveKcYB3VR9+iK3AqroGD6L2wG6FxLv4lb3l7gxAfk5J4zHF1WYErT3en0e3jDvvNoleCNY2C88f2LA4XpbS5rFiGBEBYNfvFXJ2OTopod0iNW1m49JBmZOQZynMVU4owCNq2m3g5XJhMfutw4xfD3UfiSdSOSGStS5E9YRBEBpy3ZJXloU4/AqrdFaqAoiH7eW/aLtTpwt1O6/N80y2Wdqs8lJCkBmTjO6VaDrspabe++qpUMx9LvKMzZpsM5tVuLSInDNPXad+sd0kuzUsvcDqmOolC81hvUZPxdnc3FvOK4TJBg0eaDBjnumWDjE15BCPqfF+abp5l7kl+dItvma+qYaubde48ViIcQC9H198/2M0j8gOdmGCpqjKdUhZWTWYFE/YGVQay6h3m76N1rEJjbWvZhLnspHZd6OvgEIt5Pp280+uQ+eAHfN6C5jLmpPZw9shxRyMwddt4k/asFQc5R2AdwMCkiHjUwXvqC8ez3zAxHVXoc14QOYfw93eRHkPpUJMLIsYfM5dRhRgBWrAXDFneRgHICb0QA9lOpkWCj5qa+Meko2zSgS0KUayRQhbClrd9793UDaaZSh2ggshKWyI9/thJMWz5ncAxyfv7TY1qpgDmX68Iho7L2kwprJsY+TgOCrfrzgCWisDg9kT5/rLdW07t2Sz0d0HT8GVgSER6/vp38gFR2u2CNTHKvhpBDG4y1PcPP6USAYWV+HDvYMEUzGsAP23tk4kKn+Zr1VVuqXHG2vPcZ2A6Yg2bx628bGyFPjmiFiOulXigV55E8qmypkYBvo8zMhyDJxREL4REHm18v9Q/MibRk3T5HJ1CKOPeNqxxxiSf/vlsmfu/sYOooXIY7FFP8deRlDpuIMmy6wjVVJuhPMs7/bKiBFZCyk0Ontk+Rb4qRV/+ZpooYW0oR05D7gDB1WbK8Z0cA+8xgnDf/0JOoU8vSuZfT8OX1yYjSao/HZL6HNx2XCRKoDhvzl8sQWCpcWiPMzefP9JObYKiqtIOqjJkkU+/fAKbpFNa89Z81DrKvsQOqqmM74d7uUsMu+XOcNO3cAtuAh5AHgWH3XQHvkQ6jGG+HUjOGegcOaFtP+K+AkccpDdT8VdQlY/sU3MKvhdsbl4xvIgCGzi84FdQOGPpmMTKhzVuZ7DjLge4ACeFyLQrKlNlbjOuFCYHIlNbBCsLboUwpgbkzP5+zw0AAcvFWUBXMGPkF5j1i/ANXQOESzdsIDH0z0RS2tj7sALjCuOaKZsKlpA5kUKtBrE3qRAMVBXwk1vEBpKUXshM2QmxL4Beuh65T95yFIBiU74/9fIU6Zbll8IojWhyDPHv8JFWYquyfoCOgw0sTC59CRkrbiBC4yryd9bjamGRP5ava8dbtBUWCa/vYjFJpRDoOKW65VCPDp/6bQjD0yATn5aCrgbCyLiLTqWA1gnAzrsKaIrKv6dMDs7X4AOOB5V1pluBF9mF27mkJQuh6dj4Hkooc5ifYiy/7yQ+XOmkTi2wMBYhA6onbxdeWbRBQUQ9B/YPiKcgjUC9hJZrmNYbSD6jqJxMe7G6oxt2576VcpkwZQ6uOYqQQBZQTMLgkdfevTEksgAD6AKs65m1DKIpuAoXJhqkYI4+Y4xxxkK1EyGyHyqp74a84yu5eZ27bW48vOBK46lgihAJK66hObhAZLJ9glaDbGqgyXGV0hAHLcze0gTOsjUkc+MJMddmxtUIAxmMe1D1WXr6lvaOcbye/By74dJB/K+e9A/A+YgDq6tD0jYbYVoWfPQ7RciJcxp+Bm7si70SYe+Gwcg/0AIRkJN4e922i7ExNdyiIGGldj46u340hbH4dN0Q/5dvXeuCiIYH2DJa7DKA1C0vH/u3qIw1ufqwEFn4AvIRiAOvCjrA/bAGi4Eb29jdrC7TFRJ3PQR4xEDIBH1j3wEWbDqwfJ//sUJip8d8Kgu3mbLzWG0jy6NB4o9jPK5Kc0vHQ7G3Wa8McegmrtnznykCVXNadyMAWj8DBNQt6CEZC6d+2oBXwmJvbyUf48oNgy/jAoHwj016t6johwSnIB3R1dFk/66XSnsdRgm8QMOsQDEYI/4bo1woJGFPp2evaOI3Bb4iaMg//OpD1TAL/kOAi/pJe1pv3L6iwqCQdm8B8SnZorgWmVOesthkwQR8DIxRlSKrWHRSAfKtFYbOq6zvngdPBdd0aGkxeOpxIh3WqX+wxoqzhissaCX0eCW1gOOKDwnvAY1cHhT92waujQQlWwLGFsQkmj+4t8zYekNCgqtK1eWTBwr4zTj3gcTyB09O5eUDT80VYUhK2ITnmGsgZdJW2m814bTGP4wlKMhLBUDXTOIVAw9M6pmRdJWnTm+pcMtNBEtLyzV63X7oiWVe7xvnMpTcNZknf9ZJBgpJ2gK/eBTYq8XVwxeiBS4InqBhd7blP6UMCzx2bcnsyHxKUW1d77o18SOC5Y1NuT+ZDgnLras+9kQ8JPHdsyu3JfEhQbl3tuTfyIYHnjk25PZkPCcqtqz33Rj4k8NyxKbcn8yFBuXW1597IhwSeOzbl9mQ+JCi3rvbcG/mQwHPHptyezIcE5dbVnnsjj0aCf83ZLne/t1hmrtvruT14CTyZxxqaroOx6L9+2mB08SbkLWRofd3N/RLoe495BY+lBP4INEgfAgK9kitX8thHtT1kBf71aBvDactTZAXS53VsFimbEZCCjiTXd2tUgbvbMx/do5FAdVm/Z2cYUct4/AaSVdUI9pc2MTV93saqg0q59VieQL0XQyoxn5GCcV+tMgJT0NMooVEtaY68Rrf1jlWXHdt0OKQw2Wb72HAfL+HoFeudCkEJ5q4/IJPmbpUwJK9aYfI85mu9fn83w+NoffIxmQIH1GaIivb1b1vlBPwZYxDjaOpz/Q2+wroLfGc9mhKQCjz71VpZs+WgXNMrVu5AZtORSLOzHxlTGedI5S3KPHlGMhHm5qEJvxuRzPMzN4qkIgfiEVAFb06IXRSaezQSzFmPmAP28LWT/rdJbgMiTHthgBxGVNPdBzPl45mbpUndMLkaoXHvfX9JgVD2fHlGMY1CKFwFG5Hgc9OeYzIY4WvC7Im51TWrLcPgJR/OkrH/WSehiK/0/A3tpDp4ktBAW1S2k7lnERjznFtTDkP46QG7rO53Mc55NBJMQlhcHfKQIc0/pDIYQz+5HDEM+b8AUdNv+sc8OQDqYAXs9ExELJk4Y7P8goRYKuD2ZGR1fWB4S0wjdY3kXea6dGt77ONlRrsqbiLLXANvZ8ZkHHNnZ2RK8ZNnP7HlengVGVn6t7FFVWHmNQbyVkj2EhBoLlzlGVtxUI/G8hqSdXsSeDRPcNXLsw3SrzosuJqfhAYHGdnYmyBbSef4KJkya5u67BTo0nESO7cgE/oUUyZ2dZ2pd27s21TaN46QWqFV5VjWaaTRS0Hy7Z2qiOW2Q0K0ZGSDIiGkLoGMKnmPDTh+EFFa85CF9XakCo5HlJTnPlnu1MacN4cbORs5hTEOQ6Mo5xzUToXL4cCjKcHVyLz+z2nrHd2Qjbk/+6Tti2c8Y/7roH+x6jy/2hb1w50QRA+aydxLH02zSSZVHRXpRB1bbTu3iJKftCgoOZgWCD8sS0IwTdtqhrmiH0S4fR0YTo8M7Mtc5WTbYiqN6NNUrmhdV9bBrZ6R2so7UadHUwJ23vWvz5XkPRl6Pxr7OmNY4CJOYOxleK+moBxVpVOTCKwutssfW5wTbljVc/fcS8jtMO7L1Y7iDJUXVj1QmmI1smC1LVYCLzJCO6Ou8nlaNouSYV0ayn/mbzcYVlWZ2V8YhJP8R82wajL7tSFAWndQUbVQuq1HUwK+mgpyqb8mo5u+cncXMHjH5Wswh1ZwF8LXTv19hyFk+prtaGHvrMoX5xyHR0cA1uVylP979mcaA47xNAY03Z7VhaSIkVWZbcU8vKHI9HrqlC3ndEbmKcR/Pg9BmLlUcZ6weGU9GglykDdpy678DGvq1ZhEg/Msvy5CNXxJJ+3p8WxnRH4EqWZuBAWn8/IFTuqcO1vewhwB3HxspkpEAAIRgF85U/z079JI5tnjKPFyWI0gR6Z5lVme97pzWMtyl4R6tFaGKXcb2iOYqXzK7FwFqrPZyWZIR/o8HVRH6+fc2TcPuLkOM7h/+nQfl9nU+GxM2PHayA5y7mx+az2REOzeEa3lRUwr6eBLCLzKJedaaFCvQE7Ink9Ol28W7TauXcgfj+cJTiCa+aJNB2UT0ux9j3ndE+G6fs1k2jzn5az5ORVvoM43xKohBWLtAER9p9BLheXnaiUQkdr3IagngazBfGSGV3IJVb8stx49HfBF+fJDO9aXLCCDGXQu33ytPI9/LAIB+CzmkPxEAII5MRhXK0wGroPKKLtpb4aM+WoN5A8B8jbyOodjWxbg0dOB/oLXgavu1NI5xK3VklCvU177+US+bO4YoSXnGtC1MSLBVzUafnjiIlCPDFkP9frrP6w30vlNX5Uqa3YdKdWNPX46ML/d4BdnIgGnbQ41X4usVc24VhhykPmKi42UrbsPm6tflGN+9czaoqf3IcPbpkU0MrRURozn09IB9hSPDYsXZqNXfBATeMRBwLUJeaZIEd9+qKdhfVWSl/D46cD8Uq2b1JIFFkjw/B2XQdASIx/M3CKTXSwb2Ra/2m2lQICynoJUUi8ig9rnQG/edQjHWAYBNsO8jpnjKPhSzOUZIM62JBsFINJvhOCMJnglgQozHaiXawqFkRXkQFZPPUEkBDZFQXHIN9Pp6lAYldHLFXdfIYCqpxBAHX8x409khHF+8mAotIg8VJJd362hKlrsbYWbDshJf/DrVtm1P0NWIoytGhR+odPHDZXosED5CHqCPdD8LViV4kRmi907Hl4hKLCKLH7nmlI/ZYVDAv2NZyXulzH/Xm7kNGB6vNoRoRKHPMo392wqbbB99+c/PXZZqb9HSfeZanDWq6VP61OhkYCdN2/DAZmP9Ljz8NXrCbQSmkbKVwh0vXzbIXkUXLUzIS1pt3tGPSJ8IJbOjaCnGNU/TrojimsAmMiSQoVHAvXig7BqOGpiGOe/fZWxvLpyzCxHIg1V3p0tZf01qgcJ1+5lBXWjQ2R/mi2pR0nb5ApHR+r4JpEy+cneJW3uwqbJLfFTlaDix4/2FKpkVTpeyhTU+nr0dW0NyVwohCsjhyRI/66NDKlcYbdhR0fWCilTBOD9SosAbCPUHsyb+4Qtuw7LiHG/yVAge0lkBpcMJbB1hwiVTgehN2gAvT2XVAools3EmvvVqX8YWVofujIecvldUg/z6jdzt0G3n6eKXvRtYZnmA6GavhrW1d/Othah841joG/57NFeDsumol6o5BNJUS1fpOtzwB98PneH/AkbBCLE3qM2Uk6EmAA7xd9Xp8qyxL3y4S+bkUQrXqYvTZKTFxkBLmsZbUhDW8HegEAtqSug+f338NGMApJbAacJShUnawYvVuX0cxVOWKQ/vHmfFjuvfLHSWDYuWJuKbGn+Bjnvc1kMZAiVZdWm/Y4qlbGmfPSTpQ5ewTzPOgqWw87qTcUzdqmMdzmkZZG3ekRqYN2FSwoJMk/lOeQGufhiToL8ExauSXWcJ7PHuT4Jxh/7YbGsoFVcbYmJCpa5sC80K3VY5mIiiXpGPkMg7BPOg1JQYugKKDS7rVcTV5cLnK8yFlDgbAU9Qdu845AccuhvQ0rdTcnpkocpoUnDmnIMmdoJAVhacf8EjEQVNI4Jl0mP95J+sDzOPV9JErcfUpfc2lJQVV7AwdeXwlb37RBfR3ZDWLYHU2GrGGsJq17vkmMM9ZejK1rS4Wxpi474FZ5LW1Iz5BAQgHwBgd5JbSFPeGhIC4NZ3AL1bpdmteS7pcmyAUafyzRvJ1IQim07wso4cWua07xN/T8dZXLtsn79GS7GfnhYgBzLsCH5Ezd3MPw1CnuOSxoJ9BfnF3QMJt4BUMSMn75JzoD7egqJuquBb9h7JFvuHD/fmD4iwHA9CH+EBhHV5P7xvzumEbZVDbL6hW9dJaMmLDa0d3r7nrrPqWH8wz3ho2FjOq2e0yuQgJnYb3/rd4MHIJP4NhxHaPP/KZxbflyw3cmyR3XSHUNbSuPaIfLu1ETJPGFbPjLJ1vKJ1wozvj8HS+M0IM+RdJuBqKpn3tL8LBBOKq7U3+byF+L4Spjuv3JrB5dNX3JLRKs3Xbn9sIMJ5FRAD6H7PlgCh5QtBhNIGUIASLoOuw4cl+GdGsiUZwcaNoK83gxe0IlJ6ci2FiQT7u0qj0MIFR4WpFcrsJ+F5Wd5IgCnJjOLsviPvULjE1fgFUjQGowh/QIIcbG1DDN2OqrqcH3fOPnw8d5YOQRLVESI3GtPxF07PFBeG9XF8AvYvOOwPPbhYnge5cnNr8+TFz9dJoFV/eSr5/tLnahQvbmLtk8nGF2kzAehKfy4SauACHssn6tCLhH3p5+Ssd+sNebrv4HMHYFp+b70LBnYtp6l1S+/3O9fHCg7sCzsAKMUAk27J8H4pA5WFI9c3Vp6J9gMMn4dV1Arl52bb99Ivf/OtEzHNHAAPovBIPfvPdRdXvhyjWQCQfLy4F5mZ8yszOGtRsLdclZ13T2XghWDFVQoJMgARv+wIlmWwgl1o30Z9+LkNQaTRruCOR3qy4R7ulq9p2FsohucNIUhRkJshLRrGuFAAMuKONkDLme3Dk6QP2DhczPc41sjSkrzxrVke9JRaduitkNE/c3TVxiR1sYiZa+CtpA/3Na7qTz18VLJsbunqWv6tk3zKFkFZ1dldaxfI3U6XIRwSC9v3qc+JRrUjV7dVlBhkGAXTLBv+/ucAkKSHDiVKMOSbSbfRKsX5jna870AOwR+1YlwTZsJxPr0sd5St6br+X30VQlOzX39ZB85mpUrEVDm6C5j/12WbNg3qMLHgbhd4yJl1utD5c53F0qS3aUuoGplLFHDZAd4DEJMZKisOJcv0VT1uW2DZWwCnGbfn7peP+3WPhFg3hvDCy1bYZBgLnQCupSM6lN+xVd3aSCPfrTMEA+PGhxf6Muqi2Scqhh2YzYn0oMgk9/AC/kpTAvuAnUROmVR9bphWlm32SYGjooIlmduaGtcCoGQil7LH8EqKvVwptyHZ+U5HocDkR4cGCdM9/sF9BtmOH32LBC0mtNpf7ip9erQUP4ARdRV3Q0QpYUi8RTwPHzPp25s71TP6qDCLBHp8n3f2wsMaVkwll3fPj/A4NLVS1FYo3+R6ryr7aqdR2TMpNWOuf2Fv3SWaxDsoiyAz+oHJEuAg0lx4f4Pl8raTQegIAqRYATDoJDq7/BSaghyPvbbRPkz+ahc072xXAubQsZ1TIPw67PftksdIMlNPRoBkfyNKWXh5oMSDV4oHgKxoqDCIMEPy5MlBUxYd8zB3WBJUxZALeNPy1MlCnaJ/ewBJsqi3dK0QZ5gH+QQUTCYLY21UHGeoUIgAc3IGa6GQGORjx/uUZx3LLLslwt2yuTftklzBL549+6u5db5RT5YORWoEHKC2ZqgY1vK0TLtGk4j//xxveEhvArWy3M37CvT9itCYxUCCZppmrC2ZTQVqMEhH8H5l0BmrwHmXm+DCjEd0BmVXHSVKlXkwcFxloErSjNwZK5mQJrWBtNBl+aRpWmqQtb9f3Lj8TAMC2WaAAAAAElFTkSuQmCC"
+
+# Few-shot prefix of the ai_resolution_interpretation messages, built once at module load
+RESOLUTION_INTERPRETATION_MESSAGES = [
+    {"role": "system", "content": "You are a nit-picking data scientist who decides if the clustering resolution should be 1) decreased 2) increased 3) unchanged. You only respond with one of these three words."},
+    # {"role": "system", "content": "A true cluster is an island of points. A subsplit cluster is when a true cluster has multiple labels assigned to it; this calls for resolution to be decreased. An undersplit cluster is when multiple true clusters have been assigned to the same label; this calls for resolution to be increased. Based on an image of a plot, decide if the clustering resolution should be 1) decreased 2) increased 3) unchanged. You only respond with one of these three words."},
+    {"role": "user", "content": [
+        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{OVERSPLIT_EXAMPLE}"}}
+    ]},
+    {"role": "user", "content": "decreased"},
+    {"role": "user", "content": [
+        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{UNDERSPLIT_EXAMPLE}"}}
+    ]},
+    {"role": "user", "content": "increased"},
+    {"role": "user", "content": [
+        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{WELL_SPLIT_EXAMPLE}"}}
+    ]},
+    {"role": "user", "content": "unchanged"}
+]
+
+
+def ai_resolution_interpretation(plot=None, encoded_image=None, image_format='png', backend=None):
     """
     Determines the clustering resolution adjustment based on an image of a plot using AI.
 
     Args:
-        plot (function): A function that generates a matplotlib plot.
+        plot (function, optional): A function that generates a matplotlib plot.
+        encoded_image (str, optional): An already base64-encoded image (i.e. from encode_image_for_openai). Used instead of plot if provided.
+        image_format (str): Format of encoded_image, 'png' or 'webp'. Defaults to 'png'.
+        backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
 
     Returns:
         str: The resolution adjustment suggestion generated by AI. One of "decreased", "increased", or "unchanged".
     """
     #convert plot to base64
-    encoded_image = encode_plot_for_openai(plot)
-
-    # Prepare the messages for the Chat Completions API
-
-    # Example images encoded as base64 (replace with actual images as needed)
-    oversplit_example = "iVBORw0KGgoAAAANSUhEUgAAAHwAAACRCAYAAAABxNziAAABWmlDQ1BJQ0MgUHJvZmlsZQAAKJF1kL1LQmEUxn+WYphUQ0NUhFBDhYWYQzUI5iBBg/jR13a9mgZql6sRQRQNzTU11Rb9CRpNDdFSW1AQ0dweuJTcztVKLTrwcH48PO95DwfaOhRNy1qBXL6oR0JzruWVVZf9FTv9dGHBqagFLRAOL0iE795alQfJSd1PmLOiDuftgX93/fqkr3Rjuzz9m28pRzJVUKV/iDyqphfB4hYObxU1k3eEe3VZSvjI5HSdz0xO1PmilolFgsJ3wj1qRkkKPwu7E01+uolz2U31awdze2cqH4+ac0SDBIgSF7lYJISXaWb+yftq+SAbaGyjs06aDEV5GRBHI0tKeJ48KpO4hb14RD7zzr/v1/D2hmA2IF+NN7zYIZT8MPDS8IZHoXtf/BFN0ZWfq1oq1sLalLfOnWWwHRvG2xLYx6D6aBjvZcOonkP7E1xVPgHNoWEQDEZXhgAAAFZlWElmTU0AKgAAAAgAAYdpAAQAAAABAAAAGgAAAAAAA5KGAAcAAAASAAAARKACAAQAAAABAAAAfKADAAQAAAABAAAAkQAAAABBU0NJSQAAAFNjcmVlbnNob3SeXeUJAAAB1mlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNi4wLjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyI+CiAgICAgICAgIDxleGlmOlBpeGVsWURpbWVuc2lvbj4xNDU8L2V4aWY6UGl4ZWxZRGltZW5zaW9uPgogICAgICAgICA8ZXhpZjpQaXhlbFhEaW1lbnNpb24+MTI0PC9leGlmOlBpeGVsWERpbWVuc2lvbj4KICAgICAgICAgPGV4aWY6VXNlckNvbW1lbnQ+U2NyZWVuc2hvdDwvZXhpZjpVc2VyQ29tbWVudD4KICAgICAgPC9yZGY6RGVzY3JpcHRpb24+CiAgIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CrxF5gkAADQUSURBVHgB7V0HfFTF1v9vyW56771BQgmELtKrdAGxgIIgReQTxI69i+XZeD7Fgl0eiiICIkU6SO81EEogpPe6fb9z7u7d7C67CWD0kXLyy97p986cmXPOnDkzIzES4B+GytJSPDFwEM6nn0KH7r3x4vJlcFEoLF+Rn3kJZQVFSEhtbwlrdtRPC0j+aYRXlZfjo9lzsPHXny01CA4Og09AEHQ6Lbx8vHFk324hrkuv/nhpxXJLumbHX2+Bfxzhz4+8Ffu2b7rKL5dgdXHpVaZtTnY1LSC9mkT1mSbr/LlrKM6IeYMGX0P65qR1tcDfOsK/eOppbFu2DF2HDEVs2zYw6PXQ63T48pWXoNaoLN8mlcpgMOgtfnvHB+s3okXnzvbBzf7raIG/DeFZZ89iWucOV/VJwcHhyMvLcprWVemGN1etJqR3cpqmOeLqWuBvI+kH1q23fIFEIrG4r3RIakG2KZ9KXY1Xxt+F+1q3wbafaoS9K8tqDqmrBf6WEX7mwAG8d/9MXKBpF0N8i1bIy8pERWW5zffURcplMhn0xAaswdfHH4svXLAOanZfQwvU2wg/sH49TbcewuePP4GHBvSzIFsqkWLM7Nn4MfMyhtx1j82n1ca3OaE9sjmspLQILOlXFBeDVQjvTZuOe1u0xPcvv8LRzVBHC/ylEa7TaiF3ccEPb7yBb96aLyDA+n0yEsY+3bsfYfHxWDj3Yaz4epF1tOCWy12E+bdtBJPy2vVBSSkdcN/LL+PJMSMtWRenpcM3ONjib3Zc2QLyK4OuLmTJ6/Px7b/eQGBgKPLzsx1mCo+MwdNDh0FGWrSK0mKHaVjZIoJUKsWUp59Hx0GD8NqECci6nCFGXfE8d/IYAiIj4EIdRktleHv5ws3L64p0zQG2LXDdCF++8GNhRDOymWwbjAahZH+/IBQV58PPLxD+ISE4vHenEO7j7Wf7Zjtf1z4D8X8ffoCgyChUV1ZCJpfZpbD1hkfFIjwxEa//8isO/rEBve+4A0o3N9tEzb4rWuC6Ed6yfQdBY8bInvjEU9j688/IunheQDa/pbKiDBHEW0WEs6QeEhqJ3JxM4SN4qqVQKFFdXYmklI647ZG5eHPiZFSVlyEwLByXMqwVNLYkvlu/QZj2xutCOa1uvhltevYU3M0/dbfAdfPw1Z98ig/nPSa8Yey0B7B80SeWUS6+9oMNm/HdSy9j79aNQpDCRSEgmaV1Jt8Gg4kqiGRZzFfXkzsZS/ARsQmCcMidZ+HefQiOiqora5OPv2aEs0Ll908+x+kD+3F0/y6hAVu164TSokJkZV6wNKiEkBIcFIpcK4UKj/K/a3EuNiEZ72/fCoWrq+Ubmh1XtsA1I/yFduMw1fczXKw+hF1lP+DusHchcZPCZX45tm5eDP+wULw5czpcpW5QGaotbxweMhPlukJsLVxqCatvx6h7p2Lm++/Vd7GNqrxrnod3ko+Ep9wPrb36YUrkx1BK3aFQu0L+VRDGzH2IEB4GucTFBtnuMk8MDHgAM6IXIc69NRRSpdCIwUFhlsZM8uyEGTEL0MlnoCXMkWPaC68gqW2qoyiUFhQ6DG8OrGmBa0a4R3tvqPVVphKMJtUneyS+gKEESIrvCR/ShokwOGgK3kjegyBlnBD0csud+KxdNjr7DIaE+DiDQqrAY/Gr0Nt/Mh6OX4ZgZbgQLv6E+EQiJiAZo++bgZEPzETasUNilPBk4a995+6Y8lqz8sWmYRx4rklKP7XiAP69cjo0eg0YkZMiPxCKlHjTg/QkJWOB81UHUVVZIYQPC56J8ZFvQWKlQ2E+LoMcA0Jn4GTVZqzAh5SWwojnizAwdBoOeK9EzqlLSHBPxZzEpZAZKBfNulyIOPj5BqC4pGY06/U6zF74ET5/8in4keJl6ltvNPNysTHtnlfNwzXHgI9vexhr80zaMubRC9tfJmlbhnWe76J17mBEu6VgSdY8rMr9SHjN7NjP0c3vDsGtNWiRXvknkjx707ydKAMhzqAyYEvh5/ji0uPoGTkGU0IXQqE3CV3GwWoY17tAaqzpCFzQyqhXsXTVOwJVUOtU1M+MSCatG3/HicP7hHexLiC1V2/M/fxTQRMoBDb/CC1g25q1NIr2CNDasx+k9MeQ4t0bVfGFmH0kHt9teQkvnR6IMm0e2nkNgQvxcAYX6hQirMp7A6+lj8KjJ5Px+Mm2yC5LExQ2ce6d0SfwdnRUjCLFSY2ELd2tvALZXJZmjw4RxB5eSNyAt1rtx6yWC/HKt6ttpH9W/Gxc8TM2fP2N+Prmp7kFrpqkK24COvmOwqvJW1Gmy0Nbr4HIPpGGEGUMIl1b4Hj5LhQZM0mY64u3W++nNAUkoHVGZvUJrMh9HTuLVxLhBvLV2fSUULeRQ2/U4WTFZlysOg6tXo0Ur1tIuvcQPs1YSg9WtlktlrHIcFvYixgT+oKJSlB0GBJRtOciHvnsE6yf+yOOn9iG46Vm7V6zXl1oS+ufqyLpmWmn4KEJhvGhGmHMuhB27yxdgr4P3QX11+Sx4tkc93vee/BxCSVkemJ70bckiY9CD/97hGTcCUS7Wab0FmAiwXoZK4Rb4qwcLEA+dq4tFjx4EpK1Julfb9SjSJaBxCXxkAVaJW52kjxVhyZk0byn8PMn/wGvag0NuB8DgmcQrQYCjbG2zUfUWEoLVRKaaelNRqe28dfgkwRRJyigDHYdx74I7ijrCz5EG68BCHdtJVAQ6zQ8c5D3B7wetA5t2u46ET4luRVycy/btNLjPX9A+8qhNmFCa9eBINsMzn0ST8K1SdB3mEjiTtSerJ1WnXwXffJmwI0ohz3wp4gEw+NtkhGbraOEJqpTaLt5xAhTQvO0ifXh8V1r2SDAJSqELM5/REyIKewWxgRkExVhxIMpRxQ9xTws11H5um3AUO0jVyBblkKjug8lF7+B8kl9xBc1P52O8LSfd2Hz85/DIzAAEYPaIrJna+QVXURMm1bw25cM9SInjceIcTDSrUctz9tlHQlpm52UYQ6WUb8yXKLiimpPZxPLYih1OgnJfhLS3yiHAW5WxOiPpSuwY+1GdO7TA8Mn3m6TtSl4nCL88w6zUFaYbWkDuVyJ8SvfQlCbaJBwjcrPAO0mQkaBJUntDuoIjGiWvplHS3genuk8i3UHcZ7KQYxdh8s0nsW/8SjadElF+pFjKC4sppdzIuDtH75AeFy0g0Iab5BTku4bVaPn5urrdGrk7D0rtISERpGRtKvOkM2jSxpD7Rpq1XA06oWpFgUZ8+m/Fh7NueqKtyqZXkQ+JuHUiSQ1U3khSaQkAYZKA/Zu3o7iItL9mpEtkUpIG2eS6m3KauQepwgftfgx9Hr4PsR36yY0gX9INBJGdkL1b6RCnUmjm57OQEKDxpBBSMtxkoKQ4vawk7g6gh1wC8gHkLr1V2ITreid4gKdWS7YrvkNKlDvtANvHx94+bJOuGmBU5IuNsPp5XtQcjYHqTMHk6LcFRVzxBirJzeuOF+2I6lWqSzOCmMetlwmdaz3MMSRxo5B4kfIImp7PeByC1EgUv0arSYTOg8dniq4DSp9pdMivf188eKiBQiJtF2scZqhEUTUivAT/92GNU++K1QzvlN39HF5wikZt7QFIVxqHuGWMAeOCm0Bll+ajUFhLyDEPZmwRUhnHl/mILFdEM+/rZU0EtIH2Qt261Q/YKWOBA0CXrBp3TGVTKeCsXP9ZmjUakuJCqUSfUcOQWrPm/DhM68K6t3H3n0NscmJljSNyeEU4efWHsK2l75BYeZ5ob5R/p0xwP8Z27pbj2wxhnip73+BUjJBF8mrIIDxQLOjxxnlfyI0ri2UBVdPWtVGFb6vfgsKiRvucXtcfKvNs8RAtutVd9LrTC8cO20ibptxr5CmpLAI/5r7DM6nnbHJExETjcsZF4Ww3sMG4/4Xn7CJbywehzy8uqgcK2fOtyCbK5tbepIYpR3GRDJu3Ro0wsuorURkc5RBRU1vMCWq0pHgZIZI364IevNKZIsWsGI68cnS/YagJTho2Ipj+l1YXP0O9ms2i9E4g8N4VnonjnfbQlavPD8jvk7Wr71H3CIsrhTnF9HBA0pcPHvOkocdckorIpv9CW2I4jRSMLWKXeUMGj0ZGNLcywr00MDt3ypI811hyJJA/QshMr0mgdagwuHCJcjSHEHvsofhq4wSIos0F/DHhZfJCsYNCZ59cb5iKzoHTEZwcDL8nmVxnpLZUQo2UnQEmkotXCspD0ElSrFT/zt26dciRpaEQFkYijQ5KNUU4tc9X0Bv3o3KJJtJ+MSbBgtIV5LNG9vbiUJHRHQ0olvGY+cfm7lYBBM/H3j7KMHdGH8ctqxHqC/6Pz8LHl4Bljrr9Vp82f8BfDRqHHZt+hpu04g3kopThKzKAzhW+iuKqs/jSPFPKNNkY0fuh/gtcx6qdMXwU0SRVasWbX3HYl/R19jn/xk00cUomE9M2xGlMBecXXUE5docWlnTI6csA30l4zBCPpkWAVg6ZC5hQCkx8Api/lu1y4UwVRWtk5stYlVV1XjizqmW5VO1SoX4VklCOv7RUcceevftcPfwEKjCmCl3W+Iao8PhCOeKtp86AMe+XY/K8hrLElUVaU0IDi1ZgfYniCfybMcsleerTgtx/OPjEoHNOW/SiMsgSxYXJNLI7hn6kBB/unQ9SjSXEFPZGV/0mEkLHyPQMXCiJS+v5ZRqsuCtCBM6yvrsV6ij6KgcBQJCb0GkPAG3uN4Dd6kv9mjXIpHUcR9U8xyP2IbZtEZcD2IkMh+vrrSdlp0mBYwI5XTCxI//WURWOpWCsURMy0QxqlE+nSKcaxs7oBNyz6VdUXGlgsiquJ+f2LqC8NXiz75QZRYhqHcM2ZfdhrNzNpO1AmeVwdulZtojurPOHKfNghocLfkF1foStPAejI05rwkIYh6e7DsSZfTHyGbQGNXo6jqU+pdpZPdSjAD/F0VcwkXFUZw+elxIZ/2jotGcSKpgawRbx7vQusCQu8Zgxbc/CsG8Vy792EnEJCVYJ2tU7loR3vLWrtjz+RIihwYyIZJb+LpKU46CLicQnNsasnbAqfLfsHXt50LDpB/fhqzOaRjy+Rz8+ep/BdJ66szvCHZrBVeZD/YXfkM8VIb8EhNF4BF4pnwTslRHaM5cs514j3ojTnidQwv3cChV1UjzLUGc7k9sVv2McEk8IqWJ1B0KMOLJsah6zTSCWVDjDQritItPnGBk83y7qrzyik2LWq0GyxZ9Z0FoaFQEuvTrYfE3RofsRQJnFfMI8UUwkTh3L3/0eHw80lbuIASaGK5PB38kfdAO+bqTOPbNBpTmZluKKc3KgodvIIZ+Nhtt7u4LdXE1MtR7CLEbUVBCkp5o8UA5lDIv9AyZhRzJCUJUjb5V6Z2ALNklVBkr4amWoMRDjxPG/ahGBfLJsuas/ggyjekIiqC59bqNwruZb7t7emLSI7NwcOcey3uYb4u7XCwfaefo2q83nv/s/Ua/P63WEc5tkjC8k/BflllI57MINFpoKv+kCKSv3IcVD74uNKyEjAjFzsAJ9n65FDkH0lGQfh6Jg7pD4eFG0zzb6RCn05BSviQlHarNJvmAw1xl3pCX5iJV70t2bXqBiEcWKXA+kPiIiaLD1d2NLFgV2Ll2E2exQDmdAbfs8+9g1JvngZYY5w62pevUp7vzBI0oxqnixb6OGx//Cod++NUUTJqrSWsW4NQP27Hnix+EMDdPP1RXONeNyl3coNOKiu6a0v1ColCce8kSwFMmZiGO4EBQOYw8hasFpDLas1YHsu23PPEed+bfd82ahpGT76ql9IYf5XBa5qhaalLGiOBCyAtsFYmUKf3pQL1wms4oEd+nqxjt8KnTXYlsudwVNz9tOw1yhGwD8flMJU21ruJr7ZHNyA2i7U/WcPfcB8ACmwiMbIad622phRjfmJ5X0YSm6galxFrqLSXBiMEnhoz+D/4HD51bgtYTelvIrUzG5ipm2ivmImneHjxoQ8Fvc9+wD7bx6709cSygErl+hBSrItnGrk6g9DxFy8/OsSQNCAnCr198DxbY5FZI5wRd+1MdGjlcNcJT7huIyLbt4eEdiL7PTbVpFl21GpvmLaLWNQWzkoZJtUxeM4qsM0SltEf/Zx6AlqRvMY8QT50klA4AimzTDl4BoVApXXBUkQOti6lgLz8fSzHWJ0dYAslhPXLHzZhi2c4kpinMzQfzeQbescLAa+PTnnoYo6faUhshspH9XDUPF+t9eddprJr6lsBnO98/Bp5hAVg7bwEJdDUrUGJav+BIFOdlil7L89ZPnkPC0I74NGUGHQVC1hBmaNmvD2L6tYeqpAJ/fLEEl7WFkOolKPShIz1oalVWUqOHF/NYP5Pap6C8uIQOJjDJBB50BAjvQ+deVV565TJct/590LlfTyjJECIgJBjvPfGicHDgnPnPoWX7NtZFNxr3NSP8l3Fv4Pye3ZYGYH6udSCMcYJoOiUilw7aUatq+D+Hu3n44rYlL2DbC98j48A+DrIBnpsfCqoAbScTwJeOC1HTRgVVdTXNBGx5Q2RcLDLPXxDSDR43GjvWbUBlme37eM+4hqZmIrBUPvvV5+Dp44X5Dz5B36cCa9gu0aIKywDtb+qCJxbMF5M3qudVk3Sx1kFtYkSn8HSGbI5sO3EgJm54B50n326Tp7qyBD+OexZ51BmcgdXGVMjcFIJ61B7ZnDcvKxu+AQGk9/dCQU7OFcjmNHzcZ+fePcASfLuunbFgxWJ06NUN+7f8KSA7tnUS/EKDkNyxvaBPj0qI42yNEq55hHMrLEgYT9MY04hhSXvs9y/g0MI1yD6choqSPEG7xunCW7VFRW4ByopqhCYOrwsKZVpkBBGLMAtddaW3xLNQZyYA7l6epF0zKXI69uyOR999RRDgWGo/vvcg/vPc64JhREVFBdp262QpIimlDUZOulOIswQ2Isc1j3Cue2Qq6VPNkDysH3QVGpzetAXlhFhx4YKjs+horSuQTUhRurLBuXPI9tYQ3ujPSiPHqf2rXeGqcv7J1suqIrJ5bfvB154WXsbIZlj51X/piJJisDFEJBk+lOSbFoh0Gi0Gjh3ZaJHNdXfeehzrBEZ++wi6TZ+AHrPvxYD3pqIs08pW2Q5JYhEuCvNaKo3AEFqedHX3FqOueIaXKhBH6+5u1VLrmRh8aMAmlLpZ0vNqmDj9C6KTJxypT728va9Ql0YlxlvKYGHwwsnTOEmjnm9hcPeiMhsxXBfCXdyV6PHc7ej2+GjIXGSkL+9FUxuzhOWksdjMWYSLhw5AVVVG1idWC+piJD39DS7w17sgudQdHcpD4VvhghZ5bkKYaYyaEvOSJpEB9B89Au//+i0i4mJNEfTL0rkLGT8MvG2kJUx09BoxWHTi2L6DiEyMgy9tuLhr9nRLeGN1XBfC7RtDpnBBdGoHIZg3LHSaOA7eAWE2yaz17IwkBq3Gdp1aJrOdt0tdyLpmeBz82kejXK5HsUyH8341HUd8QWBYiODsNXSgGCSMdqYAcUTST+w/jMxzGUJc1oWL+OS1d2rS0Yoa8/sw2pCwh2zXGzvUuXhytQ0weuk8ZGw8Cv8WYfCND4Grvyd2fPDV1WaHQumBxIE9cOaP7YLQxxRBd1O4QNJ9aEXMo1yOXE0RKktq5u1ceKsO7THy3juF98QmtxD4r8j7S4uKaCGFDDHzTSyHBbLsS5nw8PSwpJORxs7Nw0Rp2PypscN1SelX0yjrZn2CY6vW1CRlgcmOvwsLLpW04EIDnpdgq8qLatKTS5cUBkn7AFM+yq/VaHB8134hjY+/PyY99n+kDu2FQzt2o5QsV7r07YG0Q0ex6psfofR0J7IuoekaSet2Fi9cgFatoWmaTBABRFWxjNjA0LvGohVNzxor1BvCi05nIXtvOhKGdYKrnwfyj1/E4hGPkfrStDBBrU9Wj45XwZw1Lq+ctXxqHE6kn7AkKcrNg4ZUuZMfn40Umk4d2b0Pa5eaVvH4RiR7jRpr0Ri5BrvOZinQzhEdH4c7Z91nF9p4vPXCw4tpZ8r3Qx/D2qfew5LBpikQbzocufBpGkHmV9SBbEGAM6eV0uJLh7tG466lb8I1tEZ/rqBTmeOIbI+ZNgmxSYn4c90mZJw+a8GGPbI5Qq1SIywq0pKmLgeX25ihXnh4/tGLFvVqUS65q9RgST6yZzKZHPF56FcKWtaN6qJww+1LX0FIapzAWzlOQ4g6SmetH2bLFTNoiKTz/84/NmHXhs2WeboLCY16HZtWO6YgTNI79eqOvMxsXDKrYcUyrZ+9hw5GtwG9rIManbteSDoj+MfhLyKPDB7b0LYdNv4/sWojIYFIqZV9O49iFqh0dNyWNT9vO3oYBi+wnRIt/eQrXDhTM3rro+X9g+ho73xboY/LTWydjJbtWqPNVV7KUx/f8r8qo15IOo/muzfNx9zzP8Ej2BeHl60SplzWyOYKarVVgtVLWFIbwWhCrPTR5atx8Is/RK/wLCBeXd/gCNnuJKEPvn10k0A2t2e9IFxEDB+lqbKyjOFwD58gYcolpDHrubNPHaMBznYsJmBlyokVOwQPW598Pv99VJhXvORODsp3IbMkHpkshf8VYHL/06df/ZUiGlTeekU417z7M+MQ26kLAsJj0WPOvZh+6GPiu7YKFk5nIOmdEc1IN1JHaTuxHwdjy2/r6JQGk26b/TrizY6AzZYGjBnuKMoS5krLoD1uGYCudLxHbVBddeX31Za+IcfVi9Bm3QDuQT4Y+4tJUhfDAyPiUGBnsSogmkyMQtu3wuD37kdwTBjU1bQ/bddeMVutzxZtW2H5l4tpZ0yNabMPWcQoXN0sJk0soe9Yu0Eox9GVWOIL+o4YIjob/bPeR7h9i51bcwgFl88LwQrzKpmRlCj6nnEwjmmJyiRXBEYGE7KrsfjfnwnStn0Zop/nyCJsWb0O+Tm5old49hgyEHfMnILQyAi4uZsERDEBX4nF4VFxMeCRL4IfKXCSO6SI3kb//NsRfnHLUYtE7sJHIRMYaT4tCfcQ3GXaShTTOee8A6Qgr3ZBLeuSyXRJyEg/9tOwjct/g46mbXyigzupT+0hJ/MyTcsyyHLGtJbP8aV0/xkvlTYV+NsR3uaePrQU6iPMrzvPHIOE7t0hIaTIK0xzZubFa35Yjkxa1KgLdFpdrUlY4Fu7dLnAFgrz8mtNK0ayBq4oz2p5V4xopM96mYfX1TZsJ6ZTaWj3iYmUaipVkMilYAvSHWQLfu5kWl1FXBEv8mReBo2IjUY2GS7y3jLm2yKwBG/N48VwfgaHhxFlKUBUQizGTL5b0KtbxzdWd70LbY4aim3JRGRzvOhmrdn1IJvL4HXuatogGBYThZ8XfStI89YSPZ/q4AzZPmT0MHzCbQgMNS2rcnlNBf4RhDtrTLYHt4ZIEqgSyBomI/0sLljpyK3TsCSe0q0LGSOa7NB4fVvcOWKdTkeGi/bAgtyIu+8gPXyCfVST8f8jJL221jywfTcukyDVrntnxJhNj1j9WkKC3LbV65F2tGalzD8wkKTwyXS+mmlB5cC2nTiyZz9Nw0zSOo9qFuTshTnx/TcP7IceQ/qL3ib5/J8jvLZW53n5Vpp+8cIIn6xkbW/GkvVn89+1qORb0Mb/jrRAsv6nFSgi3mwPPB0bOWk8aeaulN7t0zZm/w2N8NoanjcbfPr6u8S7dXQKkwzTn3qENhZ4C8YOC19+k9bha1bOWpNVzPC7x9VWXJOJ+5/y8NpaeSupWPdv3wnm63zQDm/ptQYPby+MnXIPTh87Lhzrwchm4MUQ3pRQVmLaP8Zhf8dCDJfbEOGGRDhbqOzetE1oTxbeLp45h3jaHWIPfBaL9XksOq0e235fT6tyZisbcwYV6cqZr5v2mdmX0rT8f7vi5XqaU04GDf5BgUJWXhXzpy2+VwMHd+zEvq07hG1JPE8XgUc7Gz80Ax1CeCM2Au8QGU+nMZwlhUx4dCTtHaPDVK8RQiLChCVWRjarWX0Dr72Ma3xlg0jeYIU2R61bTsj9bsGnZB5Vjb6jhiGB2EBm+gU6BD9K2G7sKE9TC7shSfr1IuEobReqKCuj9Xct9m/dCU8S7JI7pjQj26pBGxXC/WnbsAh+zSRcbAqb5w3Jw22+8Bo8PJqltChTRqdAtOvW+RpyNp2kjYqHNx20XX9NGxVJv/5maDo5mxHedHAt1LQZ4c0Ib2It0MSq2zzCmxHexFqgiVW3eYQ3I7yJtUATq27zCG9GeBNrgSZW3eYR3ozwJtYCTay6zSO8GeFNrAWaWHWbR3gzwptYCzSx6t7wFi+GylKoD2yk7cUKKDsNgERRc3pDE8NVvVT3hke4ev8f0GemC5WVKN2g7Ni/XireVAu58Xm49Tns1u6mirG/WO8b3qbNqKqC+ug2SOgIT4mrOwxV5VC06gqpR80ZrH+xDZpU9hse4SI2tOeOQb3rN8ErpcP3lV2HUCeQQ+rdvKNEbKOred7wPFyshNHqgF4jCXLVv39JURLIE+nCHdqapGjZEVI69dEe9MV0MhRdgS2zu6HBPl1T8TeYEU4bvqHatw6GcjpiS6eFwe5qLImHNzxufUDAmyZtHwx0nZaETo/SHt0uhCk69CVW0K2p4NVpPRvECNcTclU7Vgok3LXXaOgLsoi8rxbuNaN9wELljBrT6U2aE7ugObTligrrs+hwwGaE35i7R+2xpdqxAkYa2Xxcp3r/Orj1vRPyMDqVkUi55tif4A6haNNdGP2aw6Z95fZlyGOSbYI2mE/sHHAVZ/OKlylsojy/lhiRQDdpTfSVwJ12JCvN5xKV0ZGwrjTnUdieU2TzTtFjIGolXrshhv1Tzxt+hBvoEnpGtghG80G4EqUrXYajF5QxfNCLai+dBZOTQcc81hz1IebhjsHSvVFdjVM7fsdiZRzOh6cK0TvpJqxbvCXoQki0B0b0dopflG8ElyqWXFgO7Ck3QkEIfj5Mgm2VRqyle3BFf6z5cia+ZktK73al06P4QIKPnnsKpw8fIrceI+6ZjCET7rF/5d/uv/ERboVsbg3mzVVrv4GhlA7uoeugFR37QZt2EEbqGE6BMKclSkCHuCMq5wzU8S0tSU/RQcqnqoyIJwVeKzcJBtGIz6YTv8iJBYToItvDJIR8BjpXRkonRmmoB2wiZG8xny7C/p9LjXg0SIIDWzbjy7dM111OeeJpXDqXjpNWF+uu/+kHC8Ir6HprdXUVAkLDLN/1dzlueITLQ2IhcfOEsdpMg6klDIU1pzlojhIiNTVnpzprKIl3ACRKd5RLXdCu+Bxy/OJgsLoo7xwVcU5lxG+19BuxbE1pNlwDomAk4bGDqwIbS/iIb5MOS8N8h2DjL0uFkczuJR++jxZDb0VlUCQ88jM5iG4zTsLuP9Zi6cf/Md2aTJTp1slTERIVjcvnzuLmocPpIIRAIW19/jQIKV1fnEvTsK8c1ltC118Z7a6/sk4o8fSDPK4NJHRUd2VYIh7Lc4WaLsgVhD2+aek6QFWYgZMf3AYfhRwT7n0ZO8P6k67fNHaMlw/BTa9C7M6NyN6yUShdRocKF3+wimQQCXTLPsUt2suY8HACXp66gu4/rbkT3T8ohK7oMJ05FxEbj6c//uw6vq72LDf8COfPZ2Q5AqlfKJQ3DYVq688wVpY5SoKLve7Ce5lVRP0laHvkJNSR3U3prhPZnFnpG4WIoQ9DW1GIze50j6qIbDoqTBKRCqY3u1U6eG5eDk8j3Z/We4iAbM7re/sM3B3VBnLJSRrNHQnhvhwsgHBhnvlM4OKC2k+WFvNc67NBIJy1bI7AUJyD6jVfmwQ1vgKLG574tDV8dS4XVf6JQtBBOd1ISAKT8Tp08kwLRKFNQmfHBne/WyiT+bkIpcd/h2+74YJX5uaNXRX7BLfb9gyEutKx3gPmoHuoUkA2R0x//gDemD2WzpM3jfIyuu2Yga/+GjNtpuCu75/ro2n1/RV1lCcLjKAU5vkOqVNtQJTK+WmHbE4XUF4zUtxVJPFf58gWkW3zbvKw8GagY8I81UWYmxwFTWkuLq58DWkf3mVKSp9dXZCB80ueheSr8RimNOLr4ul0cR5wVJKKHk+/Qee/3otxMx5AeblJ+uP7YHjmYcQa6mTe9O9F7m/sX31d/gbBw7lm+kK6m5ymVqqdq0jTZjuKa6u5jjrK8oA2KHFxx4GwTjC4etWW/C/FdaOiv3j1VmgKMuHdqg+UAdGIGDgbBQeX4cyCu+Eakojo/hORtekHOlosF26+ERjm2RLp504hzj8SKrpwx6xHotOrYvB/8zfD2/+88E0cLpdyvW0PKLzWD24wCBcrVrn8Y0K8Y34tpnH0ZMR/EnYTwjRlOOwbj9zgVo6S/eWwA8+kIvXF3ZCSoKZXVUAmXvvBquGiiyg78yepCjTwOvkSgiQXsWELUQjo4C8LxJuzlfhlUc0BhAPGZmH09FPCN50+FIDkVJ6duNBo30P/95I7nOYGS+l59QtIshcJKEeDAZl/GHQZp4nkOb7tyFFFjrgF481W41Du4oXbs/dgeOFx/BHQCnoXB9oWRwU4CDu35DGkL5oJVeF5+LcbIqQwMp0m/u6dYNLZS2gKyGfOMfAVXy4efvCMagfP6A4oLtfi9IY/oFKbmIUG1XjpuTKkHQygM2qUdC+LnjhUHM4dN+DP38PgEzATUYm9Te9BMj2z6J9HfxZ15eHUAb4jdym5Y+npHBrcCOeq6C6nQ7XlZ6e1krgTzyPyz6CSyPBSizEoDogX/EmZe/Dwpc2Y5xmPqnbjIM6bhcir/KnKOoWDT7a2pG7/+mFCpOmiHAPp9IU72fQalJ7ZjoD2JiHOktjsODU/FYUnjliCJ97ujhcfqgIt/yPtQCAiEgoQQOf3r/rqAQSE6dB9yHHS2g0khL5EFMHUiSyZ0ZOc2wUvMTCKvbUmys5lJwHZxd6gXnl4AklLpMgmidsGyN7NY8R0wVDimeNZCM49hak5e+FO96aJ+hQddYB3o/qhmPi5hAakCCxta8tyofRnAbF2kHsGQupKwpSqDFIlHepLNzOIIFUokf7tbOSu+48QFD3hDUQNfUKMJsKkQ1XGeoQOfQha2WKUHd0A0ryiZRxhmoBsPNC+J2kRzXDz2C8R4MsTPSJqICUTCXFXggnZpvA99GhkCGfdOFu/iKNYbAAJdQJeN6dlDVT6huGQxBU5BcdJqxYjJsHZiE6Cm8eIrqSI0mtoGdUNx5/vgorcdPh1uRWt5/xiSc8OIx/WW14CiX+QEK7wDkSbp9ahYM+PCOxyO2RHjqBarYVr25ugunwGZadqFnAqMw4LOn/+Nu5Uqrx0uEUPggdJ9z5tJ2DP7GhUVeTjTeof40cw6RcEdK6iAH4+JmSbfIz0x0Sn1TOY3Hn0n0h1v98q/EpngyTpXA3WvmnT9sNQVgRDwWVLzWQRiXDrcxsySaD9nvTaCnUV9mtp2NiBtjAXksXvQT9yMgJOr8Dab+dZUnT7pBhyWku3Bj3RWhkPPzsw0OH9UjqvXX3hNPTqShz/eDQ0hZcsqQLbpGDSnWqsyCJ9+q/zoc5Og3e7QWj76BqBQu19KBLJUXn49l3A0dn9vIAjIj+vkC7nCbAUbeXwIOGtwsrv3NlgEW6pEpH16m3LoL98TghiQwiJiyvkLVIhD42BlFSvUzOMMMtGlmxG1oqRgMUwfPcneGvRPJRUlyI8vCXi3jwljEajjpFsIqFGvhKTBC8myRI6qdlAbKLi4iF4J/agUUkX72mqkf71A4ge/TwMtCpXmrYFmctfRYBrDjypn6SbPs/y/rjJ/0bxkd9xR+vVGDWQFm4SLVHX4YgmhGdcVb6Gj3CuJk151Mf/pJGeRUukF2wqrrxpGIxxKXifVr6OmFktS9PWF+wEFKTjgaOLcbIoD6t7z0VVQIJNvPAKUorw4ovuv+9DlnkaJy6thcbXC53eOC68T09I1hZmwZXlCwJWxuycqmQa7BToPh/QYdEICQTmTgHueYgWcAhvs6cCM8cL1cKqTUBmDjDjLpqQOZS4uEOmECl/gv4Hk9vV6fs4onEg3FxFXfY5qDbxvLQGZFEt4dZrjEDi512uaX2JVgUjUQILkGbDQKtu6lOHIAkKgyvdl8qgLSuAglbr1NtXUb+SIHTZx0L4pR6D4HnHI9CU5UB96QzOLbwXEZPfQvBNhCkCpiB75kRCR/GO4JUnYnHn8AsYfh/A16TfORqg+/oE8PAAjqwFHnqZpPR1prAZE4Ena2fPlJCsebHblMHJr8M+4yTtDR8sD4uH8uaR0F1Kg56QwMxPHmNSsETS+kuKJ6kzidWFKwx4unw/tudL8P2y1VCndIMsJgnKHz9E6IUT0CnccHbIELi36ASZtlpQk5aW5iM5YYylDdxHTifliouwTFq+by3dtXIZZz+9XyDT3km9ENsxCHEdwhGsysEOBzioVl8An+H/6uOE7Jk0si8KU3hQPwFf7sSatTPnLa9DUc2NHjWBINKAGomezDJoykZkg5ZvJPiS/vtbpTU5GxXCuUousa2Ff7ZnZ320xI2GixmeJMMEA7XRnwc3Yda384lvtsNL996LnWtWI6Z1BJZeOCmklBM/1pMhZKWrHNW5Z8HIZjiXtR2yHrOg1NHFe9QpGJg9uCZ1oM7FZLwCBdvoDlX6j6BFuSRStVYR4hxBRChQQSzm1QW0+kaUf+8B4GEawb5EoYNIMOtDJLwlERm6HAKuRIjmTgaKCel0pYsQRre70CvvI47xll3xpJQiMGIA/SfRiN9MPnqZGRodwrlePDXTnNorjHBFW2p5nlbxVI62KvHdeHOevwfFJbnYuXcj2rbshKhZT+OLArKK6T0K/lt/RRlN0y7t+y88D6yEZ1JPyiqnvqODnlSgxze8BBffcNJ6kfbLvy2tzvgiZ9On3MIW4Hfs3elJ44zIiR2wxD13BjCkV03EuJE06ysHHpw4jAJ1+G1TKbKydiPQD1hORTPwyDfLmKYAVJmRHUP+DHOY/SON0rxNHeMdS0SjRLj6wCbo0g8LleQlVH02NQi1dFH3MXjfJR4RM79C+UeTib+SYUVBGdY8+yhUvsGQT3gExWOm4eTC8YguCkcrV6KtmRVI8u6NCk0JWctocdJYDG1xFs4vmkWNSUujhGipgngFIZLdDKxhFZGtlLiToaMSZYZiIY47A12uKABPuX76yLSqywG5hasRQqObRzjDKeJKW6nfdmhNxJqUcgOo7zJYT9WcI9uU1n6xpcHp0sVq1PbUXjgOI9u8MfB6tVYttNJRlQHbfchgITiRLE518Cq7DN2JQlJHZ8LjMpFuN3d065iKyOiWUGzbDdrXIhQhJ8S4S12hIcqRrROFsBpabSQ1qjNIdW2D1tRx9EYJignpjKxNOwiJKUBshDDTs2Slo96FJf0IUql6k13EyIFkYEmUQEnyRy5V5wBNCLgzBQtrJUTbhe/TW/I7ckjxGwUTTzBDoxzhytS+UNM1GEy/ZUHhZKe+laorQTYhWoQLK99DdVk+ggjJgXJqXYJxIZ4YT3weQZ3wWlIKstJOCOHUxsIALtMT03UElEVJZatJU2cPlwwkzFVeQqmBOhZBcBCR9GlAd2L74kjlW7Lp5i5hvs5p+NPTzlI/pL4VH03CZktTehbkapbzSUapE3oR0XmNUkXS98+mJwmxdeZpgAl4o6Fbv3GWL5eT9o1172M9/KEm7Rvbkp8kEbmaUhxWncJ9vaYiNbU7BtHFOAeO70QFLbw89OIrWL90CTJOn8KZY0dpZJGpsswIqV5BErQGw0dOw7oda6AtyhRIeWjvMbglciP2bThOAh1JyfSOzu1ZCMvHK++aPiU4GJg1CbiDWDXHM2RkAWOn0zr6O6RDTzaFffkTsPRXk5tu3AYZ6QpQg2yTv+7f84TwbeZk5YTuZxonwu0bQtxzxnL1na7U0jRSkl7/CZ/+8C+kJHXC7InPgneuLFvzFR5/nSRfGtLdu/THnHufB99IzAhPU1/Aee15oejOHXrjwyc/Q5dJqShghBPMbfs2Rg0gx20QplD+Zj69ZY8QLQiL7z0P3JRq8ou/qzaQ3EckOj7KJJhxuIJIuAgspV8/mL6N8xvxLP0mNw2Eiw32537gxbdMpPTpR3rg01d7kH17Pqlmf6F5+2l0JbPjAHd/FFQWCRL87v1bsXjBBoyadB92fPqQWAzUpFVj+PcjH+D592ajtKwErRMvWeIZ2TxyK4jqvvMZcQiaCibGd0ZEyFFKQ/KEGXhPxdotwLxZtnr0SaOBwmKSF7NJ+TJFTP3Xn0YsRqMU2pw1zSffAxcu0ACnEV6hAgZ2LEbV71/BWGKaZ7sR2c9WV+BoNiUi4HXtDindMea2KYhNSMSOfZsho6NH2ianonNKTyTHp2B0xyFo6RmCL9dvRud2WvCVp3R7FkjrigefluPwCQPU9K7n5mRh29dtiLMY6PZjGUIiNODrVMePAuhaNRtg0n1zR5q69SGJnubl1wc0uaeJpC1caloIL6cRtWufqQlGDycC558F3fljNW1Ca5P9Jj0Lj6BQHD11ECmtO2Pe/fNJ0aFEImnsdEYNtuxcjfTzJ3Hi7CH0DUvB72P6onzTenT0IEVH+y/x/ZtknEFI37I8EuuP55JFi4mixMXSqN+ejANbQ3FsVwgG35lR896/xWWPbH6JpmGTdO3ZI9DSfFsWHgclbSbUElmWevo63Qt+6yAQ6TXxyuQEqr8hVsirz8uEPLIFFDRqpV5+eGD8k8K/PR4qrGzfK6sqkbN1E9m7m6ZkZYf3Yggpedzu/xeWfbYQ/sGlmDCqFKt/lNONx3oMuRlY+DPJDwTxySX2RVv53clNPfNvgga5eKLLvkDbjXKgOUIM0AzS4CgY8oiPkvjr2p92l4bEiFG1PtVHttFe82y4JHel5dTYWtOWVZRi3tvTib/m48U57yPSxQfraIRXV5Qg+c7p6PzK25b8axZ/h5XffmnxDxs/AR37uiPn0qNo0zWbrsc2RdlOtXjidA8JWN9Z8tk6osl70TbomnyBDW+Eq/asJS3aIdtqEpKNZAghAE+f+LCAq0A428YJmwwpI+8fl8e3hWu3YTVzJtu3wNvTBx+99KNN6OidabRiVgq3oGCb8B1rWOFRA3x5Xlj0VPofRHy9PbGLLFwgIXrZ1z3wyDOXKeEFc2JGqmOQgL6NLFWNIHH/moGNJPLNqqRrzvy/y6DLOGXzcnlCO7jSHNglpYegleC9ZvKY1jZpnHpISLMGHe1w4b3m1wIyWvmwRzbnT04lqYuBOmNMYksMnTDJ5KcVrvatM/HbT69i+6+vYfoDKwgJ62lkT6F/2m1KihIJZpjT2j94dhBvH0jpx1OYneRH5k5AzRxQApMyoMGRdBUd7MOIYZAntKcROURwCz+i6qompE6X5uRuYg3baIiTkEMSuMfIGTYrbHUW4CSBkb7l7LEjZF4chKDwcCepnAXTkSboRZG8rtqC/lni5hG6hJ60a5U6hxH7CNEz6Z/nbTQlQDaFvUpP1qrNoicrAnj3yip6hlBYV3pS/6MPMwquBvDDpzJqzx6lVS/anxVFS3/u1z1nsamtgXiwLuss8X0yFXJwMJBN4n/Mw1I2S/I8cs0Mvx7eLa+HMv6xInjjIJ/iwCALiKAVjfpBOEv2isQOqN65UhD8WIDjs+D+t8Ds5kry/Ve/iab4DQN4FIrI5i/WW1mq1kcNdDnnoSf5wFhdCQ0ZSAgkvj4KvsHKaDAI58N1wUbbAtCqT2TLem1KHuXiUhRbvoruen3JDVBYg+LhupwLgr0aK0nYfq2+QZ9/mXapXib5IJmO9qwfdlHf3/hXy2tQCP+rlW3OD/w/+GHMuF/3b+sAAAAASUVORK5CYII="
-    well_split_example = "iVBORw0KGgoAAAANSUhEUgAAAIQAAACVCAYAAACZzlKZAAABWmlDQ1BJQ0MgUHJvZmlsZQAAKJF1kL1LQmEUxn+WYphUQ0NUhFBDhYWYQzUI5iBBg/jR13a9mgZql6sRQRQNzTU11Rb9CRpNDdFSW1AQ0dweuJTcztVKLTrwcH48PO95DwfaOhRNy1qBXL6oR0JzruWVVZf9FTv9dGHBqagFLRAOL0iE795alQfJSd1PmLOiDuftgX93/fqkr3Rjuzz9m28pRzJVUKV/iDyqphfB4hYObxU1k3eEe3VZSvjI5HSdz0xO1PmilolFgsJ3wj1qRkkKPwu7E01+uolz2U31awdze2cqH4+ac0SDBIgSF7lYJISXaWb+yftq+SAbaGyjs06aDEV5GRBHI0tKeJ48KpO4hb14RD7zzr/v1/D2hmA2IF+NN7zYIZT8MPDS8IZHoXtf/BFN0ZWfq1oq1sLalLfOnWWwHRvG2xLYx6D6aBjvZcOonkP7E1xVPgHNoWEQDEZXhgAAAFZlWElmTU0AKgAAAAgAAYdpAAQAAAABAAAAGgAAAAAAA5KGAAcAAAASAAAARKACAAQAAAABAAAAhKADAAQAAAABAAAAlQAAAABBU0NJSQAAAFNjcmVlbnNob3Rykxa0AAAB1mlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNi4wLjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyI+CiAgICAgICAgIDxleGlmOlBpeGVsWURpbWVuc2lvbj4xNDk8L2V4aWY6UGl4ZWxZRGltZW5zaW9uPgogICAgICAgICA8ZXhpZjpQaXhlbFhEaW1lbnNpb24+MTMyPC9leGlmOlBpeGVsWERpbWVuc2lvbj4KICAgICAgICAgPGV4aWY6VXNlckNvbW1lbnQ+U2NyZWVuc2hvdDwvZXhpZjpVc2VyQ29tbWVudD4KICAgICAgPC9yZGY6RGVzY3JpcHRpb24+CiAgIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CiGiL5YAACQ9SURBVHgB7V0HnBRF1n+TZ3c2AaJ4mDgx66EognomVAzIKRhQFDhM6KdnDmf6lDPnn4rpO1HPgDnded6Z44nZUxRUQDEgCLrsLrsTdtL3f9VdPTU93b0zu8uys9Pv95vp6qpX1dWvXr1671VoTxZAawiyKSKPfw093H2sJQW8lrGrOTLTStQ0jWjlGKLmM4mYMVRI/0yUXKDGuOGeooCnpyVENkq06nqi1Ou5V/QMgKRowH0av2qizDwtzTecqB64LvQcBXqcIZrPQrt/UvwL9n+1eFwXs+sU6PEhI7O0tEo3/ak0fBe7axRYrRKi9XboAq8T+UcR+TZGRTP4QV+Iz8K1HT8JzJacZgM1M4mCW9okutHdSoHVxhCpH4laphRXV89aUCx/ccANEtXeRBTYwgHHTeoWCqy2IaP9faV+HiVsEbRlBpkP0qT1YlglR0C6uDqFBQW7L2q1METyS4wI/8hV0rsBrAhYDwXQ0dOV9GwjpMhyotitBaW4Ed1IgW4bMhKQCO1voWYQ78mnlRqiUatgWVTtD3PzGqS9oKR1MujbDkPIpUTeGgxLV8Fq+RjDyQFENcd0skA3m0GBLjGE9DS23U+U+BvKNPs8wQx1iPcPBjNAB0gqUsOogQ8h9j+owEOFuSw1HWHvJmCy6URtZ+cSGp5AfP/cvRsqnQKddhy3oaETYAQPGiD7q/WDPeuCEc5AGj8F3klLUJkBDBQ6BkJmR6D/L8pdZplDRGa+heUyEEEum13gkBaWw5J9EW6KBQU6zRDtT6I09GLBDEqPZo9jtgmNU4/e2g+d/3PtqZ5ai6crUb4dIPIxtPjWQf4YElhyOIAXzOZfH3muw1D1AVF4Lzwz7JDBTSqKAp1mCBbZwuMIZghNxXDwGlwJP2nMwE/OtoEh0GCSIQh4HvTo7Aq9XiHcB3Af18X/kZAmM5AG1za7srNLdDy+KAzHt74RRJGTOQRpsg1+w7Sw+991CnRah4g+AxPwFq0CgfFgiGcRzuRXqBaOqegsMMVHejzYzwOlk+cz8hpZF/v5uR3uMLQQfl7oJpnvEAZz1d+nSReHXG5SERQomSHY4RSDFZH+Co0xT3uCdzM0cjN+6pjPEoF7uupwMvX0IupXNAqbtvV34ZlgDhc6T4GSGWIlpAE3vgBpIWDs5rE8CX3BCyaIXdn5CnUlZ2AczNEzulKCm5eFb0mQXaWgyyECekDsrxjXJ0JsgyGKBZYgpUJoOphuqHUug1Gtk93YIihQMkP4fqeUCitDAlsXGVgXXiiOnjoZ28GVh5AigM1JNisDB2O5BCRUZqEpE3QQ39ZgyBNN8e5tyRRgda5oiL8C3eHTQnTBAGCOpgl6mmoy2ukNwMmTNmqxsD68G6Hh9VVTbImwwsqua1ZK2aTNkwZ4duRcOKlmIg1+kRpYIK4uoRK0+HDROkQ79IPW01CwIhWEpcDaPkR4BkpmScDKXyKXgyWAaHh9OV1gP+gkLyBdfR5ufaPAlO/r8Xoam8Dst8h8iSuApZVvW+gTFyBcEstr+Sv5v+ghI/kZyGRqHNEQ6U4wA1NcYQZmLPZbqI6l1JzC53G29Lv4Y91F1oUV2ouUew5i6OIlerHnceNCSRQomiGC6JlCIijFZ75WbjjY2d7IjYtftjVXnhgS1KGHk6x0Dgwn7ZjcqvkzJNVvgaPkYU+pC6VRoCiGSH2HxgLhjV5p9QyUFDoaCVaNZoXfURz0iAKQUsGUkICFE3sUguMbJEBiMXiq3AU1GiVK++9Qh+BlcO1PoFDueUxsvrIkUEU+bgmi27s2GmJdoL3HEZ0H4eL+BfltGKDYklmX8I+GLnFKsTlcvA4lRPJ1nUh6z2OmsPQfgEEy33edGcTTeHLLgRnYDPXvCt7cWq+bzYV1ieRT4F3pOrfBc6NzFOiQIfy/15HlUADp4MeEki1wiTANHUGWJZGUcZ+jhC6BIYMtDyF51sdV5oEk4vJTb4EBf0DYBD7Uzb87ImUdkM8LM9WF4ihgqwby2sXYbWgHKGZB6AaBYWgoeCn9Q9Dj3rYoXPZovmINpBmEWakrjTwVzptw2BIQIKWPfisuSTTkllqj5zU8dBmhzwApzxeh503PRwBM6YngB3M0dADqPlRPxCX6BKr3MuIgYSJH5eLdkEYBWx2CF7SyI8gA9LhaMEhgY8Sn4ASCIsdT3nmTVwayRQA9lR1Y3IisI7DjKPOjBZ4epTKQPZZFCksSyZycrEssHxiaHV28NlNC3SyNweW9e9XIZUkH729M0ej1Ke59AHb28BS2HTNw7/RuCLxBGr74RyPJHs1rIlQTU8Eygh2lG4gcYCbgIQJMpvoyOEn4LCBVWNFVmYHzFOCKDJX9Z6tD1F0O+h4H0T5CI5AHDBKCPhH7J1zUJ0I64GoHng3QDt+hAZbZYEAPqDrDJq0T0f69iPo9i7pugWeyQsrg0y52/yytvLBCXMingO2QIdHir6N3LcGkEuYpkovgvj5VpihXJr7UA8wiW0Ezgiq+Hsm6SnalgVFSILAvpBdc6+oqKzHkQIqZF+2oBTMOD4O8FM8FjQKODBF7ARLhGg2R5wZ4zLcbJgyCgiF4sYpYyWREdhDQmUjoGC0d4Foki4W+im5QgMJ1goLqXUezTggKqwEYagKQMIGd8a5XIhb3NVfhfnMDo6ICtgyRmAMC3YWG/V6jh6WSZ9HTmaAND+PcB1gmUnyLvG0oR1X2dDKznmE7tHRTUwSPRCMfrxWW/gVrN8/Fey3OL5yHxOxPWpx/T2wfuDg/vVLuLHWIDHpp2yU5ZmBisBLJYj0P5DChRqI3toDgkhk4ydbtDeW09go1s3NYWCeqompGR3nstPKNRAIzKwOuYZiezIxpKLPCuvlBpOT+gCOZgSP90EUqFUDCQsiySM2Y4sE6dbeDqFAU0+hJiaeBstCEw7fIl1mkxDPLwUw1A/siqs9HLKdz41kxlzkTpAybvLaANE4XazZk/QPAhoXUuDeuLKEgwQwnFwfXxeOHoIrv4IbvB6Jeh2rhSvy3lBC8DC78JxBH1cJB6JYToFSeBeLBnq86DunojQWgjs+cKBvGhMg6iX9jlHcdEophBqCJ1dpo3A4hwcg6FsItxyr3yO/Fcw3As8NH4g6Wj5Amk42UigzY6hBMjSYwgKUUQBozg2ggDBEG8TlTkeDdCmV/BWSnHl9kWXZoPOMpjlSDH8IOGIcZROwfgbysvaVyFUqmkaWEkMTz7yhDpmsIhJZERk8MolfxHIJ3U/gqpkB6nG8jPZRisj/iphuYgR1gYqGOUrYMZiEd2OKxBTBA4CAww5c6BuqTnGeLXREJjgwR2gM0kBg+hR4gNGvi3o1A0D9ojZ+eix7/NXSL+zFkv4h5AiiLLAW8Ngqa9FoaparlG5EdBCCdqjGEkeqMYp1BAoYrrhNbOUJPkfHyCgZofwQ3OmN6YJaG95CJlXmVzW359jwpVH0pGv1gNPDVQFGIzbusG+6BRABjpN7Nz847tfjAkIZbtV/wCLTHDmAO9GZVoTNyoRZioa4RYRHgockMkE5JPMuYE4E+wFYE6z8GIyMo3OBIcwJeq9kP5nKl7x531CFUAqaXw7eAhpVQdTaIX4vZw0sRg4YpsBTQyLxkn3dp8xQ6z5Sm3pS5lSsamtc2pN5DHCRP0YCG572hYvk/Dz8KlOz1DGKYOw2//ZVCKjSIUbQ4iKL3GIBG5POe4i8hhpkBIJxPzVpY/ENcp/+r3Yt5DzSgFbDZl8coLAn0Mq3wjTgwD+sIBZNgYMQOXeDmZ6CuMVg7GTB9ZKrxhIoMgHzFQd6Yj8bldRFV48AIGHd5KPHZKaCyeKvezz3zOImgX4thBlOWvFs0bh6g8flQMxVCsJ7yFgTrOgRP51c6FM0Qvk1ypPLoCqAPvZvH3f4vYNxmccs9j4HljgyLCOs/noOI/sU6TcYKhVDeqNdiZBvXAQymzr/wM9sfQjwzgakM/27qAyozXDRDVMGa4DWMPD6H/yefWGyCRm9GnOzdIDbPDahKqJqDTdTwKYiR1oFMRAOy6crWiWdtREKCqENCHnPovVpmNa5KIwePQqyJMcXhZa06tlQ0gRM+FfMdxxilVGygaKVSUqgd5mXbpbiDaA5OROMNQLtej3uzhxJRdhNX1ZehAXbBMYOHosEbgagDK5eBESgaCmg7JI+ZGdR7mUe9mo8lEJ5UZnmWEjy5ZgK2LIKQCuyc4pNr+OhD9ppGLkH8MBNyhdyWzBDN54JmHyrUYWXRSj9AtFi2trCwMdg6qQETRe/IKZ5KiQVBobCyRODnSCmkY3kGI2qJdsMn0aXeKHyemL9o1zPwBZKn+kIwcz2YAO/Dcx0skeSSQXar19+o4FdQsOghQ9LEN1SG9KsNM3BqEA1UdzeukCQqsAnaegYkwTdqrEMYDUgYlszMwDnEBmA0LEuDzM8WzMBI6PVi5Rfelk3hhscgoSCNxDGKOqNIZmB07xD+r0woWUIwmRpZgZSMgMaquRbt9RToPh8N8ivSMJwwsJeSFTrjXCkturh/OfabJIJjZs6j4xtzLYjybY8eD7NSpAEnAQkXvVwrSQwlYBgJgQMxnwFmNeseMr2vX0uWEEwQdYNMYDToHNV8CaLhlQbMMIOsMJEQDSLGdlN0wS2Xo5Ql0ktwb4uJN2Tiiau6v+il60wWfwBFt2g/73p6Gl9AjcgfcdXxOKrSoFMMwQRmDT40DdLhTEgGtdHNjSgpGtYDSGdLIs9ikDhWV7VxlJ7MqKwMysYTvgaLZ7O+IvCUssWmYP2ez5qQwE6ySnddd4ohmMA1x6I3TQaxYeYJl29HvTcpyQ4G+hS9k00/ySS5pMKQQ7liVRaYwD8G/hDoBaxgGsCMBIdZaLwRYwTCwJcgpr35GfiFj5axlXvtFEOYycVMYRw1BJ0iCHNS+BFURLV3y57MiqIKKCcPuHZsXaigSgw93jdICwT3VhDxDGZcXizLWwcSH2tp7WDGVacpeKzvcN3wE9/xUJIqMWhugk7ToO4aaO0fgDE2QI9FT22DKE7MKr441it8O6Nd/gPpwY3E2r+unOaVIplJj2TFNTJFu/Fvhmcyw+g4rCesuhTFQJdhiO+I8AIEVCZT8HmDUaVDp6yMYojWcjXo/qKCqRBexoqzotBo3IAF50ZJJJsrM1D4dAxXo8F8j6Khl8K3MBl8BAnAB6qKIQnPFD4MmLlFAYYN3kBUdUBR2H0SqdsYgg8VSaInhnaBYgZFjjf1rDoJNJO9kcW/VY93IivyiKnxN3QkyVS4Vs8AQ/we5iPM3fhMLd2SqVhPsXBo2T3WiyGm4Xa71L4fz83UZRCfUzoRY/W1WDPBTADgTcERNJq0AjpkBm44WRsMZLwop+ZmZIckMABKIk9OBQ9D+lA4t+4C48GnICFvRlZGQk9RrQoZbXf172CXUhnx3aJDpBaCWLqjivc3sPbPCl0QLuA2NKLQB5zoCWaovRGNDB1AMlAGcw+xZ9Hg6rADvYLnPtofw+9x4Ep9AoqskEQ2EogZJTAW+gnq6XRaHq8NrZnmVNG+n9YtQwYzQDM0d96PEWCTDmyWfAXXJH5phYgsBbgRWWGUjYlgYH8wxDkIKNB0Csqbp0R0Q9Buso2/0BPcE7oDvJSVDt3CEAYR0UNb70F7zzZi8gMe3IIR2DIQy/uZYXQInwy94BB5h5nQ8UBFz17dwEpn3b2wcAas7ieVR/ly1O6e2qI0cyPyeVSGp1CXCsIMVCQEP5xXajPwsriVE5Vy7AY1DBPcsztcnKsVa/vP1oj46o8tRmUldC9DgHYRjMF8XBDPEfDnkvo9gsY1O6CYxql8QvPMKEPrzcBfoYXFvwlPpnD5kTPlnXJlKaQDK6S80Ze3CjiB7RHLTpn6aFr3Dhk2RGoCk9gdD8DzGpGz0GibAAe9VZyXbcMEavHiKz6vIs8PuVixGRlMINdHCAVVSiL4GAx9Rh+6ZM6qc6E/7CfvKvva7RLCTM7EO2i077XYPBNSR+TpcV6wy6ukmqcj0oEZxKYfXQLwhiD+pJMKYUikekgYcZxRBCmSGRgJyq13I/xgyahHCfGkmMsMTCANVjtDJD/Bg2TDhORjc1c2I9mp1QIpkV2ai7cKCUVUlsVX1YLBbRwOpSwsGLG1D84xM2QWg4m+Ag6sIgm8foP9KC5oFFjtDBGCKBZT3ejZwcOhX4zSSc/+CQDPULZdjYZaqN07/itWiRUeH2Ow6go08Mto9GVWGBZxYKzUYov4Co3qER2CezL3XGltyB7K7u0YzFS5oaekNpA6AVia9RDBUGyRKAqs0xFF/MVAXnLHB5XVXYe62VkzJVWq/JF7hgxoPMkMTDIZZsboFDOgDN4KkFkJZXQbSJiLEMG6B/8k4M14ttMK2P0duRh5h1qlVnZczzCEHY1NAxb39ACGlNTHYJTPrTNxY7Jnkz+1xMCzm1ZbAPKYQ2CCEaFo8qk1oZ31CPdSQIGeGTIKHpuL4KnrFBo1jMms0I56PI/rP6Dn3wbG+CCHy4tu6mBF8B4KhraHwRDPQxIs0e7FTiwLZVNPFZNiNSfJO/dqRYE1zhBWlZJxbIq23oo7DAU1mNtQ1zuKGdapSGMGALAzLAwPZ/QGRC3X4tR/lj58wJnrolapUhju1QxRWN1cDB8v2DwJ96w3YOCrfxCNDQnCekXT4YiDIiuBjyMwVl7LSPdqSYE1q0NYVkmLXHULVIPnNEdS/fUY/00+DB8cSrzeIvEazNndNGbgnPxZJWFdgDEk2HlJZbp7zVGgVzIEWx/JZ7RKZr5Ao7+H4QCNbobQTtA78JPApm3rTNzhqoJYTscSg01VFxwpYNLzHXF7LJFdy+LcCX4iHFjs2i4Goo9oUkXsxlJYnQ8QaZ9fTAkujkK2XkQMeDXrYWHE3wI/bA2GgBOpVODT55gR+MeeUv96pZZQmfhlq1RaNVf6Z8yJnAgmwJATPh7DCYaZ9g+hY2ApHx9u4kLHFOiVQ0bH1bbG4DWYYoEOdIjEk2CCgZjJ3N9lBmtqWcf2KYbwKUOLd5D1C7uxzhTonTqEc51tU8UeUyihGcx0Vo23RXMTHCjQp3QIh/d0k4qkQJ8aMop8ZxfNgQIuQzgQpxKTXIaoxFZ3eGeXIRyIU4lJLkNUYqs7vLPLEA7EqcQklyEqsdUd3tllCAfiVGKSyxCV2OoO7+wyhANxKjHJZYhKbHWHd3YZwoE4lZjkMkQltrrDO7sM4UCcSkxyGaISW93hnV2GcCBOJSb1+hVTqWVLqW0WNluEqqj2xNPIW1Nbie3UY+/c6xmi9a6b8TmF9wVB2mrrqXb6n3qMOJX4oF4/ZHj8WCQpIaCEZZx77VYK9Po1lemVjdT24Czs7azCifkNlPnlZxxwOon8g9yNFt3KCXphvZ4h5EtHX3yeYndi1y/Au9EmOB7gHBwDFCD/BhtKFPfaDRTo9TqEfMdstE0G8eW/5dRy9gngDC8Fdh+DvXpeqho7gQJDfmvgyEBy0ULKJtspuPmWMsq9OlCgbCREtj1Bq26/EXsuluL44zgOQl2Y91qe/gOp/92Piri2px+j9OJF5B04iBJPP4jtXFkKHXEM1Rx+dF4e96aQAmUhIdq//pJab7yCPEE/1Z43Ax9qmU9RHj6wKZjS+skgMU2CtD5yPyUeu097Uw8QwAwMqU8/InIZQqOLw39ZMETrDZfh/GtIBrxI6503U8NlN1BoxEgwhIdaH7qP0t8uoKpDj6LUku8p8cQDudfVmYEjgrvskYtHKPYWThoBVO26p7g6/unlxN95k2JPzib/pltRZNIUnIgLRTeonWSSaV0lwp5g0LEokchM7Oudh1X0eoZI/bREMIOkcra5SQTZQZVNpajupNOEFGiZeT1FP/8v9vHpEkNm4Ct0jcwvKyjT0kTNF51FmSWLDcnRPudNCo85kELbbq/m0MJghPj7cyh6y5XiWQRdhKF98QKc3v8MeWobqO6ymyj+7tuUePQefP2nluquuNlQdDNtOCTL4yNvdTXqlaGmGedReh7XMUOhw6ZSzRFTtOf0ov9er0PEP3iX2q66II9k3iGb4pzr73E6SDuFJ51AiX8/g09KY0OnE0CaBPc5SDSkFZp/+Cjyb7UthXffm9LLl8HMDeFk/qtwTvc3VuhGXOjQKdT+3OM48R9nEAACow+gulPOFhIoevOVYlirPu1CSkG5bX92tpGPpUv/2f8U98yomWisV5jSvV5ChIePoGh9P2zzx8kfOmS+/VoGKfHUA/jUdM4CMRJMAe86g3H2VF1+LCQH91aG1Mfvil/8wbs06aHoH/mZlDvkD/5uOCWeyTU0QflliD/7uCGtYnfdRP7t5ZnOWn7vkM0o9vILFLv3VqEkC6kBxde//oaU+mYRVe07lnxrDdSQe/C/10sIpkVy0QJqOWe6JVk8aw/GMYRLLNM40jNwXQrutjdOz41QcJtt8B3Pc3CgSNQWv5QET0N/Cu41FmdR5PQWtnY8dQ3ieen5GB4YWF9gBsMQR34/+bcdRcGRv6fYA3fhtN0co3v6r41vimlnKnrXG0L9bpml5e/B/14vIZgWniqMwRbg3XAo1Zx6Hg48v9AgZB4aGqH62FOo7ZqLRK+PswKo9+A8vE7esNRSmYGLyTauED9RpC6BvGDKzLIfRRQ3embJdxS97W2h24hI/c8DXYO/DsAgGUO767l/yMzeD/GX/2VZSfZFtJx7okY8r6+QcaAUtt10mTYEcAnMDJ3V7q3mURQrRlQwYLIw9OEow/qNnhbcdS98dPYH7X2Q7qnDOYo6ZJt0bgAjhSfjbKQ1AGXBEP7Nt8r1poDpwErph4B1YTkUwImVBxI/L7KIGxb3DuAdvCFFTr/QGoPzQgH2bbUddIMD83DCh04mVkzDk0/C14hbtDTBSFl8r/wDapz8B2o8ehzFXns5L9/quikLHYJfvv3r+TAdl1PbzGuhsWka/eoiSqfKZQVzn4Op/YWnHLOzqZpdpZnOjOgdvAGGkO9xMHuNphzrUofjmcGzjb9o5UECDnj0352XcI61yiWWDUPIKjceNxFEWiFv+/YVCqhQRPktFYZILoDn9tZriZXaunP+F5/WNllPXaBKWQwZ6vtFTj2/UFdQEfpQ2NMwwHib4L4HG9Jh1YxzKfPjYnxC4mNqnXU7Pk7TTrFXX6T2z+ca+J0NlJ2E4BeNz3mL2q67xPqdYVl4+g3IiVprLPIMwEnp0C+McdsGr8eiWTdKQ9dQPa1QgH1bbodpfr8YTvzDthfezV8njM5VC8qqb+gWlJ7/qTBtI+ddTuEdd8qllxgqC7PT/E7hkbtQG6+kSuV/hMsTqaX6W+4jX79+1Dj9qDyXt7kMnkLvVZDUHFqkmsZQgNMLvjB0pvRXc4V/g4cPg3GgrKYXztNeBfpHCsMJdYEhym7IEG8OBc5TYzFu+tCTdKeTp7sX4+qTWKudicx+EpMCHX/gjhwz6JXhjsCM5B20HlWNGdulKpblkMFvzN7LGNzD6Z9+pMw36BU6+IaNoIZLrqHUsp8o+uj9GF9TlJrzqkzuk1d23PV/CN+S6AYoW4aQ757FsNF8+YWU/uxDEcW6ARMoNGYcBYcNF3MDjdMOyZsLkXn7ytWz1iDq/3/KfEoXXqzsGYLfnVdTtT58P8bb+dr0siQIFMyqE86kqj33oVV33kTJ11+QKX3jCmWTFx971x9C4fETKYQOINdndPYFy1OHML0tE6F26vEUPuiw/BQoWcn3/wMiBan6sMn5aaXcYaqaNwp1J3iwvK/LAKUzizUX6S8/wxKBC6kJaz26Cn2CISQRwiN2oupTzide2yA0cZhtQaxvYPCv+xsK7LqPMM18m25NwbGHkX/kbjKr7VWsioKySonu9Y5mV3SwfsO2RrkE9nqqkIG1sfLkP1LjCZMo8Zk+06oiFBHuE0OG1Xvyfg5ec+frjw99qoB5gsTc/4qlcL6NhlJwh1EUf/E5CmBdg1zmr6Kv0bBqXpoqwnpSYAwW/Dz7sCkld8vzK3V/uQFmuIkGOZSCUJ9kiEw0Sm1YbMszmzUTJ1MmFsNKNi956+oFARr/OAHrELT5hOpTMSHl91H01qs1c66zk18FpC0xAqa0f7uRWKrHw0ArPl2t+xacisH7efoNdFwtFhw3kWqnTXcqJS+tLB1TeW9gcdN690wokP8WKc2LvtYUTTBE+Ojp1P7mK/BV5FZY8U6wxNPQ0PX1khbF5aJ4kYt5yjuX2rUQJFfqozmllQEJ0tHSQfZylgKlYZdS8hrE5R4mIfPjt1rPh0s48dRDhvnJ8wS8ICXxD6yHVFZQBUaPhZu4lVLvviGLyF1XFzPknlBciN3zUHSzXJ98Z21+fkid6glH5Md1cNcnh4z0z0tp1W03YsiAGN5sK22fBojjG7oVpb/WJ4BUF7FOpOCBh1PtMdrClJWnH48Ftos6IF/vTvZtsS35Nt0CXzMeSNVjD9KW8XVQ5T7JEOZ3Tn77DSaIMFG01trU9tQjYkV14rknjfWMvm22Fyuuaw6bJNZdZKFzBIZsTG2Pz6b0oq+I5xAEgKkEQLz7d9odHtB8KcJrKVm6GFPWGvYa+2cnnZyzCU86jiKHTuqwLhXBECoVWOFkPSD1w2KKPf0Y+TbeFFv8jqJMWxslsEcjegd2hCHdt/Vwqj4cS+znfkKJx/+mFkG+LYZRwxU3UePU8Vjs0pyX1mtvwMyRsy6h8E67OlaxT/khHN8UifEP5tDKaRPwG0+ZX3+h+vNnYAfYKGrGIt2Vk8dR9G58X5rHZQCvNVh16ZlYqb0dhSZO0/waIgUoCW1msuacGcJL6Om/lp5if+G9JN3t3LJ/mkUKm9tvdTynU1EMkeDFumxNYI1j/OXniXeFtfz55Jx2zzON6kJZ1vyX/CBM18jZl2KnVr2YJ/EOXIfSv/5Kwa1/R3UXYP3BhKPEbKNFMxhRYnNyNzu3jMKtAuxdZatIgfRnH1H0+WeVmMJgRTFEYLsRBpEC247AsPFdvrkJu7724mux4PUErHGsFUND1W6jBdXCo3ah0IGHCosk9d4btAq7uviogabTjqHY3di+t80OVHvVbfarucBcPQo8ba5LO/lc1m+4rm1/f0pGFVzL2uyM/usflHjleQoM24EicEDxZlwfXNTBzbYseFGOqN5vHAU22QJmaArXzcXSszh0hfSCedg8M5IiRx9L/sHriZ4fGV9orrGyKSEbjwv9Qu7z4PmE4GaXiXE6et8dYLQUmKfVcIDx+kdjmb0sxOIqzEnTGggLtC5FZbBkwA7KkiESH71PyQVfQdm7T/SCxDdfUWreZ5o1AOWp5qJrrDfvggqBjYcatOBJL//QzcV9eJ8DBDMYiRaB6kOOpPTPP8GX0UQRbADyRuDH+PujoqF5TydDCFsP+Zd3LAHig3vshwUsv6HYX2+CgpIWuFZ//pG7UvLNlwp6N+PyNHdHjiirMmUc7wFhfad6wuEyquBadgzRcut1lHwNugCDHCPBBJmlOtdDNCexZN9yN7eWy/jntZlyX2brF59QfOfRVH8mNhbLcg1MLeCNRKgeq5xV6HfnbDGMeHH+lQrtL/9TvaUMdnnVTDmOeOhpOvUYw+T1DFhHuNizy38S+N61cG8S9bKgACbtvAMGUPzhWTKq6KunOkL973uyQ/yyY4jUe2/mXgqEC+y+LwUxy5lp/JVif7sDi2fXoarRY3I4DiGPqkCirNR/XqH2A8fbDjlWRbGUsToTwr/NcEq+gfUXYC7echg5cqrIzvMp/e99glbdfQeslRjOmZiGoStO0SdmY7hbnyKHTMSxBS2UfKlQ+csm4+RdZ938auAdApi1Tc2fC5/Dz0YaL6cjTIDJjdHhqZrDzUCwCZSdH6L5hitEw/H7BPbYl+qwt9MA7lk2vdvAMQVaH3sI+zPvx5gPHzA084aZDxTOkJryFHWLuiTmfooP0g/E1PvgorIYSBhSmi44XSyw9a6LhvWD6VC32rMuFF5HPguDHWahMX+gqr32hSJbRenGRoo+/hB54Xyr2u9ADGcRIWniH75HvoYGoTMZ5TsEyooh2CUde+lfmIOIUBgnv/gGru3wasUnpZYuocR772DJ3faWB5cVX1I3YoIpUiuWk5/fEdZPT0FZMUTjlIO1fRSQArVX3IKT5bDns7sADdB87Qwopl9QCCfaRQ6Db6ECoWz8EKml0O7lZliI4+S8L7q1ufikmtQHbwtlL/7IPWKdZrc+oEwKKxuG8ITDOfcxJERoZ2effKn0Z/8F8VI5gKffWpSncJZaWBnjl9WQwdvjE++8IU5fCWMOoruB90Ymv5xLYXgnfWsP6u7iy6K8smKIsqBomVeybIaMMqdz2VS/VzLEm18uo1PufZuefH9x2RCyr1S01w0ZrfEk7XzGbEomsDUeMGncdnTx+OF9hd69/j3+H8jXIuayFVfoAAAAAElFTkSuQmCC"
-    undersplit_example = "iVBORw0KGgoAAAANSUhEUgAAAIEAAACYCAYAAADDeYoDAAABXGlDQ1BJQ0MgUHJvZmlsZQAAKJF1kLtKA1EQhv9oZL2ihZWKBLRQWSWsCaiFsKYIgsKSi7ducxI3gU1y2KyIKIhPoJW+gPgEYrQRH8BOULxgY2MvpNFwnJOoSRQP/MzHz39mhgGaWk3ObS+AbM51IuE538rqmk95hYI+dJHtMVmB64axQIzv2vhKt/DIejMue90vajx/dPrSdrGtXQYfg3/zDa89mSowqh8kP+OOSyNVYmPT5ZJ3iHsdWor4QLJV5WPJiSqfVzKxSIj4mriHpc0k8ROxmqjzrTrO2hvsawe5fWcqF4/KPqQB6IgiTvJhCWFomML0P/lAJR9CHhxbcJCBhTRc+qmTw2EjRTyPHBgmoBJr8JMC8s6/71fzdgeBGZ1GjdW82D5wNgv0P9e8oRGge4/8YW465s9VPSVvYX1Sq3JHEWg5FOJtGVBGgfKdEO9FIconQPMDcFX6BNg7YazuqqV9AAAAVmVYSWZNTQAqAAAACAABh2kABAAAAAEAAAAaAAAAAAADkoYABwAAABIAAABEoAIABAAAAAEAAACBoAMABAAAAAEAAACYAAAAAEFTQ0lJAAAAU2NyZWVuc2hvdK4BWr8AAAHWaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA2LjAuMCI+CiAgIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgICAgIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICAgICAgICAgIHhtbG5zOmV4aWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vZXhpZi8xLjAvIj4KICAgICAgICAgPGV4aWY6UGl4ZWxZRGltZW5zaW9uPjE1MjwvZXhpZjpQaXhlbFlEaW1lbnNpb24+CiAgICAgICAgIDxleGlmOlBpeGVsWERpbWVuc2lvbj4xMjk8L2V4aWY6UGl4ZWxYRGltZW5zaW9uPgogICAgICAgICA8ZXhpZjpVc2VyQ29tbWVudD5TY3JlZW5zaG90PC9leGlmOlVzZXJDb21tZW50PgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4Kaj0ZjAAAJ5JJREFUeAHtXQd8VFXWP0BCEpJAAkkILUAoIaEXqVKkIyD2ii729tmwrJVF0dVVUbCsuq6K4oqK6CIrgjTpnQhILym00EIICSShff//m7mTOy9vkkkhTJg5+WVeu/e+9+4979xzT610HiA+8OoeqOzVb+97eaMHfEjgQwTxIYEPCXxI4MMB8SGBDwl8SODDAfTAReEJzpw5J76VqefgX7kjwYw1e+TyJ36Snk9Ol1/W7nXqiXPnzsv65HQ5fjLP6bzv4ML2QKXyFBat250uz362QtKPnTTeqhJ+m8XWktOnz0q1QH9J2pchJ0+elipVKsnk5wZI87rVL+zb+1q3jUN5IcHOA5ky8u9z5czZc251/bCesTL2lg5ulfUVKl0PlNt0kHrkpNsIwFf6ZfFuSUxKL93b+Wq71QMXBAnSjp+S28cvlBHjfsO8v0c+n7dDquBObVvUFk4B7gAVGh/9stmdor4ypeyBC8ITvDp1vfx3wQ7j0Ti/nz3rWkcVGlJVTmS5ZgT7d20kb9zRqZSv6ateWA+UORJw6Tf85d8k7dCJwu5rMH+FIYeqXAmkI6pWiDRtECZvjuosAf4XhHip23nltkx7lEu875YmOyFAt3Z1hQNpBn8/925NRffBI1myNHGv/A/LSx+UfQ/4lbbJsxj4L+bvkIzs07J04z7Zsz/T0WRURIi8OrKTpA09JU9+uhzIkeW4VhIrhvem/SHhwVWlb5s6smTLIXnju0SpWSNQxt/dRSKrBzra9u0UrwdKPB1Q6peHuX7UhN9ld8qxAnft1KoOBqezAEdk+Eu/Sla287xfGdSB18xAomFx2lGMVGXq3wbJk/9eKSl7M4zztw6Ol9FXtXSU8e0UrweKTQlO5Z2Ve95bJNt2H5XGMeGSlFoQAfgI1QL8ZNhLs6R5w5oFEIDXzQjQpGG4/N/wVrLncLa88906FrEEUpDZifslulY1BxI0iAi2LOs76V4PFBsJVu88YiAAm9cRICCgClYB5+TMmfPSt3OMzF+VajzB2k0HCn0SP6wdX7mrq/RtHS1+4BMoSnZFJVRDHZrWktt6x8o3i5OkNqaDEbifD0reA8VGgmZ1qktQoJ+cyjljcO29wfjNAcN2IivHsRTMBH8QGhKAc7kGU9gA4t+DR7IlN/es8aS1I0MkPeOk+PtVkQdGtJaUo1ly3etzpSWoxtxVyU5Uwg9LzDP2JWZoiL88cm076QRRcyXMC/f0ayaViTE+KFUPlIgnuP2dhbJl52Hjy72xf5x8M2uL00Nw7f/pE33kzrfny6lTZ4xrLZrUkq27jhr7fn4YWFAMAud4d5lEUgryIpw6kvdkCFcjN/RvLs9c28Zoy/dTsh4oFhLM23BA1mDwf160S3LBGxBuxCBMnbfdaSA5NZDMZ0MZpKAoEq/KFXdLSvDvp/tKGyCGD0rWA24jwfrkY3L3m/OMu+gcfJu4KHlgaIJs25spC9bvlQ3bDrn1JDo1YAV3KIIr6WO1av4y5/XhPkGSWz1fsJB7EhvUO3Tcpv5lE/oSjoMeADJ9e59YycrJ//IL3sr5TG3IEIoDjSExHHd3N8squeBPTp+1USbLAr6ThfaA20jQr3VdCahaxbIxCnBSDmfJg8MSLK9bncw4keN02hVfUB38RUy9GvLW3V1lyeY0pzo84LXRt3SUENgj+KBkPeD26uCvX6528AH6rS7vUF/+8tZ8QwlUxU1OPQRIYxYeqTbbxNXGlHLQOOTKIBPKpdNYHVSqdF5aN6opM5fsVkWN7dXdG4NKnZLHPl0hdw2Ik7aNfLyBUwe5ceAWT/DOz5sKrADYdjDm4nrRobIdFkPuglpe6uWjsWRMAyUhRNSsJlX9/WT/wXzxM883wnSQnnEKlkd5jiUjkW7UsJby2c9/sgjqVTHKPXdDe2ndMMw45/spugfcmg4SdxxxaonTQi0MFrn/4iAAG+Gyzgyn7PIDnj+afrIAAvD8IcgSMk/kOhCA50b0bir1NWlhHszUtkOS+cbURF72gZs94BYSxJu+Ki4POVgKyLW7C2ppqZc/nnnKcUgUqVE9yHHMncp4ypMnbfIG/cLa7YdkWMf6cuXlscIpRkFYaIDa9W3d6IFCeYLc0+cMhq96tfwOtmoztgHmYeDBjjIyB4Mg0QEk+dRUWkHKvuPyDqaCWct2g8Lkl7g8vk7+gW+vyB5wyRMQAUaOX2DoB/xhyHEax4EQF+dgOWaGOlGhEgL+IBfkOBUDU1IgIxgJA5IDmkFKUGAViKhdL/+s5AvkDVo2jZSXb+sodWs6U5WSPtulXM/ldJBy+IRDQUQEIBABOFA60DiEg7YD/gJ7YVFcGjgPCUSOxh+wrUqV8h+RUsjYmDChyVlVu4WR1dKSvEHiljSZAIbWB0X3QH4Pm8rGgGNvWN/GYfNrI8TUryE1w6vZDuy/pyHLVxDmhmFHjer58zUpjA6U9xyDUIr3IPMZVSvY0E+oMg3qhkJ9fFzmr0yxiRjVBWxrgA+g9rI5lEsKakDh5IOie8ByOqCh6IK1qdKueZSh2evcPEIOgBHsBhHxPe8tlp346q2ADJw+N6sytcHBU4tIuK5vM/l1ebKcPOVauhjfJFJy8k4L53yr1YTRkMVPeFiQZEGb2ah+uLSALuGZa9pIkF3AtRVtvTVtg4RBuzn21vYS6hMuOXqwABLsTjshN74y21GAO1yj//Bcf+McJYPv/2+TLEncZ2j0nAq6OODXz+UdSffIIfHy9a/OWke9GuVNLvhAvViR+6Re/G8PJjH9xClJBQVRDOZtQxLkieHuSzeLvFkFL+BMj/EyNUFWqZDRgWpbWhQRomoEydotB10iQETNYEloFulExo9n2hCA9Reu38+NSyguAoTheahJNOsiiHCkSjRqSUrNcCAAbxwCBtcH+T1QAAnCsN7+7Mkr5C6YetWz+wIO7dnEqPHWTxtl6EszXfoJVAXpPZWTJ5t3HHaJJJ3iIrECKBtzMPIUv7wyRF69p6thkaxeCwSgUOjXNrrQ6952scB0oDogBxz2D8tSpEawvwzv1EBe+/4P+en3neqyY6sv4WqGB8HZNF/w4yik7SjDEHWKA1bFbiyizrniLdR1tSW5f+KmDvLOt842iY3A0CbbjVBVWX3Le46+taPccnlj/bTX7rtEgtGfr5RFdjv/m6CY+QGGI2pOddVbzRrXlN0wPHXHqUS1QWljFSz9KBSiyVpxgJSHzi5qCavqcimpHF+pgq6HlU5yWqbs1czheb9YMI9jgQzPfrEKuosT8jBM10bCdtHbwBIJPpu7Xb6avVWy7Wbi9WFXaJYBWBl4DOsVK02jq8sEUA0FXLodB1NoBn7F5B8OH7WtGszXy+K4Qd0a8vXTfSQ4wF9I2T6etQ1MqbN/YwKESpthLUWojmed/4/hZXHrCtVGAZ6ADqQf/bjBgQB8Gw6YWT9g9bWnY7Dfn7beqQOsEIAFemOKqe0mb0Dy3T4+2ngOp8a1g0CYtHEVw6lAQV+ouYkAx2jwir8tFubxO1Jsdo+s0wRLS2+EAmxyloWINiwkUCY+0B1LrTxZse2wTJkLKqHZD6qO+xPm6DpyUAdwxiTxJSffsWUdwzPpr5NWq6qFbqk5OAolk5V0UFWkpJGrGJ3pjIF84qqXZ0MrafOLjNUUYYHwi7iyRyP5cX4+n/PiLW1Vc161LUAJrusSI8N6NTF086onNu04JLe+Nlce/XCxtMW8P7BLI2MOV9fVlrIABeTczQjAaxT+PDK8pazYftjwL1Tli9q6q5NQUVDY3ptT1jkQgMeH4NhCxpSQm3dGhnSMcUhFe4EyNYwINa55208BSsBOegIuXf+DRbECrt1zcm1M28T/bpSdKTaJYQC+plz7eZalLwAZNYKZWTNO2n++mLNNFqxO1U+V2T6ZV05f9IM8aDdUUY1nadSLjzl9ZarDiymuXv40osp7y7YAJeCL14DqmHoCKziryYU5D9MPsDmoQxc4ib71YA8Z2LWxVTWnc4vXlRwBKnOEAVwBDO5hfS8OcDT4DXtRp3urg+7t6snOvfni70RMZd4KlkjAzujfvoGjT3QvH64SyNQ1hb3fmNs7yzJI5LbDjmAlfBKe/miJDOhQT+4Y2lJaw1aQCiAzcBCtpglzOVfH5+yUpmOraNgc5iuLqkEKqA/6+q0HJQzGKWYllWp3+fp9shVmcXw3LjVv6dNUXfK6reUSkb1AsvoVhEMn4EFUI8hP3v8hn+v/bswgIdM164998vrXqyUvL1+TSEHPz+OGSjQER7ugh/gYegJy50n7MkW3IFI93QyGoTvg0+AK+N3bJhjnEl3b1hUyorrBKqWcM1cgPoJpGnCu6XxEbeXCt0c4eAXnq95xVIAnUK9NYcqd0PgRxk/P18tzqdgExqW6MEnV4ZazxeP/WibZQB4O3oNgAv8xZa0Rmk4vx32u0U8UEbPQjAB8Ln8YjRxGGDwdAdjejGVJxZY7XHFZQ1b1anCJBHqvzMLXpYAklrAdShkFtBA+otkc7tTiFYxF3ELzQKp6x7NzZZ/dEMXVF6/Kqi0p1Fkwo7u0+6trmVAjm4FThH0GMV8yVkCzlu6WVCwhJz3ey2udW13yBHqPndYm8Ti7z99dg1sYnUgP4yhI/lwBEYAuZ2YY1K2xhENCp8AVoqjraqvP++qc2iqvZ3VMCaDuMNMJ8gmKkRXQAolAieHB4wURSJW71LduUYI6USEOI9LwUFtYmGu7NhT+Ex7451JHP4FpBz/hODR2lAeyfnbN1jQ5WoSyyeordvVV621znz4RutyCiEiBUxIESmY/SFojMc6Bt4JblOCp69oJv3hGJrl7gI1PUB1Gpk8PROGH+Toahqeu4A44r95/desCCEA9AkXDcRiQELieEdSAh9XIpxiu2iWXr5aP/NobmkLiEhGJAATuK4rSo319+fLx3l47FbA/XK4OeNEMH8zcKt/O2SoMOvEwPH9+WbNX5ixPMhczjqMjQw3NnH6R1srkxJdi+Tb6gyWOSyTZb97fXTbD+uf4yVz5dvY2xzXu1Mf9dA2g00X7AeUVepwETgWVsVTJgIuaGcJhiPI8LJEPwqNpCIJsPPHZKqEOYeSgeLl/UJy5+CV/7DYSkCHr9uiPbtv80SHE7DfI3uzbuZE8e31rGfTXGY4vneeVVtLMINaDBjMNjBvvrwPLB0I5lI3VBaOi9IaySJdyqrJ0aKU/owIiy+19msgDQEIGvtJtILjyWPH+taASBXkYVf9S3Lo1HfDF2UH0GdSBQhYroL/hK7d2kImP9ILAyNk6ef6qZLkZga7NoBRP+lAHQT7B1YMZAViX5TnAAQGVpX7tEPlNW8Hobfe9LMZgYGnB/N6jvYwoZ2QCVeQz3QimLtTg3oYA7Cu3KQELb0rJkL/8I38Au7evByVMA5kEXcDRjBwn0su5/z8QFPGjUjGH2IY7YKYG7tRRZSghVHoL7i+feK26JCcQP+F+UgBYHpOK6MIrGsR8+EAPw8bSUcFLdtymBOyP5vWqGyJW1TcPXZkg82A4ugtyAfPcOwVGKfyCdQTgl+0O6NTAnfJ6GYUA5D/ex5evw8y1+wyHVSq9aAupE/3BEIXTyNYboVhIQG+jzxEfiOZm4x/uKS0QICIt3doyiAGmzMAgVp3bIMyt+UIxj+l8SvE026HW0zxNsTl6SzWp7bxKiYOlkdKD1MBS198+nWGmkz4IvumtUCwkYCdx4J++prX0blnb6LMeLeta9p3+NSs+iwOwaoPN5JxawMLA3981qlBcTPE02100foSMguBKgRpkeiOFg2HUoVWDGmAibfIAmrVVRuALIgARs6GJ39HrXer7hY+EG28/tFM9CQqy+SkwTF1P8Ai0M9BBrfeVNxERRBmCshy/aoJCFu6fPq2jkY0x5XkdgoMDDKZveKcYB3VR9+iK3AqroGD6L2wG6FxLv4lb3l7gxAfk5J4zHF1WYErT3en0e3jDvvNoleCNY2C88f2LA4XpbS5rFiGBEBYNfvFXJ2OTopod0iNW1m49JBmZOQZynMVU4owCNq2m3g5XJhMfutw4xfD3UfiSdSOSGStS5E9YRBEBpy3ZJXloU4/AqrdFaqAoiH7eW/aLtTpwt1O6/N80y2Wdqs8lJCkBmTjO6VaDrspabe++qpUMx9LvKMzZpsM5tVuLSInDNPXad+sd0kuzUsvcDqmOolC81hvUZPxdnc3FvOK4TJBg0eaDBjnumWDjE15BCPqfF+abp5l7kl+dItvma+qYaubde48ViIcQC9H198/2M0j8gOdmGCpqjKdUhZWTWYFE/YGVQay6h3m76N1rEJjbWvZhLnspHZd6OvgEIt5Pp280+uQ+eAHfN6C5jLmpPZw9shxRyMwddt4k/asFQc5R2AdwMCkiHjUwXvqC8ez3zAxHVXoc14QOYfw93eRHkPpUJMLIsYfM5dRhRgBWrAXDFneRgHICb0QA9lOpkWCj5qa+Meko2zSgS0KUayRQhbClrd9793UDaaZSh2ggshKWyI9/thJMWz5ncAxyfv7TY1qpgDmX68Iho7L2kwprJsY+TgOCrfrzgCWisDg9kT5/rLdW07t2Sz0d0HT8GVgSER6/vp38gFR2u2CNTHKvhpBDG4y1PcPP6USAYWV+HDvYMEUzGsAP23tk4kKn+Zr1VVuqXHG2vPcZ2A6Yg2bx628bGyFPjmiFiOulXigV55E8qmypkYBvo8zMhyDJxREL4REHm18v9Q/MibRk3T5HJ1CKOPeNqxxxiSf/vlsmfu/sYOooXIY7FFP8deRlDpuIMmy6wjVVJuhPMs7/bKiBFZCyk0Ontk+Rb4qRV/+ZpooYW0oR05D7gDB1WbK8Z0cA+8xgnDf/0JOoU8vSuZfT8OX1yYjSao/HZL6HNx2XCRKoDhvzl8sQWCpcWiPMzefP9JObYKiqtIOqjJkkU+/fAKbpFNa89Z81DrKvsQOqqmM74d7uUsMu+XOcNO3cAtuAh5AHgWH3XQHvkQ6jGG+HUjOGegcOaFtP+K+AkccpDdT8VdQlY/sU3MKvhdsbl4xvIgCGzi84FdQOGPpmMTKhzVuZ7DjLge4ACeFyLQrKlNlbjOuFCYHIlNbBCsLboUwpgbkzP5+zw0AAcvFWUBXMGPkF5j1i/ANXQOESzdsIDH0z0RS2tj7sALjCuOaKZsKlpA5kUKtBrE3qRAMVBXwk1vEBpKUXshM2QmxL4Beuh65T95yFIBiU74/9fIU6Zbll8IojWhyDPHv8JFWYquyfoCOgw0sTC59CRkrbiBC4yryd9bjamGRP5ava8dbtBUWCa/vYjFJpRDoOKW65VCPDp/6bQjD0yATn5aCrgbCyLiLTqWA1gnAzrsKaIrKv6dMDs7X4AOOB5V1pluBF9mF27mkJQuh6dj4Hkooc5ifYiy/7yQ+XOmkTi2wMBYhA6onbxdeWbRBQUQ9B/YPiKcgjUC9hJZrmNYbSD6jqJxMe7G6oxt2576VcpkwZQ6uOYqQQBZQTMLgkdfevTEksgAD6AKs65m1DKIpuAoXJhqkYI4+Y4xxxkK1EyGyHyqp74a84yu5eZ27bW48vOBK46lgihAJK66hObhAZLJ9glaDbGqgyXGV0hAHLcze0gTOsjUkc+MJMddmxtUIAxmMe1D1WXr6lvaOcbye/By74dJB/K+e9A/A+YgDq6tD0jYbYVoWfPQ7RciJcxp+Bm7si70SYe+Gwcg/0AIRkJN4e922i7ExNdyiIGGldj46u340hbH4dN0Q/5dvXeuCiIYH2DJa7DKA1C0vH/u3qIw1ufqwEFn4AvIRiAOvCjrA/bAGi4Eb29jdrC7TFRJ3PQR4xEDIBH1j3wEWbDqwfJ//sUJip8d8Kgu3mbLzWG0jy6NB4o9jPK5Kc0vHQ7G3Wa8McegmrtnznykCVXNadyMAWj8DBNQt6CEZC6d+2oBXwmJvbyUf48oNgy/jAoHwj016t6johwSnIB3R1dFk/66XSnsdRgm8QMOsQDEYI/4bo1woJGFPp2evaOI3Bb4iaMg//OpD1TAL/kOAi/pJe1pv3L6iwqCQdm8B8SnZorgWmVOesthkwQR8DIxRlSKrWHRSAfKtFYbOq6zvngdPBdd0aGkxeOpxIh3WqX+wxoqzhissaCX0eCW1gOOKDwnvAY1cHhT92waujQQlWwLGFsQkmj+4t8zYekNCgqtK1eWTBwr4zTj3gcTyB09O5eUDT80VYUhK2ITnmGsgZdJW2m814bTGP4wlKMhLBUDXTOIVAw9M6pmRdJWnTm+pcMtNBEtLyzV63X7oiWVe7xvnMpTcNZknf9ZJBgpJ2gK/eBTYq8XVwxeiBS4InqBhd7blP6UMCzx2bcnsyHxKUW1d77o18SOC5Y1NuT+ZDgnLras+9kQ8JPHdsyu3JfEhQbl3tuTfyIYHnjk25PZkPCcqtqz33Rj4k8NyxKbcn8yFBuXW1597IhwSeOzbl9mQ+JCi3rvbcG/mQwHPHptyezIcE5dbVnnsjj0aCf83ZLne/t1hmrtvruT14CTyZxxqaroOx6L9+2mB08SbkLWRofd3N/RLoe495BY+lBP4INEgfAgK9kitX8thHtT1kBf71aBvDactTZAXS53VsFimbEZCCjiTXd2tUgbvbMx/do5FAdVm/Z2cYUct4/AaSVdUI9pc2MTV93saqg0q59VieQL0XQyoxn5GCcV+tMgJT0NMooVEtaY68Rrf1jlWXHdt0OKQw2Wb72HAfL+HoFeudCkEJ5q4/IJPmbpUwJK9aYfI85mu9fn83w+NoffIxmQIH1GaIivb1b1vlBPwZYxDjaOpz/Q2+wroLfGc9mhKQCjz71VpZs+WgXNMrVu5AZtORSLOzHxlTGedI5S3KPHlGMhHm5qEJvxuRzPMzN4qkIgfiEVAFb06IXRSaezQSzFmPmAP28LWT/rdJbgMiTHthgBxGVNPdBzPl45mbpUndMLkaoXHvfX9JgVD2fHlGMY1CKFwFG5Hgc9OeYzIY4WvC7Im51TWrLcPgJR/OkrH/WSehiK/0/A3tpDp4ktBAW1S2k7lnERjznFtTDkP46QG7rO53Mc55NBJMQlhcHfKQIc0/pDIYQz+5HDEM+b8AUdNv+sc8OQDqYAXs9ExELJk4Y7P8goRYKuD2ZGR1fWB4S0wjdY3kXea6dGt77ONlRrsqbiLLXANvZ8ZkHHNnZ2RK8ZNnP7HlengVGVn6t7FFVWHmNQbyVkj2EhBoLlzlGVtxUI/G8hqSdXsSeDRPcNXLsw3SrzosuJqfhAYHGdnYmyBbSef4KJkya5u67BTo0nESO7cgE/oUUyZ2dZ2pd27s21TaN46QWqFV5VjWaaTRS0Hy7Z2qiOW2Q0K0ZGSDIiGkLoGMKnmPDTh+EFFa85CF9XakCo5HlJTnPlnu1MacN4cbORs5hTEOQ6Mo5xzUToXL4cCjKcHVyLz+z2nrHd2Qjbk/+6Tti2c8Y/7roH+x6jy/2hb1w50QRA+aydxLH02zSSZVHRXpRB1bbTu3iJKftCgoOZgWCD8sS0IwTdtqhrmiH0S4fR0YTo8M7Mtc5WTbYiqN6NNUrmhdV9bBrZ6R2so7UadHUwJ23vWvz5XkPRl6Pxr7OmNY4CJOYOxleK+moBxVpVOTCKwutssfW5wTbljVc/fcS8jtMO7L1Y7iDJUXVj1QmmI1smC1LVYCLzJCO6Ou8nlaNouSYV0ayn/mbzcYVlWZ2V8YhJP8R82wajL7tSFAWndQUbVQuq1HUwK+mgpyqb8mo5u+cncXMHjH5Wswh1ZwF8LXTv19hyFk+prtaGHvrMoX5xyHR0cA1uVylP979mcaA47xNAY03Z7VhaSIkVWZbcU8vKHI9HrqlC3ndEbmKcR/Pg9BmLlUcZ6weGU9GglykDdpy678DGvq1ZhEg/Msvy5CNXxJJ+3p8WxnRH4EqWZuBAWn8/IFTuqcO1vewhwB3HxspkpEAAIRgF85U/z079JI5tnjKPFyWI0gR6Z5lVme97pzWMtyl4R6tFaGKXcb2iOYqXzK7FwFqrPZyWZIR/o8HVRH6+fc2TcPuLkOM7h/+nQfl9nU+GxM2PHayA5y7mx+az2REOzeEa3lRUwr6eBLCLzKJedaaFCvQE7Ink9Ol28W7TauXcgfj+cJTiCa+aJNB2UT0ux9j3ndE+G6fs1k2jzn5az5ORVvoM43xKohBWLtAER9p9BLheXnaiUQkdr3IagngazBfGSGV3IJVb8stx49HfBF+fJDO9aXLCCDGXQu33ytPI9/LAIB+CzmkPxEAII5MRhXK0wGroPKKLtpb4aM+WoN5A8B8jbyOodjWxbg0dOB/oLXgavu1NI5xK3VklCvU177+US+bO4YoSXnGtC1MSLBVzUafnjiIlCPDFkP9frrP6w30vlNX5Uqa3YdKdWNPX46ML/d4BdnIgGnbQ41X4usVc24VhhykPmKi42UrbsPm6tflGN+9czaoqf3IcPbpkU0MrRURozn09IB9hSPDYsXZqNXfBATeMRBwLUJeaZIEd9+qKdhfVWSl/D46cD8Uq2b1JIFFkjw/B2XQdASIx/M3CKTXSwb2Ra/2m2lQICynoJUUi8ig9rnQG/edQjHWAYBNsO8jpnjKPhSzOUZIM62JBsFINJvhOCMJnglgQozHaiXawqFkRXkQFZPPUEkBDZFQXHIN9Pp6lAYldHLFXdfIYCqpxBAHX8x409khHF+8mAotIg8VJJd362hKlrsbYWbDshJf/DrVtm1P0NWIoytGhR+odPHDZXosED5CHqCPdD8LViV4kRmi907Hl4hKLCKLH7nmlI/ZYVDAv2NZyXulzH/Xm7kNGB6vNoRoRKHPMo392wqbbB99+c/PXZZqb9HSfeZanDWq6VP61OhkYCdN2/DAZmP9Ljz8NXrCbQSmkbKVwh0vXzbIXkUXLUzIS1pt3tGPSJ8IJbOjaCnGNU/TrojimsAmMiSQoVHAvXig7BqOGpiGOe/fZWxvLpyzCxHIg1V3p0tZf01qgcJ1+5lBXWjQ2R/mi2pR0nb5ApHR+r4JpEy+cneJW3uwqbJLfFTlaDix4/2FKpkVTpeyhTU+nr0dW0NyVwohCsjhyRI/66NDKlcYbdhR0fWCilTBOD9SosAbCPUHsyb+4Qtuw7LiHG/yVAge0lkBpcMJbB1hwiVTgehN2gAvT2XVAools3EmvvVqX8YWVofujIecvldUg/z6jdzt0G3n6eKXvRtYZnmA6GavhrW1d/Othah841joG/57NFeDsumol6o5BNJUS1fpOtzwB98PneH/AkbBCLE3qM2Uk6EmAA7xd9Xp8qyxL3y4S+bkUQrXqYvTZKTFxkBLmsZbUhDW8HegEAtqSug+f338NGMApJbAacJShUnawYvVuX0cxVOWKQ/vHmfFjuvfLHSWDYuWJuKbGn+Bjnvc1kMZAiVZdWm/Y4qlbGmfPSTpQ5ewTzPOgqWw87qTcUzdqmMdzmkZZG3ekRqYN2FSwoJMk/lOeQGufhiToL8ExauSXWcJ7PHuT4Jxh/7YbGsoFVcbYmJCpa5sC80K3VY5mIiiXpGPkMg7BPOg1JQYugKKDS7rVcTV5cLnK8yFlDgbAU9Qdu845AccuhvQ0rdTcnpkocpoUnDmnIMmdoJAVhacf8EjEQVNI4Jl0mP95J+sDzOPV9JErcfUpfc2lJQVV7AwdeXwlb37RBfR3ZDWLYHU2GrGGsJq17vkmMM9ZejK1rS4Wxpi474FZ5LW1Iz5BAQgHwBgd5JbSFPeGhIC4NZ3AL1bpdmteS7pcmyAUafyzRvJ1IQim07wso4cWua07xN/T8dZXLtsn79GS7GfnhYgBzLsCH5Ezd3MPw1CnuOSxoJ9BfnF3QMJt4BUMSMn75JzoD7egqJuquBb9h7JFvuHD/fmD4iwHA9CH+EBhHV5P7xvzumEbZVDbL6hW9dJaMmLDa0d3r7nrrPqWH8wz3ho2FjOq2e0yuQgJnYb3/rd4MHIJP4NhxHaPP/KZxbflyw3cmyR3XSHUNbSuPaIfLu1ETJPGFbPjLJ1vKJ1wozvj8HS+M0IM+RdJuBqKpn3tL8LBBOKq7U3+byF+L4Spjuv3JrB5dNX3JLRKs3Xbn9sIMJ5FRAD6H7PlgCh5QtBhNIGUIASLoOuw4cl+GdGsiUZwcaNoK83gxe0IlJ6ci2FiQT7u0qj0MIFR4WpFcrsJ+F5Wd5IgCnJjOLsviPvULjE1fgFUjQGowh/QIIcbG1DDN2OqrqcH3fOPnw8d5YOQRLVESI3GtPxF07PFBeG9XF8AvYvOOwPPbhYnge5cnNr8+TFz9dJoFV/eSr5/tLnahQvbmLtk8nGF2kzAehKfy4SauACHssn6tCLhH3p5+Ssd+sNebrv4HMHYFp+b70LBnYtp6l1S+/3O9fHCg7sCzsAKMUAk27J8H4pA5WFI9c3Vp6J9gMMn4dV1Arl52bb99Ivf/OtEzHNHAAPovBIPfvPdRdXvhyjWQCQfLy4F5mZ8yszOGtRsLdclZ13T2XghWDFVQoJMgARv+wIlmWwgl1o30Z9+LkNQaTRruCOR3qy4R7ulq9p2FsohucNIUhRkJshLRrGuFAAMuKONkDLme3Dk6QP2DhczPc41sjSkrzxrVke9JRaduitkNE/c3TVxiR1sYiZa+CtpA/3Na7qTz18VLJsbunqWv6tk3zKFkFZ1dldaxfI3U6XIRwSC9v3qc+JRrUjV7dVlBhkGAXTLBv+/ucAkKSHDiVKMOSbSbfRKsX5jna870AOwR+1YlwTZsJxPr0sd5St6br+X30VQlOzX39ZB85mpUrEVDm6C5j/12WbNg3qMLHgbhd4yJl1utD5c53F0qS3aUuoGplLFHDZAd4DEJMZKisOJcv0VT1uW2DZWwCnGbfn7peP+3WPhFg3hvDCy1bYZBgLnQCupSM6lN+xVd3aSCPfrTMEA+PGhxf6Muqi2Scqhh2YzYn0oMgk9/AC/kpTAvuAnUROmVR9bphWlm32SYGjooIlmduaGtcCoGQil7LH8EqKvVwptyHZ+U5HocDkR4cGCdM9/sF9BtmOH32LBC0mtNpf7ip9erQUP4ARdRV3Q0QpYUi8RTwPHzPp25s71TP6qDCLBHp8n3f2wsMaVkwll3fPj/A4NLVS1FYo3+R6ryr7aqdR2TMpNWOuf2Fv3SWaxDsoiyAz+oHJEuAg0lx4f4Pl8raTQegIAqRYATDoJDq7/BSaghyPvbbRPkz+ahc072xXAubQsZ1TIPw67PftksdIMlNPRoBkfyNKWXh5oMSDV4oHgKxoqDCIMEPy5MlBUxYd8zB3WBJUxZALeNPy1MlCnaJ/ewBJsqi3dK0QZ5gH+QQUTCYLY21UHGeoUIgAc3IGa6GQGORjx/uUZx3LLLslwt2yuTftklzBL549+6u5db5RT5YORWoEHKC2ZqgY1vK0TLtGk4j//xxveEhvArWy3M37CvT9itCYxUCCZppmrC2ZTQVqMEhH8H5l0BmrwHmXm+DCjEd0BmVXHSVKlXkwcFxloErSjNwZK5mQJrWBtNBl+aRpWmqQtb9f3Lj8TAMC2WaAAAAAElFTkSuQmCC"
+    if encoded_image is None:
+        encoded_image = encode_plot_for_openai(plot)
+        image_format = 'png'
 
     #Prepare messages
-    messages = [
-        {"role": "system", "content": "You are a nit-picking data scientist who decides if the clustering resolution should be 1) decreased 2) increased 3) unchanged. You only respond with one of these three words."},
-        {"role": "user", "content": [
-            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{oversplit_example}"}}
-        ]},
-        {"role": "user", "content": "decreased"},
-        {"role": "user", "content": [
-            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{undersplit_example}"}}
-        ]},
-        {"role": "user", "content": "increased"},
+    messages = RESOLUTION_INTERPRETATION_MESSAGES + [
         {"role": "user", "content": [
-            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{well_split_example}"}}
-        ]},
-        {"role": "user", "content": "unchanged"},
-        {"role": "user", "content": [
-            {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{encoded_image}"}}
+            {"type": "image_url", "image_url": {"url": f"data:image/{image_format.lower()};base64,{encoded_image}"}}
         ]}
     ]
 
-            # {"role": "system", "content": "A true cluster is an island of points. A subsplit cluster is when a true cluster has multiple labels assigned to it; this calls for resolution to be decreased. An undersplit cluster is when multiple true clusters have been assigned to the same label; this calls for resolution to be increased. Based on an image of a plot, decide if the clustering resolution should be 1) decreased 2) increased 3) unchanged. You only respond with one of these three words."},
-
     # Call the LLM using the call_llm function
     annotation = call_llm(
         messages=messages,
         max_tokens=30,
-        temperature=0
+        temperature=0,
+        backend=backend
     )
 
     return annotation
@@ -1285,7 +3474,102 @@ def filter_gene_list(adata, gene_list):
     return updated_gene_list
 
 
-def cell_type_marker_gene_score(adata, cell_type_col=None, cell_types=None, species='Human', list_length=None, score_name='_score', adt_key=None, **kwargs):
+def nanmean_genes(X):
+    """Returns the mean expression of each gene (column) of a dense or sparse matrix, ignoring NaNs as sc.tl.score_genes does."""
+    if not issparse(X):
+        return np.nanmean(X, axis=0)
+    nans = np.isnan(X.data)
+    if not nans.any():
+        return np.asarray(X.mean(axis=0)).ravel()
+    X = X.copy()
+    X.data[nans] = 0
+    nan_counts = X.copy()
+    nan_counts.data = nans.astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.asarray(X.sum(axis=0)).ravel() / (X.shape[0] - np.asarray(nan_counts.sum(axis=0)).ravel())
+
+
+# Keyword arguments of sc.tl.score_genes that score_genes_multi supports
+SCORE_GENES_MULTI_ARGS = ('ctrl_size', 'gene_pool', 'n_bins', 'random_state', 'use_raw')
+
+def score_genes_multi(adata, gene_lists, ctrl_size=50, gene_pool=None, n_bins=25, random_state=0, use_raw=None):
+    """
+    Scores many gene sets at once, following the method of sc.tl.score_genes: the score of a gene set is the average
+    expression of its genes minus the average expression of control genes drawn from the same expression bins.
+    The expression bins are computed once for all gene sets, and all scores are computed together in one pass over
+    the expression matrix, as its product with a sparse (genes x gene sets) weight matrix.
+
+    Parameters:
+        adata (AnnData): Annotated data matrix.
+        gene_lists (dict): Dictionary of the form {score_name: gene_list}. Each score is written to adata.obs[score_name].
+        ctrl_size (int, optional): Number of control genes drawn from each expression bin of a gene set.
+        gene_pool (list of str, optional): Genes to draw the control genes from. Defaults to all genes.
+        n_bins (int, optional): Number of expression bins.
+        random_state (int, optional): Seed of the control gene draws.
+        use_raw (bool, optional): Whether to use adata.raw. Defaults to True if adata.raw is present.
+
+    Returns:
+        pd.DataFrame: The scores, with one column per gene set.
+    """
+    if use_raw is None:
+        use_raw = adata.raw is not None
+    X = adata.raw.X if use_raw else adata.X
+    var_names = adata.raw.var_names if use_raw else adata.var_names
+
+    # Mean expression of each gene in the pool and its expression bin, computed once for all gene sets
+    pool_idx = np.arange(len(var_names)) if gene_pool is None else np.unique(var_names.get_indexer(gene_pool))
+    pool_idx = pool_idx[pool_idx >= 0]
+    obs_avg = nanmean_genes(X)[pool_idx]
+    pool_idx, obs_avg = pool_idx[np.isfinite(obs_avg)], obs_avg[np.isfinite(obs_avg)]
+    n_items = max(int(np.round(len(obs_avg) / (n_bins - 1))), 1)
+    obs_cut = pd.Series(obs_avg).rank(method='min').to_numpy() // n_items
+    gene_bins = np.full(len(var_names), -1.0)
+    gene_bins[pool_idx] = obs_cut
+    bin_genes = {cut: pool_idx[obs_cut == cut] for cut in np.unique(obs_cut)}
+
+    # Weight matrix: +1/n for the n genes of each gene set and -1/m for its m control genes
+    random_state = check_random_state(random_state)
+    rows, cols, weights = [], [], []
+    has_controls = np.ones(len(gene_lists), dtype=bool)
+    for j, (score_name, gene_list) in enumerate(gene_lists.items()):
+        gene_idx = np.unique(var_names.get_indexer(list(gene_list)))
+        gene_idx = gene_idx[gene_idx >= 0]
+        if len(gene_idx) == 0:
+            raise ValueError(f"No valid genes were passed for scoring {score_name}.")
+
+        control_idx = set()
+        for cut in np.unique(gene_bins[gene_idx]):
+            if cut < 0:
+                continue
+            candidates = bin_genes[cut]
+            if ctrl_size < len(candidates):
+                candidates = random_state.choice(candidates, ctrl_size, replace=False)
+            control_idx.update(candidates.tolist())
+        control_idx = np.array(sorted(control_idx - set(gene_idx.tolist())), dtype=int)
+        has_controls[j] = len(control_idx) > 0
+
+        rows.extend(gene_idx)
+        cols.extend([j] * len(gene_idx))
+        weights.extend([1 / len(gene_idx)] * len(gene_idx))
+        if has_controls[j]:
+            rows.extend(control_idx)
+            cols.extend([j] * len(control_idx))
+            weights.extend([-1 / len(control_idx)] * len(control_idx))
+
+    weight_matrix = csc_matrix((weights, (rows, cols)), shape=(len(var_names), len(gene_lists)))
+
+    # Score all gene sets in one pass over the expression matrix
+    scores = X @ weight_matrix
+    scores = scores.toarray() if issparse(scores) else np.asarray(scores)
+    scores[:, ~has_controls] = np.nan
+
+    scores = pd.DataFrame(scores, index=adata.obs_names, columns=list(gene_lists))
+    adata.obs = pd.concat([adata.obs.drop(columns=scores.columns, errors='ignore'), scores], axis=1)
+
+    return scores
+
+
+def cell_type_marker_gene_score(adata, cell_type_col=None, cell_types=None, species='Human', list_length=None, score_name='_score', adt_key=None, vectorized=False, **kwargs):
     """
     Compute marker gene scores for specified cell types. Must provide either a list of cell types, or a column that contains cell_type labels.
     
@@ -1296,7 +3580,8 @@ def cell_type_marker_gene_score(adata, cell_type_col=None, cell_types=None, spec
         species (str, optional): Species for gene list generation. Defaults to 'Human'.
         list_length (str, optional): Qualitative length of the marker gene list (i.e. "longer" if you are having trouble getting valid genes present in your dataset.)
         score_name (str, optional): Suffix for the computed score names. Defaults to '_score'.
-        **kwargs: Optional keyword args passed to sc.tl.score_genes().
+        vectorized (bool, optional): If True, all cell types are scored together with score_genes_multi, which draws its control genes differently from sc.tl.score_genes. If False (default), or if kwargs include arguments score_genes_multi does not support (see SCORE_GENES_MULTI_ARGS), sc.tl.score_genes is run once per cell type.
+        **kwargs: Optional keyword args passed to sc.tl.score_genes() (or score_genes_multi() if vectorized is True).
     
     Modifies:
         adata.var: Adds boolean columns indicating genes used in the scores.
@@ -1320,14 +3605,21 @@ def cell_type_marker_gene_score(adata, cell_type_col=None, cell_types=None, spec
         if isinstance(cell_types, str):
             cell_types = [cell_types]
     
-    for cell_type in cell_types:
-        cell_type = str(cell_type)  # Ensure cell_type is a string
+    cell_types = [str(cell_type) for cell_type in cell_types]  # Ensure cell_type is a string
+
+    # Generate gene lists concurrently; lists already generated (e.g. for another stratum) come from the cache
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, get_marker_gene_list, cell_type, species, list_length=list_length)
+            for cell_type in cell_types
+        ]
+        gene_lists = [future.result() for future in futures]
+
+    gene_lists_to_score = {}
+    for cell_type, gene_list in zip(cell_types, gene_lists):
         # Set the score_name per cell type
         score_name = f"{cell_type}{score_name_suffix}"
         
-        # Generate gene list using ai_gene_list function
-        gene_list = ai_gene_list(cell_type, species, list_length=list_length)
-        
         # Filter the gene list based on genes present in adata
         gene_list = filter_gene_list(adata, gene_list)
         
@@ -1336,13 +3628,19 @@ def cell_type_marker_gene_score(adata, cell_type_col=None, cell_types=None, spec
 
         #calculate score if any valid genes, otherwise print warning and assign score value as NaN.
         if gene_list:
-            # Compute the gene score and store it in adata.obs[score_name]
-            sc.tl.score_genes(adata, gene_list=gene_list, score_name=score_name, **kwargs)
+            gene_lists_to_score[score_name] = gene_list
         else:
             # Assign NaN to adata.obs[score_name] for all observations
             adata.obs[score_name] = np.nan
             print(f"No valid genes for {cell_type} in {adt_key if adt_key else ''}. Assigning score value as NaN")
 
+    # Compute the gene scores and store them in adata.obs
+    if vectorized and set(kwargs) <= set(SCORE_GENES_MULTI_ARGS):
+        if gene_lists_to_score:
+            score_genes_multi(adata, gene_lists_to_score, **kwargs)
+    else:
+        for score_name, gene_list in gene_lists_to_score.items():
+            sc.tl.score_genes(adata, gene_list=gene_list, score_name=score_name, **kwargs)
 
 def module_score_barplot(adata, group_cols, score_cols, adt_key=None, figsize=(10,8)):
     """
@@ -27,7 +27,11 @@ import harmonypy as hm
 import textwrap
 
 import inspect
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 
 import warnings
 
@@ -47,6 +51,8 @@ from .stablelabel import (
     plot_sankey,
     save_sankey,
     plot_grouped_average,
+    kappa_adata,
+    krippendorff_alpha_adata,
     harmony_label_transfer
 )
 from .utils import normalize_string, normalize_label, make_names, add_label_to_adata, convert_obs_col_to_category, create_color_map
@@ -54,14 +60,21 @@ from .ai import (
     attempt_ai_integration, 
     generate_file_key, 
     map_cell_type_labels_to_simplified_set, 
+    amap_cell_type_labels_to_simplified_set,
     map_gene_labels_to_simplified_set, 
     ai_biological_process, 
     ai_cell_type,
+    aai_cell_type,
     ai_cell_types_by_comparison,
     ai_compare_cell_types_binary,
+    ai_compare_cell_type_pairs,
     ai_compare_cell_types_categorical,
     ai_resolution_interpretation,
-    determine_sign_of_resolution_change
+    determine_sign_of_resolution_change,
+    UmapRaster,
+    encode_image_for_openai,
+    resolve_llm_backend,
+    track_llm_usage
 )
 
 def to_nested_tuple(nested_list):
@@ -284,7 +297,7 @@ def adata_dict_fapply(adata_dict, func, use_multithreading=True, num_workers=Non
         with ThreadPoolExecutor(max_workers=num_workers) as executor:
             futures = {
                 executor.submit(
-                    apply_func, adt_key, adata, func, accepts_key, max_retries, **{
+                    contextvars.copy_context().run, apply_func, adt_key, adata, func, accepts_key, max_retries, **{
                         arg_name: get_arg_value(arg_value, adt_key)
                         for arg_name, arg_value in kwargs_dicts.items()
                     }
@@ -362,7 +375,7 @@ def adata_dict_fapply_return(adata_dict, func, use_multithreading=True, num_work
         with ThreadPoolExecutor(max_workers=num_workers) as executor:
             futures = {
                 executor.submit(
-                    apply_func_return, adt_key, adata, func, accepts_key, max_retries, **{
+                    contextvars.copy_context().run, apply_func_return, adt_key, adata, func, accepts_key, max_retries, **{
                         arg_name: get_arg_value(arg_value, adt_key)
                         for arg_name, arg_value in kwargs_dicts.items()
                     }
@@ -395,6 +408,186 @@ def adata_dict_fapply_return(adata_dict, func, use_multithreading=True, num_work
     return results
 
 
+def init_export_worker():
+    """
+    Initializer for plot export worker processes. Selects the non-interactive Agg backend.
+    """
+    matplotlib.use('Agg')
+
+
+def get_export_path(directory, adt_key, file_format, prefix=''):
+    """
+    Builds a filesystem-safe output path for the figure of one key of an adata_dict.
+    """
+    key_str = '_'.join(map(str, adt_key)) if isinstance(adt_key, tuple) else str(adt_key)
+    key_str = re.sub(r'[^\w.-]+', '_', key_str)
+    return os.path.join(directory, f"{prefix}{key_str}.{file_format}")
+
+
+def check_holoviews_export():
+    """
+    Raises an ImportError if holoviews plots can't be written to files. Bokeh exports png and svg through selenium,
+    which also needs a browser driver (e.g. geckodriver or chromedriver) on the PATH.
+    """
+    try:
+        import selenium
+    except ImportError as e:
+        raise ImportError("Exporting holoviews plots (e.g. Sankey plots) to png or svg requires selenium and a browser driver "
+                          "(e.g. geckodriver or chromedriver). Install them, or call without directory to get the plot objects.") from e
+
+
+def get_export_adata(adata, obs_keys, obsm_keys=()):
+    """
+    Returns an AnnData with only the given obs columns and obsm keys of adata (and the colors of those obs columns
+    in uns), without X, layers or var, so that only what a plot needs is sent to the export worker processes.
+    """
+    return ad.AnnData(
+        obs=adata.obs[list(obs_keys)],
+        obsm={key: adata.obsm[key] for key in obsm_keys if key in adata.obsm},
+        uns={f"{key}_colors": adata.uns[f"{key}_colors"] for key in obs_keys if f"{key}_colors" in adata.uns}
+    )
+
+
+def save_figure(result, path, dpi=150):
+    """
+    Saves the figure produced by a plotting function to path and closes all open figures.
+
+    Parameters:
+    - result: Return value of the plotting function. Holoviews objects are saved with holoviews (svg via save_sankey),
+      matplotlib Figures and objects with a .figure attribute (Axes, seaborn grids) are saved directly,
+      anything else falls back to the current figure.
+    - path: Output file path; the extension determines the format.
+    - dpi: Resolution for raster formats.
+
+    Returns:
+    - str or None: path, or None if nothing was drawn.
+    """
+    if type(result).__module__.startswith('holoviews'):
+        import holoviews as hv
+        check_holoviews_export()
+        if path.endswith('.svg'):
+            save_sankey(result, path)
+        elif path.endswith('.pdf'):
+            raise ValueError("Holoviews plots can only be exported to png or svg.")
+        else:
+            hv.save(result, path)
+        return path
+
+    if isinstance(result, matplotlib.figure.Figure):
+        fig = result
+    elif isinstance(getattr(result, 'figure', None), matplotlib.figure.Figure):
+        fig = result.figure
+    elif plt.get_fignums():
+        fig = plt.gcf()
+    else:
+        return None
+
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close('all')
+    return path
+
+
+def export_func(adt_key, adata, func, accepts_key, max_retries, path, dpi, **func_args):
+    """
+    Runs a plotting function on one AnnData object and saves the resulting figure to path.
+    Returns the path, or the error string from apply_func_return if plotting failed.
+    """
+    with warnings.catch_warnings():
+        # plt.show() is a no-op under Agg
+        warnings.filterwarnings('ignore', message='.*non-interactive.*')
+        result = apply_func_return(adt_key, adata, func, accepts_key, max_retries, **func_args)
+    if isinstance(result, str) and result.startswith('Error:'):
+        plt.close('all')
+        return result
+    return save_figure(result, path, dpi=dpi)
+
+
+def adata_dict_fapply_export(adata_dict, func, directory, file_format='png', prefix='', dpi=150, use_multiprocessing=True, num_workers=None, max_retries=0,
+                             obs_keys=None, obsm_keys=(), **kwargs_dicts):
+    """
+    Applies a plotting function to each AnnData object in the adata_dict and writes each figure to a file,
+    rendering in a process pool with the headless Agg backend (one task per key).
+
+    Parameters:
+    - adata_dict: Dictionary of AnnData objects with keys as identifiers.
+    - func: Plotting function to apply to each AnnData object. Must be defined at module level (picklable)
+      when use_multiprocessing is True. It should return the figure (or an Axes, seaborn grid or holoviews object);
+      otherwise the current matplotlib figure is saved.
+    - directory: Directory to write the files to. Created if it doesn't exist.
+    - file_format: 'png', 'svg' or 'pdf'.
+    - prefix: Optional filename prefix. Files are named {prefix}{key}.{file_format}.
+    - dpi: Resolution for raster formats.
+    - use_multiprocessing: If True, use ProcessPoolExecutor; if False, execute sequentially in this process.
+    - num_workers: Number of worker processes to use (default: number of CPUs available).
+    - max_retries: Maximum number of retries for a failed task.
+    - obs_keys: If given, the obs columns that func uses. Only these columns and obsm_keys are then sent to the worker
+      processes (see get_export_adata) rather than pickling each whole AnnData object. Can be given per key as a dictionary.
+    - obsm_keys: The obsm keys that func uses, when obs_keys is given.
+    - kwargs_dicts: Additional keyword arguments to pass to the function.
+
+    Returns:
+    - dict: A dictionary with the same keys as adata_dict, containing the path of each written file
+      (None if nothing was drawn, or an error string if plotting failed).
+    """
+    if file_format not in ('png', 'svg', 'pdf'):
+        raise ValueError("file_format must be one of 'png', 'svg' or 'pdf'.")
+
+    os.makedirs(directory, exist_ok=True)
+
+    sig = inspect.signature(func)
+    accepts_key = 'adt_key' in sig.parameters
+    results = {}
+
+    def get_arg_value(arg_value, adt_key):
+        if isinstance(arg_value, dict):
+            if adt_key in arg_value:
+                return arg_value[adt_key]
+            elif not set(adata_dict.keys()).issubset(arg_value.keys()):
+                return arg_value  # Use the entire dictionary if it doesn't contain all adata_dict keys
+        return arg_value  # Use the value as is if it's not a dictionary or doesn't contain all adata_dict keys
+
+    def get_task_args(adt_key, adata):
+        return (adt_key, adata, func, accepts_key, max_retries, get_export_path(directory, adt_key, file_format, prefix), dpi)
+
+    def get_worker_adata(adt_key, adata):
+        key_obs_keys = get_arg_value(obs_keys, adt_key)
+        if key_obs_keys is None:
+            return adata
+        return get_export_adata(adata, key_obs_keys, get_arg_value(obsm_keys, adt_key))
+
+    if use_multiprocessing:
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=init_export_worker) as executor:
+            futures = {
+                executor.submit(
+                    export_func, *get_task_args(adt_key, get_worker_adata(adt_key, adata)), **{
+                        arg_name: get_arg_value(arg_value, adt_key)
+                        for arg_name, arg_value in kwargs_dicts.items()
+                    }
+                ): adt_key for adt_key, adata in adata_dict.items()
+            }
+
+            for future in as_completed(futures):
+                adt_key = futures[future]
+                try:
+                    results[adt_key] = future.result()
+                except Exception as e:
+                    print(f"Unhandled error processing {adt_key}: {e}")
+                    results[adt_key] = None
+    else:
+        for adt_key, adata in adata_dict.items():
+            try:
+                results[adt_key] = export_func(*get_task_args(adt_key, adata), **{
+                    arg_name: get_arg_value(arg_value, adt_key)
+                    for arg_name, arg_value in kwargs_dicts.items()
+                })
+            except Exception as e:
+                print(f"Unhandled error processing {adt_key}: {e}")
+                results[adt_key] = None
+
+    # Return in the key order of adata_dict
+    return {adt_key: results[adt_key] for adt_key in adata_dict if adt_key in results}
+
+
 # def adata_dict_fapply(adata_dict, func, **kwargs_dicts):
 #     """
 #     Applies a given function to each AnnData object in the adata_dict, with additional
@@ -1204,7 +1397,153 @@ def leiden_adata_dict(adata_dict, **kwargs):
     adata_dict_fapply(adata_dict, sc.tl.leiden, **kwargs)
 
 
-def leiden_sub_cluster(adata, groupby, **kwargs):
+def get_igraph_from_adjacency(adjacency, directed=True):
+    """
+    Build an igraph Graph from a sparse adjacency matrix (i.e. adata.obsp['connectivities']).
+
+    Parameters:
+    adjacency : scipy.sparse matrix Square (weighted) adjacency matrix.
+    directed : bool Whether to build a directed graph (default True, as in sc.tl.leiden).
+
+    Returns:
+    igraph.Graph Graph with edge weights stored in g.es['weight'].
+    """
+    import igraph as ig
+
+    adjacency = adjacency.tocsr()
+    sources, targets = adjacency.nonzero()
+    weights = np.asarray(adjacency[sources, targets]).ravel()
+
+    g = ig.Graph(directed=directed)
+    g.add_vertices(adjacency.shape[0])
+    g.add_edges(list(zip(sources.tolist(), targets.tolist())))
+    g.es['weight'] = weights
+    return g
+
+
+def leiden_on_graph(g, resolution=1, random_state=0, n_iterations=-1, use_weights=True):
+    """
+    Run Leiden clustering on an igraph Graph built by get_igraph_from_adjacency.
+
+    Parameters:
+    g : igraph.Graph Graph with edge weights stored in g.es['weight'].
+    resolution, random_state, n_iterations, use_weights : Same meaning as in sc.tl.leiden.
+
+    Returns:
+    leidenalg.VertexPartition The partition found by leidenalg (clusters are numbered by decreasing size).
+    """
+    import leidenalg
+
+    return leidenalg.find_partition(
+        g,
+        leidenalg.RBConfigurationVertexPartition,
+        resolution_parameter=resolution,
+        weights=g.es['weight'] if use_weights else None,
+        n_iterations=n_iterations,
+        seed=random_state
+    )
+
+
+def leiden_on_adjacency(adjacency, resolution=1, random_state=0, n_iterations=-1, directed=True, use_weights=True):
+    """
+    Run Leiden clustering on a sparse adjacency matrix. Module-level so that it can be sent to worker processes.
+
+    Parameters:
+    adjacency : scipy.sparse matrix Square (weighted) adjacency matrix.
+    resolution, random_state, n_iterations, directed, use_weights : Same meaning as in sc.tl.leiden.
+
+    Returns:
+    np.ndarray Cluster membership of each vertex (clusters are numbered by decreasing size).
+    """
+    if adjacency.shape[0] == 0:
+        return np.array([], dtype=int)
+
+    g = get_igraph_from_adjacency(adjacency, directed=directed)
+    partition = leiden_on_graph(g, resolution=resolution, random_state=random_state, n_iterations=n_iterations, use_weights=use_weights)
+    return np.array(partition.membership)
+
+
+def get_connectivities(adata, neighbors_key=None):
+    """
+    Get the neighbor graph of an AnnData object, resolving neighbors_key the same way scanpy does.
+
+    Parameters:
+    adata : AnnData Annotated data matrix with a precomputed neighbor graph (i.e. from sc.pp.neighbors).
+    neighbors_key : str, optional Key in adata.uns of the neighbors run to use (default: 'neighbors').
+
+    Returns:
+    scipy.sparse.csr_matrix The connectivities matrix.
+    """
+    neighbors_key = neighbors_key or 'neighbors'
+    if neighbors_key in adata.uns and 'connectivities_key' in adata.uns[neighbors_key]:
+        connectivities_key = adata.uns[neighbors_key]['connectivities_key']
+    else:
+        connectivities_key = 'connectivities'
+    if connectivities_key not in adata.obsp:
+        raise ValueError(f"adata.obsp['{connectivities_key}'] not found. Run sc.pp.neighbors first.")
+    return adata.obsp[connectivities_key].tocsr()
+
+
+def leiden_sub_cluster_graph_only(adata, groupby, resolution=1, key_added='leiden', random_state=0, n_iterations=-1,
+                                  directed=True, use_weights=True, neighbors_key=None, use_multiprocessing=True, num_workers=None):
+    """
+    Perform Leiden clustering on subgroups of cells using only the parent's neighbor graph.
+
+    Each group's induced subgraph is taken from adata.obsp['connectivities'] by CSR row/column slicing,
+    Leiden is run on the subgraphs in parallel worker processes, and the combined sub-cluster labels are
+    written to adata.obs[key_added] in place. Unlike leiden_sub_cluster, X, layers and obsm are never copied
+    and the row order of adata is preserved.
+
+    Parameters:
+    adata : AnnData Annotated data matrix with a precomputed neighbor graph (i.e. from sc.pp.neighbors).
+    groupby : str Column name in adata.obs for grouping cells before subclustering.
+    resolution, key_added, random_state, n_iterations, directed, use_weights : Same meaning as in sc.tl.leiden.
+    neighbors_key : str, optional Key in adata.uns of the neighbors run to use (default: 'neighbors').
+    use_multiprocessing : bool If True, cluster the subgraphs in a ProcessPoolExecutor; if False, sequentially.
+    num_workers : int, optional Number of worker processes (default: number of CPUs available).
+
+    Returns:
+    AnnData The input AnnData object, modified in-place.
+    """
+    connectivities = get_connectivities(adata, neighbors_key=neighbors_key)
+
+    # Indices of each group, in the row order of adata
+    groups = adata.obs.groupby(groupby, observed=True).indices
+
+    # Induced subgraph of each group by CSR row/column slicing
+    def get_subgraph(indices):
+        return connectivities[indices][:, indices]
+
+    leiden_kwargs = dict(resolution=resolution, random_state=random_state, n_iterations=n_iterations, directed=directed, use_weights=use_weights)
+
+    memberships = {}
+    if use_multiprocessing and len(groups) > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = {
+                executor.submit(leiden_on_adjacency, get_subgraph(indices), **leiden_kwargs): group
+                for group, indices in groups.items()
+            }
+            for future in as_completed(futures):
+                memberships[futures[future]] = future.result()
+    else:
+        for group, indices in groups.items():
+            memberships[group] = leiden_on_adjacency(get_subgraph(indices), **leiden_kwargs)
+
+    # Write the combined sub-cluster labels back in place (cells with a missing group label get NaN)
+    labels = np.full(adata.n_obs, np.nan, dtype=object)
+    for group, indices in groups.items():
+        labels[indices] = memberships[group].astype(str)
+
+    categories = sorted({label for label in labels if isinstance(label, str)}, key=int)
+    adata.obs[key_added] = pd.Categorical(labels, categories=categories)
+
+    # Record the parameters, as sc.tl.leiden does
+    adata.uns[key_added] = {'params': {'resolution': resolution, 'random_state': random_state, 'n_iterations': n_iterations, 'groupby': groupby}}
+
+    return adata
+
+
+def leiden_sub_cluster(adata, groupby, graph_only=False, **kwargs):
     """
     Perform Leiden clustering on subgroups of cells.
     This function applies Leiden clustering to subgroups of cells defined by the groupby parameter.
@@ -1212,18 +1551,22 @@ def leiden_sub_cluster(adata, groupby, **kwargs):
     Parameters:
     adata : AnnData Annotated data matrix.
     groupby : str Column name in adata.obs for grouping cells before subclustering.
-    kwargs : dict Additional keyword arguments to pass to the leiden_adata_dict function.
+    graph_only : bool If True, subcluster using only adata.obsp['connectivities'] and write the labels into adata.obs in place (see leiden_sub_cluster_graph_only). Default False.
+    kwargs : dict Additional keyword arguments to pass to the leiden_adata_dict function (or to leiden_sub_cluster_graph_only if graph_only=True).
 
     Returns:
-    None, The function modifies the input AnnData object in-place.
+    AnnData A new AnnData object, concatenated across groups. If graph_only=True, the input AnnData object, modified in-place.
     """
+    if graph_only:
+        return leiden_sub_cluster_graph_only(adata, groupby, **kwargs)
+
     adata_dict = build_adata_dict(adata, strata_keys=[groupby])
     leiden_adata_dict(adata_dict, **kwargs)
     adata = concatenate_adata_dict(adata_dict, index_unique=None) #setting index_unique=None avoids index modification
     return adata
 
 
-def leiden_sub_cluster_adata_dict(adata_dict, groupby, **kwargs):
+def leiden_sub_cluster_adata_dict(adata_dict, groupby, graph_only=False, use_multiprocessing=False, **kwargs):
     """
     This function applies the leiden_sub_cluster function to each AnnData object
     in the provided dictionary.
@@ -1231,12 +1574,119 @@ def leiden_sub_cluster_adata_dict(adata_dict, groupby, **kwargs):
     Parameters:
     adata_dict : dict Dictionary of AnnData objects.
     groupby : str Column name in adata.obs for grouping cells before subclustering.
+    graph_only : bool See leiden_sub_cluster. Default False.
+    use_multiprocessing : bool Passed to leiden_sub_cluster_graph_only if graph_only=True. Default False, because the AnnData
+        objects are already processed in parallel threads, and forking worker processes from a multithreaded process can deadlock.
     kwargs : dict Additional keyword arguments to pass to the leiden_sub_cluster function.
 
     Returns:
     None The function modifies the input AnnData objects in-place.
     """
-    return adata_dict_fapply_return(adata_dict, leiden_sub_cluster, groupby=groupby, **kwargs)
+    if graph_only:
+        kwargs['use_multiprocessing'] = use_multiprocessing
+    return adata_dict_fapply_return(adata_dict, leiden_sub_cluster, groupby=groupby, graph_only=graph_only, **kwargs)
+
+
+# Graph held by each resolution sweep worker process, so it is only sent once per worker
+_leiden_sweep_graph = None
+
+def init_leiden_sweep_worker(g):
+    """
+    Initializer for resolution sweep worker processes. Stores the shared graph in the worker.
+    """
+    global _leiden_sweep_graph
+    _leiden_sweep_graph = g
+
+
+def leiden_sweep_partition(resolution, g=None, random_state=0, n_iterations=-1, use_weights=True):
+    """
+    Run Leiden at one resolution on the shared sweep graph (or on g, if provided).
+
+    Returns:
+    tuple (membership, modularity) where membership is an np.ndarray of cluster labels and
+    modularity is the (resolution 1) modularity of the partition on the graph.
+    """
+    g = g if g is not None else _leiden_sweep_graph
+    partition = leiden_on_graph(g, resolution=resolution, random_state=random_state, n_iterations=n_iterations, use_weights=use_weights)
+    modularity = g.modularity(partition.membership, weights='weight' if use_weights else None)
+    return np.array(partition.membership), modularity
+
+
+def get_leiden_sweep_key(key_prefix, resolution):
+    """
+    Name of the adata.obs column that holds the leiden_resolution_sweep partition at resolution,
+    with the resolution in its shortest form (e.g. 'leiden_0.3' rather than 'leiden_0.30000000000000004').
+    """
+    return f"{key_prefix}_{resolution:g}"
+
+
+def leiden_resolution_sweep(adata, resolutions, key_prefix='leiden', random_state=0, n_iterations=-1, directed=True,
+                            use_weights=True, neighbors_key=None, use_multiprocessing=True, num_workers=None):
+    """
+    Run Leiden clustering at a grid of resolutions on one shared graph.
+
+    The igraph object is built once from adata.obsp['connectivities'] and each worker process receives it
+    once, then clusters it at its share of the resolutions. Every partition is stored as a categorical column
+    adata.obs[get_leiden_sweep_key(key_prefix, resolution)], and a summary table is stored in adata.uns[f"{key_prefix}_sweep"].
+
+    Parameters:
+    adata : AnnData Annotated data matrix with a precomputed neighbor graph (i.e. from sc.pp.neighbors).
+    resolutions : list of float Resolutions at which to run Leiden.
+    key_prefix : str Prefix of the new adata.obs columns (default: 'leiden').
+    random_state, n_iterations, directed, use_weights : Same meaning as in sc.tl.leiden.
+    neighbors_key : str, optional Key in adata.uns of the neighbors run to use (default: 'neighbors').
+    use_multiprocessing : bool If True, run the resolutions in a ProcessPoolExecutor; if False, sequentially.
+    num_workers : int, optional Number of worker processes (default: number of CPUs available).
+
+    Returns:
+    pd.DataFrame One row per resolution with columns 'resolution', 'key', 'n_clusters' and 'modularity'.
+    """
+    resolutions = list(resolutions)
+    g = get_igraph_from_adjacency(get_connectivities(adata, neighbors_key=neighbors_key), directed=directed)
+    partition_kwargs = dict(random_state=random_state, n_iterations=n_iterations, use_weights=use_weights)
+
+    partitions = {}
+    if use_multiprocessing and len(resolutions) > 1:
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=init_leiden_sweep_worker, initargs=(g,)) as executor:
+            futures = {
+                executor.submit(leiden_sweep_partition, resolution, **partition_kwargs): resolution
+                for resolution in resolutions
+            }
+            for future in as_completed(futures):
+                partitions[futures[future]] = future.result()
+    else:
+        for resolution in resolutions:
+            partitions[resolution] = leiden_sweep_partition(resolution, g=g, **partition_kwargs)
+
+    # Store each partition as a categorical obs column and summarize the sweep
+    summary = []
+    for resolution in resolutions:
+        membership, modularity = partitions[resolution]
+        key = get_leiden_sweep_key(key_prefix, resolution)
+        n_clusters = len(np.unique(membership))
+        adata.obs[key] = pd.Categorical(membership.astype(str), categories=[str(i) for i in range(n_clusters)])
+        summary.append({'resolution': resolution, 'key': key, 'n_clusters': n_clusters, 'modularity': modularity})
+
+    summary = pd.DataFrame(summary)
+    adata.uns[f"{key_prefix}_sweep"] = summary
+    return summary
+
+
+def leiden_resolution_sweep_adata_dict(adata_dict, resolutions, use_multiprocessing=False, **kwargs):
+    """
+    Applies leiden_resolution_sweep to each anndata in an anndict.
+
+    Parameters:
+    adata_dict : dict Dictionary of AnnData objects.
+    resolutions : list of float Resolutions at which to run Leiden.
+    use_multiprocessing : bool Passed to leiden_resolution_sweep. Default False, because the AnnData objects are already
+        processed in parallel threads, and forking worker processes from a multithreaded process can deadlock.
+    kwargs : dict Additional keyword arguments to pass to the leiden_resolution_sweep function.
+
+    Returns:
+    dict Dictionary with the same keys as adata_dict and the sweep summary DataFrames as values.
+    """
+    return adata_dict_fapply_return(adata_dict, leiden_resolution_sweep, resolutions=resolutions, use_multiprocessing=use_multiprocessing, **kwargs)
 
 
 def calculate_umap_adata_dict(adata_dict, **kwargs):
@@ -1262,23 +1712,42 @@ def calculate_umap_adata_dict(adata_dict, **kwargs):
     return adata_dict
 
 
-def plot_umap_adata_dict(adata_dict, **kwargs):
+def plot_umap(adata, adt_key=None, **kwargs):
+    """
+    Plots the UMAP embedding of adata with sc.pl.umap, if it has been computed.
+    """
+    print(f"Plotting UMAP for key: {adt_key}")
+    if 'X_umap' in adata.obsm:
+        return sc.pl.umap(adata, **kwargs)
+    else:
+        print(f"UMAP not computed for adata with key {adt_key}. Please compute UMAP before plotting.")
+
+
+def plot_umap_adata_dict(adata_dict, directory=None, file_format='png', dpi=150, num_workers=None, **kwargs):
     """
     Plots UMAP embeddings for each AnnData object in adata_dict, colored by a specified variable.
 
     Parameters:
     - adata_dict (dict): A dictionary with keys as strata and values as AnnData objects.
+    - directory (str, optional): If provided, export the plots to files in this directory instead of showing them,
+      rendering in parallel worker processes (see adata_dict_fapply_export).
+    - file_format (str): 'png', 'svg' or 'pdf' (only used with directory).
+    - dpi (int): Resolution for raster formats (only used with directory).
+    - num_workers (int, optional): Number of worker processes (only used with directory).
     - kwargs: Additional keyword arguments, including 'color_by' which specifies a variable by which to color the UMAP plots, typically a column in .obs.
 
     Returns:
-    - None: The function creates plots for the AnnData objects.
-    """
-    def plot_umap(adata, adt_key=None, **kwargs):
-        print(f"Plotting UMAP for key: {adt_key}")
-        if 'X_umap' in adata.obsm:
-            sc.pl.umap(adata, **kwargs)
-        else:
-            print(f"UMAP not computed for adata with key {adt_key}. Please compute UMAP before plotting.")
+    - None, or if directory is provided, dict: the path of the file written for each key.
+    """
+    if directory is not None:
+        # Send only the embedding and the obs columns it is colored by, unless it is colored by genes
+        color = kwargs.get('color')
+        colors = [] if color is None else [color] if isinstance(color, str) else color
+        obs_keys = None
+        if isinstance(colors, list) and all(key in adata.obs for adata in adata_dict.values() for key in colors):
+            obs_keys = colors
+        return adata_dict_fapply_export(adata_dict, plot_umap, directory, file_format=file_format, prefix='umap_', dpi=dpi, num_workers=num_workers,
+                                        obs_keys=obs_keys, obsm_keys=['X_umap'], show=False, **kwargs)
     adata_dict_fapply(adata_dict, plot_umap, use_multithreading=False, **kwargs)
 
 
@@ -1417,7 +1886,14 @@ def update_adata_dict_with_label_dict(adata_dict, results_dict, new_label_key=No
             add_label_to_adata(adata, indices, labels, new_label_key)
 
 
-def plot_changes_adata_dict(adata_dict, true_label_key, predicted_label_key, percentage=True):
+def plot_changes_stratum(adata, true_label_key, predicted_label_key, percentage=True, adt_key=None):
+    """
+    Runs plot_changes on one AnnData object of an adata_dict, titled with its key.
+    """
+    plot_changes(adata, true_label_key, predicted_label_key, percentage, adt_key)
+
+
+def plot_changes_adata_dict(adata_dict, true_label_key, predicted_label_key, percentage=True, directory=None, file_format='png', dpi=150, num_workers=None):
     """
     Applies the plot_final_mismatches function to each AnnData object in adata_dict.
 
@@ -1426,14 +1902,27 @@ def plot_changes_adata_dict(adata_dict, true_label_key, predicted_label_key, per
     predicted_label_key (str): The key in obs for predicted labels.
     true_label_key (str): The key in obs for true labels.
     percentage (bool): If True, plot percentages, otherwise plot counts.
+    directory, file_format, dpi, num_workers: If directory is provided, export the plots to files in parallel
+        worker processes and return the paths (see plot_umap_adata_dict).
     """
+    if directory is not None:
+        return adata_dict_fapply_export(adata_dict, plot_changes_stratum, directory, file_format=file_format, prefix='changes_', dpi=dpi, num_workers=num_workers,
+                                        obs_keys=[true_label_key, predicted_label_key], true_label_key=true_label_key, predicted_label_key=predicted_label_key, percentage=percentage)
     for stratum, adata in adata_dict.items():
         print(f"Plotting changes for {stratum}")
         plot_changes(adata, true_label_key, predicted_label_key, percentage, stratum)
 
 
+def plot_confusion_matrix_stratum(adata, true_label_key, predicted_label_key, adt_key=None, **kwargs):
+    """
+    Runs plot_confusion_matrix_from_adata on one AnnData object of an adata_dict, titled with its key.
+    """
+    return plot_confusion_matrix_from_adata(adata, true_label_key, predicted_label_key, title=f"Confusion Matrix for {adt_key}", **kwargs)
+
+
 def plot_confusion_matrix_adata_dict(adata_dict, true_label_key, predicted_label_key,
-                                     row_color_keys=None, col_color_keys=None, figsize=(10,10), diagonalize=False):
+                                     row_color_keys=None, col_color_keys=None, figsize=(10,10), diagonalize=False,
+                                     directory=None, file_format='png', dpi=150, num_workers=None):
     """
     Applies the plot_confusion_matrix_from_adata function to each AnnData object in adata_dict.
 
@@ -1444,7 +1933,14 @@ def plot_confusion_matrix_adata_dict(adata_dict, true_label_key, predicted_label
     title (str): Title of the plot, which will be prefixed with the stratum name.
     row_color_keys (list): Optional keys for row colors in adata.obs.
     col_color_keys (list): Optional keys for column colors in adata.obs.
-    """
+    directory, file_format, dpi, num_workers: If directory is provided, export the plots to files in parallel
+        worker processes and return the paths (see plot_umap_adata_dict).
+    """
+    if directory is not None:
+        obs_keys = list(dict.fromkeys([true_label_key, predicted_label_key] + list(row_color_keys or []) + list(col_color_keys or [])))
+        return adata_dict_fapply_export(adata_dict, plot_confusion_matrix_stratum, directory, file_format=file_format, prefix='confusion_matrix_', dpi=dpi, num_workers=num_workers,
+                                        obs_keys=obs_keys, true_label_key=true_label_key, predicted_label_key=predicted_label_key,
+                                        row_color_keys=row_color_keys, col_color_keys=col_color_keys, figsize=figsize, diagonalize=diagonalize)
     for stratum, adata in adata_dict.items():
         # Customize title for each subset
         subset_title = f"Confusion Matrix for {stratum}"
@@ -1457,13 +1953,44 @@ def harmony_label_transfer_adata_dict(adata_dict, master_data, master_subset_col
 
 
 #AI integrations
-def ai_determine_leiden_resolution(adata, initial_resolution):
+def ai_interpret_umap_resolution(adata, color, raster=None, image_format='png'):
+    """
+    Asks the AI whether the clustering in adata.obs[color] calls for a lower, higher or unchanged resolution.
+
+    Args:
+        adata (AnnData): The annotated data matrix, with a UMAP in adata.obsm['X_umap'].
+        color (str): The column in adata.obs holding the clustering to assess.
+        raster (UmapRaster, optional): Pre-rasterized UMAP coordinates. If provided, the frame is drawn with the
+            vectorized numpy rasterizer instead of sc.pl.umap.
+        image_format (str): 'png' or 'webp'; only used with raster.
+
+    Returns:
+        str: The AI's resolution adjustment suggestion (see ai_resolution_interpretation).
+    """
+    if raster is not None:
+        encoded_image = encode_image_for_openai(raster.render(adata.obs[color]), image_format=image_format)
+        return ai_resolution_interpretation(encoded_image=encoded_image, image_format=image_format)
+
+    # Plot UMAP colored by the clustering
+    def plot_umap():
+        sc.pl.umap(adata, color=color, show=False)
+
+    return ai_resolution_interpretation(plot_umap)
+
+
+def ai_determine_leiden_resolution(adata, initial_resolution, resolutions=None, fast_plot=False, plot_size=256, image_format='png', use_multiprocessing=True):
     """
     Adjusts the Leiden clustering resolution of an AnnData object based on AI feedback.
 
     Args:
         adata (AnnData): The annotated data matrix.
         initial_resolution (float): The initial resolution for Leiden clustering.
+        resolutions (list of float, optional): If provided, choose among the partitions of a leiden_resolution_sweep
+            over these resolutions instead of rerunning Leiden at each step. Missing partitions are computed in one sweep.
+        fast_plot (bool): If True, rasterize the UMAP once and draw each frame with numpy instead of matplotlib (see UmapRaster).
+        plot_size (int): Width and height in pixels of the fast_plot frames (default 256).
+        image_format (str): 'png' or 'webp' encoding of the fast_plot frames (default 'png').
+        use_multiprocessing (bool): Passed to leiden_resolution_sweep when missing partitions are computed (default True).
 
     Returns:
         float: The final resolution value after adjustments based on AI interpretation.
@@ -1471,8 +1998,16 @@ def ai_determine_leiden_resolution(adata, initial_resolution):
     This function iteratively performs Leiden clustering on the AnnData object,
     generates a UMAP plot, and uses an AI model to interpret the plot and suggest
     whether to increase, decrease, or maintain the current resolution. The resolution
-    is adjusted by ±0.1 based on the AI's suggestion until no further adjustment is needed.
+    is adjusted by ±0.15 based on the AI's suggestion until no further adjustment is needed.
+    If resolutions is provided, the resolution moves one step along the sorted grid instead.
     """
+    if resolutions is not None:
+        return ai_determine_leiden_resolution_from_sweep(adata, initial_resolution, resolutions, fast_plot=fast_plot, plot_size=plot_size, image_format=image_format,
+                                                         use_multiprocessing=use_multiprocessing)
+
+    # Rasterize the UMAP coordinates once, then only recolor per partition
+    raster = UmapRaster(adata.obsm['X_umap'], size=plot_size) if fast_plot else None
+
     resolution = initial_resolution
     previous_sign_change = None
     
@@ -1480,12 +2015,8 @@ def ai_determine_leiden_resolution(adata, initial_resolution):
     while k <= 10:
         sc.tl.leiden(adata, resolution=resolution)
         
-        # Plot UMAP colored by Leiden clusters
-        def plot_umap():
-            sc.pl.umap(adata, color='leiden', show=False)
-
-        # Get AI interpretation
-        annotation = ai_resolution_interpretation(plot_umap)
+        # Get AI interpretation of the UMAP colored by Leiden clusters
+        annotation = ai_interpret_umap_resolution(adata, 'leiden', raster=raster, image_format=image_format)
         
         # Determine the sign of resolution change
         sign_change = determine_sign_of_resolution_change(annotation)
@@ -1505,17 +2036,77 @@ def ai_determine_leiden_resolution(adata, initial_resolution):
     return resolution
 
 
-def ai_determine_leiden_resolution_adata_dict(adata_dict, initial_resolution=1):
+def ai_determine_leiden_resolution_from_sweep(adata, initial_resolution, resolutions, key_prefix='leiden', fast_plot=False, plot_size=256, image_format='png',
+                                              use_multiprocessing=True):
+    """
+    Chooses a Leiden resolution among the already-computed partitions of a resolution sweep based on AI feedback.
+
+    Works like ai_determine_leiden_resolution, but instead of rerunning Leiden after each suggestion, it steps
+    along the sorted grid of resolutions and plots the stored partition. Partitions that are not yet in
+    adata.obs are computed first with a single leiden_resolution_sweep.
+
+    Args:
+        adata (AnnData): The annotated data matrix.
+        initial_resolution (float): The resolution to start from (the nearest grid value is used).
+        resolutions (list of float): The grid of candidate resolutions.
+        key_prefix (str): Prefix of the sweep columns in adata.obs (default: 'leiden').
+        fast_plot, plot_size, image_format, use_multiprocessing: See ai_determine_leiden_resolution.
+
+    Returns:
+        float: The chosen resolution from the grid.
+    """
+    resolutions = sorted(resolutions)
+
+    # Compute any missing partitions in one sweep over a shared graph
+    missing = [resolution for resolution in resolutions if get_leiden_sweep_key(key_prefix, resolution) not in adata.obs]
+    if missing:
+        leiden_resolution_sweep(adata, missing, key_prefix=key_prefix, use_multiprocessing=use_multiprocessing)
+
+    # Rasterize the UMAP coordinates once, then only recolor per partition
+    raster = UmapRaster(adata.obsm['X_umap'], size=plot_size) if fast_plot else None
+
+    index = int(np.argmin([abs(resolution - initial_resolution) for resolution in resolutions]))
+    previous_sign_change = None
+
+    k = 0
+    while k <= 10:
+        key = get_leiden_sweep_key(key_prefix, resolutions[index])
+
+        # Get AI interpretation of the UMAP colored by the stored partition
+        annotation = ai_interpret_umap_resolution(adata, key, raster=raster, image_format=image_format)
+
+        # Determine the sign of resolution change
+        sign_change = determine_sign_of_resolution_change(annotation)
+
+        # Check if the resolution needs to be adjusted, staying within the grid
+        if sign_change == 0:
+            return resolutions[index]
+        new_index = min(max(index + sign_change, 0), len(resolutions) - 1)
+        if new_index == index or (previous_sign_change is not None and sign_change != previous_sign_change):
+            return resolutions[new_index]
+        index = new_index
+
+        previous_sign_change = sign_change
+        k = k + 1
+
+    return resolutions[index]
+
+
+def ai_determine_leiden_resolution_adata_dict(adata_dict, initial_resolution=1, resolutions=None, fast_plot=False, plot_size=256, image_format='png'):
     """
     Adjusts Leiden clustering resolution for each AnnData object in a dictionary based on AI feedback.
 
     Args:
         adata_dict (dict): Dictionary of AnnData objects.
         initial_resolution (float): Initial resolution for Leiden clustering (default is 1).
+        resolutions (list of float, optional): If provided, choose among the partitions of a resolution sweep over this grid.
+        fast_plot, plot_size, image_format: See ai_determine_leiden_resolution.
 
     Returns: dict: Dictionary with final resolution values after AI-based adjustments.
     """
-    return adata_dict_fapply_return(adata_dict, ai_determine_leiden_resolution, max_retries=3, initial_resolution=initial_resolution)
+    # The AnnData objects are processed in parallel threads, so the sweeps run sequentially rather than forking worker processes
+    return adata_dict_fapply_return(adata_dict, ai_determine_leiden_resolution, max_retries=3, initial_resolution=initial_resolution, resolutions=resolutions,
+                                    fast_plot=fast_plot, plot_size=plot_size, image_format=image_format, use_multiprocessing=False)
 
 
 def simplify_obs_column(adata, column, new_column_name, simplification_level=''):
@@ -1624,7 +2215,7 @@ def simplify_var_index_adata_dict(adata_dict, column, new_column_name, simplific
     return adata_dict_fapply_return(adata_dict, simplify_var_index, max_retries=3, column=column, new_column_name=new_column_name, simplification_level=simplification_level)
 
 
-def ai_annotate_cell_type(adata, groupby, n_top_genes, label_column='ai_cell_type', tissue_of_origin_col=None):
+def ai_annotate_cell_type(adata, groupby, n_top_genes, label_column='ai_cell_type', tissue_of_origin_col=None, backend=None, parallel=False):
     """
     Annotate cell types based on the top marker genes for each cluster.
 
@@ -1637,18 +2228,51 @@ def ai_annotate_cell_type(adata, groupby, n_top_genes, label_column='ai_cell_typ
     groupby : str Column in adata.obs to group by for differential expression analysis.
     n_top_genes : int The number of top marker genes to consider for each cluster.
     label_column : str, optional (default: 'ai_cell_type') The name of the new column in adata.obs where the cell type annotations will be stored.
+    backend : LLMBackend or str, optional The LLM backend to use (see register_llm_backend).
+    parallel : bool, optional (default: False) If True, the clusters are annotated concurrently (see ai_annotate).
 
     Returns:
     pd.DataFrame A DataFrame with a column for the top marker genes for each cluster.
     """
-    return ai_annotate(func=ai_cell_type, adata=adata, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col)
+    return ai_annotate(func=ai_cell_type, adata=adata, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col, parallel=parallel, backend=backend)
+
+
+def ai_annotate_cell_type_adata_dict(adata_dict, groupby, n_top_genes=10, label_column='ai_cell_type', tissue_of_origin_col=None, backend=None, num_workers=None, deduplicate=False):
+    """
+    Applies ai_annotate_cell_type to each anndata in an anndict. If deduplicate is True, clusters with the same top
+    marker genes and tissue are annotated once across all strata instead (see ai_annotate_adata_dict).
+    """
+    if deduplicate:
+        return ai_annotate_adata_dict(func=ai_cell_type, adata_dict=adata_dict, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col, num_workers=num_workers, backend=backend)
+    return adata_dict_fapply_return(adata_dict, ai_annotate_cell_type, num_workers=num_workers, max_retries=3, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col, backend=backend)
+
+
+async def aai_annotate_cell_type(adata, groupby, n_top_genes, label_column='ai_cell_type', tissue_of_origin_col=None, backend=None):
+    """
+    Async version of ai_annotate_cell_type.
+    """
+    return await aai_annotate(func=aai_cell_type, adata=adata, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col, backend=backend)
 
 
-def ai_annotate_cell_type_adata_dict(adata_dict, groupby, n_top_genes=10, label_column='ai_cell_type', tissue_of_origin_col=None):
+async def aai_annotate_cell_type_adata_dict(adata_dict, groupby, n_top_genes=10, label_column='ai_cell_type', tissue_of_origin_col=None, backend=None):
     """
-    Applies ai_annotate_cell_type to each anndata in an anndict
+    Async version of ai_annotate_cell_type_adata_dict. All strata and clusters are annotated concurrently on one
+    event loop (bounded by configure_llm_concurrency) rather than in nested threads.
+
+    From synchronous code, run with run_async(aai_annotate_cell_type_adata_dict(...)); in Jupyter, await it directly.
+
+    Returns:
+    dict: A dictionary with the same keys as adata_dict, containing the results of aai_annotate_cell_type
+    (or an error string if a stratum failed).
     """
-    return adata_dict_fapply_return(adata_dict, ai_annotate_cell_type, max_retries=3, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col)
+    async def annotate(adata):
+        try:
+            return await aai_annotate_cell_type(adata, groupby, n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col, backend=backend)
+        except Exception as e:
+            return f"Error: {e}"
+
+    results = await asyncio.gather(*[annotate(adata) for adata in adata_dict.values()])
+    return dict(zip(adata_dict.keys(), results))
 
 
 def ai_annotate_cell_sub_type_adata_dict(adata_dict, cell_type_col, sub_cluster_col, new_label_col, tissue_of_origin_col=None, n_top_genes=10):
@@ -1737,7 +2361,7 @@ def ai_annotate_cell_type_by_comparison(adata, groupby, n_top_genes, label_colum
     return ai_annotate_by_comparison(func=ai_cell_types_by_comparison, adata=adata, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, cell_type=adt_key, cell_type_of_origin_col=cell_type_of_origin_col, tissue_of_origin_col=tissue_of_origin_col, **kwargs)
 
 
-def ai_annotate_biological_process(adata, groupby, n_top_genes, label_column='ai_biological_process'):
+def ai_annotate_biological_process(adata, groupby, n_top_genes, label_column='ai_biological_process', backend=None, parallel=False):
     """
     Annotate biological processes based on the top n marker genes for each cluster.
 
@@ -1750,18 +2374,22 @@ def ai_annotate_biological_process(adata, groupby, n_top_genes, label_column='ai
     groupby : str Column in adata.obs to group by for differential expression analysis.
     n_top_genes : int The number of top marker genes to consider for each cluster.
     label_column : str, optional (default: 'ai_cell_type') The name of the new column in adata.obs where the cell type annotations will be stored.
+    parallel : bool, optional (default: False) If True, the clusters are annotated concurrently (see ai_annotate).
 
     Returns:
     pd.DataFrame A DataFrame with a column for the top marker genes for each cluster.
     """
-    return ai_annotate(func=ai_biological_process, adata=adata, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column)
+    return ai_annotate(func=ai_biological_process, adata=adata, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, parallel=parallel, backend=backend)
 
 
-def ai_annotate_biological_process_adata_dict(adata_dict, groupby, n_top_genes=10, label_column='ai_biological_process'):
+def ai_annotate_biological_process_adata_dict(adata_dict, groupby, n_top_genes=10, label_column='ai_biological_process', backend=None, num_workers=None, deduplicate=False):
     """
-    Applies ai_annotate_biological_process to each anndata in an anndict
+    Applies ai_annotate_biological_process to each anndata in an anndict. If deduplicate is True, clusters with the same
+    top marker genes are annotated once across all strata instead (see ai_annotate_adata_dict).
     """
-    return adata_dict_fapply_return(adata_dict, ai_annotate_biological_process, max_retries=3, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column)
+    if deduplicate:
+        return ai_annotate_adata_dict(func=ai_biological_process, adata_dict=adata_dict, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, num_workers=num_workers, backend=backend)
+    return adata_dict_fapply_return(adata_dict, ai_annotate_biological_process, num_workers=num_workers, max_retries=3, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column, backend=backend)
 
 
 def ai_annotate_by_comparison(func, adata, groupby, n_top_genes, label_column, cell_type_of_origin_col=None, tissue_of_origin_col=None, **kwargs):
@@ -1859,7 +2487,7 @@ def ai_annotate_by_comparison(func, adata, groupby, n_top_genes, label_column, c
 
     return pd.DataFrame(results)
 
-def ai_annotate(func, adata, groupby, n_top_genes, label_column, tissue_of_origin_col=None, **kwargs):
+def ai_annotate(func, adata, groupby, n_top_genes, label_column, tissue_of_origin_col=None, parallel=False, num_workers=None, **kwargs):
     """
     Annotate clusters based on the top marker genes for each cluster.
 
@@ -1873,10 +2501,78 @@ def ai_annotate(func, adata, groupby, n_top_genes, label_column, tissue_of_origi
     groupby : str Column in adata.obs to group by for differential expression analysis.
     n_top_genes : int The number of top marker genes to consider for each cluster.
     label_column : str The name of the new column in adata.obs where the annotations will be stored.
+    parallel : bool, optional (default: False) If True, the clusters are annotated concurrently in threads (still subject to configure_llm_concurrency and the rate limits of the backend).
+    num_workers : int, optional Maximum number of clusters annotated at once when parallel is True.
 
     Returns:
     pd.DataFrame A DataFrame with a column for the top marker genes for each cluster.
     """
+    rank_genes_groups, clusters, cluster_to_tissue = get_annotation_inputs(adata, groupby, tissue_of_origin_col)
+
+    if parallel:
+        def get_func_kwargs(cluster):
+            if cluster_to_tissue:
+                return {**kwargs, 'tissue': cluster_to_tissue[cluster]}
+            return kwargs
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, func, rank_genes_groups['names'][cluster][:n_top_genes], **get_func_kwargs(cluster))
+                for cluster in clusters
+            ]
+            cell_type_annotations = {cluster: future.result() for cluster, future in zip(clusters, futures)}
+
+        return apply_annotations(adata, groupby, label_column, n_top_genes, rank_genes_groups, cell_type_annotations)
+
+    # Initialize a dictionary to store cell type annotations
+    cell_type_annotations = {}
+
+    # Loop through each cluster and get the top n marker genes, then get cell type based on these marker genes
+    for cluster in clusters:
+        # Add tissue to kwargs if tissue_of_origin_col is provided
+        if cluster_to_tissue:
+            kwargs['tissue'] = cluster_to_tissue[cluster]
+
+        #Get top n genes
+        top_genes = rank_genes_groups['names'][cluster][:n_top_genes]
+
+        #Get annotation via func
+        cell_type_annotations[cluster] = func(top_genes, **kwargs)
+
+    return apply_annotations(adata, groupby, label_column, n_top_genes, rank_genes_groups, cell_type_annotations)
+
+
+async def aai_annotate(func, adata, groupby, n_top_genes, label_column, tissue_of_origin_col=None, **kwargs):
+    """
+    Async version of ai_annotate. func must be a coroutine function (e.g. aai_cell_type); the clusters
+    are annotated concurrently on the running event loop.
+
+    See ai_annotate for parameters and return value.
+    """
+    rank_genes_groups, clusters, cluster_to_tissue = get_annotation_inputs(adata, groupby, tissue_of_origin_col)
+
+    def get_func_kwargs(cluster):
+        if cluster_to_tissue:
+            return {**kwargs, 'tissue': cluster_to_tissue[cluster]}
+        return kwargs
+
+    annotations = await asyncio.gather(*[
+        func(rank_genes_groups['names'][cluster][:n_top_genes], **get_func_kwargs(cluster))
+        for cluster in clusters
+    ])
+    cell_type_annotations = dict(zip(clusters, annotations))
+
+    return apply_annotations(adata, groupby, label_column, n_top_genes, rank_genes_groups, cell_type_annotations)
+
+
+def get_annotation_inputs(adata, groupby, tissue_of_origin_col=None):
+    """
+    Prepares the inputs of ai_annotate: makes adata.obs[groupby] categorical, runs sc.tl.rank_genes_groups if needed,
+    and gets the tissue(s) of origin of each cluster.
+
+    Returns:
+    tuple: (rank_genes_groups, clusters, cluster_to_tissue), where cluster_to_tissue is empty if tissue_of_origin_col is not used.
+    """
     # Ensure the groupby column is categorical
     if not pd.api.types.is_categorical_dtype(adata.obs[groupby]):
         adata.obs[groupby] = adata.obs[groupby].astype('category')
@@ -1906,39 +2602,33 @@ def ai_annotate(func, adata, groupby, n_top_genes, label_column, tissue_of_origi
     # Get mapping of cluster to tissue if tissue_of_origin_col is provided
     cluster_to_tissue = {}
     if tissue_of_origin_col:
+        # Get the tissues of all clusters in one pass over obs
+        cluster_tissues = adata.obs.groupby(groupby, observed=True)[tissue_of_origin_col].unique()
+        cluster_tissues = {str(cluster): tissue for cluster, tissue in cluster_tissues.items()}
         for cluster in clusters:
-            tissue = adata.obs.loc[adata.obs[groupby] == cluster, tissue_of_origin_col].unique()
+            tissue = cluster_tissues[cluster]
             if len(tissue) > 1:
                 tissue = ", ".join(tissue)
             else:
                 tissue = tissue[0]
             cluster_to_tissue[cluster] = tissue
 
-    # Initialize a dictionary to store cell type annotations
-    cell_type_annotations = {}
-
-    # Initialize a list to store the results
-    results = []
-
+    return rank_genes_groups, clusters, cluster_to_tissue
 
-    # Loop through each cluster and get the top n marker genes, then get cell type based on these marker genes
-    for cluster in clusters:
-        # Add tissue to kwargs if tissue_of_origin_col is provided
-        if tissue_of_origin_col:
-            kwargs['tissue'] = cluster_to_tissue[cluster]
 
-        #Get top n genes
-        top_genes = rank_genes_groups['names'][cluster][:n_top_genes]
-
-        #Get annotation via func
-        annotation = func(top_genes, **kwargs)
-        cell_type_annotations[cluster] = annotation
-
-        results.append({
+def apply_annotations(adata, groupby, label_column, n_top_genes, rank_genes_groups, cell_type_annotations):
+    """
+    Writes per-cluster annotations to adata.obs[label_column] and returns the results table of ai_annotate.
+    """
+    # Collect the results in cluster order
+    results = [
+        {
             groupby: cluster,
             label_column: annotation,
-            f"top_{n_top_genes}_genes": list(top_genes)
-        })
+            f"top_{n_top_genes}_genes": list(rank_genes_groups['names'][cluster][:n_top_genes])
+        }
+        for cluster, annotation in cell_type_annotations.items()
+    ]
 
     # Create a new column in .obs for cell type annotations
     adata.obs[label_column] = adata.obs[groupby].map(cell_type_annotations)
@@ -1949,7 +2639,90 @@ def ai_annotate(func, adata, groupby, n_top_genes, label_column, tissue_of_origi
     return pd.DataFrame(results)
 
 
-def ai_unify_labels(adata_dict, label_columns, new_label_column, simplification_level='unified, typo-fixed'):
+def get_annotation_request_key(gene_list, tissue=None):
+    """
+    Returns the canonical form of an annotation request: the sorted set of genes and the tissue. Requests with the
+    same key get the same annotation.
+    """
+    return tuple(sorted(set(gene_list))), tissue
+
+
+def get_annotation_requests(adata, groupby, n_top_genes, tissue_of_origin_col=None):
+    """
+    Returns the request ai_annotate would make for each cluster of adata, as a dictionary of the form {cluster: (top_genes, tissue)}.
+    tissue is None if tissue_of_origin_col is not used.
+    """
+    rank_genes_groups, clusters, cluster_to_tissue = get_annotation_inputs(adata, groupby, tissue_of_origin_col)
+    return {
+        cluster: (list(rank_genes_groups['names'][cluster][:n_top_genes]), cluster_to_tissue.get(cluster))
+        for cluster in clusters
+    }
+
+
+def ai_annotate_adata_dict(func, adata_dict, groupby, n_top_genes, label_column, tissue_of_origin_col=None, num_workers=None, max_retries=3, **kwargs):
+    """
+    Runs ai_annotate on each anndata in an anndict, sending each distinct request only once.
+
+    The (top genes, tissue) request of every cluster in every stratum is collected first and deduplicated on its
+    canonical form (see get_annotation_request_key). The unique requests are sent concurrently, using the gene
+    order of their first occurrence, and each answer is written back to the obs of every stratum that asked for it.
+
+    Parameters:
+    func : callable The annotation function, called as func(top_genes, **kwargs) (e.g. ai_cell_type).
+    adata_dict : dict Dictionary of AnnData objects.
+    groupby, n_top_genes, label_column, tissue_of_origin_col : See ai_annotate. Can be given per stratum as dictionaries keyed like adata_dict.
+    num_workers : int, optional Maximum number of concurrent requests.
+    max_retries : int, optional Number of times to retry a failed request.
+    **kwargs : Additional keyword arguments passed to func.
+
+    Returns:
+    dict: A dictionary with the same keys as adata_dict, containing the results table of ai_annotate for each
+    stratum (or an error string if a stratum failed).
+    """
+    # Collect the requests of each stratum
+    stratum_requests = adata_dict_fapply_return(adata_dict, get_annotation_requests, max_retries=max_retries, groupby=groupby, n_top_genes=n_top_genes, tissue_of_origin_col=tissue_of_origin_col)
+
+    # Deduplicate them across strata
+    unique_requests = {}
+    for adt_key in adata_dict:
+        requests = stratum_requests[adt_key]
+        if isinstance(requests, dict):
+            for gene_list, tissue in requests.values():
+                unique_requests.setdefault(get_annotation_request_key(gene_list, tissue), (gene_list, tissue))
+
+    def annotate(gene_list, tissue):
+        func_kwargs = kwargs if tissue is None else {**kwargs, 'tissue': tissue}
+        for attempt in range(max_retries + 1):
+            try:
+                return func(gene_list, **func_kwargs)
+            except Exception as e:
+                if attempt == max_retries:
+                    raise
+                print(f"Error annotating {gene_list} on attempt {attempt + 1}: {e}")
+
+    # Send the unique requests concurrently
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = {
+            key: executor.submit(contextvars.copy_context().run, annotate, gene_list, tissue)
+            for key, (gene_list, tissue) in unique_requests.items()
+        }
+        wait(futures.values())
+
+    # Scatter the answers back to each stratum; a failed request fails the strata that asked for it
+    def scatter(adata, adt_key, groupby, n_top_genes, label_column):
+        requests = stratum_requests[adt_key]
+        if not isinstance(requests, dict):
+            return requests
+        cell_type_annotations = {
+            cluster: futures[get_annotation_request_key(gene_list, tissue)].result()
+            for cluster, (gene_list, tissue) in requests.items()
+        }
+        return apply_annotations(adata, groupby, label_column, n_top_genes, adata.uns['rank_genes_groups'], cell_type_annotations)
+
+    return adata_dict_fapply_return(adata_dict, scatter, groupby=groupby, n_top_genes=n_top_genes, label_column=label_column)
+
+
+def ai_unify_labels(adata_dict, label_columns, new_label_column, simplification_level='unified, typo-fixed', backend=None, parallel=False, group_threshold=None):
     """
     Unifies cell type labels across multiple AnnData objects by mapping them to a simplified, unified set of labels.
 
@@ -1957,6 +2730,9 @@ def ai_unify_labels(adata_dict, label_columns, new_label_column, simplification_
     adata_dict (dict): Dictionary where keys are identifiers and values are AnnData objects.
     label_columns (dict): Dictionary where keys should be the same as the keys of adata_dict and values are the column names in .obs containing the original labels.
     new_label_column (str): Name of the new column to be created in .obs for storing the harmonized labels.
+    backend (LLMBackend or str, optional): The LLM backend to use (see register_llm_backend).
+    parallel (bool, optional): If True, the labels are unified in parallel batches (see map_cell_type_labels_to_simplified_set).
+    group_threshold (float, optional): If given, trivial variants of a label are grouped offline and only one label per group is sent to the LLM (see group_similar_labels).
 
     Returns:
     dict: A mapping dictionary where the keys are the original labels and the values are the unified labels.
@@ -1977,7 +2753,7 @@ def ai_unify_labels(adata_dict, label_columns, new_label_column, simplification_
     unique_labels_list = list(set(aggregated_labels))
 
     # Step 2: Get the mapping dictionary
-    mapping_dict = map_cell_type_labels_to_simplified_set(unique_labels_list, simplification_level=simplification_level)
+    mapping_dict = map_cell_type_labels_to_simplified_set(unique_labels_list, simplification_level=simplification_level, backend=backend, parallel=parallel, group_threshold=group_threshold)
 
     # Step 3: Apply the mapping to each anndata in adata_dict
     for key in adata_dict:
@@ -1985,12 +2761,29 @@ def ai_unify_labels(adata_dict, label_columns, new_label_column, simplification_
 
     return mapping_dict
 
+
+async def aai_unify_labels(adata_dict, label_columns, new_label_column, simplification_level='unified, typo-fixed', backend=None, parallel=False, group_threshold=None):
+    """
+    Async version of ai_unify_labels, using amap_cell_type_labels_to_simplified_set.
+    """
+    # Aggregate all labels
+    unique_labels_list = list({label for key in adata_dict for label in adata_dict[key].obs[label_columns[key]].unique().tolist()})
+
+    # Get the mapping dictionary
+    mapping_dict = await amap_cell_type_labels_to_simplified_set(unique_labels_list, simplification_level=simplification_level, backend=backend, parallel=parallel, group_threshold=group_threshold)
+
+    # Apply the mapping to each anndata in adata_dict
+    for key in adata_dict:
+        adata_dict[key].obs[new_label_column] = adata_dict[key].obs[label_columns[key]].map(mapping_dict)
+
+    return mapping_dict
+
 #the following functions also unify labels but serve a different purpose than ai_unify_labels.
 #ai_unify_labels is meant to unify labels across multiple adata
 #the following set of ensure_label functions are meant to operate within a single adata
 #and do not communicate across multiple adata in a dict
 
-def ensure_label_consistency_adata_dict(adata_dict, cols, simplification_level='unified, typo-fixed', new_col_prefix='consistent'):
+def ensure_label_consistency_adata_dict(adata_dict, cols, simplification_level='unified, typo-fixed', new_col_prefix='consistent', group_threshold=None):
     """
     Apply label consistency across multiple AnnData objects in a dictionary.
 
@@ -2001,13 +2794,14 @@ def ensure_label_consistency_adata_dict(adata_dict, cols, simplification_level='
     cols : list List of column names in adata.obs for which label consistency is enforced.
     simplification_level : str, optional Level of label simplification (default is 'unified, typo-fixed').
     new_col_prefix : str, optional Prefix for the new consistent label columns (default is 'consistent').
+    group_threshold : float, optional If given, trivial variants of a label are grouped offline before calling the LLM (see group_similar_labels).
 
     See ensure_label_consistency_adata for details.
     """
-    return adata_dict_fapply_return(adata_dict, ensure_label_consistency_adata, cols=cols, simplification_level=simplification_level, new_col_prefix=new_col_prefix)
+    return adata_dict_fapply_return(adata_dict, ensure_label_consistency_adata, cols=cols, simplification_level=simplification_level, new_col_prefix=new_col_prefix, group_threshold=group_threshold)
 
 
-def ensure_label_consistency_adata(adata, cols, simplification_level='unified, typo-fixed', new_col_prefix='consistent'):
+def ensure_label_consistency_adata(adata, cols, simplification_level='unified, typo-fixed', new_col_prefix='consistent', group_threshold=None):
     """
     Wrapper function to ensure label consistency across specified columns in an AnnData object.
     
@@ -2016,6 +2810,7 @@ def ensure_label_consistency_adata(adata, cols, simplification_level='unified, t
     - cols: List of column names in adata.obs to ensure label consistency
     - simplification_level: Level of simplification for label mapping
     - new_col_prefix: Prefix to create new columns in adata.obs. Default is "" (overwrites original columns).
+    - group_threshold: If given, trivial variants of a label are grouped offline before calling the LLM (see group_similar_labels).
     
     Returns:
     - Updated adata with consistent labels in adata.obs[new_col_prefix + cols]
@@ -2025,7 +2820,7 @@ def ensure_label_consistency_adata(adata, cols, simplification_level='unified, t
     df = adata.obs[cols].copy()
     
     # Step 2: Ensure label consistency using the helper function
-    consistent_df, label_map = ensure_label_consistency_main(df, simplification_level)
+    consistent_df, label_map = ensure_label_consistency_main(df, simplification_level, group_threshold=group_threshold)
     
     # Step 3: Create new columns in adata.obs with the prefix
     for col in cols:
@@ -2035,7 +2830,7 @@ def ensure_label_consistency_adata(adata, cols, simplification_level='unified, t
     return label_map
 
 
-def ensure_label_consistency_main(df, simplification_level='unified, typo-fixed'):
+def ensure_label_consistency_main(df, simplification_level='unified, typo-fixed', group_threshold=None):
     """
     Function to ensure label consistency across multiple columns in a DataFrame
     by mapping labels to a unified and simplified set.
@@ -2051,7 +2846,7 @@ def ensure_label_consistency_main(df, simplification_level='unified, typo-fixed'
     
     # Step 3: Use the external function to map labels to a simplified set
     unique_labels_list = list(unique_labels)
-    mapping_dict = map_cell_type_labels_to_simplified_set(unique_labels_list, simplification_level=simplification_level)
+    mapping_dict = map_cell_type_labels_to_simplified_set(unique_labels_list, simplification_level=simplification_level, group_threshold=group_threshold)
     
     # Step 4: Apply the mapping dictionary to all columns
     for column in df.columns:
@@ -2097,7 +2892,17 @@ def create_label_df(adata, cols1, cols2):
     return result_df
 
 
-def ai_compare_cell_type_labels_pairwise(adata, cols1, cols2, new_col_prefix='agreement', comparison_level='binary'):
+def get_label_codes(labels):
+    """
+    Returns integer codes for a column of labels and the labels the codes refer to. Categorical columns reuse their
+    codes, other columns are factorized. Missing labels get code -1.
+    """
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        return labels.cat.codes.to_numpy(), labels.cat.categories
+    return pd.factorize(labels)
+
+
+def ai_compare_cell_type_labels_pairwise(adata, cols1, cols2, new_col_prefix='agreement', comparison_level='binary', backend=None, batched=False, batch_size=40, num_workers=None):
     """
     Compare cell type labels by finding unique combinations between labels in cols1 and cols2,
     applying the comparison, and mapping the results back to adata.obs.
@@ -2107,6 +2912,10 @@ def ai_compare_cell_type_labels_pairwise(adata, cols1, cols2, new_col_prefix='ag
     cols2: List of columns to compare with cols1.
     new_col_prefix: The base name for the new comparison result columns.
     comparison_level: 'binary' or 'categorical', determines which comparison function to use.
+    backend: LLMBackend or name of a registered backend to use (see register_llm_backend).
+    batched: If True, compare the label pairs with ai_compare_cell_type_pairs, which answers equal labels locally, compares each unordered pair once, and packs batch_size pairs into each LLM call. Otherwise, each pair is a separate call.
+    batch_size: Number of label pairs per LLM call when batched is True.
+    num_workers: Maximum number of concurrent LLM calls. Defaults to the ThreadPoolExecutor default.
     Returns:
     dict: Dictionary with keys as tuples of (col1, col2) and values as DataFrames with the comparison results.
     """
@@ -2119,24 +2928,30 @@ def ai_compare_cell_type_labels_pairwise(adata, cols1, cols2, new_col_prefix='ag
 
     # Define the comparison and cleaning functions based on the level
     if comparison_level == 'binary':
-        comparison_func = lambda row: ai_compare_cell_types_binary(row['col1'], row['col2'])
+        comparison_func = lambda row: ai_compare_cell_types_binary(row['col1'], row['col2'], backend=backend)
         cleaning_func = lambda x: 1 if x.lower() == 'yes' else 0 if x.lower() == 'no' else None
     elif comparison_level == 'categorical':
-        comparison_func = lambda row: ai_compare_cell_types_categorical(row['col1'], row['col2'])
+        comparison_func = lambda row: ai_compare_cell_types_categorical(row['col1'], row['col2'], backend=backend)
         cleaning_func = lambda x: 0 if x.lower() == 'no match' else 1 if x.lower() == 'partial match' else 2 if x.lower() == 'perfect match' else None
 
     # Convert the label_combinations DataFrame into a list of dictionaries for parallel processing
     label_records = label_combinations.to_dict('records')
 
-    # Use ThreadPoolExecutor to apply the comparison function using threads for API calls
-    with ThreadPoolExecutor() as executor:
-        # Submit comparison tasks in parallel
-        future_to_row = {executor.submit(comparison_func, row): row for row in label_records}
+    if batched:
+        # Pack the pairs into a few structured prompts
+        raw_agreements = ai_compare_cell_type_pairs([(row['col1'], row['col2']) for row in label_records], comparison_level=comparison_level, batch_size=batch_size, num_workers=num_workers, backend=backend)
+        for row, raw_agreement in zip(label_records, raw_agreements):
+            row['raw_agreement'] = raw_agreement
+    else:
+        # Use ThreadPoolExecutor to apply the comparison function using threads for API calls
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            # Submit comparison tasks in parallel
+            future_to_row = {executor.submit(contextvars.copy_context().run, comparison_func, row): row for row in label_records}
 
-        # Process the results as they are completed
-        for future in as_completed(future_to_row):
-            row = future_to_row[future]
-            row['raw_agreement'] = future.result()
+            # Process the results as they are completed
+            for future in as_completed(future_to_row):
+                row = future_to_row[future]
+                row['raw_agreement'] = future.result()
 
     # Re-create the DataFrame from the processed records
     label_combinations = pd.DataFrame(label_records)
@@ -2146,7 +2961,16 @@ def ai_compare_cell_type_labels_pairwise(adata, cols1, cols2, new_col_prefix='ag
 
     # Initialize a dictionary to store results
     results = {}
-    
+
+    # Codes of each column in obs, which label each cell has and which labels occur at all
+    label_codes = {}
+    for col in dict.fromkeys(cols1 + cols2):
+        codes, categories = get_label_codes(adata.obs[col])
+        present = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+        label_codes[col] = codes, categories, present
+
+    agreement = label_combinations['agreement'].to_numpy(dtype=float)
+
     # Iterate over each pair of cols1 and cols2 and map the comparison results back
     for col1 in cols1:
         for col2 in cols2:
@@ -2156,43 +2980,262 @@ def ai_compare_cell_type_labels_pairwise(adata, cols1, cols2, new_col_prefix='ag
             # Define the new column name in adata.obs for this comparison
             new_col_name = f"{new_col_prefix}_{col1}_{col2}"
 
-            # Prepare a temporary DataFrame from adata.obs
-            temp_obs = adata.obs[[col1, col2]].copy()
-            temp_obs.reset_index(inplace=True)  # Reset index to preserve cell indices
-            temp_obs.columns = ['index', 'col1_label', 'col2_label']
+            codes1, categories1, present1 = label_codes[col1]
+            codes2, categories2, present2 = label_codes[col2]
+
+            # Dense (n_categories1 x n_categories2) lookup table of agreements, indexed by the codes of both columns
+            combination_codes1 = categories1.get_indexer(label_combinations['col1'])
+            combination_codes2 = categories2.get_indexer(label_combinations['col2'])
+            in_columns = (combination_codes1 >= 0) & (combination_codes2 >= 0)
+            lookup = np.full((len(categories1) + 1, len(categories2) + 1), np.nan)
+            lookup[combination_codes1[in_columns], combination_codes2[in_columns]] = agreement[in_columns]
 
-            # Merge temp_obs with label_combinations on the label columns
-            merged_df = pd.merge(
-                temp_obs,
-                label_combinations[['col1', 'col2', 'agreement']],
-                left_on=['col1_label', 'col2_label'],
-                right_on=['col1', 'col2'],
-                how='left'
-            )
+            # Gather each cell's agreement; missing labels (code -1) index the all-NaN last row or column
+            cell_agreement = lookup[codes1, codes2]
+            if not np.isnan(cell_agreement).any():
+                cell_agreement = cell_agreement.astype(int)
 
             # Assign the 'agreement' values back to adata.obs
-            adata.obs[new_col_name] = merged_df['agreement'].values
+            adata.obs[new_col_name] = cell_agreement
 
             # Store the relevant portion of label_combinations in the results dictionary
-            results[(col1, col2)] = label_combinations[
-                label_combinations['col1'].isin(adata.obs[col1]) &
-                label_combinations['col2'].isin(adata.obs[col2])
-            ]
+            occurs = in_columns.copy()
+            occurs[in_columns] = present1[combination_codes1[in_columns]] & present2[combination_codes2[in_columns]]
+            results[(col1, col2)] = label_combinations[occurs]
 
     return results
 
 
-def ai_compare_cell_type_labels_pairwise_adata_dict(adata_dict, cols1, cols2, new_col_prefix='agreement', comparison_level='binary'):
+def ai_compare_cell_type_labels_pairwise_adata_dict(adata_dict, cols1, cols2, new_col_prefix='agreement', comparison_level='binary', backend=None, batched=False, batch_size=40, num_workers=None):
     """
     Applies ai_compare_cell_type_labels_pairwise to each anndata in an anndict.
     """
-    return adata_dict_fapply_return(adata_dict, ai_compare_cell_type_labels_pairwise, max_retries=3, cols1=cols1, cols2=cols2, new_col_prefix=new_col_prefix, comparison_level=comparison_level)
+    return adata_dict_fapply_return(adata_dict, ai_compare_cell_type_labels_pairwise, max_retries=3, cols1=cols1, cols2=cols2, new_col_prefix=new_col_prefix, comparison_level=comparison_level, backend=backend, batched=batched, batch_size=batch_size, num_workers=num_workers)
+
+
+#LLM benchmark functions
+BENCHMARK_TASKS = ('annotate', 'compare', 'kappa', 'krippendorff')
+
+BENCHMARK_RESULT_COLUMNS = ['backend', 'provider', 'model', 'dataset', 'task', 'adt_key', 'metric', 'value']
+
+def get_benchmark_adata(adata):
+    """
+    Returns a lightweight AnnData sharing var and rank_genes_groups with adata but with its own copy of obs,
+    so that several backends can annotate the same dataset concurrently.
+    """
+    return ad.AnnData(obs=adata.obs.copy(), var=adata.var, uns={'rank_genes_groups': adata.uns['rank_genes_groups']})
+
+
+def prepare_benchmark_adata_dict(adata_dict, groupby):
+    """Makes adata.obs[groupby] categorical and runs sc.tl.rank_genes_groups where needed, so that annotation does not have to."""
+    for adata in adata_dict.values():
+        if not isinstance(adata.obs[groupby].dtype, pd.CategoricalDtype):
+            adata.obs[groupby] = adata.obs[groupby].astype('category')
+        if 'rank_genes_groups' not in adata.uns or adata.uns['rank_genes_groups']['params']['groupby'] != groupby:
+            sc.tl.rank_genes_groups(adata, groupby, method='t-test')
+
+
+def get_benchmark_metrics(result, result_type, get_metrics, metric_names):
+    """
+    Returns get_metrics(result) for the result of a benchmark task on one adata. If the task failed on that adata
+    (adata_dict_fapply_return gives None or an error string instead of a result_type), or its metrics can't be
+    computed, returns NaN for each of metric_names and the error as metric 'error'.
+    """
+    try:
+        if not isinstance(result, result_type):
+            raise ValueError(result if isinstance(result, str) else f"Unexpected result: {result!r}")
+        return get_metrics(result)
+    except Exception as e:
+        return {**{metric: np.nan for metric in metric_names}, 'error': str(e)}
+
+
+def run_benchmark_task(task, bench_dict, groupby, reference_col, label_column, n_top_genes, tissue_of_origin_col, comparison_level, backend):
+    """
+    Runs one benchmark task on the adata in bench_dict and returns {adt_key: {metric: value}}. An adata on which the
+    task failed gets NaN metrics and an 'error' metric (see get_benchmark_metrics).
+    """
+    if task == 'annotate':
+        results = ai_annotate_cell_type_adata_dict(bench_dict, groupby, n_top_genes=n_top_genes, label_column=label_column, tissue_of_origin_col=tissue_of_origin_col, backend=backend)
+        return {
+            adt_key: get_benchmark_metrics(result, pd.DataFrame,
+                                           lambda result: {'n_clusters': len(result), 'n_unique_labels': result[label_column].nunique()},
+                                           ['n_clusters', 'n_unique_labels'])
+            for adt_key, result in results.items()
+        }
+
+    if task == 'compare':
+        results = ai_compare_cell_type_labels_pairwise_adata_dict(bench_dict, [reference_col], [label_column], new_col_prefix='agreement', comparison_level=comparison_level, backend=backend)
+        agreement_col = f"agreement_{reference_col}_{label_column}"
+        return {
+            adt_key: get_benchmark_metrics(results.get(adt_key), dict,
+                                           lambda result: {'mean_agreement': adata.obs[agreement_col].astype(float).mean()},
+                                           ['mean_agreement'])
+            for adt_key, adata in bench_dict.items()
+        }
+
+    if task == 'kappa':
+        results = adata_dict_fapply_return(bench_dict, kappa_adata, cols=[reference_col, label_column])
+        return {
+            adt_key: get_benchmark_metrics(result, dict,
+                                           lambda result: {'cohen_kappa': float(result['pairwise'][(reference_col, label_column)])},
+                                           ['cohen_kappa'])
+            for adt_key, result in results.items()
+        }
+
+    if task == 'krippendorff':
+        results = adata_dict_fapply_return(bench_dict, krippendorff_alpha_adata, cols=[reference_col, label_column])
+        return {
+            adt_key: get_benchmark_metrics(result, (float, np.floating),
+                                           lambda result: {'krippendorff_alpha': float(result)},
+                                           ['krippendorff_alpha'])
+            for adt_key, result in results.items()
+        }
+
+    raise ValueError(f"Unknown benchmark task '{task}'. Must be one of {BENCHMARK_TASKS}.")
+
+
+def run_llm_benchmark(backends, adata_dicts, groupby, reference_col, tasks=BENCHMARK_TASKS, n_top_genes=10,
+                      tissue_of_origin_col=None, comparison_level='binary', costs=None, results_path=None, max_workers=None):
+    """
+    Benchmarks LLM backends on cell type annotation over a matrix of backends x datasets x tasks.
+
+    For each backend and dataset, the clusters in groupby are annotated (task 'annotate') into the column
+    'ai_cell_type_<backend name>', which is then compared to the reference labels with the LLM (task 'compare',
+    see ai_compare_cell_type_labels_pairwise), Cohen's kappa (task 'kappa', see kappa_adata) and Krippendorff's
+    alpha (task 'krippendorff', see krippendorff_alpha_adata). All backend-dataset pairs run concurrently; the
+    calls to each provider and model stay within its limits (see configure_llm_governor), and responses are
+    cached if a cache is configured (see configure_llm_cache).
+
+    Parameters:
+    backends : list of LLMBackend or str Backends (or names of registered backends, see register_llm_backend) to benchmark.
+    adata_dicts : dict Dictionary of datasets, with names as keys and adata_dicts as values.
+    groupby : str Column in adata.obs with the clusters to annotate.
+    reference_col : str Column in adata.obs with the reference cell type labels.
+    tasks : tuple of str, optional Tasks to run, a subset of ('annotate', 'compare', 'kappa', 'krippendorff').
+    n_top_genes : int, optional (default: 10) The number of top marker genes to annotate each cluster with.
+    tissue_of_origin_col : str, optional Column in adata.obs with the tissue of origin of the cells.
+    comparison_level : str, optional (default: 'binary') 'binary' or 'categorical', the comparison of the 'compare' task.
+    costs : dict, optional Prices per million tokens, as {backend name: (input cost, output cost)}, used for the cost metric.
+    results_path : str, optional Path of a CSV file the results are appended to as they complete. If the file exists,
+        the tasks already in it are not run again (annotation is rerun if a later task needs its labels, from the cache if one is configured).
+        Tasks that failed on any adata are returned but not written, so they are retried on the next run.
+    max_workers : int, optional Maximum number of backend-dataset pairs to run at once (default: all of them).
+
+    Returns:
+    pd.DataFrame A tidy table with columns backend, provider, model, dataset, task, adt_key, metric and value.
+    Agreement metrics are reported per adt_key, with NaN and an 'error' metric where the task failed; the usage metrics of each task (wall_time, llm_calls, cached_calls,
+    input_tokens, output_tokens, mean_llm_latency and cost) have adt_key 'all'. The labels of each backend are also
+    added to the original adata.obs.
+    """
+    for task in tasks:
+        if task not in BENCHMARK_TASKS:
+            raise ValueError(f"Unknown benchmark task '{task}'. Must be one of {BENCHMARK_TASKS}.")
+    backends = [resolve_llm_backend(backend) for backend in backends]
+    costs = costs or {}
+
+    # Resume from the results of a previous run
+    if results_path and os.path.isfile(results_path):
+        previous_results = pd.read_csv(results_path, dtype={'adt_key': str})
+    else:
+        previous_results = pd.DataFrame(columns=BENCHMARK_RESULT_COLUMNS)
+    previous_cells = list(zip(previous_results['backend'], previous_results['dataset'], previous_results['task']))
+    failed = {cell for cell, metric in zip(previous_cells, previous_results['metric']) if metric == 'error'}
+    completed = set(previous_cells) - failed
+
+    results_lock = threading.Lock()
+    dataset_locks = {dataset: threading.Lock() for dataset in adata_dicts}
+    new_results = []
+
+    def record_results(rows, persist=True):
+        with results_lock:
+            new_results.extend(rows)
+            if results_path and persist:
+                pd.DataFrame(rows, columns=BENCHMARK_RESULT_COLUMNS).to_csv(
+                    results_path, mode='a', index=False, header=not os.path.isfile(results_path))
+
+    def run_pipeline(backend, dataset):
+        pending = [task for task in tasks if (backend.name, dataset, task) not in completed]
+        if not pending:
+            return
+        adata_dict = adata_dicts[dataset]
+        label_column = f"ai_cell_type_{backend.name}"
+        bench_dict = {adt_key: get_benchmark_adata(adata) for adt_key, adata in adata_dict.items()}
+        input_cost, output_cost = costs.get(backend.name, (0.0, 0.0))
+
+        # Annotation is run first, as the other tasks need its labels
+        for task in BENCHMARK_TASKS:
+            needs_labels = task == 'annotate' and any(label_column not in adata.obs for adata in bench_dict.values())
+            if task not in pending and not needs_labels:
+                continue
+            start = time.perf_counter()
+            with track_llm_usage() as usage:
+                try:
+                    metrics = run_benchmark_task(task, bench_dict, groupby, reference_col, label_column, n_top_genes,
+                                                 tissue_of_origin_col, comparison_level, backend)
+                except Exception as e:
+                    # Record the failure and go on with the other tasks
+                    metrics = {'all': {'error': str(e)}}
+            wall_time = time.perf_counter() - start
+            if task not in pending:
+                continue
+
+            usage_stats = usage.stats()
+            cell_metrics = {
+                'wall_time': wall_time,
+                'llm_calls': usage_stats['calls'],
+                'cached_calls': usage_stats['cached_calls'],
+                'input_tokens': usage_stats['input_tokens'],
+                'output_tokens': usage_stats['output_tokens'],
+                'mean_llm_latency': usage_stats['mean_latency'],
+                'cost': usage.cost(input_cost, output_cost),
+            }
+            rows = [
+                [backend.name, backend.provider, backend.model, dataset, task, str(adt_key), metric, value]
+                for adt_key, adt_metrics in metrics.items()
+                for metric, value in adt_metrics.items()
+            ]
+            rows += [[backend.name, backend.provider, backend.model, dataset, task, 'all', metric, value]
+                     for metric, value in cell_metrics.items()]
+            # Failed cells are not persisted, so that a resumed run retries them
+            record_results(rows, persist=not any('error' in adt_metrics for adt_metrics in metrics.values()))
+
+        # Copy the labels of this backend to the original adata
+        with dataset_locks[dataset]:
+            for adt_key, adata in adata_dict.items():
+                if label_column in bench_dict[adt_key].obs:
+                    adata.obs[label_column] = bench_dict[adt_key].obs[label_column]
+
+    for adata_dict in adata_dicts.values():
+        prepare_benchmark_adata_dict(adata_dict, groupby)
+
+    pipelines = [(backend, dataset) for backend in backends for dataset in adata_dicts]
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(pipelines), 1)) as executor:
+        futures = {
+            executor.submit(contextvars.copy_context().run, run_pipeline, backend, dataset): (backend.name, dataset)
+            for backend, dataset in pipelines
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Unhandled error benchmarking {futures[future]}: {e}")
+
+    new_results = pd.DataFrame(new_results, columns=BENCHMARK_RESULT_COLUMNS)
+    if previous_results.empty:
+        return new_results
+    return pd.concat([previous_results, new_results], ignore_index=True)
 
 
-def plot_sankey_adata_dict(adata_dict, cols, params=None):
+def plot_sankey_adata_dict(adata_dict, cols, params=None, directory=None, file_format='png', num_workers=None):
     """
-    Applies plot_sankey to each anndata in an anndict
+    Applies plot_sankey to each anndata in an anndict. If directory is provided, the plots are instead
+    rendered and written to files ('png' or 'svg') in parallel worker processes, and the paths are returned.
+    Exporting requires selenium and a browser driver (see check_holoviews_export).
     """
+    if directory is not None:
+        check_holoviews_export()
+        return adata_dict_fapply_export(adata_dict, plot_sankey, directory, file_format=file_format, prefix='sankey_', num_workers=num_workers,
+                                        obs_keys=cols, cols=cols, params=params)
     return adata_dict_fapply_return(adata_dict, plot_sankey, cols=cols, params=params)
 
 
@@ -26,7 +26,7 @@ import squidpy as sq
 from scipy.sparse import lil_matrix, csr_matrix
 from scipy.sparse import dok_matrix
 
-from .dict import adata_dict_fapply
+from .dict import adata_dict_fapply, adata_dict_fapply_export
 
 
 def read_data(file_path, platform=None):
@@ -280,23 +280,34 @@ def build_adata_from_visium(paths_dict, hd=False):
 
 
 
-def plot_spatial_adata_dict(adata_dict, **kwargs):
+def plot_spatial(adata, **kwargs):
+    """
+    Plots the spatial data of adata with sc.pl.spatial, if spatial coordinates are available.
+    """
+    if 'spatial' in adata.obsm:
+        return sc.pl.spatial(adata, **kwargs)
+    else:
+        print(f"Spatial coordinates not available for adata. Please add spatial data before plotting.")
+
+
+def plot_spatial_adata_dict(adata_dict, directory=None, file_format='png', dpi=150, num_workers=None, **kwargs):
     """
     Plots spatial data for each AnnData object in adata_dict, colored by a specified variable.
 
     Parameters:
     - adata_dict (dict): A dictionary with keys as strata and values as AnnData objects.
+    - directory (str, optional): If provided, export the plots to files in this directory instead of showing them,
+      rendering in parallel worker processes (see adata_dict_fapply_export).
+    - file_format (str): 'png', 'svg' or 'pdf' (only used with directory).
+    - dpi (int): Resolution for raster formats (only used with directory).
+    - num_workers (int, optional): Number of worker processes (only used with directory).
     - kwargs: Additional keyword arguments, including 'color_by' which specifies a variable by which to color the spatial plots, typically a column in .obs, and 'crop_coord' which specifies coordinates for cropping the spatial plots.
 
     Returns:
-    - None: The function creates spatial plots for the AnnData objects.
+    - None, or if directory is provided, dict: the path of the file written for each key.
     """
-    def plot_spatial(adata, **kwargs):
-        if 'spatial' in adata.obsm:
-            sc.pl.spatial(adata, **kwargs)
-        else:
-            print(f"Spatial coordinates not available for adata. Please add spatial data before plotting.")
-    
+    if directory is not None:
+        return adata_dict_fapply_export(adata_dict, plot_spatial, directory, file_format=file_format, prefix='spatial_', dpi=dpi, num_workers=num_workers, show=False, **kwargs)
     adata_dict_fapply(adata_dict, plot_spatial, **kwargs)
 
 
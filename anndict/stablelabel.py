@@ -11,6 +11,8 @@ import re
 import pandas as pd
 import random
 import itertools
+import hashlib
+from collections import OrderedDict
 from IPython.display import HTML, display
 
 from sklearn.decomposition import PCA
@@ -592,10 +594,114 @@ def plot_confusion_matrix(true_labels_encoded, predicted_labels_encoded, label_e
 
     return g
 
-def plot_sankey(adata, cols, params=None):
+_sankey_flows_cache = OrderedDict()
+_SANKEY_FLOWS_CACHE_SIZE = 32
+
+
+def get_sankey_codes(values):
+    """
+    Encodes a column as integer codes into an array of unique string labels (matching values.astype(str)).
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        labels = values.cat.categories.astype(str).to_numpy()
+    else:
+        codes, labels = pd.factorize(values, use_na_sentinel=True)
+        labels = pd.Index(labels).astype(str).to_numpy()
+    missing = codes < 0
+    if missing.any():
+        # Missing values are labelled as astype(str) labels them ('nan', 'None', '<NA>', ...)
+        missing_values = pd.Series(values.to_numpy()[missing], dtype=values.dtype)
+        missing_codes, missing_labels = pd.factorize(missing_values.astype(str).to_numpy())
+        codes = codes.copy()
+        codes[missing] = len(labels) + missing_codes
+        labels = np.append(labels, missing_labels)
+
+    # Merge labels that are only distinct before conversion to str
+    label_map, labels = pd.factorize(labels, use_na_sentinel=False)
+    codes = label_map[codes]
+
+    # Drop unused labels
+    used = np.flatnonzero(np.bincount(codes, minlength=len(labels)))
+    remap = np.zeros(len(labels), dtype=np.int64)
+    remap[used] = np.arange(len(used))
+    return remap[codes], np.asarray(labels, dtype=object)[used]
+
+
+def get_sankey_flows_digest(obs, cols):
+    """
+    Hashes the contents of the given obs columns, used to key the flow cache.
+    """
+    digest = hashlib.sha1()
+    for col in cols:
+        values = obs[col]
+        digest.update(str(col).encode())
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            digest.update(values.cat.codes.to_numpy().tobytes())
+            digest.update('\x1f'.join(values.cat.categories.astype(str)).encode())
+        else:
+            digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def get_sankey_flows(adata, cols, use_cache=True):
+    """
+    Computes the flows between each pair of adjacent columns for a Sankey plot.
+
+    Parameters:
+    adata : AnnData object.
+    cols : list of str, the columns in adata.obs, in plotting order.
+    use_cache : bool, if True, reuse the table computed for identical column contents.
+
+    Returns:
+    pd.DataFrame with columns 'source', 'target' and 'value', where nodes are labelled "{label} ({col})".
+    """
+    obs = adata.obs[cols]
+
+    if use_cache:
+        digest = get_sankey_flows_digest(obs, cols)
+        if digest in _sankey_flows_cache:
+            _sankey_flows_cache.move_to_end(digest)
+            return _sankey_flows_cache[digest].copy()
+
+    encoded = [get_sankey_codes(obs[col]) for col in cols]
+
+    flows = []
+    for i in range(len(cols) - 1):
+        codes_a, labels_a = encoded[i]
+        codes_b, labels_b = encoded[i + 1]
+
+        # Count each (a, b) pair via a single integer index per cell
+        pair_index = codes_a.astype(np.int64) * len(labels_b) + codes_b
+        if len(labels_a) * len(labels_b) <= 4 * len(pair_index) + 1024:
+            counts = np.bincount(pair_index, minlength=len(labels_a) * len(labels_b))
+            pairs = np.flatnonzero(counts)
+            counts = counts[pairs]
+        else:
+            pairs, counts = np.unique(pair_index, return_counts=True)
+
+        source_nodes = np.array([f"{label} ({cols[i]})" for label in labels_a], dtype=object)
+        target_nodes = np.array([f"{label} ({cols[i + 1]})" for label in labels_b], dtype=object)
+        flows.append(pd.DataFrame({
+            'source': source_nodes[pairs // len(labels_b)],
+            'target': target_nodes[pairs % len(labels_b)],
+            'value': counts
+        }))
+
+    sankey_data = pd.concat(flows, ignore_index=True) if flows else pd.DataFrame({'source': [], 'target': [], 'value': []})
+
+    if use_cache:
+        _sankey_flows_cache[digest] = sankey_data
+        while len(_sankey_flows_cache) > _SANKEY_FLOWS_CACHE_SIZE:
+            _sankey_flows_cache.popitem(last=False)
+        sankey_data = sankey_data.copy()
+
+    return sankey_data
+
+
+def plot_sankey(adata, cols, params=None, flows=None):
 
     import holoviews as hv
-    from collections import defaultdict
     hv.extension('bokeh')
 
     def f(plot, element):
@@ -607,38 +713,8 @@ def plot_sankey(adata, cols, params=None):
     if params is None:
         params = {}
     
-    obs = adata.obs[cols]
-    
-    # Creating unique labels for each column
-    unique_labels = []
-    label_dict = defaultdict(dict)
-    for col_index, col in enumerate(cols):
-        col_data = obs[col].astype(str).tolist()
-        for item in col_data:
-            if item not in label_dict[col_index]:
-                unique_label = f"{item} ({col})"
-                label_dict[col_index][item] = unique_label
-                unique_labels.append(unique_label)
-    
-    # Creating source, target and value lists
-    source = []
-    target = []
-    value = []
-    for i in range(len(cols) - 1):
-        ct_dict = defaultdict(int)
-        for a, b in zip(obs[cols[i]].astype(str), obs[cols[i+1]].astype(str)):
-            ct_dict[(a, b)] += 1
-        for (a, b), v in ct_dict.items():
-            source.append(label_dict[i][a])
-            target.append(label_dict[i+1][b])
-            value.append(v)
-    
-    # Creating DataFrame for Sankey
-    sankey_data = pd.DataFrame({
-        'source': source,
-        'target': target,
-        'value': value
-    })
+    # Flow table for adjacent column pairs (pass flows to reuse a table from get_sankey_flows)
+    sankey_data = flows if flows is not None else get_sankey_flows(adata, cols)
     
     # Appearance parameters
     cmap = params.get('cmap', 'Colorblind')
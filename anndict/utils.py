@@ -11,6 +11,8 @@ import re
 import pandas as pd
 import random
 import itertools
+from collections import Counter
+from difflib import SequenceMatcher
 from IPython.display import HTML, display
 
 from sklearn.decomposition import PCA
@@ -61,6 +63,160 @@ def normalize_label(label):
         return 'missing'
     return normalize_string(label.strip())
 
+def canonicalize_label(label):
+    """
+    Returns a rule-based canonical form of a label, under which trivial variants of a cell type label coincide:
+    casing, punctuation, plurals and marker notation (e.g. 'CD4-positive T cell' and 'CD4+ T cells').
+    """
+    if pd.isna(label):
+        return 'missing'
+    label = str(label).lower().replace('+', ' positive ').replace('-', ' ').replace('_', ' ')
+    tokens = []
+    for token in normalize_string(label).split():
+        # Singularize plural words (but not e.g. 'class', 'virus', 'basis')
+        if len(token) > 3 and token.endswith('ies'):
+            token = token[:-3] + 'y'
+        elif len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+            token = token[:-1]
+        tokens.append(token)
+    return ' '.join(tokens)
+
+
+LABEL_SIGNATURE_WORDS = {'positive', 'negative', 'non', 'not', 'high', 'low', 'alpha', 'beta', 'gamma', 'delta'}
+
+def get_label_signature(canonical_label):
+    """
+    Returns the distinguishing tokens of a canonical label: numbers, short tokens (e.g. 'b', 't', 'nk', roman numerals)
+    and marker polarity and greek letter words. Labels are only grouped if their signatures agree, so that e.g. CD4 and
+    CD8 T cells, B and T cells, or type I and type II pneumocytes are kept apart.
+    """
+    tokens = canonical_label.split()
+    numbers = tuple(re.findall(r'\d+', canonical_label))
+    words = tuple(sorted(token for token in tokens if len(token) <= 3 or token in LABEL_SIGNATURE_WORDS))
+    return numbers, words
+
+
+def group_similar_labels(labels, threshold=0.9, ngram_range=(2, 4)):
+    """
+    Groups labels that are trivial variants of each other, offline. Labels with the same canonical form
+    (see canonicalize_label) are grouped, then groups whose canonical forms have a TF-IDF character n-gram cosine
+    similarity of at least threshold are merged, provided they have the same numbers and marker polarity words
+    (see get_label_signature).
+
+    Args:
+        labels (list): Labels to group.
+        threshold (float): Minimum cosine similarity of two canonical forms to merge their groups. Use 1 to only group identical canonical forms.
+        ngram_range (tuple): Range of the character n-gram lengths.
+
+    Returns:
+        dict: Mapping of each label to the representative of its group (its shortest label).
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    unique_labels = list(dict.fromkeys(labels))
+    if not unique_labels:
+        return {}
+    canonical_labels = [canonicalize_label(label) for label in unique_labels]
+    canonical_forms = list(dict.fromkeys(canonical_labels))
+    form_index = {form: i for i, form in enumerate(canonical_forms)}
+
+    # Link canonical forms with similar character n-grams and the same signature
+    group_ids = np.arange(len(canonical_forms))
+    if threshold < 1 and len(canonical_forms) > 1:
+        tfidf = TfidfVectorizer(analyzer='char_wb', ngram_range=ngram_range).fit_transform(canonical_forms).tocsr()
+        signature_ids = pd.factorize(pd.Series([get_label_signature(form) for form in canonical_forms]))[0]
+
+        # Compare in blocks of rows, as most pairs of labels share some n-grams
+        rows, cols = [], []
+        for start in range(0, tfidf.shape[0], 1000):
+            similarity = (tfidf[start:start + 1000] @ tfidf.T).tocoo()
+            keep = similarity.data >= threshold
+            block_rows, block_cols = similarity.row[keep] + start, similarity.col[keep]
+            same_signature = signature_ids[block_rows] == signature_ids[block_cols]
+            rows.append(block_rows[same_signature])
+            cols.append(block_cols[same_signature])
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        links = coo_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(canonical_forms), len(canonical_forms)))
+        _, group_ids = connected_components(links, directed=False)
+
+    # The representative of each group is its shortest label
+    representatives = {}
+    for label, canonical_label in zip(unique_labels, canonical_labels):
+        group_id = group_ids[form_index[canonical_label]]
+        representative = representatives.get(group_id)
+        if representative is None or (len(str(label)), str(label)) < (len(str(representative)), str(representative)):
+            representatives[group_id] = label
+
+    return {label: representatives[group_ids[form_index[canonical_label]]] for label, canonical_label in zip(unique_labels, canonical_labels)}
+
+
+def get_closest_matches(words, possibilities, cutoff=0.6):
+    """
+    Finds the closest match of each word among possibilities. Gives the same result as
+    difflib.get_close_matches(word, possibilities, n=1, cutoff=cutoff) for each word, without scoring every possibility.
+
+    The possibilities are indexed by character counts, which bound the SequenceMatcher ratio from above (as in
+    SequenceMatcher.quick_ratio). The bounds of all words are computed in batches, and for each word only the
+    possibilities whose bound reaches the cutoff are scored, in decreasing order of bound, until none of the
+    remaining ones can beat the best ratio found.
+
+    Args:
+        words (list of str): Strings to match.
+        possibilities (list of str): Strings to match against.
+        cutoff (float): Minimum similarity ratio of a match.
+
+    Returns:
+        list: The closest match of each word, or None if no possibility reaches the cutoff.
+    """
+    unique_possibilities = list(dict.fromkeys(possibilities))
+    unique_words = list(dict.fromkeys(words))
+    if not unique_possibilities or not unique_words:
+        return [None] * len(words)
+
+    # Character count vectors over the characters of the possibilities (other characters never match)
+    alphabet = {char: i for i, char in enumerate(sorted(set(''.join(unique_possibilities))))}
+    def count_chars(strings):
+        counts = np.zeros((len(strings), max(len(alphabet), 1)), dtype=np.int32)
+        for row, string in enumerate(strings):
+            for char, count in Counter(string).items():
+                if char in alphabet:
+                    counts[row, alphabet[char]] = count
+        return counts
+
+    possibility_counts = count_chars(unique_possibilities)
+    possibility_lengths = np.array([len(possibility) for possibility in unique_possibilities])
+    word_counts = count_chars(unique_words)
+    word_lengths = np.array([len(word) for word in unique_words])
+
+    matcher = SequenceMatcher()
+    closest_matches = {}
+    chunk_size = max(1, 4_000_000 // possibility_counts.size)
+    for start in range(0, len(unique_words), chunk_size):
+        end = start + chunk_size
+        overlaps = np.minimum(word_counts[start:end, None, :], possibility_counts[None, :, :]).sum(axis=2)
+        totals = word_lengths[start:end, None] + possibility_lengths[None, :]
+        bounds = np.where(totals > 0, 2.0 * overlaps / np.maximum(totals, 1), 1.0)
+
+        for row, word in enumerate(unique_words[start:end]):
+            candidates = np.flatnonzero(bounds[row] >= cutoff)
+            candidates = candidates[np.argsort(-bounds[row, candidates], kind='stable')]
+            matcher.set_seq2(word)
+            best_ratio, best_match = None, None
+            for index in candidates:
+                if best_ratio is not None and bounds[row, index] < best_ratio:
+                    break
+                possibility = unique_possibilities[index]
+                matcher.set_seq1(possibility)
+                ratio = matcher.ratio()
+                # Ties are broken by the larger string, as in get_close_matches
+                if ratio >= cutoff and (best_ratio is None or (ratio, possibility) > (best_ratio, best_match)):
+                    best_ratio, best_match = ratio, possibility
+            closest_matches[word] = best_match
+
+    return [closest_matches[word] for word in words]
+
 def add_label_to_adata(adata, indices, labels, new_label_key):
     """
     Adds a label to the AnnData object in a specified column for given indices.
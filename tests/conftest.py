@@ -0,0 +1,11 @@
+import pytest
+
+from anndict import ai
+
+
+@pytest.fixture(autouse=True, scope='session')
+def disable_llm_response_log():
+    """Keeps the tests from writing the LLM response log to the working directory."""
+    ai.configure_llm_response_log(enabled=False)
+    yield
+    ai.configure_llm_response_log()
@@ -0,0 +1,103 @@
+import threading
+
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+
+import anndict.dict as adict
+
+
+def make_adata(cluster_genes):
+    """AnnData with one cell per cluster and a precomputed rank_genes_groups of the given top genes of each cluster."""
+    clusters = list(cluster_genes)
+    adata = ad.AnnData(np.zeros((len(clusters), 1)))
+    adata.obs_names = [f"cell{i}" for i in range(len(clusters))]
+    adata.obs['leiden'] = pd.Categorical(clusters)
+    names = np.rec.fromarrays([np.array(cluster_genes[cluster], dtype=object) for cluster in clusters], names=clusters)
+    adata.uns['rank_genes_groups'] = {'params': {'groupby': 'leiden'}, 'names': names}
+    return adata
+
+
+@pytest.fixture
+def annotation_calls(monkeypatch):
+    """Replaces ai_cell_type with a stub that records its calls and names the cell type after the first gene."""
+    calls = []
+    lock = threading.Lock()
+
+    def ai_cell_type(gene_list, tissue=None, backend=None):
+        with lock:
+            calls.append(tuple(gene_list))
+        return f"{gene_list[0]} cell"
+
+    monkeypatch.setattr(adict, 'ai_cell_type', ai_cell_type)
+    return calls
+
+
+def make_adata_dict():
+    return {
+        'a': make_adata({'0': ['CD3E', 'CD8A'], '1': ['MS4A1', 'CD79A']}),
+        'b': make_adata({'0': ['CD8A', 'CD3E'], '1': ['LYZ', 'CD14']}),
+    }
+
+
+@pytest.mark.parametrize('deduplicate', [False, True])
+def test_annotate_cell_type_adata_dict(annotation_calls, deduplicate):
+    adata_dict = make_adata_dict()
+    results = adict.ai_annotate_cell_type_adata_dict(adata_dict, groupby='leiden', n_top_genes=2, deduplicate=deduplicate)
+    assert set(results) == {'a', 'b'}
+    assert adata_dict['a'].obs['ai_cell_type'].tolist() == ['CD3E cell', 'MS4A1 cell']
+    assert adata_dict['b'].obs['ai_cell_type'].tolist()[1] == 'LYZ cell'
+    assert list(results['a']['ai_cell_type']) == ['CD3E cell', 'MS4A1 cell']
+
+
+def test_per_stratum_annotation_is_default(annotation_calls):
+    adict.ai_annotate_cell_type_adata_dict(make_adata_dict(), groupby='leiden', n_top_genes=2)
+    assert len(annotation_calls) == 4
+
+
+def test_deduplicate_sends_each_request_once(annotation_calls):
+    adata_dict = make_adata_dict()
+    adict.ai_annotate_cell_type_adata_dict(adata_dict, groupby='leiden', n_top_genes=2, deduplicate=True)
+    # Cluster 0 of both strata has the same genes in a different order
+    assert len(annotation_calls) == 3
+    assert adata_dict['b'].obs['ai_cell_type'].tolist()[0] == 'CD3E cell'
+
+
+def test_annotation_request_key_ignores_gene_order():
+    assert adict.get_annotation_request_key(['CD8A', 'CD3E'], 'blood') == adict.get_annotation_request_key(['CD3E', 'CD8A', 'CD3E'], 'blood')
+    assert adict.get_annotation_request_key(['CD3E'], 'blood') != adict.get_annotation_request_key(['CD3E'], 'lung')
+
+
+def make_tissue_adata():
+    adata = make_adata({'0': ['CD3E', 'CD8A'], '1': ['MS4A1', 'CD79A'], '2': ['LYZ', 'CD14']})
+    adata = ad.concat([adata, adata[:1]], uns_merge='first')
+    adata.obs_names_make_unique()
+    adata.obs['tissue'] = ['blood', 'lymph node', 'blood', 'spleen']
+    return adata
+
+
+def annotate(gene_list, tissue=None):
+    return f"{gene_list[0]} cell from {tissue}"
+
+
+def test_parallel_annotation_matches_sequential():
+    adata = make_tissue_adata()
+    sequential = adict.ai_annotate(annotate, adata, 'leiden', 2, 'sequential', tissue_of_origin_col='tissue')
+    parallel = adict.ai_annotate(annotate, adata, 'leiden', 2, 'parallel', tissue_of_origin_col='tissue', parallel=True, num_workers=2)
+    assert parallel.drop(columns='parallel').equals(sequential.drop(columns='sequential'))
+    assert list(parallel['parallel']) == list(sequential['sequential'])
+    assert list(adata.obs['parallel']) == list(adata.obs['sequential'])
+    assert adata.obs['parallel'].iloc[0] == 'CD3E cell from blood, spleen'
+
+
+def test_parallel_annotation_is_concurrent():
+    # Each call waits until all three clusters are being annotated at once
+    barrier = threading.Barrier(3, timeout=5)
+    def annotate_together(gene_list):
+        barrier.wait()
+        return f"{gene_list[0]} cell"
+
+    adata = make_adata({'0': ['CD3E'], '1': ['MS4A1'], '2': ['LYZ']})
+    adict.ai_annotate(annotate_together, adata, 'leiden', 1, 'ai_cell_type', parallel=True)
+    assert list(adata.obs['ai_cell_type']) == ['CD3E cell', 'MS4A1 cell', 'LYZ cell']
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from anndict import ai
+
+
+async def get_usage():
+    await asyncio.sleep(0)
+    return ai._llm_usage.get()
+
+
+def test_run_async_without_running_loop():
+    with ai.track_llm_usage() as usage:
+        assert ai.run_async(get_usage()) is usage
+
+
+def test_run_async_inside_running_loop_keeps_context():
+    async def notebook_cell():
+        # As in Jupyter, where an event loop is already running
+        with ai.track_llm_usage() as usage:
+            return ai.run_async(get_usage()), usage
+
+    result, usage = asyncio.run(notebook_cell())
+    assert result is usage
+
+
+def run_local_calls(n_calls, latency=0.2):
+    backend = ai.LLMBackend('async_test', 'local', 'async-test', latency=latency)
+
+    async def main():
+        return await asyncio.gather(*[
+            ai.acall_llm([{'role': 'user', 'content': f"Request {i}"}], temperature=0, use_cache=False, backend=backend)
+            for i in range(n_calls)
+        ])
+
+    start = time.monotonic()
+    responses = ai.run_async(main())
+    return responses, time.monotonic() - start
+
+
+def test_acall_llm_runs_requests_concurrently():
+    responses, elapsed = run_local_calls(8)
+    assert len(responses) == 8 and all(isinstance(response, str) for response in responses)
+    assert elapsed < 0.2 * 4
+
+
+def test_configure_llm_concurrency_bounds_requests_in_flight():
+    ai.configure_llm_concurrency(2)
+    try:
+        _, elapsed = run_local_calls(6)
+    finally:
+        ai.configure_llm_concurrency(64)
+    assert elapsed >= 0.2 * 3
+
+
+def test_aretry_llm_call_falls_back_to_failure_handler(monkeypatch):
+    calls = []
+
+    async def acall_llm(messages, **kwargs):
+        calls.append(kwargs.get('temperature'))
+        return "not a number"
+
+    monkeypatch.setattr(ai, 'acall_llm', acall_llm)
+    result = asyncio.run(ai.aretry_llm_call(
+        messages=[{'role': 'user', 'content': 'Pick a number.'}],
+        process_response=int,
+        failure_handler=lambda: 'failed',
+        max_attempts=3,
+        call_llm_kwargs={'temperature': 0}
+    ))
+    assert result == 'failed'
+    assert len(calls) == 3
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from anndict import ai
+from anndict.dict import adata_dict_fapply_return
+
+
+@pytest.fixture
+def backends():
+    names = ['backend_a', 'backend_b']
+    for name in names:
+        ai.register_llm_backend(name, 'local', f"model-{name}", responder=lambda messages, request_hash, name=name: f"answer from {name}")
+    yield names
+    for name in names:
+        ai.unregister_llm_backend(name)
+
+
+def test_registry(backends):
+    assert set(backends) <= set(ai.list_llm_backends())
+    backend = ai.get_llm_backend('backend_a')
+    assert (backend.provider, backend.model) == ('local', 'model-backend_a')
+    assert ai.resolve_llm_backend('backend_a') is backend
+    assert ai.resolve_llm_backend(backend) is backend
+    ai.unregister_llm_backend('backend_a')
+    with pytest.raises(KeyError):
+        ai.get_llm_backend('backend_a')
+
+
+def test_unsupported_provider_raises():
+    with pytest.raises(ValueError):
+        ai.LLMBackend('unsupported', 'not-a-provider', 'model')
+
+
+def test_llm_is_constructed_once(backends):
+    backend = ai.get_llm_backend('backend_a')
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        llms = list(executor.map(lambda _: backend.get_llm(), range(8)))
+    assert all(llm is llms[0] for llm in llms)
+
+
+def test_backends_run_concurrently(backends):
+    messages = [{'role': 'user', 'content': 'Which cell type expresses COL1A1?'}]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {name: executor.submit(ai.call_llm, messages, temperature=0, use_cache=False, backend=name) for name in backends}
+    assert {name: future.result() for name, future in futures.items()} == {name: f"answer from {name}" for name in backends}
+
+
+def test_use_llm_backend_reaches_adata_dict_threads(backends):
+    def get_model(adata):
+        return ai.get_active_llm_config()['model']
+
+    with ai.use_llm_backend('backend_b'):
+        models = adata_dict_fapply_return({'x': None, 'y': None}, get_model)
+    assert models == {'x': 'model-backend_b', 'y': 'model-backend_b'}
+    assert ai.resolve_llm_backend() is None
@@ -0,0 +1,115 @@
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+
+import anndict.dict as adict
+from anndict import ai
+
+
+def make_adata():
+    adata = ad.AnnData(np.zeros((4, 1)), obs=pd.DataFrame({'cluster': pd.Categorical(list('0011')), 'reference': list('xxyy')}, index=list('abcd')))
+    adata.uns['rank_genes_groups'] = {'params': {'groupby': 'cluster'}}
+    return adata
+
+
+@pytest.fixture
+def tasks(monkeypatch):
+    """Replaces the benchmark tasks with stubs that copy the reference labels, and fail on strata named 'bad'. Returns their calls."""
+    calls = []
+
+    def annotate(adata_dict, groupby, n_top_genes, label_column, tissue_of_origin_col, backend):
+        calls.append('annotate')
+        results = {}
+        for adt_key, adata in adata_dict.items():
+            if adt_key == 'bad':
+                results[adt_key] = "Error: provider down"
+                continue
+            adata.obs[label_column] = adata.obs['reference']
+            results[adt_key] = pd.DataFrame({label_column: ['x', 'y']})
+        return results
+
+    def compare(adata_dict, cols1, cols2, new_col_prefix, comparison_level, backend):
+        calls.append('compare')
+        results = {}
+        for adt_key, adata in adata_dict.items():
+            if cols2[0] not in adata.obs:
+                results[adt_key] = f"Error: {cols2[0]} not found"
+                continue
+            adata.obs[f"{new_col_prefix}_{cols1[0]}_{cols2[0]}"] = (adata.obs[cols1[0]] == adata.obs[cols2[0]]).astype(int)
+            results[adt_key] = {}
+        return results
+
+    def kappa_adata(adata, cols):
+        adata.obs[cols]
+        return {'pairwise': {tuple(cols): 1.0}}
+
+    def krippendorff_alpha_adata(adata, cols):
+        adata.obs[cols]
+        return np.float64(1.0)
+
+    monkeypatch.setattr(adict, 'ai_annotate_cell_type_adata_dict', annotate)
+    monkeypatch.setattr(adict, 'ai_compare_cell_type_labels_pairwise_adata_dict', compare)
+    monkeypatch.setattr(adict, 'kappa_adata', kappa_adata)
+    monkeypatch.setattr(adict, 'krippendorff_alpha_adata', krippendorff_alpha_adata)
+    return calls
+
+
+@pytest.fixture
+def backend():
+    return ai.LLMBackend('benchmark_test', 'local', 'benchmark-test')
+
+
+def get_metric(results, task, adt_key, metric):
+    rows = results[(results['task'] == task) & (results['adt_key'] == adt_key) & (results['metric'] == metric)]
+    return rows['value'].item()
+
+
+def test_benchmark_reports_each_task(tasks, backend):
+    adata_dicts = {'dataset': {'good': make_adata()}}
+    results = adict.run_llm_benchmark([backend], adata_dicts, 'cluster', 'reference')
+    assert list(results.columns) == adict.BENCHMARK_RESULT_COLUMNS
+    assert get_metric(results, 'annotate', 'good', 'n_clusters') == 2
+    assert get_metric(results, 'compare', 'good', 'mean_agreement') == 1
+    assert get_metric(results, 'kappa', 'good', 'cohen_kappa') == 1
+    assert get_metric(results, 'krippendorff', 'good', 'krippendorff_alpha') == 1
+    assert get_metric(results, 'annotate', 'all', 'llm_calls') == 0
+    # The labels are copied to the original adata
+    assert 'ai_cell_type_benchmark_test' in adata_dicts['dataset']['good'].obs
+
+
+def test_failed_strata_are_reported_and_retried_on_resume(tasks, backend, tmp_path):
+    results_path = str(tmp_path / 'results.csv')
+    adata_dicts = {'dataset': {'good': make_adata(), 'bad': make_adata()}}
+    results = adict.run_llm_benchmark([backend], adata_dicts, 'cluster', 'reference', tasks=('annotate',), results_path=results_path)
+    assert np.isnan(get_metric(results, 'annotate', 'bad', 'n_clusters'))
+    assert get_metric(results, 'annotate', 'bad', 'error') == "Error: provider down"
+    assert get_metric(results, 'annotate', 'good', 'n_clusters') == 2
+    # The failed task is not persisted, so the next run retries it
+    assert not (tmp_path / 'results.csv').exists()
+    adict.run_llm_benchmark([backend], adata_dicts, 'cluster', 'reference', tasks=('annotate',), results_path=results_path)
+    assert tasks == ['annotate', 'annotate']
+
+
+def test_resume_skips_completed_tasks(tasks, backend, tmp_path):
+    results_path = str(tmp_path / 'results.csv')
+    adata_dicts = {'dataset': {'good': make_adata()}}
+    first = adict.run_llm_benchmark([backend], adata_dicts, 'cluster', 'reference', tasks=('annotate', 'compare'), results_path=results_path)
+    assert tasks == ['annotate', 'compare']
+    resumed = adict.run_llm_benchmark([backend], adata_dicts, 'cluster', 'reference', tasks=('annotate', 'compare'), results_path=results_path)
+    assert tasks == ['annotate', 'compare']
+    assert len(resumed) == len(first)
+
+
+def test_unknown_task_raises(backend):
+    with pytest.raises(ValueError):
+        adict.run_llm_benchmark([backend], {}, 'cluster', 'reference', tasks=('translate',))
+
+
+def test_get_benchmark_metrics():
+    get_metrics = lambda result: {'n': len(result)}
+    assert adict.get_benchmark_metrics([1, 2], list, get_metrics, ['n']) == {'n': 2}
+    metrics = adict.get_benchmark_metrics("Error: boom", list, get_metrics, ['n'])
+    assert np.isnan(metrics['n']) and metrics['error'] == "Error: boom"
+    metrics = adict.get_benchmark_metrics(None, list, get_metrics, ['n'])
+    assert np.isnan(metrics['n']) and 'None' in metrics['error']
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from anndict import ai
+
+
+GENE_LISTS = [['CD3E', 'CD8A'], ['MS4A1', 'CD79A'], ['LYZ', 'CD14']]
+
+
+@pytest.fixture
+def requests():
+    """Registers a backend that contrasts the gene sets and labels each gene set after its first gene. Returns its requests."""
+    requests = []
+    lock = threading.Lock()
+
+    def respond(messages, request_hash):
+        with lock:
+            requests.append(messages)
+        prompt = messages[-1]['content']
+        if prompt.startswith('Briefly compare'):
+            return 'They are immune cells.'
+        return f"{prompt.split(': ', 1)[1].split()[0]} cell"
+
+    ai.register_llm_backend('comparison_test', 'local', 'comparison-test', responder=respond)
+    yield requests
+    ai.unregister_llm_backend('comparison_test')
+
+
+def test_parallel_matches_sequential(requests):
+    sequential = ai.ai_cell_types_by_comparison(GENE_LISTS, backend='comparison_test')
+    parallel = ai.ai_cell_types_by_comparison(GENE_LISTS, backend='comparison_test', parallel=True, num_workers=2)
+    assert parallel == sequential == ['CD3E cell', 'MS4A1 cell', 'LYZ cell']
+
+
+def test_parallel_requests_share_only_the_contrast(requests):
+    ai.ai_cell_types_by_comparison(GENE_LISTS, backend='comparison_test', parallel=True)
+    contrast, *label_requests = requests
+    assert len(contrast) == 2 and len(label_requests) == 3
+    for messages in label_requests:
+        assert len(messages) == 5
+        assert messages[2] == {'role': 'assistant', 'content': 'They are immune cells.'}
+        assert messages[:4] == label_requests[0][:4]
+    assert sorted(messages[-1]['content'].split(': ')[1].rstrip('?') for messages in label_requests) == sorted('    '.join(genes) for genes in GENE_LISTS)
+
+
+def test_sequential_conversation_grows(requests):
+    ai.ai_cell_types_by_comparison(GENE_LISTS, backend='comparison_test')
+    assert [len(messages) for messages in requests] == [2, 5, 7, 9]
@@ -0,0 +1,60 @@
+import difflib
+import random
+
+import pytest
+
+from anndict import ai
+from anndict.utils import get_closest_matches
+
+
+CELL_TYPES = ['t cell', 'b cell', 'natural killer cell', 'macrophage', 'monocyte', 'dendritic cell', 'fibroblast',
+              'endothelial cell', 'epithelial cell', 'hepatocyte', 'neutrophil', 'mast cell', 'plasma cell']
+
+
+def get_close_match(word, possibilities, cutoff):
+    matches = difflib.get_close_matches(word, possibilities, n=1, cutoff=cutoff)
+    return matches[0] if matches else None
+
+
+def mutate(rng, word):
+    chars = list(word)
+    for _ in range(rng.randint(0, 4)):
+        i = rng.randrange(len(chars) + 1)
+        operation = rng.choice(['insert', 'delete', 'replace'])
+        if operation == 'insert' or not chars:
+            chars.insert(i, rng.choice('abcdefghijklmnopqrstuvwxyz +-'))
+        elif i < len(chars):
+            if operation == 'delete':
+                del chars[i]
+            else:
+                chars[i] = rng.choice('abcdefghijklmnopqrstuvwxyz0')
+    return ''.join(chars)
+
+
+@pytest.mark.parametrize('cutoff', [0, 0.6, 0.8, 1])
+def test_matches_difflib(cutoff):
+    rng = random.Random(0)
+    words = [mutate(rng, rng.choice(CELL_TYPES)) for _ in range(300)] + ['', 'xyz', 'cell']
+    possibilities = CELL_TYPES + [mutate(rng, rng.choice(CELL_TYPES)) for _ in range(30)] + ['', 'cell']
+    expected = [get_close_match(word, possibilities, cutoff) for word in words]
+    assert get_closest_matches(words, possibilities, cutoff) == expected
+
+
+def test_ties_and_duplicates():
+    # 'ab' and 'ac' match 'a' equally well; get_close_matches returns the larger string
+    possibilities = ['ab', 'ac', 'ab']
+    assert get_closest_matches(['a', 'a'], possibilities, cutoff=0.5) == [get_close_match('a', possibilities, 0.5)] * 2
+
+
+def test_empty_inputs():
+    assert get_closest_matches(['t cell', 'b cell'], []) == [None, None]
+    assert get_closest_matches([], CELL_TYPES) == []
+
+
+def test_process_llm_category_mapping():
+    llm_dict = {'T Cell': 'lymphocyte', 'Macrophage': 'myeloid cell'}
+    mapping = ai.process_llm_category_mapping(['T-cell', 'macrophages', 'hepatocyte'], llm_dict)
+    assert mapping == {'T-cell': 'lymphocyte', 'macrophages': 'myeloid cell', 'hepatocyte': 'hepatocyte'}
+    with ai.track_failed_mapping_labels() as failed_labels:
+        ai.process_llm_category_mapping(['T-cell', 'hepatocyte'], llm_dict)
+    assert failed_labels == {'hepatocyte'}
@@ -0,0 +1,102 @@
+import re
+import threading
+
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+
+import anndict.dict as adict
+from anndict import ai
+
+
+def same_cell_type(label1, label2):
+    return label1.split()[0].lower() == label2.split()[0].lower()
+
+
+class Comparer:
+    """Responder that answers single and numbered pair comparisons by the first word of the labels, and records its prompts."""
+    def __init__(self, comparison_level='binary', fail_batches=False):
+        self.answers = ('yes', 'no') if comparison_level == 'binary' else ('partial match', 'no match')
+        self.fail_batches = fail_batches
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def __call__(self, messages, request_hash):
+        prompt = messages[-1]['content'].rstrip().removesuffix('->').rstrip()
+        with self.lock:
+            self.prompts.append(prompt)
+        pairs = re.findall(r'^(?:(\d+): )?1\) (.+?) 2\) (.+)$', prompt, flags=re.MULTILINE)
+        if len(pairs) == 1 and not pairs[0][0]:
+            return self.answers[0] if same_cell_type(*pairs[0][1:]) else self.answers[1]
+        if self.fail_batches:
+            return "I am not sure."
+        return '\n'.join(f"{i}: {self.answers[0] if same_cell_type(label1, label2) else self.answers[1]}" for i, label1, label2 in pairs)
+
+    @property
+    def batch_prompts(self):
+        return [prompt for prompt in self.prompts if prompt.startswith('1: ')]
+
+
+@pytest.fixture
+def comparer():
+    comparer = Comparer()
+    ai.register_llm_backend('compare_pairs_test', 'local', 'compare-pairs-test', responder=comparer)
+    yield comparer
+    ai.unregister_llm_backend('compare_pairs_test')
+
+
+PAIRS = [('T cell', 'T cells'), ('T cell', 'B cell'), ('B cell', 'T cell'), ('macrophage', 'Macrophage.'), ('CD4 T cell', 'CD4 T-cell'), ('B cell', 'Macrophage')]
+
+
+def test_pairs_are_compared_in_batches(comparer):
+    answers = ai.ai_compare_cell_type_pairs(PAIRS, batch_size=2, backend='compare_pairs_test')
+    assert answers == ['yes', 'no', 'no', 'yes', 'yes', 'no']
+    # Equal normalized labels are answered locally, and ('T cell', 'B cell') is compared once
+    compared = [line for prompt in comparer.prompts for line in prompt.split('\n')]
+    assert len(compared) == 4
+    assert len(comparer.batch_prompts) == 2
+    assert not any('acrophage.' in line for line in compared)
+
+
+def test_categorical(comparer):
+    comparer.answers = ('partial match', 'no match')
+    answers = ai.ai_compare_cell_type_pairs(PAIRS, comparison_level='categorical', backend='compare_pairs_test')
+    assert answers == ['partial match', 'no match', 'no match', 'perfect match', 'partial match', 'no match']
+
+
+def test_unparseable_batches_fall_back_to_single_pairs(comparer):
+    comparer.fail_batches = True
+    answers = ai.ai_compare_cell_type_pairs(PAIRS, batch_size=10, backend='compare_pairs_test')
+    assert answers == ['yes', 'no', 'no', 'yes', 'yes', 'no']
+    assert len(comparer.batch_prompts) == 3
+
+
+def test_invalid_comparison_level():
+    with pytest.raises(ValueError):
+        ai.ai_compare_cell_type_pairs(PAIRS, comparison_level='ternary')
+
+
+@pytest.mark.parametrize('response, comparison_level, expected', [
+    ("1: yes\n2. No\n3) yes, same type", 'binary', ['yes', 'no', 'yes']),
+    ("1: no match\n2: partial match\n3: Perfect match", 'categorical', ['no match', 'partial match', 'perfect match']),
+])
+def test_process_pair_comparison_response(response, comparison_level, expected):
+    assert ai.process_pair_comparison_response(response, 3, comparison_level) == expected
+
+
+def test_process_pair_comparison_response_requires_every_answer():
+    with pytest.raises(ValueError):
+        ai.process_pair_comparison_response("1: yes\n3: no", 3)
+
+
+def test_pairwise_batched_matches_single_calls(comparer):
+    obs = pd.DataFrame({
+        'model_a': ['T cell', 'B cell', 'Macrophage', 'T cell'],
+        'model_b': ['T cells', 'T cell', 'macrophage', 'B cell'],
+    }, index=[f"cell_{i}" for i in range(4)])
+    adata = ad.AnnData(np.zeros((4, 1)), obs=obs)
+    adict.ai_compare_cell_type_labels_pairwise(adata, ['model_a'], ['model_b'], new_col_prefix='single', backend='compare_pairs_test')
+    adict.ai_compare_cell_type_labels_pairwise(adata, ['model_a'], ['model_b'], new_col_prefix='batched', backend='compare_pairs_test', batched=True)
+    assert list(adata.obs['batched_model_a_model_b']) == [1, 0, 1, 0]
+    assert adata.obs['batched_model_a_model_b'].equals(adata.obs['single_model_a_model_b'])
@@ -0,0 +1,61 @@
+import inspect
+import os
+import sys
+
+import anndata as ad
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+import anndict.dict as adict
+
+matplotlib.use('Agg')
+
+
+def make_adata(n_obs=20):
+    adata = ad.AnnData(np.ones((n_obs, 5)))
+    adata.obs_names = [f"cell{i}" for i in range(n_obs)]
+    adata.obs['label'] = pd.Categorical(np.tile(['a', 'b'], n_obs // 2))
+    adata.obs['other'] = np.arange(n_obs)
+    adata.obsm['X_umap'] = np.zeros((n_obs, 2))
+    adata.uns['label_colors'] = ['#ff0000', '#0000ff']
+    return adata
+
+
+def plot_label_counts(adata):
+    """Module-level (picklable) plotting function that only uses obs['label']."""
+    assert adata.n_vars == 0
+    assert list(adata.obs.columns) == ['label']
+    fig, ax = plt.subplots()
+    adata.obs['label'].value_counts().plot.bar(ax=ax)
+    return fig
+
+
+def test_get_export_adata_keeps_only_requested_fields():
+    export_adata = adict.get_export_adata(make_adata(), ['label'], ['X_umap', 'X_pca'])
+    assert export_adata.n_obs == 20 and export_adata.n_vars == 0
+    assert list(export_adata.obs.columns) == ['label']
+    assert list(export_adata.obsm.keys()) == ['X_umap']
+    assert list(export_adata.uns.keys()) == ['label_colors']
+
+
+def test_export_sends_only_obs_keys_to_workers(tmp_path):
+    adata_dict = {'x': make_adata(), ('y', 'z'): make_adata()}
+    paths = adict.adata_dict_fapply_export(adata_dict, plot_label_counts, str(tmp_path), prefix='counts_', num_workers=2, obs_keys=['label'])
+    assert list(paths) == ['x', ('y', 'z')]
+    assert paths['x'] == os.path.join(str(tmp_path), 'counts_x.png')
+    assert paths[('y', 'z')] == os.path.join(str(tmp_path), 'counts_y_z.png')
+    assert all(os.path.exists(path) for path in paths.values())
+
+
+def test_export_formats_default_to_png():
+    for func in (adict.plot_umap_adata_dict, adict.plot_changes_adata_dict, adict.plot_confusion_matrix_adata_dict, adict.plot_sankey_adata_dict):
+        assert inspect.signature(func).parameters['file_format'].default == 'png'
+
+
+def test_sankey_export_without_selenium_raises(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'selenium', None)
+    with pytest.raises(ImportError, match='selenium'):
+        adict.plot_sankey_adata_dict({'x': make_adata()}, cols=['label', 'other'], directory=str(tmp_path))
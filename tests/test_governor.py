@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+import pytest
+
+from anndict.ai import LLMBackend, LLMGovernor, call_llm, configure_llm_governor, get_llm_governor
+
+
+class OverloadError(Exception):
+    status_code = 429
+
+
+def test_request_releases_slot():
+    governor = LLMGovernor(requests_per_minute=600)
+    with governor.request():
+        assert governor.stats()['in_flight'] == 1
+    assert governor.stats()['in_flight'] == 0
+
+
+def test_overload_error_pauses_and_slows_down():
+    governor = LLMGovernor(requests_per_minute=600)
+    with pytest.raises(OverloadError):
+        with governor.request():
+            raise OverloadError("Too many requests")
+    stats = governor.stats()
+    assert stats['in_flight'] == 0
+    assert stats['overload_errors'] == 1
+    assert stats['slowdown'] == 2
+    assert stats['paused_for'] > 0
+
+
+def test_keyboard_interrupt_releases_slot():
+    governor = LLMGovernor(requests_per_minute=600)
+    with pytest.raises(KeyboardInterrupt):
+        with governor.request():
+            raise KeyboardInterrupt
+    assert governor.stats()['in_flight'] == 0
+    assert governor.stats()['overload_errors'] == 0
+
+
+def test_cancelled_async_request_releases_slot():
+    governor = LLMGovernor(requests_per_minute=600, max_concurrency=1)
+
+    async def hold_slot(started):
+        async with governor.arequest():
+            started.set()
+            await asyncio.sleep(60)
+
+    async def main():
+        started = asyncio.Event()
+        task = asyncio.create_task(hold_slot(started))
+        await started.wait()
+        assert governor.stats()['in_flight'] == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert governor.stats()['in_flight'] == 0
+        # The slot is free for the next request
+        async with governor.arequest():
+            pass
+
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'requests_per_minute': 0},
+    {'requests_per_minute': -1},
+    {'tokens_per_minute': -1},
+    {'max_bucket_size': 0.5},
+])
+def test_invalid_limits_raise(kwargs):
+    with pytest.raises(ValueError):
+        LLMGovernor(**kwargs)
+
+
+def test_low_rate_still_grants_requests():
+    governor = LLMGovernor(requests_per_minute=0.5)
+    with governor.request():
+        pass
+
+
+def test_unlimited_governor_does_not_pause_on_overload():
+    governor = LLMGovernor(requests_per_minute=None)
+    for _ in range(100):
+        with governor.request():
+            pass
+    with pytest.raises(OverloadError):
+        with governor.request():
+            raise OverloadError("Service unavailable")
+    stats = governor.stats()
+    assert stats['overload_errors'] == 1
+    assert stats['slowdown'] == 1
+    assert stats['paused_for'] == 0
+
+
+def test_local_provider_governor_is_unlimited_by_default():
+    assert get_llm_governor({'provider': 'local', 'model': 'governor-test'}).requests_per_minute is None
+    limited = get_llm_governor({'provider': 'local', 'model': 'governor-test-limited', 'requests_per_minute': 30})
+    assert limited.requests_per_minute == 30
+
+
+def test_local_provider_errors_do_not_throttle_later_calls():
+    backend = LLMBackend('governor_test', 'local', 'governor-test-errors', error_rate=1)
+    messages = [{'role': 'user', 'content': 'Which cell type expresses COL1A1?'}]
+    start = time.monotonic()
+    for _ in range(3):
+        with pytest.raises(Exception):
+            call_llm(messages, use_cache=False, temperature=0, max_transport_attempts=1, backend=backend)
+    assert time.monotonic() - start < 1
+    assert get_llm_governor(backend.get_config()).stats()['paused_for'] == 0
+
+
+def test_request_rate_is_limited_after_burst():
+    governor = LLMGovernor(requests_per_minute=600, max_bucket_size=2)
+    start = time.monotonic()
+    for _ in range(4):
+        with governor.request():
+            pass
+    # Two requests go through at once, the other two at 10 per second
+    assert 0.15 <= time.monotonic() - start < 1
+
+
+def test_token_rate_is_limited():
+    governor = LLMGovernor(requests_per_minute=6000, tokens_per_minute=60000)
+    start = time.monotonic()
+    for _ in range(2):
+        with governor.request(tokens=600):
+            pass
+    assert time.monotonic() - start < 0.5
+    # A request of the whole bucket waits for the 1200 tokens used so far to refill
+    with governor.request(tokens=60000):
+        pass
+    assert time.monotonic() - start >= 1
+
+
+def test_max_concurrency_is_enforced():
+    governor = LLMGovernor(requests_per_minute=6000, max_concurrency=1, check_every_n_seconds=0.01)
+    with governor.request():
+        assert governor._try_acquire(0) > 0
+    assert governor._try_acquire(0) == 0
+    governor.release()
+
+
+def test_configure_llm_governor_replaces_governor():
+    governor = configure_llm_governor('openai', 'governor-test', requests_per_minute=120, max_concurrency=4)
+    assert get_llm_governor({'provider': 'openai', 'model': 'governor-test'}) is governor
+    assert governor.max_concurrency == 4
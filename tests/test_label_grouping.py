@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from anndict import ai
+from anndict.utils import canonicalize_label, group_similar_labels
+
+
+@pytest.mark.parametrize('label, canonical', [
+    ('CD4+ T cells', 'cd4 positive t cell'),
+    ('CD4-positive T cell', 'cd4 positive t cell'),
+    ('Natural_Killer Cells', 'natural killer cell'),
+    ('Capillaries', 'capillary'),
+    ('Plasma cell (class switched)', 'plasma cell class switched'),
+    (np.nan, 'missing'),
+])
+def test_canonicalize_label(label, canonical):
+    assert canonicalize_label(label) == canonical
+
+
+def test_groups_trivial_variants():
+    labels = ['CD4+ T cells', 'CD4-positive T cell', 'cd4 positive t-cell', 'Fibroblasts', 'fibroblast', 'fibroblastt']
+    groups = group_similar_labels(labels, threshold=0.8)
+    assert {groups[label] for label in labels[:3]} == {'CD4+ T cells'}
+    assert {groups[label] for label in labels[3:]} == {'fibroblast'}
+
+
+def test_keeps_distinct_labels_apart():
+    labels = ['CD4+ T cell', 'CD8+ T cell', 'B cell', 'T cell', 'CD4- T cell', 'Type I pneumocyte', 'Type II pneumocyte']
+    groups = group_similar_labels(labels, threshold=0.5)
+    assert groups == {label: label for label in labels}
+
+
+def test_threshold_one_only_groups_canonical_forms():
+    groups = group_similar_labels(['Fibroblasts', 'fibroblast', 'fibroblastt'], threshold=1)
+    assert groups == {'Fibroblasts': 'fibroblast', 'fibroblast': 'fibroblast', 'fibroblastt': 'fibroblastt'}
+
+
+def test_empty():
+    assert group_similar_labels([]) == {}
+
+
+def test_only_representatives_are_sent_to_the_llm():
+    sent_labels = []
+
+    def respond(messages, request_hash):
+        prompt = messages[-1]['content']
+        if 'Generate only a dictionary:' not in prompt:
+            return 'Acknowledged'
+        labels = [label.strip() for label in prompt.split('Generate only a dictionary:', 1)[1].rsplit('->', 1)[0].split('    ') if label.strip()]
+        sent_labels.extend(labels)
+        return str({label: label.upper() for label in labels})
+
+    backend = ai.LLMBackend('label_grouping_test', 'local', 'label-grouping-test', responder=respond)
+    labels = ['Fibroblasts', 'fibroblast', 'Macrophage', 'macrophages']
+    mapping = ai.map_cell_type_labels_to_simplified_set(labels, backend=backend, group_threshold=0.9, use_mapping_store=False)
+    assert sorted(sent_labels) == ['Macrophage', 'fibroblast']
+    assert mapping == {'Fibroblasts': 'FIBROBLAST', 'fibroblast': 'FIBROBLAST', 'Macrophage': 'MACROPHAGE', 'macrophages': 'MACROPHAGE'}
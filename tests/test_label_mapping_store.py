@@ -0,0 +1,118 @@
+import pytest
+
+from anndict import ai
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ai.configure_label_mapping_store(str(tmp_path / 'label_mappings.sqlite'))
+    yield store
+    ai.configure_label_mapping_store(enabled=False)
+
+
+def fake_call_llm(mapping_response):
+    """Returns a call_llm replacement that acknowledges the label list and answers every batch with mapping_response."""
+    def call_llm(messages, **kwargs):
+        if 'Acknowledge' in messages[-1]['content']:
+            return "Acknowledged."
+        return mapping_response
+    return call_llm
+
+
+def test_successful_batch_is_stored(store, monkeypatch):
+    monkeypatch.setattr(ai, 'call_llm', fake_call_llm("{'Tregs': 'T cell', 'CD8 T cells': 'T cell'}"))
+    mapping = ai.map_cell_type_labels_to_simplified_set(['Tregs', 'CD8 T cells'], 'compartment-level')
+    assert mapping == {'Tregs': 'T cell', 'CD8 T cells': 'T cell'}
+    assert store.get_many(['Tregs', 'CD8 T cells'], 'compartment-level') == mapping
+
+
+def test_failed_batch_leaves_store_unchanged(store, monkeypatch):
+    monkeypatch.setattr(ai, 'call_llm', fake_call_llm("Sorry, I can't help with that."))
+    mapping = ai.map_cell_type_labels_to_simplified_set(['Tregs', 'CD8 T cells'], 'compartment-level')
+    assert mapping == {'Tregs': 'Tregs', 'CD8 T cells': 'CD8 T cells'}
+    assert store.get_many(['Tregs', 'CD8 T cells'], 'compartment-level') == {}
+    assert store.versions().empty
+
+
+def test_failed_gene_batch_leaves_store_unchanged(store, monkeypatch):
+    monkeypatch.setattr(ai, 'call_llm', fake_call_llm("not a dictionary"))
+    mapping = ai.map_gene_labels_to_simplified_set(['HSPA1A', 'IL6'], 'pathway-level')
+    assert mapping == {'HSPA1A': 'HSPA1A', 'IL6': 'IL6'}
+    assert store.get_many(['HSPA1A', 'IL6'], 'pathway-level', 'gene') == {}
+
+
+def test_unmatched_labels_are_not_stored(store, monkeypatch):
+    monkeypatch.setattr(ai, 'call_llm', fake_call_llm("{'Tregs': 'T cell'}"))
+    mapping = ai.map_cell_type_labels_to_simplified_set(['Tregs', 'Kupffer cells'], 'compartment-level')
+    assert mapping == {'Tregs': 'T cell', 'Kupffer cells': 'Kupffer cells'}
+    assert store.get_many(['Tregs', 'Kupffer cells'], 'compartment-level') == {'Tregs': 'T cell'}
+
+
+def test_failed_parallel_batch_leaves_store_unchanged(store, monkeypatch):
+    monkeypatch.setattr(ai, 'call_llm', fake_call_llm("no mapping"))
+    labels = ['Tregs', 'CD8 T cells', 'B cells']
+    mapping = ai.map_cell_type_labels_to_simplified_set(labels, 'compartment-level', batch_size=1, parallel=True)
+    assert mapping == {label: label for label in labels}
+    assert store.get_many(labels, 'compartment-level') == {}
+
+
+def test_stored_labels_are_not_sent_again(store, monkeypatch):
+    store.put_many({'Tregs': 'T cell'}, 'compartment-level')
+    sent = []
+    def call_llm(messages, **kwargs):
+        sent.append(messages[-1]['content'])
+        return fake_call_llm("{'B cells': 'B cell'}")(messages, **kwargs)
+    monkeypatch.setattr(ai, 'call_llm', call_llm)
+    mapping = ai.map_cell_type_labels_to_simplified_set(['Tregs', 'B cells'], 'compartment-level')
+    assert mapping == {'Tregs': 'T cell', 'B cells': 'B cell'}
+    assert not any('Tregs' in content for content in sent)
+
+
+def test_versions(store):
+    first = store.put_many({'Tregs': 'T cell', 'B cells': 'B cell'}, 'compartment-level')
+    # Unchanged mappings do not create a version
+    assert store.put_many({'Tregs': 'T cell'}, 'compartment-level') is None
+    second = store.put_many({'Tregs': 'Regulatory T cell'}, 'compartment-level')
+    assert second > first
+    assert store.get_many(['Tregs', 'B cells'], 'compartment-level') == {'Tregs': 'Regulatory T cell', 'B cells': 'B cell'}
+    assert store.get_many(['Tregs', 'B cells'], 'compartment-level', version=first) == {'Tregs': 'T cell', 'B cells': 'B cell'}
+    assert store.get_many(['Tregs'], 'compartment-level', version=first - 1) == {}
+    assert list(store.versions()['n_mappings']) == [2, 1]
+    assert store.get_targets('compartment-level') == {'T cell', 'Regulatory T cell', 'B cell'}
+    # Levels and kinds are separate
+    assert store.get_many(['Tregs'], 'unified') == {}
+    assert store.get_many(['Tregs'], 'compartment-level', 'gene') == {}
+
+
+def test_overrides_and_tombstones(store):
+    learned = store.put_many({'Tregs': 'T cell'}, 'compartment-level')
+    override = store.set_overrides({'Tregs': 'Regulatory T cell'}, 'compartment-level')
+    # Overrides take precedence over later learned mappings
+    store.put_many({'Tregs': 'Lymphocyte'}, 'compartment-level')
+    assert store.get_many(['Tregs'], 'compartment-level') == {'Tregs': 'Regulatory T cell'}
+
+    removal = store.remove_overrides(['Tregs', 'B cells'], 'compartment-level')
+    assert store.get_many(['Tregs'], 'compartment-level') == {'Tregs': 'Lymphocyte'}
+    assert store.remove_overrides(['Tregs'], 'compartment-level') is None
+    # Earlier versions still read back the override
+    assert store.get_many(['Tregs'], 'compartment-level', version=removal - 1) == {'Tregs': 'Regulatory T cell'}
+    assert store.get_many(['Tregs'], 'compartment-level', version=learned) == {'Tregs': 'T cell'}
+    assert override > learned
+
+    history = store.to_dataframe('compartment-level')
+    assert len(history) == 4
+    tombstone = history[history['version'] == removal].iloc[0]
+    assert tombstone['override'] == 1 and tombstone['target'] is None
+    assert list(store.versions()['origin']) == ['llm', 'override', 'llm', 'remove_override']
+
+
+def test_store_persists(tmp_path):
+    path = str(tmp_path / 'label_mappings.sqlite')
+    store = ai.LabelMappingStore(path)
+    store.put_many({'Tregs': 'T cell'})
+    store.close()
+    store = ai.LabelMappingStore(path)
+    assert store.get_many(['Tregs']) == {'Tregs': 'T cell'}
+    store.clear()
+    assert store.get_many(['Tregs']) == {} and store.versions().empty
+    store.close()
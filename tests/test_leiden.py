@@ -0,0 +1,83 @@
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.sparse import block_diag, csr_matrix
+
+import anndict.dict as adict
+
+pytest.importorskip('igraph')
+pytest.importorskip('leidenalg')
+
+
+def make_adata(n_cliques=3, clique_size=10):
+    """AnnData whose neighbor graph is n_cliques disjoint cliques, each split in two groups of obs['group']."""
+    clique = np.ones((clique_size, clique_size)) - np.eye(clique_size)
+    n_obs = n_cliques * clique_size
+    adata = ad.AnnData(np.zeros((n_obs, 2)))
+    adata.obs_names = [f"cell{i}" for i in range(n_obs)]
+    adata.obsp['connectivities'] = csr_matrix(block_diag([clique] * n_cliques))
+    adata.obs['group'] = pd.Categorical(np.tile(['a', 'b'], n_obs // 2))
+    return adata
+
+
+def test_sweep_key_uses_shortest_resolution():
+    assert adict.get_leiden_sweep_key('leiden', 0.1 + 0.2) == 'leiden_0.3'
+    assert adict.get_leiden_sweep_key('leiden', 1.0) == 'leiden_1'
+
+
+def test_leiden_resolution_sweep_columns():
+    adata = make_adata()
+    summary = adict.leiden_resolution_sweep(adata, [0.1 + 0.2, 1.0], use_multiprocessing=False)
+    assert list(summary['key']) == ['leiden_0.3', 'leiden_1']
+    assert {'leiden_0.3', 'leiden_1'} <= set(adata.obs.columns)
+    assert summary.loc[summary['key'] == 'leiden_1', 'n_clusters'].item() == 3
+    assert adata.uns['leiden_sweep'] is summary
+
+
+def test_leiden_resolution_sweep_adata_dict():
+    adata_dict = {'x': make_adata(), 'y': make_adata(n_cliques=2)}
+    summaries = adict.leiden_resolution_sweep_adata_dict(adata_dict, [1.0])
+    assert summaries['x']['n_clusters'].tolist() == [3]
+    assert summaries['y']['n_clusters'].tolist() == [2]
+
+
+def test_sweep_lookup_matches_written_columns(monkeypatch):
+    adata = make_adata()
+    plotted = []
+    monkeypatch.setattr(adict, 'ai_interpret_umap_resolution', lambda adata, key, **kwargs: plotted.append(key))
+    monkeypatch.setattr(adict, 'determine_sign_of_resolution_change', lambda annotation: 0)
+    resolution = adict.ai_determine_leiden_resolution_from_sweep(adata, 0.3, [0.1 + 0.2, 1.0], use_multiprocessing=False)
+    assert resolution == pytest.approx(0.3)
+    assert plotted == ['leiden_0.3']
+    assert 'leiden_0.3' in adata.obs
+
+
+@pytest.mark.parametrize('use_multiprocessing', [False, True])
+def test_leiden_sub_cluster_graph_only(use_multiprocessing):
+    adata = make_adata()
+    X = adata.X
+    result = adict.leiden_sub_cluster(adata, 'group', graph_only=True, key_added='sub', use_multiprocessing=use_multiprocessing)
+    assert result is adata
+    assert adata.X is X
+    assert list(adata.obs_names) == [f"cell{i}" for i in range(adata.n_obs)]
+    # Within each group, the cells of each clique form one sub-cluster
+    sub_clusters = adata.obs.groupby(['group', 'sub'], observed=True).size()
+    assert (sub_clusters == 5).all()
+    assert list(adata.obs['sub'].cat.categories) == ['0', '1', '2']
+    assert adata.uns['sub']['params']['groupby'] == 'group'
+
+
+def test_leiden_sub_cluster_graph_only_matches_between_modes():
+    sequential, parallel = make_adata(), make_adata()
+    adict.leiden_sub_cluster_graph_only(sequential, 'group', use_multiprocessing=False)
+    adict.leiden_sub_cluster_graph_only(parallel, 'group', use_multiprocessing=True, num_workers=2)
+    assert sequential.obs['leiden'].equals(parallel.obs['leiden'])
+
+
+def test_leiden_sub_cluster_graph_only_adata_dict():
+    adata_dict = {'x': make_adata(), 'y': make_adata(n_cliques=2)}
+    adict.leiden_sub_cluster_adata_dict(adata_dict, 'group', graph_only=True, key_added='sub')
+    for adata in adata_dict.values():
+        assert adata.obs['sub'].notna().all()
+        assert list(adata.obs_names) == [f"cell{i}" for i in range(adata.n_obs)]
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from anndict import ai
+
+
+def test_memory_cache_hits_and_misses():
+    cache = ai.LLMResponseCache()
+    assert cache.get('key') is None
+    cache.set('key', 'response')
+    assert cache.get('key') == 'response'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = ai.LLMResponseCache(max_memory_entries=2)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    cache.get('a')
+    cache.set('c', '3')
+    assert cache.get('b') is None
+    assert cache.get('a') == '1' and cache.get('c') == '3'
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    ai.LLMResponseCache(path).set('key', 'response')
+    assert ai.LLMResponseCache(path).get('key') == 'response'
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ai.LLMResponseCache(str(tmp_path / 'cache.sqlite'), ttl=0.05)
+    cache.set('key', 'response')
+    time.sleep(0.1)
+    assert cache.get('key') is None
+
+
+def test_invalidate_and_clear(tmp_path):
+    cache = ai.LLMResponseCache(str(tmp_path / 'cache.sqlite'))
+    cache.set('a', '1')
+    cache.set('b', '2')
+    cache.invalidate('a')
+    assert cache.get('a') is None and cache.get('b') == '2'
+    cache.clear()
+    assert cache.get('b') is None
+
+
+def test_request_key_depends_on_request():
+    messages = [{'role': 'user', 'content': 'Which cell type expresses COL1A1?'}]
+    key = ai.get_llm_request_key(messages, provider='openai', model='gpt-4o', temperature=0)
+    assert key == ai.get_llm_request_key(list(messages), provider='openai', model='gpt-4o', temperature=0)
+    assert key != ai.get_llm_request_key(messages, provider='openai', model='gpt-4o-mini', temperature=0)
+    assert key != ai.get_llm_request_key(messages, provider='openai', model='gpt-4o', temperature=0.5)
+    assert key != ai.get_llm_request_key([{'role': 'user', 'content': 'Which cell type expresses CD3E?'}], provider='openai', model='gpt-4o', temperature=0)
+    # Arguments that control how the call is made don't change what is generated
+    assert key == ai.get_llm_request_key(messages, provider='openai', model='gpt-4o', temperature=0, use_cache=False, max_transport_attempts=2)
+
+
+@pytest.fixture
+def cache():
+    cache = ai.configure_llm_cache()
+    yield cache
+    ai.configure_llm_cache(enabled=False)
+
+
+def test_call_llm_answers_repeated_requests_from_cache(cache):
+    calls = []
+    backend = ai.LLMBackend('cache_test', 'local', 'cache-test', responder=lambda messages, request_hash: calls.append(1) or 'Fibroblast')
+    messages = [{'role': 'user', 'content': 'Which cell type expresses COL1A1?'}]
+    assert ai.call_llm(messages, temperature=0, backend=backend) == 'Fibroblast'
+    assert ai.call_llm(messages, temperature=0, backend=backend) == 'Fibroblast'
+    assert len(calls) == 1
+    ai.call_llm(messages, temperature=0, use_cache=False, backend=backend)
+    assert len(calls) == 2
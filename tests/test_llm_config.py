@@ -0,0 +1,90 @@
+import json
+import os
+
+import pytest
+
+from anndict import ai
+
+
+@pytest.fixture
+def llm_config(monkeypatch):
+    """Restores the LLM configuration and environment variables changed by configure_llm_backend."""
+    for key in list(os.environ):
+        if key.startswith('LLM_'):
+            monkeypatch.setenv(key, os.environ[key])
+    monkeypatch.setattr(ai, '_llm_config_snapshot', None)
+    monkeypatch.setattr(ai, '_llm_instance', ai._llm_instance)
+    yield
+    for key in list(os.environ):
+        if key.startswith('LLM_'):
+            del os.environ[key]
+
+
+@pytest.fixture
+def response_log(tmp_path):
+    path = tmp_path / 'response.jsonl'
+    ai.configure_llm_response_log(path=str(path))
+    yield path
+    ai.configure_llm_response_log(enabled=False)
+
+
+def read_response_log(path):
+    ai.stop_llm_response_log()
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_config_is_a_snapshot(llm_config):
+    ai.configure_llm_backend('local', 'config-test', latency=0)
+    config = ai.get_llm_config()
+    assert (config['provider'], config['model']) == ('local', 'config-test')
+    assert ai.get_llm_config() is config
+    with pytest.raises(TypeError):
+        config['model'] = 'other'
+
+    # Environment variables changed by other means are picked up at the next configure_llm_backend
+    os.environ['LLM_MODEL'] = 'changed'
+    assert ai.get_llm_config()['model'] == 'config-test'
+    ai.configure_llm_backend('local', 'reconfigured')
+    assert ai.get_llm_config() is not config
+    assert ai.get_llm_config()['model'] == 'reconfigured'
+
+
+def test_unsupported_provider_raises(llm_config):
+    with pytest.raises(ValueError):
+        ai.configure_llm_backend('not-a-provider', 'model')
+
+
+def test_response_log(response_log):
+    backend = ai.LLMBackend('response_log_test', 'local', 'response-log-test', responder=lambda messages, request_hash: 'Fibroblast')
+    messages = [{'role': 'user', 'content': 'Which cell type expresses COL1A1?'}]
+    assert ai.call_llm(messages, backend=backend, use_cache=False, temperature=0) == 'Fibroblast'
+
+    [entry] = read_response_log(response_log)
+    assert entry['provider'] == 'local' and entry['model'] == 'response-log-test'
+    assert entry['request_hash'] == ai.get_llm_request_hash(messages, backend.get_config(), temperature=0)
+    assert entry['response'] == 'Fibroblast'
+    assert entry['latency'] >= 0 and entry['input_tokens'] > 0 and entry['output_tokens'] > 0
+    assert 'timestamp' in entry
+
+
+def test_response_log_rotates(tmp_path):
+    path = tmp_path / 'response.jsonl'
+    ai.configure_llm_response_log(path=str(path), max_bytes=200, backup_count=2)
+    try:
+        backend = ai.LLMBackend('response_log_test', 'local', 'response-log-test')
+        for i in range(10):
+            ai.call_llm([{'role': 'user', 'content': f"Question {i}"}], backend=backend, use_cache=False, temperature=0)
+        ai.stop_llm_response_log()
+    finally:
+        ai.configure_llm_response_log(enabled=False)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['response.jsonl', 'response.jsonl.1', 'response.jsonl.2']
+
+
+def test_response_log_can_be_disabled(tmp_path):
+    path = tmp_path / 'response.jsonl'
+    ai.configure_llm_response_log(enabled=False, path=str(path))
+    backend = ai.LLMBackend('response_log_test', 'local', 'response-log-test')
+    ai.call_llm([{'role': 'user', 'content': 'Question'}], backend=backend, use_cache=False, temperature=0)
+    assert ai.get_llm_response_logger() is None
+    assert not path.exists()
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from anndict import ai
+
+
+def ask(backend, question, **kwargs):
+    return ai.call_llm([{'role': 'user', 'content': question}], backend=backend, use_cache=False, temperature=0, **kwargs)
+
+
+def test_replays_recorded_responses(tmp_path):
+    path = tmp_path / 'response.jsonl'
+    ai.configure_llm_response_log(path=str(path))
+    try:
+        recorder = ai.LLMBackend('recorder', 'local', 'recorder-model', responder=lambda messages, request_hash: f"recorded: {messages[-1]['content']}")
+        for question in ['Q1', 'Q2']:
+            ask(recorder, question)
+        ai.stop_llm_response_log()
+    finally:
+        ai.configure_llm_response_log(enabled=False)
+
+    replay = ai.LLMBackend('replay', 'local', 'replay-model', cassette=str(path), cassette_model='recorder-model')
+    assert ask(replay, 'Q2') == 'recorded: Q2'
+    assert ask(replay, 'Q1') == 'recorded: Q1'
+    # Requests missing from the cassette fail, unless on_miss='synthetic'
+    with pytest.raises(KeyError):
+        ask(replay, 'Q3')
+    replay = ai.LLMBackend('replay', 'local', 'replay-model', cassette=str(path), cassette_model='recorder-model', on_miss='synthetic')
+    assert ask(replay, 'Q3').startswith('synthetic response')
+    # The request hash includes the provider and model the cassette was recorded with
+    replay = ai.LLMBackend('replay', 'local', 'replay-model', cassette=str(path), cassette_provider='openai', cassette_model='recorder-model')
+    with pytest.raises(KeyError):
+        ask(replay, 'Q1')
+
+
+def test_load_llm_cassette(tmp_path):
+    path = tmp_path / 'cassette.json'
+    path.write_text(json.dumps({'abc': 'response'}))
+    assert ai.load_llm_cassette(path) == {'abc': 'response'}
+    path = tmp_path / 'response.jsonl'
+    path.write_text('\n'.join(json.dumps({'request_hash': h, 'response': r}) for h, r in [('abc', 'one'), (None, 'unhashed'), ('def', 'two')]))
+    assert ai.load_llm_cassette(path) == {'abc': 'one', 'def': 'two'}
+    # A response log with a single entry
+    path.write_text(json.dumps({'request_hash': 'abc', 'response': 'one'}))
+    assert ai.load_llm_cassette(path) == {'abc': 'one'}
+
+
+def test_synthetic_llm_response():
+    prompt = "Map these labels. Generate only a dictionary:    T cell    B cell ->"
+    assert ai.synthetic_llm_response([{'role': 'user', 'content': prompt}], 'abcdef0123') == str({'T cell': 'T cell', 'B cell': 'B cell'})
+    assert ai.synthetic_llm_response([{'role': 'user', 'content': 'Hi'}], 'abcdef0123') == 'synthetic response abcdef01'
+
+
+def test_simulated_errors_are_reproducible():
+    def outcomes(seed):
+        backend = ai.LLMBackend('errors', 'local', 'local-errors', error_rate=0.5, seed=seed)
+        results = []
+        for i in range(20):
+            try:
+                results.append(ask(backend, f"Q{i}", max_transport_attempts=1))
+            except ai.LocalLLMError as e:
+                assert e.status_code == 503
+                results.append(None)
+        return results
+
+    results = outcomes(seed=1)
+    assert results == outcomes(seed=1)
+    assert 0 < results.count(None) < 20
+
+
+def test_simulated_rate_limit():
+    backend = ai.LLMBackend('rate_limit', 'local', 'local-rate-limit', max_requests_per_second=2)
+    ask(backend, 'Q1')
+    ask(backend, 'Q2')
+    with pytest.raises(ai.LocalLLMError) as excinfo:
+        ask(backend, 'Q3', max_transport_attempts=1)
+    assert excinfo.value.status_code == 429
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError):
+        ai.LocalChatModel('model', latency_distribution='uniform')
+    with pytest.raises(ValueError):
+        ai.LocalChatModel('model', on_miss='ignore')
+
+
+def test_requires_request_hash():
+    with pytest.raises(ValueError):
+        ai.LocalChatModel('model').invoke([])
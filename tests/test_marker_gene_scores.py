@@ -0,0 +1,119 @@
+import threading
+
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.sparse import csr_matrix
+
+from anndict import ai
+
+
+GENES = ['CD3E', 'CD8A', 'MS4A1', 'CD79A', 'LYZ', 'CD14', 'ACTB', 'GAPDH']
+
+
+def make_adata(sparse=False):
+    # Seed with distinct gene means, so that the expression bins do not depend on rounding
+    rng = np.random.default_rng(1)
+    X = rng.poisson(rng.uniform(0.5, 5, len(GENES)), size=(50, len(GENES))).astype(float)
+    adata = ad.AnnData(csr_matrix(X) if sparse else X)
+    adata.obs_names = [f"cell{i}" for i in range(50)]
+    adata.var_names = GENES
+    return adata
+
+
+@pytest.mark.parametrize('sparse', [False, True])
+def test_nanmean_genes(sparse):
+    X = np.array([[1, np.nan, 0], [3, 2, 0], [0, 4, np.nan]])
+    means = ai.nanmean_genes(csr_matrix(X) if sparse else X)
+    np.testing.assert_allclose(means, np.nanmean(X, axis=0))
+
+
+def test_score_genes_multi_hand_computed():
+    # Gene means 1, 2, 3, 4 fall in bins 0, 1, 1, 2, so the control gene of gene_b is gene_c
+    X = np.array([[1, 1, 2, 3], [1, 3, 4, 5]], dtype=float)
+    adata = ad.AnnData(X)
+    adata.var_names = ['gene_a', 'gene_b', 'gene_c', 'gene_d']
+    scores = ai.score_genes_multi(adata, {'b_score': ['gene_b'], 'd_score': ['gene_d']}, n_bins=3)
+    np.testing.assert_allclose(scores['b_score'], X[:, 1] - X[:, 2])
+    # gene_d is alone in its bin, so it has no control genes
+    assert scores['d_score'].isna().all()
+    assert list(adata.obs.columns) == ['b_score', 'd_score']
+
+
+def test_score_genes_multi_scores_each_set_as_if_alone():
+    gene_lists = {'T_score': ['CD3E', 'CD8A'], 'B_score': ['MS4A1', 'CD79A'], 'myeloid_score': ['LYZ', 'CD14', 'not a gene']}
+    adata = make_adata()
+    # With ctrl_size at least the bin size, all genes of a bin are controls, so the scores do not depend on the draws
+    together = ai.score_genes_multi(adata, gene_lists, ctrl_size=100, n_bins=4)
+    for score_name, gene_list in gene_lists.items():
+        alone = ai.score_genes_multi(make_adata(), {score_name: gene_list}, ctrl_size=100, n_bins=4)
+        np.testing.assert_allclose(together[score_name], alone[score_name])
+    sparse = ai.score_genes_multi(make_adata(sparse=True), gene_lists, ctrl_size=100, n_bins=4)
+    np.testing.assert_allclose(together, sparse)
+
+
+def test_score_genes_multi_is_reproducible():
+    gene_lists = {'T_score': ['CD3E', 'CD8A']}
+    first = ai.score_genes_multi(make_adata(), gene_lists, ctrl_size=1, n_bins=3, random_state=1)
+    second = ai.score_genes_multi(make_adata(), gene_lists, ctrl_size=1, n_bins=3, random_state=1)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_score_genes_multi_requires_valid_genes():
+    with pytest.raises(ValueError):
+        ai.score_genes_multi(make_adata(), {'none_score': ['not a gene']})
+
+
+@pytest.fixture
+def gene_list_calls(monkeypatch):
+    """Replaces ai_gene_list with a stub that records its calls, and returns no genes for 'unknown cell'."""
+    calls = []
+    lock = threading.Lock()
+    marker_genes = {'T cell': ['CD3E', 'CD8A'], 'B cell': ['MS4A1', 'cd79a'], 'unknown cell': []}
+
+    def ai_gene_list(cell_type, species, list_length=None, backend=None):
+        with lock:
+            calls.append(cell_type)
+        return marker_genes[cell_type]
+
+    monkeypatch.setattr(ai, 'ai_gene_list', ai_gene_list)
+    ai.clear_marker_gene_list_cache()
+    yield calls
+    ai.clear_marker_gene_list_cache()
+
+
+def test_marker_gene_lists_are_cached(gene_list_calls):
+    backend = ai.LLMBackend('marker_genes_test', 'local', 'marker-genes-test')
+    gene_list = ai.get_marker_gene_list('T cell', 'Human', backend=backend)
+    gene_list.append('modified')
+    assert ai.get_marker_gene_list('T cell', 'Human', backend=backend) == ['CD3E', 'CD8A']
+    assert gene_list_calls == ['T cell']
+    # Lists are cached per species, list length and model
+    ai.get_marker_gene_list('T cell', 'Mouse', backend=backend)
+    ai.get_marker_gene_list('T cell', 'Human', list_length='longer', backend=backend)
+    ai.get_marker_gene_list('T cell', 'Human', backend=ai.LLMBackend('marker_genes_test', 'local', 'other-model'))
+    assert len(gene_list_calls) == 4
+    ai.clear_marker_gene_list_cache()
+    ai.get_marker_gene_list('T cell', 'Human', backend=backend)
+    assert len(gene_list_calls) == 5
+
+
+def test_failed_marker_gene_lists_are_not_cached(gene_list_calls):
+    backend = ai.LLMBackend('marker_genes_test', 'local', 'marker-genes-test')
+    assert ai.get_marker_gene_list('unknown cell', 'Human', backend=backend) == []
+    assert ai.get_marker_gene_list('unknown cell', 'Human', backend=backend) == []
+    assert gene_list_calls == ['unknown cell', 'unknown cell']
+
+
+def test_vectorized_cell_type_marker_gene_score(gene_list_calls):
+    adata = make_adata()
+    with ai.use_llm_backend(ai.LLMBackend('marker_genes_test', 'local', 'marker-genes-test')):
+        ai.cell_type_marker_gene_score(adata, cell_types=['T cell', 'B cell', 'unknown cell'], vectorized=True, ctrl_size=100, n_bins=4)
+        # A second stratum reuses the cached gene lists, except the failed one
+        ai.cell_type_marker_gene_score(make_adata(), cell_types=['T cell', 'B cell', 'unknown cell'], vectorized=True)
+    assert sorted(gene_list_calls) == ['B cell', 'T cell', 'unknown cell', 'unknown cell']
+    assert list(adata.var_names[adata.var['B cell_score']]) == ['MS4A1', 'CD79A']
+    assert adata.obs['unknown cell_score'].isna().all()
+    expected = ai.score_genes_multi(make_adata(), {'T cell_score': ['CD3E', 'CD8A'], 'B cell_score': ['MS4A1', 'CD79A']}, ctrl_size=100, n_bins=4)
+    np.testing.assert_allclose(adata.obs[['T cell_score', 'B cell_score']], expected)
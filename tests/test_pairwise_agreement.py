@@ -0,0 +1,55 @@
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+
+import anndict.dict as adict
+
+
+def compare(label1, label2, backend=None):
+    if not isinstance(label1, str) or not isinstance(label2, str):
+        return 'no'
+    return 'yes' if label1.split()[0] == label2.split()[0] else 'no'
+
+
+@pytest.fixture(autouse=True)
+def fake_comparison(monkeypatch):
+    monkeypatch.setattr(adict, 'ai_compare_cell_types_binary', compare)
+
+
+def make_adata(categorical):
+    rng = np.random.default_rng(0)
+    labels = np.array(['T cell', 'T lymphocyte', 'B cell', 'B lymphocyte', 'Macrophage'])
+    obs = pd.DataFrame({col: labels[rng.integers(0, len(labels), 200)] for col in ['model_a', 'model_b', 'model_c']},
+                       index=[f"cell_{i}" for i in range(200)])
+    if categorical:
+        # Categories in different orders, with an unused category
+        obs['model_a'] = pd.Categorical(obs['model_a'], categories=list(labels) + ['Unused'])
+        obs['model_b'] = pd.Categorical(obs['model_b'], categories=list(labels[::-1]))
+    return ad.AnnData(np.zeros((200, 1)), obs=obs)
+
+
+@pytest.mark.parametrize('categorical', [False, True])
+def test_agreement_matches_per_cell_comparison(categorical):
+    adata = make_adata(categorical)
+    adict.ai_compare_cell_type_labels_pairwise(adata, ['model_a', 'model_b'], ['model_c'])
+    for col1, col2 in [('model_a', 'model_c'), ('model_b', 'model_c')]:
+        expected = [1 if compare(label1, label2) == 'yes' else 0 for label1, label2 in zip(adata.obs[col1], adata.obs[col2])]
+        assert list(adata.obs[f"agreement_{col1}_{col2}"]) == expected
+
+
+def test_missing_labels_have_no_agreement():
+    adata = make_adata(categorical=True)
+    adata.obs.loc['cell_0', 'model_a'] = np.nan
+    adict.ai_compare_cell_type_labels_pairwise(adata, ['model_a'], ['model_c'])
+    agreement = adata.obs['agreement_model_a_model_c']
+    assert np.isnan(agreement['cell_0'])
+    assert agreement.drop('cell_0').isin([0, 1]).all()
+
+
+def test_get_label_codes():
+    labels = pd.Series(pd.Categorical(['b', None, 'a', 'b'], categories=['b', 'a', 'c']))
+    codes, categories = adict.get_label_codes(labels)
+    assert list(codes) == [0, -1, 1, 0] and list(categories) == ['b', 'a', 'c']
+    codes, categories = adict.get_label_codes(pd.Series(['b', None, 'a', 'b']))
+    assert list(codes) == [0, -1, 1, 0] and list(categories) == ['b', 'a']
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from anndict import ai
+
+
+class ProviderError(Exception):
+    def __init__(self, message, status_code=None, headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers = headers
+
+
+class APITimeoutError(Exception):
+    pass
+
+
+@pytest.mark.parametrize('error, classification', [
+    (ProviderError("Too many requests", 429), 'retryable'),
+    (ProviderError("Overloaded", 529), 'retryable'),
+    (ProviderError("Bad gateway", 502), 'retryable'),
+    (ProviderError("Invalid API key", 401), 'fatal'),
+    (ProviderError("Bad request", 400), 'fatal'),
+    (TimeoutError(), 'retryable'),
+    (ConnectionError(), 'retryable'),
+    (APITimeoutError("Request timed out"), 'retryable'),
+    (ProviderError("The model is overloaded, try again later"), 'retryable'),
+    (ValueError("Unknown model"), 'fatal'),
+])
+def test_classify_llm_error(error, classification):
+    assert ai.classify_llm_error(error) == classification
+
+
+def test_get_retry_after():
+    assert ai.get_retry_after(ProviderError("", 429, headers={'retry-after': '3'})) == 3
+    assert ai.get_retry_after(ProviderError("", 429, headers={'Retry-After': 'Thu, 01 Jan 1970 00:00:00 GMT'})) == 0
+    assert ai.get_retry_after(ProviderError("", 429)) is None
+
+    botocore_error = Exception("Throttling")
+    botocore_error.response = {'ResponseMetadata': {'HTTPStatusCode': 429, 'HTTPHeaders': {'retry-after': '2'}}}
+    assert ai.get_error_status_code(botocore_error) == 429
+    assert ai.get_retry_after(botocore_error) == 2
+
+
+def make_flaky(errors, result='ok'):
+    """Returns a function that raises the given errors on its first calls, then returns result, and the list of its calls."""
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+    return func, calls
+
+
+def retryable_error():
+    return ProviderError("Service unavailable", 503, headers={'retry-after': '0'})
+
+
+def test_transient_errors_are_retried():
+    func, calls = make_flaky([retryable_error(), retryable_error()])
+    assert ai.call_with_transport_retries(func, max_attempts=3) == 'ok'
+    assert len(calls) == 3
+
+
+def test_fatal_errors_are_raised_immediately():
+    func, calls = make_flaky([ProviderError("Invalid API key", 401)])
+    with pytest.raises(ProviderError):
+        ai.call_with_transport_retries(func, max_attempts=3)
+    assert len(calls) == 1
+
+
+def test_attempt_budget_is_respected():
+    func, calls = make_flaky([retryable_error()] * 5)
+    with pytest.raises(ProviderError):
+        ai.call_with_transport_retries(func, max_attempts=2)
+    assert len(calls) == 2
+
+
+def test_wait_budget_is_respected():
+    func, calls = make_flaky([ProviderError("Too many requests", 429, headers={'retry-after': '30'})])
+    with pytest.raises(ProviderError):
+        ai.call_with_transport_retries(func, max_attempts=5, max_wait=10)
+    assert len(calls) == 1
+
+
+def test_async_transient_errors_are_retried():
+    func, calls = make_flaky([retryable_error()])
+
+    async def afunc():
+        return func()
+
+    assert asyncio.run(ai.acall_with_transport_retries(afunc, max_attempts=2)) == 'ok'
+    assert len(calls) == 2
+
+
+def test_backoff_delay_grows_with_attempts():
+    error = ProviderError("Service unavailable", 503)
+    assert all(0 <= ai.get_transport_retry_delay(error, 1) <= 1 for _ in range(20))
+    assert all(0 <= ai.get_transport_retry_delay(error, 4) <= 8 for _ in range(20))
+    assert ai.get_transport_retry_delay(ProviderError("", 429, headers={'retry-after': '120'}), 1, max_delay=60) == 60
+
+
+def test_retry_llm_call_retries_unprocessable_responses(monkeypatch):
+    responses = iter(["not a number", "still not", "42"])
+    temperatures = []
+
+    def call_llm(messages, **kwargs):
+        temperatures.append(kwargs.get('temperature'))
+        return next(responses)
+
+    monkeypatch.setattr(ai, 'call_llm', call_llm)
+    result = ai.retry_llm_call(
+        messages=[{'role': 'user', 'content': 'Pick a number.'}],
+        process_response=int,
+        failure_handler=lambda: None,
+        call_llm_kwargs={'temperature': 0}
+    )
+    assert result == 42
+    # Temperature is raised from the third attempt on
+    assert temperatures == [0, 0, 0.025]
+
+
+def test_retry_llm_call_drops_unusable_cached_responses():
+    cache = ai.configure_llm_cache()
+    try:
+        messages = [{'role': 'user', 'content': 'Pick a number.'}]
+        backend = ai.LLMBackend('retry_test', 'local', 'retry-test', responder=lambda messages, request_hash: "not a number")
+        result = ai.retry_llm_call(messages, process_response=int, failure_handler=lambda: 'failed', max_attempts=2,
+                                   call_llm_kwargs={'temperature': 0, 'backend': backend})
+        assert result == 'failed'
+        assert cache.get(ai.get_llm_request_key(messages, temperature=0, backend=backend)) is None
+    finally:
+        ai.configure_llm_cache(enabled=False)
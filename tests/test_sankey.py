@@ -0,0 +1,69 @@
+from collections import Counter
+from itertools import permutations
+
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+
+from anndict.stablelabel import get_sankey_codes, get_sankey_flows
+
+
+def reference_flows(obs, cols):
+    """The flows as plot_sankey computed them before vectorization, by counting astype(str) pairs."""
+    flows = Counter()
+    for i in range(len(cols) - 1):
+        for a, b in zip(obs[cols[i]].astype(str), obs[cols[i + 1]].astype(str)):
+            flows[(f"{a} ({cols[i]})", f"{b} ({cols[i + 1]})")] += 1
+    return flows
+
+
+def as_counter(flows):
+    return Counter({(source, target): value for source, target, value in flows.itertuples(index=False)})
+
+
+def make_adata(obs):
+    return ad.AnnData(obs=pd.DataFrame(obs, index=[f"cell{i}" for i in range(len(next(iter(obs.values()))))]))
+
+
+COLUMNS = {
+    'categorical': pd.Categorical(['T', 'B', 'T', None, 'NK', 'B'], categories=['T', 'B', 'NK', 'unused']),
+    'object': ['T cell', None, 'B cell', np.nan, 'T cell', 'B cell'],
+    'int': [0, 1, 1, 2, 0, 1],
+    'float': [0.5, np.nan, 1.0, 1.0, 0.5, np.nan],
+    'nullable': pd.array([1, None, 2, 2, 1, None], dtype='Int64'),
+    'bool': [True, False, True, True, False, False],
+    'mixed': [1, '1', 'a', 1, 'a', '1'],
+}
+
+
+@pytest.mark.parametrize('first, second', list(permutations(COLUMNS, 2)))
+def test_flows_match_astype_str_counts(first, second):
+    adata = make_adata({first: COLUMNS[first], second: COLUMNS[second]})
+    flows = get_sankey_flows(adata, [first, second], use_cache=False)
+    assert as_counter(flows) == reference_flows(adata.obs, [first, second])
+
+
+def test_flows_over_three_columns():
+    adata = make_adata({col: COLUMNS[col] for col in ['categorical', 'object', 'nullable']})
+    cols = ['categorical', 'object', 'nullable']
+    assert as_counter(get_sankey_flows(adata, cols, use_cache=False)) == reference_flows(adata.obs, cols)
+
+
+@pytest.mark.parametrize('col', list(COLUMNS))
+def test_codes_match_astype_str(col):
+    values = pd.Series(COLUMNS[col])
+    codes, labels = get_sankey_codes(values)
+    assert list(labels[codes]) == list(values.astype(str))
+    # Only labels that occur are kept, each once
+    assert len(set(labels)) == len(labels) == values.astype(str).nunique()
+
+
+def test_cached_flows_are_copies_and_follow_contents():
+    adata = make_adata({'a': ['x', 'y', 'x'], 'b': ['u', 'u', 'v']})
+    flows = get_sankey_flows(adata, ['a', 'b'])
+    flows['value'] = 0
+    assert get_sankey_flows(adata, ['a', 'b'])['value'].sum() == 3
+
+    adata.obs['b'] = ['u', 'v', 'v']
+    assert as_counter(get_sankey_flows(adata, ['a', 'b'])) == reference_flows(adata.obs, ['a', 'b'])
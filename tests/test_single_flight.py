@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from anndict import ai
+
+
+def test_single_flight_shares_result_of_concurrent_calls():
+    single_flight = ai.SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def slow_call():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return 'result'
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(single_flight.do, 'key', slow_call)
+        started.wait()
+        followers = [executor.submit(single_flight.do, 'key', slow_call) for _ in range(3)]
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert results == ['result'] * 4
+    assert len(calls) == 1
+    assert single_flight.coalesced == 3
+
+
+def test_single_flight_shares_exceptions_and_forgets_key():
+    single_flight = ai.SingleFlight()
+
+    def failing_call():
+        raise RuntimeError('provider down')
+
+    with pytest.raises(RuntimeError):
+        single_flight.do('key', failing_call)
+    # The failed call is not remembered
+    assert single_flight.do('key', lambda: 'ok') == 'ok'
+
+
+@pytest.fixture
+def local_backend():
+    """A local backend that counts the requests it answers, each taking 0.2 seconds."""
+    calls = []
+    lock = threading.Lock()
+
+    def responder(messages, request_hash):
+        with lock:
+            calls.append(request_hash)
+        return 'Fibroblast'
+
+    backend = ai.LLMBackend('single_flight_test', 'local', 'synthetic', latency=0.2, responder=responder)
+    backend.calls = calls
+    return backend
+
+
+def call_concurrently(n_calls, **kwargs):
+    messages = [{'role': 'user', 'content': 'Which cell type expresses COL1A1?'}]
+    with ThreadPoolExecutor(max_workers=n_calls) as executor:
+        futures = [executor.submit(ai.call_llm, messages, use_cache=False, **kwargs) for _ in range(n_calls)]
+        return [future.result() for future in futures]
+
+
+def test_deterministic_calls_are_coalesced(local_backend):
+    assert call_concurrently(4, temperature=0, backend=local_backend) == ['Fibroblast'] * 4
+    assert len(local_backend.calls) == 1
+
+
+def test_sampled_calls_are_not_coalesced_by_default(local_backend):
+    call_concurrently(4, temperature=0.7, backend=local_backend)
+    assert len(local_backend.calls) == 4
+
+
+def test_sampled_calls_are_coalesced_when_asked(local_backend):
+    call_concurrently(4, temperature=0.7, coalesce=True, backend=local_backend)
+    assert len(local_backend.calls) == 1
+
+
+def test_async_deterministic_calls_are_coalesced(local_backend):
+    messages = [{'role': 'user', 'content': 'Which cell type expresses COL1A1?'}]
+
+    async def main(**kwargs):
+        return await asyncio.gather(*[ai.acall_llm(messages, use_cache=False, backend=local_backend, **kwargs) for _ in range(4)])
+
+    assert asyncio.run(main(temperature=0)) == ['Fibroblast'] * 4
+    assert len(local_backend.calls) == 1
+    asyncio.run(main(temperature=0.7))
+    assert len(local_backend.calls) == 5
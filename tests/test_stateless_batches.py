@@ -0,0 +1,71 @@
+import asyncio
+import threading
+
+import pytest
+
+from anndict import ai
+
+
+LABELS = [f"{kind} cell type {name}" for kind in ['T', 'B'] for name in ['alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta']]
+
+
+def get_prompt_labels(prompt):
+    return [label.strip() for label in prompt.split('Generate only a dictionary:', 1)[1].rsplit('->', 1)[0].split('    ') if label.strip()]
+
+
+@pytest.fixture
+def requests():
+    """Registers a backend that simplifies labels to 'T cell' or 'T cells' (and likewise for B cells), and reconciles the plurals. Returns its requests."""
+    requests = []
+    lock = threading.Lock()
+
+    def respond(messages, request_hash):
+        with lock:
+            requests.append(messages)
+        prompt = messages[-1]['content']
+        if 'failing label' in get_prompt_labels(prompt):
+            return "not a dictionary"
+        if 'simplified in separate batches' in prompt:
+            return str({label: label.rstrip('s') for label in get_prompt_labels(prompt)})
+        return str({label: f"{label.split()[0]} cell{'s' if 'a' in label.split()[-1][-1] else ''}" for label in get_prompt_labels(prompt)})
+
+    ai.register_llm_backend('stateless_batches_test', 'local', 'stateless-batches-test', responder=respond)
+    yield requests
+    ai.unregister_llm_backend('stateless_batches_test')
+
+
+def test_batches_are_stateless_and_reconciled(requests):
+    mapping = ai.map_cell_type_labels_to_simplified_set(LABELS, batch_size=4, backend='stateless_batches_test', parallel=True, num_workers=3)
+    assert mapping == {label: f"{label[0]} cell" for label in LABELS}
+    # Each request sends only the system message and one batch, with the full label list as context
+    batch_requests = [messages for messages in requests if 'simplified in separate batches' not in messages[-1]['content']]
+    assert len(batch_requests) == 3
+    assert all([message['role'] for message in messages] == ['system', 'user'] for messages in requests)
+    assert all(all(label in messages[-1]['content'] for label in LABELS) for messages in batch_requests)
+    assert sorted(label for messages in batch_requests for label in get_prompt_labels(messages[-1]['content'])) == sorted(LABELS)
+
+
+def test_vocabulary_replaces_the_label_list(requests):
+    ai.map_cell_type_labels_to_simplified_set(LABELS, batch_size=4, backend='stateless_batches_test', parallel=True, vocabulary=['T cell', 'B cell'])
+    context = requests[0][-1]['content'].split('\n')[0]
+    assert 'T cell    B cell' in context
+    assert not any(label in context for label in LABELS)
+
+
+def test_failed_batches_map_labels_to_themselves(requests):
+    labels = LABELS[:4] + ['failing label']
+    mapping = ai.map_cell_type_labels_to_simplified_set(labels, batch_size=4, backend='stateless_batches_test', parallel=True)
+    assert mapping['failing label'] == 'failing label'
+    assert {mapping[label] for label in LABELS[:4]} <= {'T cell', 'T cells'}
+
+
+def test_async_matches_threads(requests):
+    mapping = ai.map_cell_type_labels_to_simplified_set(LABELS, batch_size=4, backend='stateless_batches_test', parallel=True)
+    amapping = asyncio.run(ai.amap_cell_type_labels_to_simplified_set(LABELS, batch_size=4, backend='stateless_batches_test', parallel=True))
+    assert amapping == mapping
+
+
+def test_gene_labels(requests):
+    mapping = ai.map_gene_labels_to_simplified_set(LABELS, batch_size=4, backend='stateless_batches_test', parallel=True)
+    assert mapping == {label: f"{label[0]} cell" for label in LABELS}
+    assert 'full list of gene labels' in requests[0][-1]['content']
@@ -0,0 +1,95 @@
+import pytest
+
+from anndict import ai
+
+
+@pytest.mark.parametrize('ai_string, expected', [
+    ('{"T cells": "T cell"}', {'T cells': 'T cell'}),
+    ("Here is the mapping: {'T cells': 'T cell', 'B cells': 'B cell'} Hope this helps!", {'T cells': 'T cell', 'B cells': 'B cell'}),
+    ("```json\n{\"T cells\": \"T cell\",}\n```", {'T cells': 'T cell'}),
+    ("{'Treg {CD25+}': 'T cell', 'Mono}': \"Monocyte\"}", {'Treg {CD25+}': 'T cell', 'Mono}': 'Monocyte'}),
+    ("{'CD4 T cell': {'subtype': 'Treg'}}", {'CD4 T cell': {'subtype': 'Treg'}}),
+])
+def test_parse_dict(ai_string, expected):
+    assert ai.parse_ai_literal(ai_string) == expected
+
+
+def test_parse_list():
+    assert ai.parse_ai_literal("Genes: ['CD3E', 'CD8A', ]", list) == ['CD3E', 'CD8A']
+    assert ai.parse_ai_literal('["[x]", "y"] and [1]', list) == ['[x]', 'y']
+
+
+@pytest.mark.parametrize('ai_string', [
+    'I cannot help with that.',
+    "{'T cells': 'T cell', 'B cells': 'B ce",
+    "{'a': __import__('os').getcwd()}",
+    '{"a": 1',
+])
+def test_unparseable_raises(ai_string):
+    with pytest.raises(ValueError):
+        ai.parse_ai_literal(ai_string)
+
+
+def test_wrong_type_raises():
+    with pytest.raises(ValueError):
+        ai.parse_ai_literal("{'a': 1}", list)
+
+
+def test_close_truncated():
+    truncated = "{'T cells': 'T cell', 'B cells': 'B cell', 'NK ce"
+    assert ai.find_ai_literal(truncated) == ''
+    assert ai.find_ai_literal(truncated, close_truncated=True) == "{'T cells': 'T cell', 'B cells': 'B cell'}"
+    assert ai.parse_ai_literal(truncated, close_truncated=True) == {'T cells': 'T cell', 'B cells': 'B cell'}
+    assert ai.parse_ai_literal("['CD3E', 'CD8A", list, close_truncated=True) == ['CD3E']
+
+
+def test_extract_from_ai_string():
+    assert ai.extract_dictionary_from_ai_string("Sure: {'a': '}'} done") == "{'a': '}'}"
+    assert ai.extract_list_from_ai_string("Sure: ['a', 'b'] done") == "['a', 'b']"
+    assert ai.extract_list_from_ai_string("no list") == ''
+
+
+def test_structured_output_asks_for_json():
+    assert 'response_format' not in ai.get_mapping_call_kwargs(['T cells'])
+    ai.configure_llm_structured_output()
+    try:
+        call_llm_kwargs = ai.get_mapping_call_kwargs(['T cells'])
+    finally:
+        ai.configure_llm_structured_output(False)
+    assert call_llm_kwargs['response_format'] == 'json' and call_llm_kwargs['temperature'] == 0
+
+
+OPENAI_CONFIG = {'provider': 'openai', 'model': 'gpt-4o', 'class': 'ChatOpenAI', 'module': 'langchain_openai', 'api_key': 'test'}
+
+
+def test_json_mode_only_for_supported_providers():
+    assert ai.get_llm_call_kwargs(OPENAI_CONFIG, max_tokens=10, response_format='json')['response_format'] == {'type': 'json_object'}
+    assert 'response_format' not in ai.get_llm_call_kwargs(OPENAI_CONFIG, max_tokens=10)
+    local_config = {'provider': 'local', 'model': 'structured-output-test', 'class': 'LocalChatModel', 'module': 'anndict.ai'}
+    assert 'response_format' not in ai.get_llm_call_kwargs(local_config, max_tokens=10, response_format='json')
+
+
+class FakeBackend:
+    def get_llm(self, **kwargs):
+        return None
+
+
+@pytest.mark.parametrize('content, expected', [
+    ('Map T cells.', 'Map T cells. Respond with a JSON object.'),
+    ('Map T cells as JSON.', 'Map T cells as JSON.'),
+])
+def test_json_mode_asks_for_json_in_the_prompt(content, expected):
+    _, messages, kwargs = ai.prepare_llm_call([{'role': 'user', 'content': content}], OPENAI_CONFIG, backend=FakeBackend(), response_format='json')
+    assert messages[-1].content == expected
+    assert kwargs['response_format'] == {'type': 'json_object'}
+
+
+def test_mapping_with_structured_output():
+    ai.configure_llm_structured_output()
+    try:
+        backend = ai.LLMBackend('structured_output_test', 'local', 'structured-output-test',
+                                responder=lambda messages, request_hash: 'Acknowledged.' if 'Acknowledge' in messages[-1]['content'] else '{"Tregs": "T cell", "B cells": "B cell",}')
+        mapping = ai.map_cell_type_labels_to_simplified_set(['Tregs', 'B cells'], backend=backend, use_mapping_store=False)
+    finally:
+        ai.configure_llm_structured_output(False)
+    assert mapping == {'Tregs': 'T cell', 'B cells': 'B cell'}
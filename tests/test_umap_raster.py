@@ -0,0 +1,54 @@
+import base64
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from anndict.ai import UmapRaster, encode_image_for_openai
+
+
+def make_coords():
+    # Two well separated blobs
+    rng = np.random.default_rng(0)
+    return np.vstack([rng.normal(0, 0.1, (50, 2)), rng.normal(5, 0.1, (50, 2))])
+
+
+def test_render_colors_each_category():
+    raster = UmapRaster(make_coords(), size=64)
+    image = raster.render(pd.Categorical(['a'] * 50 + ['b'] * 50))
+    assert image.shape == (64, 64, 3) and image.dtype == np.uint8
+    colors = {tuple(pixel) for pixel in image.reshape(-1, 3)} - {(255, 255, 255)}
+    assert len(colors) == 2
+
+
+def test_render_matches_for_categorical_and_plain_labels():
+    raster = UmapRaster(make_coords(), size=32)
+    labels = ['a'] * 50 + ['b'] * 50
+    assert np.array_equal(raster.render(labels), raster.render(pd.Categorical(labels)))
+
+
+def test_render_draws_missing_labels_in_missing_color():
+    raster = UmapRaster(make_coords(), size=32)
+    image = raster.render(pd.Categorical([None] * 100, categories=['a']), missing_color=(1, 2, 3))
+    colors = {tuple(pixel) for pixel in image.reshape(-1, 3)} - {(255, 255, 255)}
+    assert colors == {(1, 2, 3)}
+
+
+def test_render_is_reused_across_partitions():
+    raster = UmapRaster(make_coords(), size=32)
+    one = raster.render(['a'] * 100)
+    two = raster.render(['a'] * 50 + ['b'] * 50)
+    assert not np.array_equal(one, two)
+    # Background pixels don't depend on the partition
+    assert np.array_equal((one == 255).all(axis=2), (two == 255).all(axis=2))
+
+
+@pytest.mark.parametrize('image_format', ['png', 'webp'])
+def test_encode_image_round_trips(image_format):
+    from PIL import Image
+    image = UmapRaster(make_coords(), size=32).render(['a'] * 50 + ['b'] * 50)
+    decoded = Image.open(BytesIO(base64.b64decode(encode_image_for_openai(image, image_format=image_format))))
+    assert decoded.size == (32, 32)
+    if image_format == 'png':
+        assert np.array_equal(np.asarray(decoded.convert('RGB')), image)